@@ -79,7 +79,7 @@ docker compose ${docker_compose_files} up --build --abort-on-container-exit --ex
 # would silently mount an empty dir and the results would never reach the host
 # (same failure a9dbfc3 fixed for the labels mount, but quieter). `up` stops
 # test01 without removing it, so it is still cp-able here.
-for artifact in test_results.json test_metrics_history.json screenshots traces logs html_snapshots ; do
+for artifact in test_results.json test_metrics_history.json test_action_timings.json test_page_timing_history.json test_network.json screenshots traces logs html_snapshots ; do
     docker cp "test01:/app/${artifact}" "${base_dir}/src/" 2>/dev/null || true
 done
 
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Deterministic synthetic corpus for the sampledata image.
+
+The hand-written pages under content/ are a few dozen documents: too few to
+exercise pagination, facets or sort at realistic index sizes. This script
+adds a generated corpus of any size next to them, in the same layout the
+seed relies on, under a g/ directory in each section:
+
+    docs/en/g/        English pages
+    docs/ja/g/        Japanese (multibyte) pages
+    docs/labels/a/g/  pages the e2e-label-a label type matches
+    docs/labels/b/g/  pages the e2e-label-b label type matches
+    thumbnail/g/      pages with an og:image thumbnail
+    g/index.html      crawl entry point, linking the hub pages
+    g/hub/NNNNN.html  HUB_SIZE page links each
+    g/manifest.json   sizes, digest and expected hit counts
+
+Page i is generated from its own Random("<seed>:<i>"), so the corpus is the
+same for the same --pages/--seed on any machine and any Python 3, and each
+page is written as soon as it is generated: memory use does not grow with
+--pages. The manifest's hit counts are tallied while writing, from the exact
+text written, so search modules can assert against them.
+
+Stdlib only: it runs in the python:alpine build stage of sampledata/Dockerfile.
+
+Usage:
+    python3 generate_corpus.py --pages 10000 --seed 1 --out /corpus
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+
+GENERATOR_VERSION = 1
+CORPUS_DIR = "g"
+HUB_SIZE = 1000
+
+# Section per page, cycling through this pattern of 20 slots:
+# 30% en, 30% ja, 15% label a, 15% label b, 10% thumbnail.
+SECTION_PATTERN = (
+    ["docs/en"] * 6 + ["docs/ja"] * 6 + ["docs/labels/a"] * 3
+    + ["docs/labels/b"] * 3 + ["thumbnail"] * 2
+)
+SECTION_LANG = {
+    "docs/en": "en",
+    "docs/ja": "ja",
+    "docs/labels/a": "ja",
+    "docs/labels/b": "ja",
+    "thumbnail": "en",
+}
+THUMBNAIL_URL = "http://sampledata01/thumbnail/thumb.png"
+
+# Every generated page carries this term, and no hand-written page does.
+CORPUS_TERM = "corpusdoc"
+# Every Japanese generated page carries this term in its title.
+CORPUS_TERM_JA = "コーパス"
+
+# Filler vocabulary. Kept clear of the words the search modules query the
+# hand-written pages for (intro, page, sample, thumbnail, alpha, label...),
+# so their hit counts do not move with the corpus.
+EN_WORDS = (
+    "river", "mountain", "engine", "harbor", "lantern", "meadow", "signal",
+    "copper", "orchard", "canyon", "glacier", "violet", "compass", "anchor",
+    "falcon", "timber", "marble", "quartz", "saddle", "thunder", "willow",
+    "beacon", "ember", "harvest", "island", "jasmine", "kettle", "lagoon",
+)
+# Words with no character in common with each other or with the title,
+# so a bigram-analysed query for one cannot match another.
+JA_WORDS = (
+    "山岳", "河川", "図書館", "電車", "花火", "天気", "料理", "音楽",
+    "写真", "時計", "銀行", "病院", "新聞", "野菜", "海岸", "森林",
+)
+# Probe terms: term k appears on a page with probability 1/(k+2), giving
+# queries with a spread of hit counts. Each is one analyzer token.
+PROBE_TERMS = tuple(f"zeta{k}" for k in range(8))
+
+
+def section_of(i: int) -> str:
+    return SECTION_PATTERN[i % len(SECTION_PATTERN)]
+
+
+def page_path(i: int) -> str:
+    return f"{section_of(i)}/{CORPUS_DIR}/{i:07d}.html"
+
+
+def render_page(i: int, seed: int):
+    """HTML of page i and the probe terms it contains"""
+    rng = random.Random(f"{seed}:{i}")
+    section = section_of(i)
+    lang = SECTION_LANG[section]
+    probes = [term for k, term in enumerate(PROBE_TERMS) if rng.random() < 1 / (k + 2)]
+    if lang == "ja":
+        title = f"{CORPUS_TERM_JA}記事 {i:07d}"
+        words = [rng.choice(JA_WORDS) for _ in range(rng.randint(20, 60))]
+        text = "。".join(words)
+    else:
+        title = f"Corpus document {i:07d}"
+        words = [rng.choice(EN_WORDS) for _ in range(rng.randint(20, 60))]
+        text = " ".join(words)
+    head = f'<meta charset="utf-8"><title>{title}</title>'
+    if section == "thumbnail":
+        head += f'\n<meta property="og:image" content="{THUMBNAIL_URL}">'
+    html = (f'<!DOCTYPE html>\n<html lang="{lang}">\n<head>{head}</head>\n'
+            f'<body><h1>{title}</h1><p>{CORPUS_TERM} {" ".join(probes)}</p>'
+            f'<p>{text}</p></body>\n</html>\n')
+    return html, probes
+
+
+def _write(out: str, path: str, content: str, digest) -> None:
+    full = os.path.join(out, path)
+    os.makedirs(os.path.dirname(full), exist_ok=True)
+    data = content.encode("utf-8")
+    with open(full, "wb") as f:
+        f.write(data)
+    digest.update(path.encode("utf-8") + b"\0")
+    digest.update(hashlib.sha256(data).digest())
+
+
+def _hub(first: int, last: int) -> str:
+    links = "\n".join(f'<li><a href="/{page_path(i)}">{i:07d}</a></li>'
+                      for i in range(first, last))
+    return (f'<!DOCTYPE html>\n<html lang="en">\n<head><meta charset="utf-8">'
+            f'<title>Corpus hub {first // HUB_SIZE:05d}</title></head>\n'
+            f'<body><ul>\n{links}\n</ul></body>\n</html>\n')
+
+
+def generate(pages: int, seed: int, out: str) -> dict:
+    """
+    Write the corpus and its manifest under `out`.
+
+    Args:
+        pages: Number of generated pages
+        seed: Corpus seed; the same seed gives the same bytes
+        out: Directory the section tree is written into
+
+    Returns:
+        The manifest (also written to g/manifest.json)
+    """
+    digest = hashlib.sha256()
+    sections = {section: 0 for section in SECTION_PATTERN}
+    probe_hits = {term: 0 for term in PROBE_TERMS}
+    ja_pages = 0
+
+    for i in range(pages):
+        html, probes = render_page(i, seed)
+        _write(out, page_path(i), html, digest)
+        sections[section_of(i)] += 1
+        ja_pages += SECTION_LANG[section_of(i)] == "ja"
+        for term in probes:
+            probe_hits[term] += 1
+        if (i + 1) % HUB_SIZE == 0 or i + 1 == pages:
+            first = i - i % HUB_SIZE
+            _write(out, f"{CORPUS_DIR}/hub/{first // HUB_SIZE:05d}.html",
+                   _hub(first, i + 1), digest)
+
+    hubs = (pages + HUB_SIZE - 1) // HUB_SIZE
+    hub_links = "\n".join(f'<li><a href="/{CORPUS_DIR}/hub/{k:05d}.html">hub {k:05d}</a></li>'
+                          for k in range(hubs))
+    _write(out, f"{CORPUS_DIR}/index.html",
+           f'<!DOCTYPE html>\n<html lang="en">\n<head><meta charset="utf-8">'
+           f'<title>Corpus index</title></head>\n<body><ul>\n{hub_links}\n</ul>'
+           f'</body>\n</html>\n', digest)
+
+    manifest = {
+        "generator": GENERATOR_VERSION,
+        "pages": pages,
+        "seed": seed,
+        "digest": digest.hexdigest(),
+        "entry": f"{CORPUS_DIR}/index.html",
+        "term": CORPUS_TERM,
+        # Every HTML file written: pages, hubs and the index.
+        "documents": pages + hubs + 1,
+        "sections": sections,
+        "queries": [{"q": CORPUS_TERM, "hits": pages},
+                    {"q": CORPUS_TERM_JA, "hits": ja_pages}]
+                   + [{"q": term, "hits": hits} for term, hits in probe_hits.items()],
+    }
+    with open(os.path.join(out, CORPUS_DIR, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--pages", type=int, required=True, help="number of pages")
+    parser.add_argument("--seed", type=int, default=1, help="corpus seed")
+    parser.add_argument("--out", required=True, help="output directory")
+    args = parser.parse_args()
+    if args.pages <= 0:
+        print("--pages must be positive", file=sys.stderr)
+        return 2
+    manifest = generate(args.pages, args.seed, args.out)
+    print(f"Generated {manifest['pages']} pages ({manifest['documents']} documents) "
+          f"into {args.out}, digest {manifest['digest'][:16]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""
+Search latency benchmark over the JSON search API.
+
+The UI modules say whether search works; this says how fast it is. A
+catalog of query classes (single term, wildcard, multibyte, label filter,
+sort, deep pagination) is replayed against the seeded index by a pool of
+workers, each with its own keep-alive HTTP client, and every class gets its
+latency percentiles (p50/p95/p99) and throughput (QPS at that concurrency).
+
+Results travel like the other per-module measurements: the benchmark
+module calls record(), run_module() hands the module's results to
+MetricsCollector (through ModuleMetric, so shard workers return them too),
+and they land in the metrics history and the final summary -- so a backend
+change, e.g. the OpenSearch 2 vs 3 compose files, shows up as a tracked
+number per class. search_load replays UI journeys through the same engine,
+one browser context per worker.
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SearchRequest:
+    """One search API call of a query class"""
+    q: str
+    ex_q: Optional[str] = None
+    sort: Optional[str] = None
+    start: int = 0
+    num: int = 10
+
+
+@dataclass
+class QueryClass:
+    """A named group of requests replayed round-robin"""
+    name: str
+    requests: List[SearchRequest] = field(default_factory=list)
+
+
+@dataclass
+class BenchmarkResult:
+    """Latency (seconds) and throughput of one query class"""
+    query_class: str
+    concurrency: int
+    requests: int
+    errors: int
+    p50: float
+    p95: float
+    p99: float
+    qps: float
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(minimum, int(raw))
+    except ValueError:
+        logger.error(f"{name}={raw!r} is not a number; using {default}")
+        return default
+
+
+def benchmark_concurrency() -> int:
+    return _env_int("BENCHMARK_CONCURRENCY", 4, minimum=1)
+
+
+def benchmark_requests() -> int:
+    """Timed requests per query class"""
+    return _env_int("BENCHMARK_REQUESTS", 200, minimum=1)
+
+
+def benchmark_warmup() -> int:
+    """Untimed requests per query class, sent first"""
+    return _env_int("BENCHMARK_WARMUP", 10, minimum=0)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list
+
+    The value at rank ceil(fraction * n), counting from 1: p50 of four values
+    is the second, p95 of twenty the nineteenth.
+    """
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+# Search callable of a worker: (request) -> anything; raising is an error.
+Searcher = Callable[[SearchRequest], Any]
+
+
+def run_class(query_class: QueryClass, searchers: List[Searcher],
+              requests: int, warmup: int = 0) -> BenchmarkResult:
+    """
+    Replay one query class with one worker thread per searcher.
+
+    Args:
+        query_class: Requests to replay, round-robin
+        searchers: One per worker; each is only ever called from its worker
+        requests: Timed requests in total, split across the workers
+        warmup: Untimed requests sent before timing starts
+
+    Returns:
+        The class's BenchmarkResult
+    """
+    catalog = query_class.requests
+    for i in range(warmup):
+        try:
+            searchers[0](catalog[i % len(catalog)])
+        except Exception as e:
+            logger.debug(f"[BENCH] warmup {query_class.name}: {e}")
+
+    lock = threading.Lock()
+    next_index = [0]
+    latencies: List[float] = []
+    errors = [0]
+
+    def worker(search: Searcher) -> None:
+        while True:
+            with lock:
+                index = next_index[0]
+                if index >= requests:
+                    return
+                next_index[0] += 1
+            started = time.perf_counter()
+            try:
+                search(catalog[index % len(catalog)])
+                ok = True
+            except Exception as e:
+                logger.debug(f"[BENCH] {query_class.name}: {type(e).__name__}: {e}")
+                ok = False
+            elapsed = time.perf_counter() - started
+            with lock:
+                if ok:
+                    latencies.append(elapsed)
+                else:
+                    errors[0] += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(searchers)) as pool:
+        for future in [pool.submit(worker, search) for search in searchers]:
+            future.result()
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return BenchmarkResult(
+        query_class=query_class.name,
+        concurrency=len(searchers),
+        requests=len(latencies),
+        errors=errors[0],
+        p50=round(percentile(latencies, 0.50), 4) if latencies else 0.0,
+        p95=round(percentile(latencies, 0.95), 4) if latencies else 0.0,
+        p99=round(percentile(latencies, 0.99), 4) if latencies else 0.0,
+        qps=round(len(latencies) / wall, 1) if wall > 0 else 0.0,
+    )
+
+
+def error_rate(result: BenchmarkResult) -> float:
+    """Failed share of a class's timed requests"""
+    total = result.requests + result.errors
+    return result.errors / total if total else 0.0
+
+
+def print_results(results: List[BenchmarkResult]) -> None:
+    """Print a per-class latency table"""
+    if not results:
+        return
+    print("\n" + "="*70)
+    print("SEARCH BENCHMARK")
+    print("="*70)
+    print(f"  {'Class':<18} {'Conc':>4} {'Reqs':>5} {'Err%':>5} "
+          f"{'p50':>7} {'p95':>7} {'p99':>7} {'QPS':>6}")
+    for r in results:
+        print(f"  {r.query_class:<18} {r.concurrency:>4} {r.requests:>5} "
+              f"{error_rate(r) * 100:>5.1f} "
+              f"{r.p50 * 1000:>5.0f}ms {r.p95 * 1000:>5.0f}ms {r.p99 * 1000:>5.0f}ms "
+              f"{r.qps:>6.1f}")
+    print("="*70)
+
+
+# Per-thread module scope, as in eventually: a module's results are handed
+# to MetricsCollector by run_module().
+_scope = threading.local()
+
+
+def begin_module() -> None:
+    _scope.results = []
+
+
+def record(results: List[BenchmarkResult]) -> None:
+    """Attach benchmark results to the running module's metrics"""
+    if getattr(_scope, "results", None) is None:
+        _scope.results = []
+    _scope.results.extend(results)
+
+
+def end_module() -> List[BenchmarkResult]:
+    results = getattr(_scope, "results", None) or []
+    _scope.results = []
+    return results
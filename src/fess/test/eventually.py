@@ -0,0 +1,194 @@
+"""
+Shared "eventually" polling engine.
+
+Several modules wait for Fess to converge on something: the crawl indexing
+enough documents (search/seed), the crawler going idle and a delete-all
+becoming visible (sysinfo/deleteall), search logs being flushed
+(sysinfo/backup_download). Each used to hand-roll a deadline-and-sleep loop
+with a fixed interval. eventually() replaces them with one engine:
+
+  * exponential backoff from `initial` to `max_interval`, so a condition
+    that is already true costs one probe and a slow one is not hammered;
+  * observed progress (a `progress` value that moved) resets the interval,
+    so a condition that is visibly converging is caught promptly, and
+    `stall_timeout` gives up early when progress stops moving;
+  * rate-based ETA logging when a `target` for the progress value is known
+    (e.g. indexed docs per second);
+  * a time budget per module (POLL_BUDGET seconds, shared by every wait in
+    the module) that caps each call's own timeout.
+
+Every call is recorded as a PollRecord under its call-site name, and
+run_module() hands the records of each module to MetricsCollector, so the
+timeouts and intervals can be tuned from measured convergence times.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, List, Optional, Tuple, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# How often a wait that is not progressing says so at INFO level.
+STILL_WAITING_LOG_INTERVAL = 30.0
+
+
+@dataclass
+class PollRecord:
+    """How one eventually() call went"""
+    site: str
+    elapsed: float
+    attempts: int
+    converged: bool
+
+
+@dataclass
+class PollResult(Generic[T]):
+    """Outcome of eventually(): the last probed value and whether it converged"""
+    value: Optional[T]
+    converged: bool
+    elapsed: float
+    attempts: int
+
+
+# Per-thread module scope: parallel workers each run one module at a time in
+# their own thread, shard workers in their own process.
+_scope = threading.local()
+
+
+def _poll_budget() -> Optional[float]:
+    raw = os.environ.get("POLL_BUDGET", "").strip()
+    return float(raw) if raw else None
+
+
+def begin_module(budget: Optional[float] = None) -> None:
+    """Start collecting PollRecords for a module and start its time budget
+    (POLL_BUDGET seconds when `budget` is not given; none when unset)."""
+    budget = budget if budget is not None else _poll_budget()
+    _scope.records = []
+    _scope.budget_deadline = time.time() + budget if budget is not None else None
+
+
+def end_module() -> List[PollRecord]:
+    """Return the module's PollRecords and leave the module scope"""
+    records = getattr(_scope, "records", [])
+    _scope.records = []
+    _scope.budget_deadline = None
+    return records
+
+
+def _budget_remaining() -> Optional[float]:
+    deadline = getattr(_scope, "budget_deadline", None)
+    return None if deadline is None else max(0.0, deadline - time.time())
+
+
+def eventually(probe: Callable[[], T], done: Callable[[T], bool], *, name: str,
+               timeout: float, initial: float = 0.5, max_interval: float = 5.0,
+               factor: float = 2.0,
+               progress: Optional[Callable[[T], float]] = None,
+               target: Optional[float] = None, unit: str = "",
+               stall_timeout: Optional[float] = None,
+               on_wait: Optional[Callable[[Optional[T]], Any]] = None,
+               ignore: Tuple[Type[BaseException], ...] = ()) -> PollResult[T]:
+    """
+    Probe until `done(value)` holds, the timeout or module budget runs out,
+    or progress stalls. Never raises on not converging: the caller owns the
+    assertion and its message.
+
+    Args:
+        probe: Returns the current value (a count, a page state, ...)
+        done: Whether the value is the one being waited for
+        name: Call-site name the convergence time is recorded under
+        timeout: Longest wait in seconds (capped by the module's budget)
+        initial: First interval between probes, in seconds
+        max_interval: Cap of the exponentially growing interval
+        factor: Interval growth per probe without progress
+        progress: Maps a value to a number that grows as it converges
+        target: Value of `progress` at which `done` is expected (for ETAs)
+        unit: Unit of `progress` for log lines (e.g. "docs")
+        stall_timeout: Give up when `progress` has not moved for this long
+        on_wait: Called with the last value before each sleep (e.g. to
+            generate the traffic being waited for)
+        ignore: Exceptions from `probe` that mean "not yet" rather than error
+
+    Returns:
+        PollResult with the last value (None if every probe raised)
+    """
+    started = time.time()
+    remaining = _budget_remaining()
+    if remaining is not None and remaining < timeout:
+        logger.info(f"{name}: module poll budget leaves {remaining:.0f}s of {timeout:.0f}s")
+        timeout = remaining
+    deadline = started + timeout
+
+    interval = initial
+    attempts = 0
+    value: Optional[T] = None
+    converged = False
+    first_progress: Optional[float] = None
+    last_progress: Optional[float] = None
+    last_progress_at = started
+    last_log_at = started
+
+    while True:
+        attempts += 1
+        try:
+            value = probe()
+        except ignore as e:
+            logger.debug(f"{name}: probe failed ({type(e).__name__}): {e}")
+        else:
+            if done(value):
+                converged = True
+                break
+            if progress is not None:
+                current = progress(value)
+                now = time.time()
+                if first_progress is None:
+                    first_progress = current
+                if last_progress is None or current != last_progress:
+                    if last_progress is not None and current > last_progress:
+                        # Moving: look again soon rather than backing off further.
+                        interval = initial
+                    _log_progress(name, current, first_progress, target, unit, now - started)
+                    last_progress, last_progress_at, last_log_at = current, now, now
+                elif stall_timeout is not None and now - last_progress_at >= stall_timeout:
+                    logger.info(f"{name}: no progress for {stall_timeout:.0f}s; giving up")
+                    break
+
+        now = time.time()
+        if now >= deadline:
+            break
+        if now - last_log_at >= STILL_WAITING_LOG_INTERVAL:
+            logger.info(f"{name}: still waiting after {now - started:.0f}s")
+            last_log_at = now
+        if on_wait is not None:
+            on_wait(value)
+        time.sleep(min(interval, max(0.0, deadline - time.time())))
+        interval = min(interval * factor, max_interval)
+
+    elapsed = time.time() - started
+    level = logging.DEBUG if converged else logging.INFO
+    logger.log(level, f"{name}: {'converged' if converged else 'did not converge'} "
+                      f"after {elapsed:.1f}s ({attempts} probe(s))")
+    records = getattr(_scope, "records", None)
+    if records is not None:
+        records.append(PollRecord(name, elapsed, attempts, converged))
+    return PollResult(value, converged, elapsed, attempts)
+
+
+def _log_progress(name: str, current: float, first: float, target: Optional[float],
+                  unit: str, elapsed: float) -> None:
+    """Log a progress change, with rate and ETA once a rate is measurable"""
+    suffix = f" {unit}" if unit else ""
+    message = f"{name}: {current:g}{suffix}"
+    if target is not None:
+        message = f"{name}: {current:g}/{target:g}{suffix}"
+        rate = (current - first) / elapsed if elapsed > 0 else 0.0
+        if rate > 0:
+            eta = max(0.0, (target - current) / rate)
+            message += f" ({rate:.1f}{suffix}/s, ETA {eta:.0f}s)"
+    logger.info(message)
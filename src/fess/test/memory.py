@@ -0,0 +1,178 @@
+"""
+Browser memory per module, and page recycling when it grows too far.
+
+FessContext keeps one page open for the whole run -- more than eighty
+top-level modules -- so whatever Fess's admin JavaScript or our own
+page.evaluate() listeners (console_errors) leave behind adds up, and a slow
+or crashing page late in the run says nothing about which module leaked.
+
+After every module, run_module() asks the context for a checkpoint: the
+sampler collects garbage and reads CDP Performance.getMetrics for the page
+(JS heap used/total, DOM nodes, event listeners, documents). Each module's
+MemoryRecord holds the sample, its growth over the previous sample (the
+module's own share) and over the page's first sample. When the growth since
+the page was opened passes a threshold (MEMORY_RECYCLE_HEAP_MB,
+MEMORY_RECYCLE_NODES, MEMORY_RECYCLE_LISTENERS), the context closes the page;
+the next module gets a fresh one in the same browser context, so the login
+session is kept.
+
+The records travel on ModuleMetric like the other per-module measurements:
+the history keeps each module's growth, and the summary lists the modules
+that grew the page the most. CDP is Chromium-only; where a CDP session
+cannot be opened, sampling is off for that page and records are None.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import CDPSession, Page
+
+logger = logging.getLogger(__name__)
+
+# MemorySample field -> CDP Performance.getMetrics name
+CDP_METRICS = {
+    "heap_used": "JSHeapUsedSize",
+    "heap_total": "JSHeapTotalSize",
+    "nodes": "Nodes",
+    "listeners": "JSEventListeners",
+    "documents": "Documents",
+}
+
+MB = 1024 * 1024
+
+
+@dataclass
+class MemorySample:
+    """Page memory: JS heap in bytes, DOM and listener counts"""
+    heap_used: int = 0
+    heap_total: int = 0
+    nodes: int = 0
+    listeners: int = 0
+    documents: int = 0
+
+    def minus(self, other: "MemorySample") -> "MemorySample":
+        return MemorySample(**{name: getattr(self, name) - getattr(other, name)
+                               for name in CDP_METRICS})
+
+
+@dataclass
+class MemoryRecord:
+    """Page memory after one module"""
+    after: MemorySample
+    growth: MemorySample          # during the module
+    since_opened: MemorySample    # since the page was opened
+    recycled: bool = False
+
+
+def memory_sampling_enabled() -> bool:
+    return os.environ.get("MEMORY_SAMPLING", "true").lower() == "true"
+
+
+def recycle_thresholds() -> MemorySample:
+    """Growth since the page was opened that gets it recycled; 0 disables
+    a bound."""
+    return MemorySample(
+        heap_used=int(float(os.environ.get("MEMORY_RECYCLE_HEAP_MB", "64")) * MB),
+        nodes=int(os.environ.get("MEMORY_RECYCLE_NODES", "10000")),
+        listeners=int(os.environ.get("MEMORY_RECYCLE_LISTENERS", "2000")),
+    )
+
+
+def exceeds(growth: MemorySample, thresholds: MemorySample) -> List[str]:
+    """Names of the bounds the growth passed"""
+    return [name for name in ("heap_used", "nodes", "listeners")
+            if getattr(thresholds, name) > 0 and getattr(growth, name) > getattr(thresholds, name)]
+
+
+def parse_metrics(metrics: List[Dict]) -> MemorySample:
+    """MemorySample from a Performance.getMetrics response's metrics list"""
+    values = {m["name"]: m["value"] for m in metrics}
+    return MemorySample(**{name: int(values.get(cdp, 0)) for name, cdp in CDP_METRICS.items()})
+
+
+class MemorySampler:
+    """Samples one page at a time over its CDP session"""
+
+    def __init__(self):
+        self._enabled = memory_sampling_enabled()
+        self._session: Optional["CDPSession"] = None
+        self._page: Optional["Page"] = None
+        self._opened: Optional[MemorySample] = None
+        self._last: Optional[MemorySample] = None
+
+    def attach(self, page: "Page") -> None:
+        """Start sampling a newly opened page; its first sample is the
+        baseline growth is measured from."""
+        self.detach()
+        if not self._enabled:
+            return
+        try:
+            session = page.context.new_cdp_session(page)
+            session.send("Performance.enable")
+        except Exception as e:
+            logger.debug(f"[MEMORY] No CDP session, memory sampling off: {e}")
+            return
+        self._session, self._page = session, page
+        self._opened = self._last = self._sample()
+
+    def detach(self) -> None:
+        if self._session is not None:
+            try:
+                self._session.detach()
+            except Exception as e:
+                logger.debug(f"[MEMORY] Detach: {e}")
+        self._session = self._page = self._opened = self._last = None
+
+    def _sample(self) -> MemorySample:
+        # Garbage first: what survives a collection is what leaked.
+        self._session.send("HeapProfiler.collectGarbage")
+        return parse_metrics(self._session.send("Performance.getMetrics")["metrics"])
+
+    def checkpoint(self) -> Optional[MemoryRecord]:
+        """
+        Sample the page after a module.
+
+        Returns:
+            The module's MemoryRecord, with recycled set when the page has
+            grown past the thresholds; None when nothing is being sampled
+        """
+        if self._session is None or self._page.is_closed():
+            return None
+        try:
+            after = self._sample()
+        except Exception as e:
+            logger.debug(f"[MEMORY] Sampling failed: {e}")
+            return None
+        record = MemoryRecord(after, after.minus(self._last), after.minus(self._opened))
+        self._last = after
+        passed = exceeds(record.since_opened, recycle_thresholds())
+        if passed:
+            record.recycled = True
+            logger.info(f"[MEMORY] Page grew past the {', '.join(passed)} threshold "
+                        f"(heap +{record.since_opened.heap_used / MB:.1f}MB, "
+                        f"nodes +{record.since_opened.nodes}, "
+                        f"listeners +{record.since_opened.listeners}); recycling it")
+        return record
+
+
+def print_summary(records: Dict[str, MemoryRecord], limit: int = 10) -> None:
+    """Print the modules that grew the page the most"""
+    if not records:
+        return
+    print("\n" + "="*70)
+    print("BROWSER MEMORY GROWTH PER MODULE (after GC)")
+    print("="*70)
+    print(f"  {'Module':<28} {'Heap':>9} {'Nodes':>7} {'Listeners':>9}  Heap after")
+    ranked = sorted(records.items(), key=lambda item: item[1].growth.heap_used, reverse=True)
+    for module, record in ranked[:limit]:
+        mark = "  (recycled)" if record.recycled else ""
+        print(f"  {module:<28} {record.growth.heap_used / MB:>+7.1f}MB "
+              f"{record.growth.nodes:>+7} {record.growth.listeners:>+9}  "
+              f"{record.after.heap_used / MB:>7.1f}MB{mark}")
+    recycled = sum(1 for record in records.values() if record.recycled)
+    if recycled:
+        print(f"  Page recycled {recycled} time(s)")
+    print("="*70)
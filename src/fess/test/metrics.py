@@ -8,12 +8,37 @@ detect performance regressions, and maintain historical data.
 import json
 import logging
 import os
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from typing import List, Dict, Optional
 
+from fess.test.benchmark import BenchmarkResult, percentile, print_results as print_benchmark_results
+from fess.test.eventually import PollRecord
+from fess.test.memory import MB, MemoryRecord, print_summary as print_memory_summary
+from fess.test.network import Exchange
+from fess.test.page_timing import NavigationTiming
+
 logger = logging.getLogger(__name__)
 
+# Planning estimate for a module when no run in the history has timed one.
+DEFAULT_MODULE_ESTIMATE = 30.0
+
+# Upper bounds (seconds) of the per-action latency histogram buckets; the
+# last bucket catches everything slower.
+ACTION_HISTOGRAM_BOUNDS = [0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+
+# How many individual calls / targets the action report ranks.
+SLOWEST_ACTIONS = 25
+
+
+@dataclass
+class ActionTiming:
+    """One timed PageWrapper call"""
+    action: str  # click, fill, goto, wait_for_selector, ...
+    target: str  # selector, URL, load state or screenshot path
+    duration: float
+    ok: bool = True
+
 
 @dataclass
 class ModuleMetric:
@@ -22,6 +47,13 @@ class ModuleMetric:
     duration: float
     status: str
     timestamp: str
+    pacing: float = 0.0  # part of duration spent in PageWrapper pacing
+    actions: List[ActionTiming] = field(default_factory=list)
+    navigations: List[NavigationTiming] = field(default_factory=list)
+    network: List[Exchange] = field(default_factory=list)
+    polls: List[PollRecord] = field(default_factory=list)
+    benchmark: List[BenchmarkResult] = field(default_factory=list)
+    memory: Optional[MemoryRecord] = None
 
 
 @dataclass
@@ -31,6 +63,13 @@ class MetricsSummary:
     module_durations: Dict[str, float]
     timestamp: str
     environment: Dict[str, str]
+    module_pacing: Dict[str, float] = field(default_factory=dict)
+    # Longest convergence time per eventually() call site in the run
+    poll_durations: Dict[str, float] = field(default_factory=dict)
+    # Search benchmark per query class: p50/p95/p99 (s), qps, requests, errors
+    benchmark: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    # Browser memory growth per module: heap (MB), DOM nodes, listeners
+    memory_growth: Dict[str, Dict[str, float]] = field(default_factory=dict)
 
 
 class MetricsCollector:
@@ -40,16 +79,56 @@ class MetricsCollector:
         self.history_file = history_file
         self.current_metrics: List[ModuleMetric] = []
 
-    def add_metric(self, module: str, duration: float, status: str):
+    def add_metric(self, module: str, duration: float, status: str, pacing: float = 0.0,
+                   actions: Optional[List[ActionTiming]] = None,
+                   navigations: Optional[List[NavigationTiming]] = None,
+                   network: Optional[List[Exchange]] = None,
+                   polls: Optional[List[PollRecord]] = None,
+                   benchmark: Optional[List[BenchmarkResult]] = None,
+                   memory: Optional[MemoryRecord] = None):
         """Add a metric for a module execution"""
         metric = ModuleMetric(
             module=module,
             duration=duration,
             status=status,
-            timestamp=datetime.now().isoformat()
+            timestamp=datetime.now().isoformat(),
+            pacing=pacing,
+            actions=actions or [],
+            navigations=navigations or [],
+            network=network or [],
+            polls=polls or [],
+            benchmark=benchmark or [],
+            memory=memory
         )
         self.current_metrics.append(metric)
 
+    def add_module_metric(self, metric: ModuleMetric):
+        """Add a metric recorded elsewhere (e.g. by a shard worker process)"""
+        self.current_metrics.append(metric)
+
+    def _poll_durations(self) -> Dict[str, float]:
+        """Longest convergence time per polling call site"""
+        durations: Dict[str, float] = {}
+        for metric in self.current_metrics:
+            for poll in metric.polls:
+                durations[poll.site] = round(max(durations.get(poll.site, 0.0), poll.elapsed), 2)
+        return durations
+
+    def _benchmark(self) -> Dict[str, Dict[str, float]]:
+        """Search benchmark results of the run, keyed by query class"""
+        return {r.query_class: {'p50': r.p50, 'p95': r.p95, 'p99': r.p99, 'qps': r.qps,
+                                'requests': r.requests, 'errors': r.errors,
+                                'concurrency': r.concurrency}
+                for metric in self.current_metrics for r in metric.benchmark}
+
+    def _memory_growth(self) -> Dict[str, Dict[str, float]]:
+        """Browser memory growth of each sampled module"""
+        return {m.module: {'heap_mb': round(m.memory.growth.heap_used / MB, 2),
+                           'nodes': m.memory.growth.nodes,
+                           'listeners': m.memory.growth.listeners,
+                           'recycled': m.memory.recycled}
+                for m in self.current_metrics if m.memory is not None}
+
     def get_summary(self) -> MetricsSummary:
         """Get summary of current execution metrics"""
         total_duration = sum(m.duration for m in self.current_metrics)
@@ -61,8 +140,13 @@ class MetricsCollector:
             timestamp=datetime.now().isoformat(),
             environment={
                 'fess_url': os.environ.get('FESS_URL', 'unknown'),
-                'headless': os.environ.get('HEADLESS', 'unknown')
-            }
+                'headless': os.environ.get('HEADLESS', 'unknown'),
+                'pacing': os.environ.get('PACING', 'adaptive')
+            },
+            module_pacing={m.module: m.pacing for m in self.current_metrics},
+            poll_durations=self._poll_durations(),
+            benchmark=self._benchmark(),
+            memory_growth=self._memory_growth()
         )
 
     def save_history(self):
@@ -85,6 +169,61 @@ class MetricsCollector:
 
         logger.info(f"Metrics history saved to {self.history_file}")
 
+    def get_action_report(self) -> Dict:
+        """
+        Per-module, per-action-type latency histograms plus the slowest
+        individual calls and targets (selectors/URLs) of the run.
+
+        Returns:
+            JSON-serializable report
+        """
+        modules: Dict[str, Dict[str, Dict]] = {}
+        targets: Dict[tuple, Dict] = {}
+        calls = []
+        for metric in self.current_metrics:
+            by_action: Dict[str, List[ActionTiming]] = {}
+            for timing in metric.actions:
+                by_action.setdefault(timing.action, []).append(timing)
+                calls.append((metric.module, timing))
+                key = (timing.action, timing.target)
+                entry = targets.setdefault(key, {
+                    'action': timing.action, 'target': timing.target,
+                    'count': 0, 'failures': 0, 'total': 0.0, 'max': 0.0,
+                    'modules': set()})
+                entry['count'] += 1
+                entry['failures'] += 0 if timing.ok else 1
+                entry['total'] += timing.duration
+                entry['max'] = max(entry['max'], timing.duration)
+                entry['modules'].add(metric.module)
+            if by_action:
+                modules[metric.module] = {
+                    action: _action_stats(timings)
+                    for action, timings in sorted(by_action.items())}
+
+        calls.sort(key=lambda c: c[1].duration, reverse=True)
+        slowest_targets = sorted(targets.values(), key=lambda t: t['total'], reverse=True)
+        for entry in slowest_targets:
+            entry['modules'] = sorted(entry['modules'])
+            entry['total'] = round(entry['total'], 3)
+            entry['max'] = round(entry['max'], 3)
+
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'histogram_bounds': ACTION_HISTOGRAM_BOUNDS,
+            'modules': modules,
+            'slowest_calls': [
+                {'module': module, **asdict(timing), 'duration': round(timing.duration, 3)}
+                for module, timing in calls[:SLOWEST_ACTIONS]],
+            'slowest_targets': slowest_targets[:SLOWEST_ACTIONS],
+        }
+
+    def save_action_timings(self, filename: str = 'test_action_timings.json'):
+        """Save the action latency report next to the metrics history file"""
+        path = os.path.join(os.path.dirname(self.history_file), filename)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.get_action_report(), f, indent=2, ensure_ascii=False)
+        logger.info(f"Action timings saved to {path}")
+
     def _load_history(self) -> List[Dict]:
         """Load historical metrics"""
         if not os.path.exists(self.history_file):
@@ -130,6 +269,139 @@ class MetricsCollector:
 
         return regressions
 
+    def detect_benchmark_regressions(self, threshold: float = 1.5,
+                                     stat: str = 'p95') -> List[str]:
+        """
+        Detect search benchmark query classes whose latency regressed against
+        the baseline (median of the last 10 runs at the same concurrency).
+
+        Args:
+            threshold: Multiplier for regression detection (e.g., 1.5 = 50% slower)
+            stat: Latency statistic to compare (p50, p95, p99)
+
+        Returns:
+            List of query classes with detected regressions
+        """
+        current = self._benchmark()
+        if not current:
+            return []
+        baseline_values: Dict[str, List[float]] = {}
+        for entry in self._load_history()[:-1][-10:]:
+            for name, stats in entry.get('benchmark', {}).items():
+                if name in current and stats.get('concurrency') == current[name]['concurrency']:
+                    baseline_values.setdefault(name, []).append(stats[stat])
+
+        regressions = []
+        for name, stats in current.items():
+            values = sorted(baseline_values.get(name, []))
+            if not values:
+                continue
+            baseline = values[len(values) // 2]
+            if baseline > 0 and stats[stat] > baseline * threshold:
+                regressions.append(name)
+                logger.warning(
+                    f"Search benchmark regression in {name}: {stat} "
+                    f"{stats[stat] * 1000:.0f}ms vs baseline {baseline * 1000:.0f}ms "
+                    f"({stats[stat]/baseline:.1f}x slower)"
+                )
+        return regressions
+
+    def estimate_durations(self, modules: List[str]) -> Dict[str, float]:
+        """
+        Expected duration of each module, for planning parallel and sharded runs.
+
+        Uses the same baseline as detect_regressions() (median of the last 10
+        runs). A module with no history is estimated at the median of the
+        modules that have one -- a typical module, neither the slowest nor a
+        trivial one -- or DEFAULT_MODULE_ESTIMATE when there is no history.
+
+        Args:
+            modules: Module names as they appear in the history
+
+        Returns:
+            Estimated duration in seconds per module name
+        """
+        baseline = self._calculate_baseline(self._load_history())
+        known = sorted(baseline.values())
+        fallback = known[len(known) // 2] if known else DEFAULT_MODULE_ESTIMATE
+
+        estimates = {}
+        for module in modules:
+            if module in baseline:
+                estimates[module] = baseline[module]
+            else:
+                logger.debug(f"No duration history for {module}; estimating {fallback:.1f}s")
+                estimates[module] = fallback
+        return estimates
+
+    def _print_pacing_summary(self, summary: MetricsSummary):
+        """Print how much of the run was pacing (fixed delays, waiting for
+        pages to settle) rather than the tests themselves."""
+        total_pacing = sum(summary.module_pacing.values())
+        if total_pacing <= 0:
+            return
+
+        total = summary.total_duration
+        share = total_pacing / total * 100 if total > 0 else 0.0
+        print(f"\nPACING (profile: {summary.environment.get('pacing')}):")
+        print(f"  {'Pacing':<20} {total_pacing:>8.2f}s ({share:.1f}%)")
+        print(f"  {'Real work':<20} {total - total_pacing:>8.2f}s")
+
+        print("  Most paced modules:")
+        most_paced = sorted(summary.module_pacing.items(),
+                            key=lambda x: x[1], reverse=True)[:5]
+        for module, pacing in most_paced:
+            if pacing > 0:
+                print(f"    {module:<18} {pacing:>8.2f}s")
+        print("="*70)
+
+    def _print_action_summary(self):
+        """Print where module time went by kind of browser action, and the
+        slowest individual calls (details in test_action_timings.json)."""
+        timings = [t for m in self.current_metrics for t in m.actions]
+        if not timings:
+            return
+
+        print("\nTIME BY ACTION TYPE:")
+        by_action: Dict[str, List[ActionTiming]] = {}
+        for timing in timings:
+            by_action.setdefault(timing.action, []).append(timing)
+        for action, group in sorted(by_action.items(),
+                                    key=lambda x: sum(t.duration for t in x[1]),
+                                    reverse=True):
+            stats = _action_stats(group)
+            failed = f"  {stats['failures']} failed" if stats['failures'] else ""
+            print(f"  {action:<20} {stats['total']:>8.2f}s  n={stats['count']:<5} "
+                  f"p95={stats['p95']:.2f}s{failed}")
+
+        print("\nSLOWEST ACTIONS:")
+        for module, timing in sorted(((m.module, t) for m in self.current_metrics
+                                      for t in m.actions),
+                                     key=lambda c: c[1].duration, reverse=True)[:5]:
+            failed = "" if timing.ok else " (failed)"
+            print(f"  {timing.duration:>7.2f}s {module:<20} {timing.action} "
+                  f"{timing.target[:60]}{failed}")
+        print("="*70)
+
+    def _print_poll_summary(self):
+        """Print how long each polling call site took to converge"""
+        by_site: Dict[str, List[PollRecord]] = {}
+        for metric in self.current_metrics:
+            for poll in metric.polls:
+                by_site.setdefault(poll.site, []).append(poll)
+        if not by_site:
+            return
+
+        print("\nPOLLING (time to converge per call site):")
+        for site, polls in sorted(by_site.items(),
+                                  key=lambda x: max(p.elapsed for p in x[1]),
+                                  reverse=True):
+            timeouts = sum(1 for p in polls if not p.converged)
+            failed = f"  {timeouts} did not converge" if timeouts else ""
+            print(f"  {site:<36} n={len(polls):<3} max={max(p.elapsed for p in polls):>7.1f}s "
+                  f"probes={sum(p.attempts for p in polls)}{failed}")
+        print("="*70)
+
     def _calculate_baseline(self, history: List[Dict]) -> Dict[str, float]:
         """Calculate baseline durations from historical data"""
         # Take last 10 entries
@@ -182,6 +454,14 @@ class MetricsCollector:
 
         print("="*70)
 
+        self._print_pacing_summary(summary)
+        self._print_action_summary()
+        self._print_poll_summary()
+        print_benchmark_results([r for metric in self.current_metrics
+                                 for r in metric.benchmark])
+        print_memory_summary({m.module: m.memory for m in self.current_metrics
+                              if m.memory is not None})
+
         # Check for regressions
         regressions = self.detect_regressions()
         if regressions:
@@ -190,4 +470,30 @@ class MetricsCollector:
                 print(f"  - {module}")
             print("="*70)
 
+        benchmark_regressions = self.detect_benchmark_regressions()
+        if benchmark_regressions:
+            print("\n⚠ SEARCH BENCHMARK REGRESSIONS DETECTED (p95):")
+            for name in benchmark_regressions:
+                print(f"  - {name}")
+            print("="*70)
+
         print()
+
+
+def _action_stats(timings: List[ActionTiming]) -> Dict:
+    """Count, totals, percentiles and histogram of one group of actions"""
+    durations = sorted(t.duration for t in timings)
+    histogram = [0] * (len(ACTION_HISTOGRAM_BOUNDS) + 1)
+    for duration in durations:
+        bucket = next((i for i, bound in enumerate(ACTION_HISTOGRAM_BOUNDS)
+                       if duration <= bound), len(ACTION_HISTOGRAM_BOUNDS))
+        histogram[bucket] += 1
+    return {
+        'count': len(durations),
+        'failures': sum(1 for t in timings if not t.ok),
+        'total': round(sum(durations), 3),
+        'p50': round(percentile(durations, 0.5), 3),
+        'p95': round(percentile(durations, 0.95), 3),
+        'max': round(durations[-1], 3),
+        'histogram': histogram,
+    }
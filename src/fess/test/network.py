@@ -0,0 +1,221 @@
+"""
+Per-module network waterfall.
+
+NetworkRecorder listens to the request/response/requestfinished/requestfailed
+events of a FessContext's browser context and keeps one Exchange per HTTP
+request made while a module runs: method, URL, route template, status,
+bytes and the timing phases Playwright reports for it.
+
+NetworkCollector turns those into a per-module report of the slowest
+endpoints and of identical requests fetched more than once (the menu-click
+navigation chains in the CRUD modules reload /admin/ and the same static
+assets over and over), writes it to test_network.json and prints the
+highlights in the final summary.
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, TYPE_CHECKING
+from urllib.parse import urlparse
+
+from fess.test.page_timing import normalize_route
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Request, Response
+
+logger = logging.getLogger(__name__)
+
+# How many endpoints / repeated fetches the report keeps per module.
+NETWORK_REPORT_LIMIT = 10
+
+
+@dataclass
+class Exchange:
+    """One HTTP request/response seen by the browser (times in ms)"""
+    method: str
+    url: str
+    template: str  # route with ids replaced, host kept for third-party URLs
+    resource_type: str
+    status: Optional[int]  # None when the request failed
+    bytes: Optional[int]  # Content-Length; None when not sent (chunked)
+    dns: float
+    connect: float
+    wait: float  # request sent to first byte
+    download: float
+    duration: float
+    failure: Optional[str] = None
+
+
+def _network_record_enabled() -> bool:
+    return os.environ.get("NETWORK_RECORD", "true").lower() == "true"
+
+
+def _phase(timing: Dict[str, float], start: str, end: str) -> float:
+    """Length of a timing phase; 0 when the phase did not happen (-1 markers)"""
+    if timing.get(start, -1) < 0 or timing.get(end, -1) < 0:
+        return 0.0
+    return round(timing[end] - timing[start], 1)
+
+
+class NetworkRecorder:
+    """Collects the Exchanges of one browser context"""
+
+    def __init__(self, base_url: str):
+        self.enabled = _network_record_enabled()
+        self._base_host = urlparse(base_url).netloc
+        # Status and size arrive with the response event; the timing is only
+        # complete at requestfinished. Keyed by request object identity.
+        self._responses: Dict[int, "Response"] = {}
+        self.exchanges: List[Exchange] = []
+
+    def attach(self, browser_context: "BrowserContext") -> None:
+        """Listen on the browser context, which covers every page it opens"""
+        if not self.enabled:
+            return
+        browser_context.on("response", self._on_response)
+        browser_context.on("requestfinished", self._on_finished)
+        browser_context.on("requestfailed", self._on_failed)
+
+    def _template(self, url: str) -> str:
+        parsed = urlparse(url)
+        route = normalize_route(url)
+        if parsed.netloc and parsed.netloc != self._base_host:
+            return f"{parsed.netloc}{route}"
+        return route
+
+    def _on_response(self, response: "Response") -> None:
+        self._responses[id(response.request)] = response
+
+    def _on_finished(self, request: "Request") -> None:
+        self._record(request, self._responses.pop(id(request), None), None)
+
+    def _on_failed(self, request: "Request") -> None:
+        self._responses.pop(id(request), None)
+        self._record(request, None, request.failure or "failed")
+
+    def _record(self, request: "Request", response: Optional["Response"],
+                failure: Optional[str]) -> None:
+        # Handlers run inside Playwright's event dispatch: never let them raise.
+        try:
+            if not request.url.startswith("http"):
+                return
+            timing = request.timing
+            length = response.headers.get("content-length") if response else None
+            exchange = Exchange(
+                method=request.method,
+                url=request.url,
+                template=self._template(request.url),
+                resource_type=request.resource_type,
+                status=response.status if response else None,
+                bytes=int(length) if length and length.isdigit() else None,
+                dns=_phase(timing, "domainLookupStart", "domainLookupEnd"),
+                connect=_phase(timing, "connectStart", "connectEnd"),
+                wait=_phase(timing, "requestStart", "responseStart"),
+                download=_phase(timing, "responseStart", "responseEnd"),
+                duration=round(max(timing.get("responseEnd", -1), 0.0), 1),
+                failure=failure,
+            )
+            self.exchanges.append(exchange)
+            logger.debug(f"[NET] {exchange.method} {exchange.status} {exchange.url} "
+                         f"{exchange.duration}ms")
+        except Exception as e:
+            logger.debug(f"[NET] could not record {request.url}: {e}")
+
+    def take(self) -> List[Exchange]:
+        """Return the exchanges recorded since the last call and start a new list."""
+        exchanges = self.exchanges
+        self.exchanges = []
+        return exchanges
+
+
+def summarize_exchanges(exchanges: List[Exchange]) -> Dict:
+    """Request count, bytes, slowest endpoints and repeated fetches of one module"""
+    endpoints: Dict[tuple, Dict] = {}
+    fetches: Dict[tuple, int] = {}
+    for exchange in exchanges:
+        key = (exchange.method, exchange.template)
+        entry = endpoints.setdefault(key, {
+            'method': exchange.method, 'template': exchange.template,
+            'count': 0, 'errors': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'bytes': 0})
+        entry['count'] += 1
+        entry['total_ms'] += exchange.duration
+        entry['max_ms'] = max(entry['max_ms'], exchange.duration)
+        entry['bytes'] += exchange.bytes or 0
+        if exchange.status is None or exchange.status >= 400:
+            entry['errors'] += 1
+        if exchange.method == 'GET':
+            fetches[(exchange.method, exchange.url)] = fetches.get(
+                (exchange.method, exchange.url), 0) + 1
+
+    for entry in endpoints.values():
+        entry['total_ms'] = round(entry['total_ms'], 1)
+    slowest = sorted(endpoints.values(), key=lambda e: e['total_ms'], reverse=True)
+    repeated = sorted(((count, method, url) for (method, url), count in fetches.items()
+                       if count > 1), reverse=True)
+    return {
+        'requests': len(exchanges),
+        'bytes': sum(e.bytes or 0 for e in exchanges),
+        'total_ms': round(sum(e.duration for e in exchanges), 1),
+        'slowest_endpoints': slowest[:NETWORK_REPORT_LIMIT],
+        'repeated_fetches': [{'method': method, 'url': url, 'count': count}
+                             for count, method, url in repeated[:NETWORK_REPORT_LIMIT]],
+        'redundant_requests': sum(count - 1 for count, _, _ in repeated),
+    }
+
+
+class NetworkCollector:
+    """Aggregates per-module exchanges into the network report"""
+
+    def __init__(self):
+        self.modules: Dict[str, List[Exchange]] = {}
+
+    def add(self, module: str, exchanges: List[Exchange]):
+        """Add the exchanges recorded while a module ran"""
+        if exchanges:
+            self.modules.setdefault(module, []).extend(exchanges)
+
+    def get_report(self) -> Dict:
+        """Per-module summaries, ordered by time spent on the network"""
+        modules = {module: summarize_exchanges(exchanges)
+                   for module, exchanges in self.modules.items()}
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'modules': dict(sorted(modules.items(),
+                                   key=lambda x: x[1]['total_ms'], reverse=True)),
+        }
+
+    def save_json(self, filepath: str = 'test_network.json'):
+        """Save the network report"""
+        if not self.modules:
+            return
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.get_report(), f, indent=2, ensure_ascii=False)
+        logger.info(f"Network report saved to {filepath}")
+
+    def print_summary(self, limit: int = 5):
+        """Print the busiest modules and the most repeated fetches"""
+        report = self.get_report()['modules']
+        if not report:
+            return
+
+        print("\n" + "="*70)
+        print("NETWORK (per module)")
+        print("="*70)
+        print(f"  {'Module':<20} {'Requests':>8} {'Redundant':>9} {'KB':>8} {'Time':>9}")
+        busiest = sorted(report.items(), key=lambda x: x[1]['requests'], reverse=True)
+        for module, summary in busiest[:limit]:
+            print(f"  {module:<20} {summary['requests']:>8} {summary['redundant_requests']:>9} "
+                  f"{summary['bytes'] / 1024:>8.0f} {summary['total_ms'] / 1000:>8.2f}s")
+
+        repeated = sorted(((r['count'], module, r['url'])
+                           for module, summary in report.items()
+                           for r in summary['repeated_fetches']), reverse=True)
+        if repeated:
+            print("\nMOST REPEATED FETCHES:")
+            for count, module, url in repeated[:limit]:
+                print(f"  {count:>4}x {module:<20} {url[:60]}")
+        print("="*70)
+        print()
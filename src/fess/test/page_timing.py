@@ -0,0 +1,277 @@
+"""
+Browser-side page performance per Fess route.
+
+Module wall time blends navigation, typing, assertions and waiting together.
+This module reads what the browser itself measured for each page load -- the
+Navigation Timing and Paint Timing entries -- and keeps it per normalized
+route (``/admin/labeltype/details/{id}/``), so UI latency can be compared
+across Fess images and runs the way MetricsCollector compares modules.
+
+PageWrapper records a NavigationTiming after every goto and after every click
+that loaded a new document (see NavigationRecorder). PageTimingCollector
+aggregates them per route, keeps a history file, and flags routes whose
+median load time regressed against the baseline of recent runs.
+"""
+
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, TYPE_CHECKING
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+logger = logging.getLogger(__name__)
+
+TIMING_FIELDS = ('ttfb', 'dcl', 'load', 'fcp', 'transfer_size')
+
+# Returns null when the page still shows the document last recorded (the
+# click did not navigate); otherwise waits briefly for the load event so
+# loadEventEnd is filled in for click-initiated navigations.
+_NAVIGATION_SCRIPT = """
+async ({lastOrigin, loadWaitMs}) => {
+  if (performance.timeOrigin === lastOrigin) return null;
+  let nav = performance.getEntriesByType('navigation')[0];
+  if (!nav) return null;
+  if (!nav.loadEventEnd) {
+    await new Promise(resolve => {
+      window.addEventListener('load', () => setTimeout(resolve, 0), {once: true});
+      setTimeout(resolve, loadWaitMs);
+    });
+    nav = performance.getEntriesByType('navigation')[0];
+  }
+  const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+  return {
+    origin: performance.timeOrigin,
+    url: location.href,
+    ttfb: nav.responseStart,
+    dcl: nav.domContentLoadedEventEnd,
+    load: nav.loadEventEnd || null,
+    fcp: fcp ? fcp.startTime : null,
+    transfer_size: nav.transferSize,
+  };
+}
+"""
+
+# A route segment that is a word (labeltype, details, createnew, style.css)
+# or a short version tag (v1, v2) is kept; anything else -- numbers,
+# generated ids, base64 dictionary ids -- is an identifier.
+_WORD_SEGMENT = re.compile(r'^[A-Za-z][A-Za-z._\-]*$')
+_VERSION_SEGMENT = re.compile(r'^v[0-9]{1,2}$')
+
+
+@dataclass
+class NavigationTiming:
+    """Timings (ms from navigation start) of one page load"""
+    route: str
+    url: str
+    ttfb: float
+    dcl: float
+    load: Optional[float]
+    fcp: Optional[float]
+    transfer_size: int
+
+
+def normalize_route(url: str) -> str:
+    """
+    Reduce a URL to its Fess route: path only, identifiers replaced by {id}.
+
+    Consecutive identifiers collapse into one, so
+    /admin/labeltype/details/4/AbC12xYz/ and
+    /admin/dict/kuromoji/details/amEva3Vyb21vamkudHh0/4/5 become
+    /admin/labeltype/details/{id}/ and /admin/dict/kuromoji/details/{id}.
+    """
+    path = urlparse(url).path or '/'
+    segments = []
+    for segment in path.split('/'):
+        is_id = (segment and not _VERSION_SEGMENT.match(segment)
+                 and (not _WORD_SEGMENT.match(segment)
+                      or (len(segment) >= 16 and segment.lower() != segment)))
+        if is_id:
+            if not segments or segments[-1] != '{id}':
+                segments.append('{id}')
+        else:
+            segments.append(segment)
+    return '/'.join(segments)
+
+
+def _page_timing_enabled() -> bool:
+    return os.environ.get("PAGE_TIMING", "true").lower() == "true"
+
+
+class NavigationRecorder:
+    """Reads the navigation entry of a page after an action, once per document."""
+
+    def __init__(self):
+        self.enabled = _page_timing_enabled()
+        self.load_wait_ms = int(os.environ.get("PAGE_TIMING_LOAD_WAIT_MS", "5000"))
+        self._last_origin: Dict[int, float] = {}
+        self.timings: List[NavigationTiming] = []
+
+    def record(self, page: "Page") -> Optional[NavigationTiming]:
+        """Record the page's navigation timing if it shows a document not
+        recorded yet. Never raises: timing is diagnostics, not a test."""
+        if not self.enabled:
+            return None
+        try:
+            entry = page.evaluate(_NAVIGATION_SCRIPT, {
+                'lastOrigin': self._last_origin.get(id(page)),
+                'loadWaitMs': self.load_wait_ms,
+            })
+        except Exception as e:
+            logger.debug(f"[PAGE_TIMING] could not read navigation timing: {e}")
+            return None
+        if not entry or not entry['url'].startswith('http'):
+            return None
+
+        self._last_origin[id(page)] = entry['origin']
+        timing = NavigationTiming(
+            route=normalize_route(entry['url']),
+            url=entry['url'],
+            ttfb=round(entry['ttfb'], 1),
+            dcl=round(entry['dcl'], 1),
+            load=round(entry['load'], 1) if entry['load'] else None,
+            fcp=round(entry['fcp'], 1) if entry['fcp'] is not None else None,
+            transfer_size=int(entry['transfer_size'] or 0),
+        )
+        self.timings.append(timing)
+        logger.debug(f"[PAGE_TIMING] {timing.route} ttfb={timing.ttfb}ms "
+                     f"load={timing.load}ms")
+        return timing
+
+    def take(self) -> List[NavigationTiming]:
+        """Return the timings recorded since the last call and start a new list."""
+        timings = self.timings
+        self.timings = []
+        return timings
+
+
+def _median(values: List[float]) -> float:
+    ordered = sorted(values)
+    n = len(ordered)
+    if n % 2 == 0:
+        return (ordered[n//2-1] + ordered[n//2]) / 2
+    return ordered[n//2]
+
+
+class PageTimingCollector:
+    """Aggregates navigation timings per route and tracks them across runs"""
+
+    def __init__(self, history_file: str = 'test_page_timing_history.json'):
+        self.history_file = history_file
+        self.current: Dict[str, List[NavigationTiming]] = {}
+
+    def add(self, timings: List[NavigationTiming]):
+        """Add the navigation timings recorded during one module"""
+        for timing in timings:
+            self.current.setdefault(timing.route, []).append(timing)
+
+    def get_route_summary(self) -> Dict[str, Dict[str, float]]:
+        """Median of each timing field per route, plus the sample count"""
+        summary = {}
+        for route, timings in sorted(self.current.items()):
+            stats: Dict[str, float] = {'samples': len(timings)}
+            for name in TIMING_FIELDS:
+                values = [getattr(t, name) for t in timings if getattr(t, name) is not None]
+                if values:
+                    stats[name] = round(_median(values), 1)
+            summary[route] = stats
+        return summary
+
+    def save_history(self):
+        """Append this run's per-route medians to the history file"""
+        if not self.current:
+            return
+        history = self._load_history()
+        history.append({
+            'timestamp': datetime.now().isoformat(),
+            'environment': {'fess_url': os.environ.get('FESS_URL', 'unknown')},
+            'routes': self.get_route_summary(),
+        })
+        if len(history) > 100:
+            history = history[-100:]
+
+        with open(self.history_file, 'w', encoding='utf-8') as f:
+            json.dump(history, f, indent=2, ensure_ascii=False)
+
+        logger.info(f"Page timing history saved to {self.history_file}")
+
+    def _load_history(self) -> List[Dict]:
+        """Load historical page timings"""
+        if not os.path.exists(self.history_file):
+            return []
+
+        try:
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load page timing history: {e}")
+            return []
+
+    def detect_regressions(self, threshold: float = 1.5, field: str = 'load') -> List[str]:
+        """
+        Detect routes whose median `field` regressed against the baseline
+        (median of the last 10 runs before this one).
+
+        Args:
+            threshold: Multiplier for regression detection (e.g., 1.5 = 50% slower)
+            field: Timing field to compare (ttfb, dcl, load, fcp)
+
+        Returns:
+            List of routes with detected regressions
+        """
+        history = self._load_history()
+        if len(history) < 2:
+            logger.info("Not enough page timing history for regression detection")
+            return []
+
+        baseline_values: Dict[str, List[float]] = {}
+        for entry in history[:-1][-10:]:
+            for route, stats in entry.get('routes', {}).items():
+                if field in stats:
+                    baseline_values.setdefault(route, []).append(stats[field])
+
+        regressions = []
+        for route, stats in self.get_route_summary().items():
+            if field not in stats or route not in baseline_values:
+                continue
+            baseline = _median(baseline_values[route])
+            if baseline > 0 and stats[field] > baseline * threshold:
+                regressions.append(route)
+                logger.warning(
+                    f"Page {field} regression detected on {route}: "
+                    f"{stats[field]:.0f}ms vs baseline {baseline:.0f}ms "
+                    f"({stats[field]/baseline:.1f}x slower)"
+                )
+
+        return regressions
+
+    def print_summary(self, limit: int = 10):
+        """Print the slowest routes by median load time"""
+        summary = self.get_route_summary()
+        if not summary:
+            return
+
+        print("\n" + "="*70)
+        print("PAGE TIMING (median ms per route)")
+        print("="*70)
+        print(f"  {'Route':<40} {'TTFB':>6} {'DCL':>6} {'Load':>6} {'FCP':>6} {'n':>4}")
+        slowest = sorted(summary.items(), key=lambda x: x[1].get('load', 0), reverse=True)
+        for route, stats in slowest[:limit]:
+            cells = ' '.join(f"{stats[name]:>6.0f}" if name in stats else f"{'-':>6}"
+                             for name in ('ttfb', 'dcl', 'load', 'fcp'))
+            print(f"  {route[:40]:<40} {cells} {stats['samples']:>4}")
+        print("="*70)
+
+        regressions = self.detect_regressions()
+        if regressions:
+            print("\n⚠ PAGE LOAD REGRESSIONS DETECTED:")
+            for route in regressions:
+                print(f"  - {route}")
+            print("="*70)
+
+        print()
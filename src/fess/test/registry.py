@@ -0,0 +1,161 @@
+"""
+Test module registry: TEST_MODULES names mapped to dotted module paths.
+
+main.py used to import every admin, dict, search, general, sysinfo and
+wizard module up front and list each one in a hand-kept dict, so running a
+single leaf (TEST_MODULES=storage) still paid for importing the other
+hundred and eighty, and a new leaf stayed unaddressable until someone
+remembered to add it there.
+
+The names are now discovered from the package layout, without importing
+anything but the package roots:
+
+  fess.test.ui.admin.<pkg>          -> <pkg>        (CRUD packages, general,
+  fess.test.ui.admin.dict.<pkg>     -> <pkg>         sysinfo, wizard composers)
+  admin.general/sysinfo/wizard leaf -> <leaf>       (storage, backup, ...)
+  fess.test.ui.integration leaf     -> <leaf>       (crawler_workflow, ...)
+  fess.test.ui.search leaf          -> search_<leaf>
+
+plus the integration composer. Modules starting with "_" are helpers, not
+tests. A dotted path under fess.test.ui selects any module, registered or
+not (TEST_MODULES=fess.test.ui.admin.label.add). Only what a run selects is
+imported (load()). The default run keeps its explicit order in
+DEFAULT_ORDER: the order carries the dependencies between modules, which
+the layout cannot.
+"""
+
+import functools
+import importlib
+import importlib.util
+import logging
+import pkgutil
+from types import ModuleType
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Packages whose subpackages are test modules, registered by their own name.
+PACKAGE_ROOTS = [
+    "fess.test.ui.admin",
+    "fess.test.ui.admin.dict",
+]
+
+# Packages whose leaf modules are test modules: (package, name format).
+# The composers among them are registered through PACKAGE_ROOTS or EXPLICIT.
+LEAF_ROOTS = [
+    ("fess.test.ui.admin.general", "{}"),
+    ("fess.test.ui.admin.sysinfo", "{}"),
+    ("fess.test.ui.admin.wizard", "{}"),
+    ("fess.test.ui.integration", "{}"),
+    ("fess.test.ui.search", "search_{}"),
+]
+
+EXPLICIT = {
+    "integration": "fess.test.ui.integration",
+}
+
+# The default run. Opt-in modules (search_benchmark, search_load) and the
+# leaves of the composers listed here are addressable by name but never run
+# by default: a composer runs its leaves itself.
+DEFAULT_ORDER = [
+    "accesstoken", "badword", "boostdoc", "duplicatehost", "elevateword",
+    "keymatch", "label", "pathmap", "relatedcontent", "relatedquery", "user", "group",
+    "role", "kuromoji", "protwords", "mapping", "stemmeroverride", "stopwords", "synonym",
+    "webconfig", "fileconfig",
+    "dataconfig", "fileauth", "reqheader", "scheduler", "webauth", "virtualhost",
+    "search_seed",
+    "search_root_top", "search_top", "search_help", "search_login_form",
+    "search_profile_form", "search_form_submit",
+    "search_query", "search_advance", "search_no_results",
+    "search_query_errors",
+    "search_pagination", "search_facet", "search_sort",
+    "search_thumbnail", "search_suggest", "search_related",
+    # Both drive a real result: they need search_seed's index, and
+    # go_click's click writes a ClickLog for the document it opens.
+    "search_go_click", "search_cache",
+    "search_i18n_smoke", "search_multibyte_query",
+    "search_layout_overflow", "search_console_errors",
+    "search_multibyte_admin_input",
+    # search_osdd must precede general: /osdd is behind the
+    # loginRequired gate, which general's last module toggles.
+    "search_error_pages", "search_osdd", "search_logout",
+    # Cross-resource workflows. After the search modules: dictionary_workflow
+    # edits the morphological analyser's dictionaries, and changed tokenisation
+    # would change what the search assertions above see.
+    "integration",
+    # After the search modules because it creates real, persistent
+    # crawl configs. It never starts a crawl -- the wizard's
+    # startCrawling button relaunches every crawler job, which would
+    # rewrite the index the modules above assert against -- so it
+    # deletes the configs it made and leaves the index alone.
+    "wizard",
+    # sysinfo ends in deleteall, which empties the job-log and
+    # crawling-info indices. Nothing after it reads them.
+    "sysinfo",
+    # Last: general's final module (loginRequired) briefly closes the
+    # public UI to anonymous visitors. It restores the setting itself,
+    # but if that ever fails, nothing is left queued behind it.
+    "general",
+]
+
+
+def _children(package: str, packages: bool) -> List[str]:
+    """Public submodule names of a package, read off the file system.
+
+    find_spec imports the package's parents, never the package itself or
+    its children.
+    """
+    spec = importlib.util.find_spec(package)
+    if spec is None or not spec.submodule_search_locations:
+        raise ValueError(f"test package not found: {package}")
+    return sorted(info.name for info in pkgutil.iter_modules(spec.submodule_search_locations)
+                  if info.ispkg == packages and not info.name.startswith("_"))
+
+
+@functools.lru_cache(maxsize=None)
+def available() -> Dict[str, str]:
+    """
+    Every addressable test module.
+
+    Returns:
+        Name -> dotted module path
+
+    Raises:
+        ValueError: When two modules would answer to the same name
+    """
+    registry: Dict[str, str] = {}
+
+    def register(name: str, path: str) -> None:
+        if registry.get(name, path) != path:
+            raise ValueError(f"test module name {name!r} is claimed by both "
+                             f"{registry[name]} and {path}")
+        registry[name] = path
+
+    for package in PACKAGE_ROOTS:
+        for child in _children(package, packages=True):
+            register(child, f"{package}.{child}")
+    for package, name_format in LEAF_ROOTS:
+        for child in _children(package, packages=False):
+            register(name_format.format(child), f"{package}.{child}")
+    for name, path in EXPLICIT.items():
+        register(name, path)
+    return registry
+
+
+def is_known(name: str) -> bool:
+    """Whether name is a registered name, or the dotted path of a test
+    module (fess.test.ui.admin.label.add), which need not be registered."""
+    if name in available():
+        return True
+    if not name.startswith("fess.test.ui."):
+        return False
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+def load(names: List[str]) -> List[ModuleType]:
+    """Import the named modules, and only those, in the given order."""
+    registry = available()
+    return [importlib.import_module(registry.get(name, name)) for name in names]
@@ -0,0 +1,241 @@
+"""
+Lock-aware scheduling of test modules across parallel browser contexts and
+sharded worker processes.
+
+Every module main.py drives may declare the shared Fess state it touches as
+module-level tuples:
+
+    READS = ("index", "loginRequired")
+    WRITES = ("labeltype",)
+    AFTER = ("fess.test.ui.integration",)
+
+Resource names are free-form; by convention they are the admin URL segment of
+the resource (``labeltype``, ``webconfig``, ``scheduler``), or a name for
+instance-wide state: ``index`` (the seeded documents), ``crawler`` (a crawl
+still running in the background), ``analyzer`` (the dictionaries tokenisation
+depends on), ``general-settings`` and ``loginRequired`` (/admin/general/).
+
+Two modules conflict when one writes a resource the other reads or writes.
+Conflicting modules keep the order they were listed in -- the serial order of
+get_modules_to_run() stays the reference, the scheduler only overlaps what
+provably does not interact. AFTER adds an edge locks cannot express: a module
+runs after every listed module (by dotted name) that is part of the same run.
+
+A module that declares nothing is treated as exclusive: it conflicts with
+everything, so forgetting a declaration costs speed, never correctness. A
+package leaf that declares nothing (TEST_MODULES=storage) inherits its
+composer's declarations.
+"""
+
+import logging
+import sys
+import threading
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+# Lock name that conflicts with every other lock.
+EXCLUSIVE = "*"
+
+
+@dataclass(frozen=True)
+class ModuleLocks:
+    """Resources a module reads and writes, and its explicit predecessors"""
+    name: str
+    reads: FrozenSet[str]
+    writes: FrozenSet[str]
+    after: FrozenSet[str]
+
+    def conflicts_with(self, other: "ModuleLocks") -> bool:
+        """True if the two modules must not run at the same time"""
+        if EXCLUSIVE in self.writes or EXCLUSIVE in other.writes:
+            return True
+        return bool(self.writes & (other.reads | other.writes)
+                    or other.writes & self.reads)
+
+
+def _declared(module: ModuleType, attr: str):
+    """Look the declaration up on the module, then on its parent package."""
+    value = getattr(module, attr, None)
+    if value is not None:
+        return value
+    parent = sys.modules.get(module.__name__.rpartition('.')[0])
+    if parent is not None:
+        return getattr(parent, attr, None)
+    return None
+
+
+def locks_of(module: ModuleType) -> ModuleLocks:
+    """Read a module's READS/WRITES/AFTER declarations.
+
+    A module that declares neither READS nor WRITES is exclusive.
+    """
+    reads = _declared(module, 'READS')
+    writes = _declared(module, 'WRITES')
+    if reads is None and writes is None:
+        writes = (EXCLUSIVE,)
+    return ModuleLocks(
+        name=module.__name__,
+        reads=frozenset(reads or ()),
+        writes=frozenset(writes or ()),
+        after=frozenset(_declared(module, 'AFTER') or ()),
+    )
+
+
+def build_predecessors(locks: Sequence[ModuleLocks]) -> List[Set[int]]:
+    """
+    Build the dependency edges for a run.
+
+    Args:
+        locks: Declarations of the selected modules, in run order
+
+    Returns:
+        For each module, the indices of the modules that must finish first
+
+    Raises:
+        ValueError: If the AFTER edges form a cycle
+    """
+    index_of = {lock.name: i for i, lock in enumerate(locks)}
+    predecessors: List[Set[int]] = []
+    for i, lock in enumerate(locks):
+        before = {j for j in range(i) if locks[j].conflicts_with(lock)}
+        # An AFTER naming a module outside this run (a TEST_MODULES subset)
+        # is simply not an edge.
+        before |= {index_of[name] for name in lock.after
+                   if name in index_of and index_of[name] != i}
+        predecessors.append(before)
+
+    _check_acyclic(locks, predecessors)
+    return predecessors
+
+
+def _check_acyclic(locks: Sequence[ModuleLocks],
+                   predecessors: List[Set[int]]) -> None:
+    """Fail at plan time rather than deadlock the workers at run time."""
+    done: Set[int] = set()
+    remaining = set(range(len(locks)))
+    while remaining:
+        ready = {i for i in remaining if predecessors[i] <= done}
+        if not ready:
+            names = sorted(locks[i].name for i in remaining)
+            raise ValueError(f"AFTER declarations form a cycle among: {names}")
+        done |= ready
+        remaining -= ready
+
+
+class ModuleScheduler:
+    """
+    Hands out modules to worker threads as their predecessors finish.
+
+    Thread-safe. Workers loop on acquire() until it returns None, and call
+    release() once per acquired module, whether it passed or not -- a failed
+    module still frees its locks, exactly as it would in a serial run.
+    """
+
+    def __init__(self, modules: Sequence[ModuleType],
+                 estimates: Optional[Sequence[float]] = None):
+        self.modules = list(modules)
+        self.locks = [locks_of(m) for m in self.modules]
+        self.predecessors = build_predecessors(self.locks)
+        self._estimates = list(estimates or [1.0] * len(self.modules))
+        self._started: Set[int] = set()
+        self._finished: Set[int] = set()
+        self._cond = threading.Condition()
+
+    def _next_ready(self) -> Optional[int]:
+        """Longest-estimated ready module first; listed order breaks ties."""
+        ready = [i for i in range(len(self.modules))
+                 if i not in self._started and self.predecessors[i] <= self._finished]
+        if not ready:
+            return None
+        return max(ready, key=lambda i: (self._estimates[i], -i))
+
+    def acquire(self) -> Optional[int]:
+        """Block until a module may start; None once there is nothing left."""
+        with self._cond:
+            while True:
+                if len(self._started) == len(self.modules):
+                    return None
+                index = self._next_ready()
+                if index is not None:
+                    self._started.add(index)
+                    return index
+                self._cond.wait()
+
+    def release(self, index: int) -> None:
+        """Mark a module finished and wake the workers waiting on it."""
+        with self._cond:
+            self._finished.add(index)
+            self._cond.notify_all()
+
+    def unstarted(self) -> List[ModuleType]:
+        """Modules no worker ever picked up."""
+        with self._cond:
+            return [m for i, m in enumerate(self.modules) if i not in self._started]
+
+
+@dataclass
+class ShardPlan:
+    """Modules per shard, in the order each shard runs them"""
+    shards: List[List[int]]
+    predicted: List[float]
+
+
+def plan_shards(predecessors: Sequence[Set[int]], shards: int,
+                estimates: Optional[Sequence[float]] = None) -> ShardPlan:
+    """
+    Split a run across worker processes by simulating it.
+
+    List scheduling, longest processing time first: of the modules whose
+    predecessors are all placed, the longest goes next, to the shard that can
+    start it soonest -- so the slowest module starts early instead of being
+    the one the other shards sit idle behind. Each shard's list is therefore in
+    simulated start order, and every cross-shard predecessor of a module has
+    an earlier simulated start -- so shards that wait on each other's modules
+    at run time can never wait in a circle, however wrong the estimates are.
+
+    Args:
+        predecessors: Output of build_predecessors()
+        shards: Number of worker processes
+        estimates: Expected duration per module (default: 1.0 each, which
+            degenerates to listed order)
+
+    Returns:
+        ShardPlan with the module indices per shard and the simulated
+        wall time of each shard
+    """
+    count = len(predecessors)
+    # Strictly positive, so a predecessor always *starts* before its
+    # successor even when the estimate is zero.
+    durations = [max(e, 1e-3) for e in (estimates or [1.0] * count)]
+    finish: Dict[int, float] = {}
+    free_at = [0.0] * shards
+    plan: List[List[int]] = [[] for _ in range(shards)]
+
+    while len(finish) < count:
+        ready = [i for i in range(count)
+                 if i not in finish and predecessors[i] <= finish.keys()]
+        index = max(ready, key=lambda i: (durations[i], -i))
+        earliest = max((finish[p] for p in predecessors[index]), default=0.0)
+        shard = min(range(shards), key=lambda s: (max(free_at[s], earliest), s))
+        finish[index] = max(free_at[shard], earliest) + durations[index]
+        free_at[shard] = finish[index]
+        plan[shard].append(index)
+
+    return ShardPlan(shards=plan, predicted=free_at)
+
+
+def print_plan_accuracy(unit: str, predicted: Sequence[float],
+                        actual: Sequence[Optional[float]]) -> None:
+    """Print predicted vs. measured wall time per worker of a planned run"""
+    print("\n" + "="*70)
+    print(f"PLAN ACCURACY (per {unit})")
+    print("="*70)
+    for n, (expected, measured) in enumerate(zip(predicted, actual)):
+        if measured is None:
+            print(f"  {unit} {n:<3} predicted {expected:>8.2f}s   actual      n/a")
+        else:
+            print(f"  {unit} {n:<3} predicted {expected:>8.2f}s   actual {measured:>8.2f}s")
+    print("="*70 + "\n")
@@ -0,0 +1,285 @@
+"""
+Declarative CRUD specs for the admin resource packages.
+
+label, keymatch, badword and the other simple admin resources used to be
+four hand-written leaves each -- add, update, (validation,) delete -- and
+every leaf paid for the same walk before testing anything: /admin/, the
+sidebar menu, the list page, the row. A label run loaded ~30 pages, a third
+of them on that walk. Their differences fit in a few lines, so each package
+now holds a CrudSpec (its _spec.py) and CrudRun executes it:
+
+  add         createnew directly, submit (lands on the list), the row's
+              data-href straight to details, read the created fields back.
+              The menu entries are asserted on the list page the submit
+              returned instead of being clicked.
+  update      from the details page add left: edit, back, edit, submit.
+  validation  every Invalid case in one createnew form session: LastaFlute
+              re-renders the rejected form under the list URL with the
+              submitted values, so the next case fills over it. The markup
+              case, which creates a record, goes last.
+  delete      from the list page the previous step left, when it is one.
+
+The steps share what they learned (the details URL, whether the page on
+screen is the real list), so a package run reloads nothing it already has.
+A leaf run on its own starts from nothing and finds its way, as before.
+
+report() logs the page loads each step cost, per resource, so the saving
+stays measurable: "[CRUD] labeltype: 12 page loads (add 3, update 4, ...)".
+"""
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urljoin
+
+from fess.test import assert_equal, assert_not_equal, assert_startswith, assert_true
+from fess.test.i18n import t
+from fess.test.i18n.keys import Labels
+from fess.test.ui.cleanup import LIST_SECTION, Cleanup, assert_absent
+
+logger = logging.getLogger(__name__)
+
+# Validation errors render as <ul class="has-error"> on the re-rendered form
+ERROR_SELECTOR = "ul.has-error"
+
+XSS_PAYLOAD = "<script>alert('xss')</script>"
+
+Fields = Dict[str, str]
+
+
+@dataclass(frozen=True)
+class Invalid:
+    """One validation case: form values the create form must reject."""
+    what: str
+    fields: Fields
+    # (selector, function) evaluated on the form before submitting, for
+    # values fill() refuses (a non-number in <input type="number">)
+    script: Optional[Tuple[str, str]] = None
+
+
+@dataclass(frozen=True)
+class CrudSpec:
+    """
+    What differs between two simple admin resources.
+
+    Field values are keyed by the form field's name attribute and built
+    from the run's generated name, so two runs never collide.
+    """
+    resource: str                           # /admin/<resource>/
+    menu: Tuple[str, str]                   # (section, entry) i18n keys
+    create: Callable[[str], Fields]
+    update: Callable[[str], Fields]
+    # Text identifying the row on the list page; renamed after the update
+    row: Callable[[str], str] = lambda name: name
+    renamed: Optional[Callable[[str], str]] = None
+    # Fields read back on the details page after the add
+    verify: Tuple[str, ...] = ()
+    selects: Tuple[str, ...] = ()           # fields that are <select>s
+    delete_link: bool = False               # "Delete" is a link, not a button
+    invalid: Tuple[Invalid, ...] = ()
+    markup_field: Optional[str] = None      # field the XSS case writes into
+
+    @property
+    def path(self) -> str:
+        return f"/admin/{self.resource}/"
+
+
+class CrudRun:
+    """Executes a CrudSpec's steps against one context, in any order that
+    starts with add()."""
+
+    def __init__(self, context, spec: CrudSpec):
+        self.context = context
+        self.spec = spec
+        self.name: str = context.create_label_name()
+        self.row: str = spec.row(self.name)
+        self.loads: Counter = Counter()
+        self._page = None
+        self._details_url: Optional[str] = None
+        self._on_list = False      # the page on screen is the real list
+
+    @property
+    def page(self):
+        if self._page is None:
+            # Whatever page the module before left open; a new one only
+            # when there is none (first module, or recycled)
+            self._page = self.context.get_wrapped_page() or self.context.get_admin_page()
+        return self._page
+
+    @property
+    def list_url(self) -> str:
+        return self.context.url(self.spec.path)
+
+    def _loaded(self, step: str) -> None:
+        self.page.wait_for_load_state("domcontentloaded")
+        self.loads[step] += 1
+
+    def _goto(self, step: str, path: str) -> None:
+        self.page.goto(self.context.url(path))
+        self._loaded(step)
+        self._on_list = path == self.spec.path
+
+    def _submit(self, step: str, selector: str) -> None:
+        self.page.click(selector)
+        self._loaded(step)
+        self._on_list = False
+
+    def _fill(self, fields: Fields) -> None:
+        for name, value in fields.items():
+            selector = f'[name="{name}"]'
+            if name in self.spec.selects:
+                self.page.select_option(selector, value)
+            else:
+                self.page.fill(selector, value)
+
+    def _list_lists(self, row: str) -> bool:
+        return self.page.inner_text(LIST_SECTION).find(row) != -1
+
+    def _open_details(self, step: str, row: str) -> None:
+        """Go to the details page of `row`, through its data-href on the
+        list page (loading that only when it is not on screen already)."""
+        if not self._on_list:
+            self._goto(step, self.spec.path)
+        href = self.page.get_attribute(f'table tr[data-href]:has-text("{row}")', "data-href")
+        assert_true(bool(href), f"{row} is not listed on page 1 of {self.spec.path}")
+        self._details_url = urljoin(self.page.url, href)
+        self.page.goto(self._details_url)
+        self._loaded(step)
+        self._on_list = False
+        assert_startswith(self.page.url, self.context.url(f"{self.spec.path}details/4/"))
+
+    def _assert_menu(self) -> None:
+        """The sidebar entries for the resource, read off the page on screen."""
+        section, entry = (t(key) for key in self.spec.menu)
+        assert_true(self.page.locator(f'a:has-text("{section}")').count() > 0,
+                    f"menu section '{section}' missing on {self.spec.path}")
+        assert_true(self.page.locator(f'a[href$="{self.spec.path}"]:has-text("{entry}")')
+                    .count() > 0, f"menu entry '{entry}' missing on {self.spec.path}")
+
+    def add(self) -> None:
+        spec = self.spec
+        logger.info(f"[CRUD] {spec.resource}: add {self.row}")
+        self._goto("add", f"{spec.path}createnew/")
+        self._fill(spec.create(self.name))
+        self._submit("add", f'button:has-text("{t(Labels.CRUD_BUTTON_CREATE)}")')
+        assert_equal(self.page.url, self.list_url)
+        assert_equal(self.page.locator(ERROR_SELECTOR).count(), 0,
+                     f"create of {self.row} was rejected")
+        self._on_list = True
+        assert_true(self._list_lists(self.row), f"{self.row} not listed after create")
+        self._assert_menu()
+
+        self._open_details("add", self.row)
+        expected = spec.create(self.name)
+        for name in spec.verify:
+            value = self.page.input_value(f'[name="{name}"]')
+            assert_equal(value, expected[name],
+                         f"{name} value '{value}' != expected '{expected[name]}'")
+
+    def update(self) -> None:
+        spec = self.spec
+        logger.info(f"[CRUD] {spec.resource}: update {self.row}")
+        if self._details_url is None or self.page.url != self._details_url:
+            self._open_details("update", self.row)
+
+        self._submit("update", f"text={t(Labels.CRUD_BUTTON_EDIT)}")
+        assert_equal(self.page.url, self.list_url)
+        self._submit("update", f"text={t(Labels.CRUD_BUTTON_BACK)}")
+        assert_equal(self.page.url, self.list_url)
+        self._submit("update", f"text={t(Labels.CRUD_BUTTON_EDIT)}")
+        assert_equal(self.page.url, self.list_url)
+
+        self._fill(spec.update(self.name))
+        self._submit("update", f'button:has-text("{t(Labels.CRUD_BUTTON_UPDATE)}")')
+        assert_equal(self.page.url, self.list_url)
+        assert_equal(self.page.locator(ERROR_SELECTOR).count(), 0,
+                     f"update of {self.row} was rejected")
+        self._on_list = True
+        if spec.renamed is not None:
+            self.row = spec.renamed(self.name)
+        self._details_url = None
+        assert_true(self._list_lists(self.row), f"{self.row} not listed after update")
+
+    def validation(self) -> None:
+        spec = self.spec
+        logger.info(f"[CRUD] {spec.resource}: {len(spec.invalid)} validation cases")
+        self._goto("validation", f"{spec.path}createnew/")
+        create = f'button:has-text("{t(Labels.CRUD_BUTTON_CREATE)}")'
+        for case in spec.invalid:
+            self._fill(case.fields)
+            if case.script is not None:
+                self.page.eval_on_selector(*case.script)
+            self._submit("validation", create)
+            # A POST lands on the list URL whether validation passed or
+            # failed; ul.has-error is the real discriminator.
+            assert_equal(self.page.url, self.list_url)
+            assert_true(self.page.locator(ERROR_SELECTOR).count() > 0,
+                        f"{case.what} must be rejected")
+            logger.info(f"[CRUD] {spec.resource}: {case.what} rejected")
+        if spec.markup_field is not None:
+            self._markup_is_escaped(create)
+
+    def _markup_is_escaped(self, create: str) -> None:
+        """Create a record whose markup_field carries a script tag, and check
+        the list renders it as text. Runs on the rejected form the cases
+        left (or a fresh one), so it fills every field."""
+        spec = self.spec
+        marker = f"x{self.context.generate_str(10)}"
+        fields = {**spec.create(marker), spec.markup_field: f"{XSS_PAYLOAD}{marker}"}
+        try:
+            self._fill(fields)
+            self._submit("validation", create)
+            assert_equal(self.page.locator(ERROR_SELECTOR).count(), 0,
+                         f"XSS-named record should have been created; url={self.page.url}")
+            self._on_list = True
+            payload_is_live = self.page.evaluate(
+                "() => Array.from(document.querySelectorAll('script'))"
+                ".some(s => (s.textContent || '').includes(\"alert('xss')\"))")
+            assert_true(not payload_is_live, "XSS payload was parsed into a live script element")
+            assert_not_equal(self.page.inner_text("table").find("script"), -1,
+                             "XSS attempt should be visible as text, not executed")
+            logger.info(f"[CRUD] {spec.resource}: markup in {spec.markup_field} escaped")
+        finally:
+            cleanup = Cleanup()
+            with cleanup.guard(f"{spec.resource} '{marker}'"):
+                self._delete_row("validation", marker)
+            cleanup.escalate()
+
+    def _delete_row(self, step: str, row: str) -> None:
+        self._open_details(step, row)
+        control = (f"text={t(Labels.CRUD_LINK_DELETE)}" if self.spec.delete_link
+                   else f'button:has-text("{t(Labels.CRUD_BUTTON_DELETE)}")')
+        self.page.click(control)
+        self.page.click(f"text={t(Labels.CRUD_BUTTON_CANCEL)}")
+        self.page.click(control)
+        self._submit(step, 'div.modal-footer button[name="delete"]')
+        assert_equal(self.page.url, self.list_url)
+        self._on_list = True
+        self._details_url = None
+        assert_absent(self.page, row, self.spec.path)
+
+    def delete(self) -> None:
+        logger.info(f"[CRUD] {self.spec.resource}: delete {self.row}")
+        self._delete_row("delete", self.row)
+
+    def report(self) -> int:
+        """Log the page loads each step cost; returns their total."""
+        total = sum(self.loads.values())
+        steps = ", ".join(f"{step} {count}" for step, count in self.loads.items())
+        logger.info(f"[CRUD] {self.spec.resource}: {total} page loads ({steps})")
+        return total
+
+
+def run(context, spec: CrudSpec) -> int:
+    """Every step the spec has, in the order the packages always ran them.
+
+    Returns:
+        The page loads it took
+    """
+    crud = CrudRun(context, spec)
+    crud.add()
+    crud.update()
+    if spec.invalid or spec.markup_field is not None:
+        crud.validation()
+    crud.delete()
+    return crud.report()
@@ -0,0 +1,12 @@
+"""What admin/badword tests: the CrudSpec its leaves and package run execute."""
+from fess.test.i18n.keys import Labels
+from fess.test.ui.admin._crud import CrudSpec
+
+SPEC = CrudSpec(
+    resource="badword",
+    menu=(Labels.MENU_SUGGEST, Labels.MENU_BAD_WORD),
+    create=lambda name: {"suggestWord": name},
+    update=lambda name: {"suggestWord": f"{name}X"},
+    renamed=lambda name: f"{name}X",
+    delete_link=True,
+)
@@ -0,0 +1,12 @@
+"""What admin/boostdoc tests: the CrudSpec its leaves and package run execute."""
+from fess.test.i18n.keys import Labels
+from fess.test.ui.admin._crud import CrudSpec
+
+SPEC = CrudSpec(
+    resource="boostdoc",
+    menu=(Labels.MENU_CRAWL, Labels.MENU_BOOST_DOCUMENT_RULE),
+    create=lambda name: {"urlExpr": f"url.matches(\"https://{name}/.*\")",
+                         "boostExpr": "100"},
+    update=lambda name: {"sortOrder": "1"},
+    row=lambda name: f"https://{name}/",
+)
@@ -1,11 +1,11 @@
 import logging
 
-from fess.test import assert_equal, assert_startswith
-from fess.test.i18n import t
-from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.admin._crud import CrudRun
 from playwright.sync_api import Playwright, sync_playwright
 
+from ._spec import SPEC
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,43 +20,11 @@ def destroy(context: FessContext) -> None:
 
 
 def run(context: FessContext) -> None:
-    logger.info("Starting boostdoc delete test")
-
-    page: "Page" = context.get_admin_page()
-    label_name: str = context.create_label_name()
-    logger.debug(f"Using test label: {label_name}")
-
-    # Step 1: Navigate to boostdoc page
-    logger.info("Step 1: Navigating to boostdoc page")
-    page.click(f"text={t(Labels.MENU_CRAWL)}")
-    page.click(f"text={t(Labels.MENU_BOOST_DOCUMENT_RULE)}")
-    assert_equal(page.url, context.url("/admin/boostdoc/"))
-
-    # Step 2: Open boostdoc details
-    logger.info("Step 2: Opening boostdoc details")
-    page.click(rf"text=/.*url\.matches\(\"https://{label_name}/\.\*\"\).*/")
-    assert_startswith(
-        page.url, context.url("/admin/boostdoc/details/4/"))
-
-    # Step 3: Test delete button and cancel
-    logger.info("Step 3: Testing delete button and cancel")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_DELETE)}")')
-    page.click(f"text={t(Labels.CRUD_BUTTON_CANCEL)}")
-
-    # Step 4: Delete boostdoc
-    logger.info("Step 4: Deleting boostdoc")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_DELETE)}")')
-    page.click('div.modal-footer button[name="delete"]')
-    assert_equal(page.url, context.url("/admin/boostdoc/"))
-
-    # Step 5: Verify boostdoc was deleted
-    logger.info("Step 5: Verifying boostdoc was deleted")
-    page.wait_for_load_state("domcontentloaded")
-    table_content: str = page.inner_text("section.content")
-    assert_equal(table_content.find(label_name), -1,
-                 f"{label_name} in {table_content}")
-
-    logger.info("Boostdoc delete test completed successfully")
+    logger.info("Starting boost document rule delete test")
+    crud = CrudRun(context, SPEC)
+    crud.delete()
+    crud.report()
+    logger.info("Boost document rule delete test completed successfully")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,11 @@
 import logging
 
-from fess.test import assert_equal, assert_startswith
-from fess.test.i18n import t
-from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.admin._crud import CrudRun
 from playwright.sync_api import Playwright, sync_playwright
 
+from ._spec import SPEC
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,44 +20,11 @@ def destroy(context: FessContext) -> None:
 
 
 def run(context: FessContext) -> None:
-    logger.info("Starting boostdoc update test")
-
-    page: "Page" = context.get_admin_page()
-    label_name: str = context.create_label_name()
-    logger.debug(f"Using test label: {label_name}")
-
-    # Step 1: Navigate to boostdoc page
-    logger.info("Step 1: Navigating to boostdoc page")
-    page.click(f"text={t(Labels.MENU_CRAWL)}")
-    page.click(f"text={t(Labels.MENU_BOOST_DOCUMENT_RULE)}")
-    assert_equal(page.url, context.url("/admin/boostdoc/"))
-
-    # Step 2: Open boostdoc details
-    logger.info("Step 2: Opening boostdoc details")
-    page.click(rf"text=/.*url\.matches\(\"https://{label_name}/\.\*\"\).*/")
-    assert_startswith(
-        page.url, context.url("/admin/boostdoc/details/4/"))
-
-    # Step 3: Test edit button and back button
-    logger.info("Step 3: Testing edit button and back button")
-    page.click(f"text={t(Labels.CRUD_BUTTON_EDIT)}")
-    assert_equal(page.url, context.url("/admin/boostdoc/"))
-    page.click(f"text={t(Labels.CRUD_BUTTON_BACK)}")
-    assert_equal(page.url, context.url("/admin/boostdoc/"))
-
-    # Step 4: Edit boostdoc details
-    logger.info("Step 4: Editing boostdoc details")
-    page.click(f"text={t(Labels.CRUD_BUTTON_EDIT)}")
-    assert_equal(page.url, context.url("/admin/boostdoc/"))
-    page.fill("input[name=\"sortOrder\"]", "1")
-
-    # Step 5: Update boostdoc
-    logger.info("Step 5: Updating boostdoc")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_UPDATE)}")')
-    assert_equal(page.url, context.url("/admin/boostdoc/"))
-
-    logger.info("Boostdoc update test completed successfully")
-    # TODO check content
+    logger.info("Starting boost document rule update test")
+    crud = CrudRun(context, SPEC)
+    crud.update()
+    crud.report()
+    logger.info("Boost document rule update test completed successfully")
 
 
 if __name__ == "__main__":
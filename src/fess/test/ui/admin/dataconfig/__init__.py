@@ -3,6 +3,9 @@ from fess.test.ui import FessContext
 from . import add, delete, update
 
 
+WRITES = ("dataconfig",)
+
+
 def run(context: FessContext) -> None:
     add.run(context)
     update.run(context)
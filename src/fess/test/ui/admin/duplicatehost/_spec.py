@@ -0,0 +1,11 @@
+"""What admin/duplicatehost tests: the CrudSpec its leaves and package run execute."""
+from fess.test.i18n.keys import Labels
+from fess.test.ui.admin._crud import CrudSpec
+
+SPEC = CrudSpec(
+    resource="duplicatehost",
+    menu=(Labels.MENU_CRAWL, Labels.MENU_DUPLICATE_HOST),
+    create=lambda name: {"regularName": name, "duplicateHostName": "fess.codelibs.org"},
+    update=lambda name: {"regularName": f"{name}X", "duplicateHostName": "www.n2sm.net"},
+    renamed=lambda name: f"{name}X",
+)
@@ -1,11 +1,11 @@
 import logging
 
-from fess.test import assert_equal, assert_startswith
-from fess.test.i18n import t
-from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.admin._crud import CrudRun
 from playwright.sync_api import Playwright, sync_playwright
 
+from ._spec import SPEC
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,50 +20,11 @@ def destroy(context: FessContext) -> None:
 
 
 def run(context: FessContext) -> None:
-    logger.info("Starting duplicatehost delete test")
-
-    page: "Page" = context.get_admin_page()
-    label_name: str = context.create_label_name()
-    logger.debug(f"Using test label: {label_name}")
-
-    # Click text=クローラー
-    logger.info("Step 1: Navigate to Crawler menu")
-    page.click(f"text={t(Labels.MENU_CRAWL)}")
-
-    # Click text=重複ホスト
-    logger.info("Step 2: Navigate to Duplicate Host page")
-    page.click(f"text={t(Labels.MENU_DUPLICATE_HOST)}")
-    assert_equal(page.url, context.url("/admin/duplicatehost/"))
-
-    # Click text=n2sm.net
-    logger.info("Step 3: Click on duplicate host to delete")
-    page.click(f"text={label_name}X")
-    assert_startswith(page.url, context.url("/admin/duplicatehost/details/4/"))
-
-    # Click text=削除
-    logger.info("Step 4: Click delete button")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_DELETE)}")')
-
-    # Click text=キャンセル
-    logger.info("Step 5: Test cancel button")
-    page.click(f"text={t(Labels.CRUD_BUTTON_CANCEL)}")
-
-    # Click text=削除
-    logger.info("Step 6: Click delete button again")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_DELETE)}")')
-
-    # Click text=キャンセル 削除 >> button[name="delete"]
-    logger.info("Step 7: Confirm deletion")
-    page.click('div.modal-footer button[name="delete"]')
-    assert_equal(page.url, context.url("/admin/duplicatehost/"))
-
-    logger.info("Step 8: Verify duplicate host was deleted")
-    page.wait_for_load_state("domcontentloaded")
-    table_content: str = page.inner_text("section.content")
-    assert_equal(table_content.find(label_name), -1,
-                 f"{label_name} in {table_content}")
-
-    logger.info("Duplicatehost delete test completed successfully")
+    logger.info("Starting duplicate host delete test")
+    crud = CrudRun(context, SPEC)
+    crud.delete()
+    crud.report()
+    logger.info("Duplicate host delete test completed successfully")
 
 
 if __name__ == "__main__":
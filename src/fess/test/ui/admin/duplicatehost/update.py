@@ -1,11 +1,11 @@
 import logging
 
-from fess.test import assert_equal, assert_startswith
-from fess.test.i18n import t
-from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.admin._crud import CrudRun
 from playwright.sync_api import Playwright, sync_playwright
 
+from ._spec import SPEC
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,56 +20,11 @@ def destroy(context: FessContext) -> None:
 
 
 def run(context: FessContext) -> None:
-    logger.info("Starting duplicatehost update test")
-
-    page: "Page" = context.get_admin_page()
-    label_name: str = context.create_label_name()
-    logger.debug(f"Using test label: {label_name}")
-
-    # Click text=クローラー
-    logger.info("Step 1: Navigate to Crawler menu")
-    page.click(f"text={t(Labels.MENU_CRAWL)}")
-
-    # Click text=重複ホスト
-    logger.info("Step 2: Navigate to Duplicate Host page")
-    page.click(f"text={t(Labels.MENU_DUPLICATE_HOST)}")
-    assert_equal(page.url, context.url("/admin/duplicatehost/"))
-
-    # Click text=fess.codelibs.org
-    logger.info("Step 3: Click on existing duplicate host")
-    page.click(f"text={label_name}")
-    assert_startswith(page.url, context.url("/admin/duplicatehost/details/4/"))
-
-    # Click text=編集
-    logger.info("Step 4: Click edit button")
-    page.click(f"text={t(Labels.CRUD_BUTTON_EDIT)}")
-    assert_equal(page.url, context.url("/admin/duplicatehost/"))
-
-    # Click text=戻る
-    logger.info("Step 5: Test back button")
-    page.click(f"text={t(Labels.CRUD_BUTTON_BACK)}")
-    assert_equal(page.url, context.url("/admin/duplicatehost/"))
-
-    # Click text=編集
-    logger.info("Step 6: Click edit button again")
-    page.click(f"text={t(Labels.CRUD_BUTTON_EDIT)}")
-    assert_equal(page.url, context.url("/admin/duplicatehost/"))
-
-    # Fill input[name="regularName"]
-    logger.info("Step 7: Update duplicate host values")
-    page.fill("input[name=\"regularName\"]", f"{label_name}X")
-
-    # Fill input[name="duplicateHostName"]
-    page.fill("input[name=\"duplicateHostName\"]", "www.n2sm.net")
-
-    # Click text=更新
-    logger.info("Step 8: Submit update")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_UPDATE)}")')
-    assert_equal(page.url, context.url("/admin/duplicatehost/"))
-
-    logger.info("Duplicatehost update test completed successfully")
-
-    # TODO check content
+    logger.info("Starting duplicate host update test")
+    crud = CrudRun(context, SPEC)
+    crud.update()
+    crud.report()
+    logger.info("Duplicate host update test completed successfully")
 
 
 if __name__ == "__main__":
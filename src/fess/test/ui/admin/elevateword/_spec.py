@@ -0,0 +1,11 @@
+"""What admin/elevateword tests: the CrudSpec its leaves and package run execute."""
+from fess.test.i18n.keys import Labels
+from fess.test.ui.admin._crud import CrudSpec
+
+SPEC = CrudSpec(
+    resource="elevateword",
+    menu=(Labels.MENU_SUGGEST, Labels.MENU_ELEVATE_WORD),
+    create=lambda name: {"suggestWord": name, "reading": "app"},
+    update=lambda name: {"suggestWord": f"{name}X"},
+    renamed=lambda name: f"{name}X",
+)
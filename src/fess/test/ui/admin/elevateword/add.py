@@ -1,11 +1,11 @@
 import logging
 
-from fess.test import assert_equal, assert_not_equal
-from fess.test.i18n import t
-from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.admin._crud import CrudRun
 from playwright.sync_api import Playwright, sync_playwright
 
+from ._spec import SPEC
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,45 +20,11 @@ def destroy(context: FessContext) -> None:
 
 
 def run(context: FessContext) -> None:
-    logger.info("Starting elevateword add test")
-
-    page: "Page" = context.get_admin_page()
-    label_name: str = context.create_label_name()
-    logger.debug(f"Using test label: {label_name}")
-
-    # Click text=サジェスト
-    logger.info("Step 1: Navigate to Suggest menu")
-    page.click(f"text={t(Labels.MENU_SUGGEST)}")
-
-    # Click text=追加ワード
-    logger.info("Step 2: Navigate to Elevate Word page")
-    page.click(f"text={t(Labels.MENU_ELEVATE_WORD)}")
-    assert_equal(page.url, context.url("/admin/elevateword/"))
-
-    # Click text=新規作成
-    logger.info("Step 3: Click create new button")
-    page.click(f"text={t(Labels.CRUD_LINK_CREATE)}")
-    assert_equal(page.url, context.url("/admin/elevateword/createnew/"))
-
-    # Fill input[name="suggestWord"]
-    logger.info("Step 4: Fill in elevate word form")
-    page.fill("input[name=\"suggestWord\"]", f"{label_name}")
-
-    # Fill input[name="reading"]
-    page.fill("input[name=\"reading\"]", "app")
-
-    # Click button:has-text("作成")
-    logger.info("Step 5: Submit form to create elevate word")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_CREATE)}")')
-    assert_equal(page.url, context.url("/admin/elevateword/"))
-
-    logger.info("Step 6: Verify elevate word was created")
-    page.wait_for_load_state("domcontentloaded")
-    table_content: str = page.inner_text("table")
-    assert_not_equal(table_content.find(label_name), -1,
-                     f"{label_name} not in {table_content}")
-
-    logger.info("Elevateword add test completed successfully")
+    logger.info("Starting elevate word add test")
+    crud = CrudRun(context, SPEC)
+    crud.add()
+    crud.report()
+    logger.info("Elevate word add test completed successfully")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,11 @@
 import logging
 
-from fess.test import assert_equal, assert_startswith
-from fess.test.i18n import t
-from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.admin._crud import CrudRun
 from playwright.sync_api import Playwright, sync_playwright
 
+from ._spec import SPEC
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,50 +20,11 @@ def destroy(context: FessContext) -> None:
 
 
 def run(context: FessContext) -> None:
-    logger.info("Starting elevateword delete test")
-
-    page: "Page" = context.get_admin_page()
-    label_name: str = context.create_label_name()
-    logger.debug(f"Using test label: {label_name}")
-
-    # Click text=サジェスト
-    logger.info("Step 1: Navigate to Suggest menu")
-    page.click(f"text={t(Labels.MENU_SUGGEST)}")
-
-    # Click text=追加ワード
-    logger.info("Step 2: Navigate to Elevate Word page")
-    page.click(f"text={t(Labels.MENU_ELEVATE_WORD)}")
-    assert_equal(page.url, context.url("/admin/elevateword/"))
-
-    # Click text=app
-    logger.info("Step 3: Click on elevate word to delete")
-    page.click(f"text={label_name}X")
-    assert_startswith(page.url, context.url("/admin/elevateword/details/4/"))
-
-    # Click text=削除
-    logger.info("Step 4: Click delete button")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_DELETE)}")')
-
-    # Click text=キャンセル
-    logger.info("Step 5: Test cancel button")
-    page.click(f"text={t(Labels.CRUD_BUTTON_CANCEL)}")
-
-    # Click text=削除
-    logger.info("Step 6: Click delete button again")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_DELETE)}")')
-
-    # Click text=キャンセル 削除 >> button[name="delete"]
-    logger.info("Step 7: Confirm deletion")
-    page.click('div.modal-footer button[name="delete"]')
-    assert_equal(page.url, context.url("/admin/elevateword/"))
-
-    logger.info("Step 8: Verify elevate word was deleted")
-    page.wait_for_load_state("domcontentloaded")
-    table_content: str = page.inner_text("section.content")
-    assert_equal(table_content.find(label_name), -1,
-                 f"{label_name} in {table_content}")
-
-    logger.info("Elevateword delete test completed successfully")
+    logger.info("Starting elevate word delete test")
+    crud = CrudRun(context, SPEC)
+    crud.delete()
+    crud.report()
+    logger.info("Elevate word delete test completed successfully")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,11 @@
 import logging
 
-from fess.test import assert_equal, assert_startswith
-from fess.test.i18n import t
-from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.admin._crud import CrudRun
 from playwright.sync_api import Playwright, sync_playwright
 
+from ._spec import SPEC
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,53 +20,11 @@ def destroy(context: FessContext) -> None:
 
 
 def run(context: FessContext) -> None:
-    logger.info("Starting elevateword update test")
-
-    page: "Page" = context.get_admin_page()
-    label_name: str = context.create_label_name()
-    logger.debug(f"Using test label: {label_name}")
-
-    # Click text=サジェスト
-    logger.info("Step 1: Navigate to Suggest menu")
-    page.click(f"text={t(Labels.MENU_SUGGEST)}")
-
-    # Click text=追加ワード
-    logger.info("Step 2: Navigate to Elevate Word page")
-    page.click(f"text={t(Labels.MENU_ELEVATE_WORD)}")
-    assert_equal(page.url, context.url("/admin/elevateword/"))
-
-    # Click text=application
-    logger.info("Step 3: Click on existing elevate word")
-    page.click(f"text={label_name}")
-    assert_startswith(page.url, context.url("/admin/elevateword/details/4/"))
-
-    # Click text=編集
-    logger.info("Step 4: Click edit button")
-    page.click(f"text={t(Labels.CRUD_BUTTON_EDIT)}")
-    assert_equal(page.url, context.url("/admin/elevateword/"))
-
-    # Click text=戻る
-    logger.info("Step 5: Test back button")
-    page.click(f"text={t(Labels.CRUD_BUTTON_BACK)}")
-    assert_equal(page.url, context.url("/admin/elevateword/"))
-
-    # Click text=編集
-    logger.info("Step 6: Click edit button again")
-    page.click(f"text={t(Labels.CRUD_BUTTON_EDIT)}")
-    assert_equal(page.url, context.url("/admin/elevateword/"))
-
-    # Fill input[name="suggestWord"]
-    logger.info("Step 7: Update elevate word value")
-    page.fill("input[name=\"suggestWord\"]", f"{label_name}X")
-
-    # Click text=更新
-    logger.info("Step 8: Submit update")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_UPDATE)}")')
-    assert_equal(page.url, context.url("/admin/elevateword/"))
-
-    logger.info("Elevateword update test completed successfully")
-
-    # TODO check content
+    logger.info("Starting elevate word update test")
+    crud = CrudRun(context, SPEC)
+    crud.update()
+    crud.report()
+    logger.info("Elevate word update test completed successfully")
 
 
 if __name__ == "__main__":
@@ -7,6 +7,9 @@ from ._const import FILECONFIG_NAME
 from . import add, delete, update
 
 
+WRITES = ("fileauth", "fileconfig")
+
+
 def run(context: FessContext) -> None:
     add.run(context)
     update.run(context)
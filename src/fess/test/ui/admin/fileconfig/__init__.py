@@ -3,6 +3,10 @@ from fess.test.ui import FessContext
 from . import add, delete, update, job
 
 
+# job.py creates and deletes a crawler job for the config.
+WRITES = ("fileconfig", "scheduler")
+
+
 def run(context: FessContext) -> None:
     add.run(context)
     update.run(context)
@@ -9,14 +9,22 @@ Order: the read-only pages first, then the modules that mutate settings.
 loginRequired goes last because a failure to restore it would send every later
 module to the login screen.
 """
+from fess.test.schedule import EXCLUSIVE
 from fess.test.ui import FessContext
 
-from . import (jsonResponse, logLevel, loginLink, loginRequired,
-               notificationLogin, notificationSearchTop, pagedesign, plugin,
-               popularWord, storage)
+# Exclusive, so in a parallel run it still starts only after every module
+# listed before it has finished and nothing runs beside it: loginRequired
+# closes the public UI to anonymous visitors while it runs.
+WRITES = (EXCLUSIVE,)
 
 
 def run(context: FessContext) -> None:
+    # Imported on use, so selecting one leaf does not import its siblings
+    # (see fess.test.registry).
+    from . import (jsonResponse, logLevel, loginLink, loginRequired,
+                   notificationLogin, notificationSearchTop, pagedesign, plugin,
+                   popularWord, storage)
+
     popularWord.run(context)
     pagedesign.run(context)
     storage.run(context)
@@ -16,8 +16,6 @@ appends a trailing slash to a resolved action path, so the rendered href is
 import logging
 import re
 
-import requests
-
 from fess.test import assert_equal, assert_true
 from fess.test.ui import FessContext
 from fess.test.ui.cleanup import Cleanup
@@ -72,7 +70,7 @@ def _set_login_link(context: FessContext, page, enabled: bool) -> None:
 
 def _anonymous_top(context: FessContext) -> str:
     """Fetch the search top page with no session cookie, and return its HTML."""
-    response = requests.get(context.url(TOP_PATH), timeout=HTTP_TIMEOUT)
+    response = context.api.get_anonymous(TOP_PATH, timeout=HTTP_TIMEOUT)
     # loginRequired would bounce an anonymous caller to the login page, and the
     # login page has no login link either way — that would make the assertions
     # below meaningless rather than failing honestly.
@@ -23,8 +23,6 @@ landing URL so it does not depend on which SSO type is configured.
 """
 import logging
 
-import requests
-
 from fess.test import assert_equal, assert_true
 from fess.test.ui import FessContext
 from fess.test.ui.cleanup import Cleanup
@@ -116,14 +114,14 @@ def run(context: FessContext) -> None:
         _set_login_required(context, page, True)
         assert_saved(page)
 
-        required = requests.get(context.url(TOP_PATH), timeout=HTTP_TIMEOUT)
+        required = context.api.get_anonymous(TOP_PATH, timeout=HTTP_TIMEOUT)
         assert_true("/login" in required.url,
                     f"loginRequired=true but an anonymous GET {TOP_PATH} ended at "
                     f"{required.url} instead of the login page")
 
         _set_login_required(context, page, False)
 
-        public = requests.get(context.url(TOP_PATH), timeout=HTTP_TIMEOUT)
+        public = context.api.get_anonymous(TOP_PATH, timeout=HTTP_TIMEOUT)
         assert_true("/login" not in public.url,
                     f"loginRequired=false but an anonymous GET {TOP_PATH} was "
                     f"still redirected to {public.url}")
@@ -19,8 +19,6 @@ the JSP byte-for-byte.
 import logging
 import re
 
-import requests
-
 from fess.test import assert_equal, assert_true
 from fess.test.ui import FessContext
 from fess.test.ui.cleanup import Cleanup
@@ -66,7 +64,7 @@ def _save(context: FessContext, page, value: str) -> None:
 
 def _notification_on_login_page(context: FessContext) -> str:
     """Return the contents of div.notification on the anonymous login page."""
-    response = requests.get(context.url(LOGIN_PATH), timeout=HTTP_TIMEOUT)
+    response = context.api.get_anonymous(LOGIN_PATH, timeout=HTTP_TIMEOUT)
     match = re.search(r'<div class="notification">(.*?)</div>', response.text,
                       re.DOTALL)
     assert_true(match,
@@ -18,8 +18,6 @@ the JSP byte-for-byte.
 import logging
 import re
 
-import requests
-
 from fess.test import assert_equal, assert_true
 from fess.test.ui import FessContext
 from fess.test.ui.cleanup import Cleanup
@@ -65,7 +63,7 @@ def _save(context: FessContext, page, value: str) -> None:
 
 def _notification_on_top_page(context: FessContext) -> str:
     """Return the contents of div.notification on the anonymous top page."""
-    response = requests.get(context.url(TOP_PATH), timeout=HTTP_TIMEOUT)
+    response = context.api.get_anonymous(TOP_PATH, timeout=HTTP_TIMEOUT)
     # loginRequired would bounce an anonymous caller to the login page, whose
     # notification comes from a different setting entirely.
     assert_true("/login" not in response.url,
@@ -1,10 +1,11 @@
 from fess.test.ui import FessContext
+from fess.test.ui.admin import _crud
 
-from . import add, delete, update, validation
+from ._spec import SPEC
+
+
+WRITES = ("keymatch",)
 
 
 def run(context: FessContext) -> None:
-    add.run(context)
-    update.run(context)
-    validation.run(context)
-    delete.run(context)
+    _crud.run(context, SPEC)
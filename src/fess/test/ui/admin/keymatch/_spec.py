@@ -0,0 +1,16 @@
+"""What admin/keymatch tests: the CrudSpec its leaves and package run execute."""
+from fess.test.i18n.keys import Labels
+from fess.test.ui.admin._crud import CrudSpec, Invalid
+
+SPEC = CrudSpec(
+    resource="keymatch",
+    menu=(Labels.MENU_CRAWL, Labels.MENU_KEY_MATCH),
+    create=lambda name: {"term": name, "query": "n2sm AND Fess", "maxSize": "10"},
+    update=lambda name: {"maxSize": "5"},
+    invalid=(
+        Invalid("empty required fields", {"term": "", "query": ""}),
+        # term has @Size(max=100)
+        Invalid("over-long term", {"term": "t" * 300, "query": "q" * 300}),
+    ),
+    markup_field="term",
+)
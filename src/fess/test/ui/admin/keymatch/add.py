@@ -1,11 +1,11 @@
 import logging
 
-from fess.test import assert_equal, assert_not_equal
-from fess.test.i18n import t
-from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.admin._crud import CrudRun
 from playwright.sync_api import Playwright, sync_playwright
 
+from ._spec import SPEC
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,48 +20,11 @@ def destroy(context: FessContext) -> None:
 
 
 def run(context: FessContext) -> None:
-    logger.info("Starting keymatch add test")
-
-    page: "Page" = context.get_admin_page()
-    label_name: str = context.create_label_name()
-    logger.debug(f"Using test label: {label_name}")
-
-    # Click text=クローラー
-    logger.info("Step 1: Navigate to Suggest menu")
-    page.click(f"text={t(Labels.MENU_CRAWL)}")
-
-    # Click text=キーマッチ
-    logger.info("Step 2: Navigate to Key Match page")
-    page.click(f"text={t(Labels.MENU_KEY_MATCH)}")
-    assert_equal(page.url, context.url("/admin/keymatch/"))
-
-    # Click text=新規作成
-    logger.info("Step 3: Click create new button")
-    page.click(f"text={t(Labels.CRUD_LINK_CREATE)}")
-    assert_equal(page.url, context.url("/admin/keymatch/createnew/"))
-
-    # Fill input[name="term"]
-    logger.info("Step 4: Fill in key match form")
-    page.fill("input[name=\"term\"]", f"{label_name}")
-
-    # Fill input[name="query"]
-    page.fill("input[name=\"query\"]", "n2sm AND Fess")
-
-    # Fill input[name="maxSize"]
-    page.fill("input[name=\"maxSize\"]", "10")
-
-    # Click button:has-text("作成")
-    logger.info("Step 5: Submit form to create key match")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_CREATE)}")')
-    assert_equal(page.url, context.url("/admin/keymatch/"))
-
-    logger.info("Step 6: Verify key match was created")
-    page.wait_for_load_state("domcontentloaded")
-    table_content: str = page.inner_text("table")
-    assert_not_equal(table_content.find(label_name), -1,
-                     f"{label_name} not in {table_content}")
-
-    logger.info("Keymatch add test completed successfully")
+    logger.info("Starting key match add test")
+    crud = CrudRun(context, SPEC)
+    crud.add()
+    crud.report()
+    logger.info("Key match add test completed successfully")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,11 @@
 import logging
 
-from fess.test import assert_equal, assert_startswith
-from fess.test.i18n import t
-from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.admin._crud import CrudRun
 from playwright.sync_api import Playwright, sync_playwright
 
+from ._spec import SPEC
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,53 +20,11 @@ def destroy(context: FessContext) -> None:
 
 
 def run(context: FessContext) -> None:
-    logger.info("Starting keymatch update test")
-
-    page: "Page" = context.get_admin_page()
-    label_name: str = context.create_label_name()
-    logger.debug(f"Using test label: {label_name}")
-
-    # Click text=クローラー
-    logger.info("Step 1: Navigate to Suggest menu")
-    page.click(f"text={t(Labels.MENU_CRAWL)}")
-
-    # Click text=キーマッチ
-    logger.info("Step 2: Navigate to Key Match page")
-    page.click(f"text={t(Labels.MENU_KEY_MATCH)}")
-    assert_equal(page.url, context.url("/admin/keymatch/"))
-
-    # Click text=n2sm
-    logger.info("Step 3: Click on existing key match")
-    page.click(f"text={label_name}")
-    assert_startswith(page.url, context.url("/admin/keymatch/details/4/"))
-
-    # Click text=編集
-    logger.info("Step 4: Click edit button")
-    page.click(f"text={t(Labels.CRUD_BUTTON_EDIT)}")
-    assert_equal(page.url, context.url("/admin/keymatch/"))
-
-    # Click text=戻る
-    logger.info("Step 5: Test back button")
-    page.click(f"text={t(Labels.CRUD_BUTTON_BACK)}")
-    assert_equal(page.url, context.url("/admin/keymatch/"))
-
-    # Click text=編集
-    logger.info("Step 6: Click edit button again")
-    page.click(f"text={t(Labels.CRUD_BUTTON_EDIT)}")
-    assert_equal(page.url, context.url("/admin/keymatch/"))
-
-    # Fill input[name="maxSize"]
-    logger.info("Step 7: Update max size value")
-    page.fill("input[name=\"maxSize\"]", "5")
-
-    # Click text=更新
-    logger.info("Step 8: Submit update")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_UPDATE)}")')
-    assert_equal(page.url, context.url("/admin/keymatch/"))
-
-    logger.info("Keymatch update test completed successfully")
-
-    # TODO check content
+    logger.info("Starting key match update test")
+    crud = CrudRun(context, SPEC)
+    crud.update()
+    crud.report()
+    logger.info("Key match update test completed successfully")
 
 
 if __name__ == "__main__":
@@ -1,8 +1,11 @@
-from fess.test.ui.admin.label import add, update, validation, delete
+from fess.test.ui import FessContext
+from fess.test.ui.admin import _crud
 
+from ._spec import SPEC
 
-def run(context):
-    add.run(context)
-    update.run(context)
-    validation.run(context)
-    delete.run(context)
+
+WRITES = ("labeltype",)
+
+
+def run(context: FessContext) -> None:
+    _crud.run(context, SPEC)
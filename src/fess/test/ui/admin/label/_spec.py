@@ -0,0 +1,28 @@
+"""What admin/label tests: the CrudSpec its leaves and package run execute."""
+from fess.test.i18n.keys import Labels
+from fess.test.ui.admin._crud import CrudSpec, Invalid
+
+SPEC = CrudSpec(
+    resource="labeltype",
+    menu=(Labels.MENU_CRAWL, Labels.MENU_LABEL_TYPE),
+    create=lambda name: {"name": name, "value": name.lower(),
+                         "includedPaths": "https://example.com/.*", "sortOrder": "1"},
+    update=lambda name: {"sortOrder": "10",
+                         "includedPaths": "https://example.com/updated/.*"},
+    verify=("name", "value"),
+    invalid=(
+        Invalid("empty required fields", {"name": "", "value": ""}),
+        # sortOrder is <input type="number">: fill() throws on a non-number
+        # before it reaches Fess, so the input is flipped to text and the
+        # server-side @ValidateTypeFailure (labeltype/CreateForm.java) has
+        # to reject it.
+        Invalid("non-numeric sortOrder",
+                {"name": "sortorder", "value": "testvalue",
+                 "includedPaths": "https://example.com/.*"},
+                script=("#sortOrder", "el => { el.type='text'; el.value='not-a-number'; }")),
+        # name and value both have @Size(max=100)
+        Invalid("over-long name/value",
+                {"name": "n" * 300, "value": "v" * 300, "sortOrder": "1"}),
+    ),
+    markup_field="name",
+)
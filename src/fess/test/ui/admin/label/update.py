@@ -1,11 +1,11 @@
 import logging
 
-from fess.test import assert_equal, assert_not_equal, assert_startswith
-from fess.test.i18n import t
-from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.admin._crud import CrudRun
 from playwright.sync_api import Playwright, sync_playwright
 
+from ._spec import SPEC
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,54 +21,12 @@ def destroy(context: FessContext) -> None:
 
 def run(context: FessContext) -> None:
     logger.info("Starting label update test")
-
-    page: "Page" = context.get_admin_page()
-    label_name: str = context.create_label_name()
-    logger.debug(f"Using test label: {label_name}")
-
-    # Step 1: Navigate to label page
-    logger.info("Step 1: Navigating to label page")
-    page.click(f"text={t(Labels.MENU_CRAWL)}")
-    page.click(f"text={t(Labels.MENU_LABEL_TYPE)}")
-    assert_equal(page.url, context.url("/admin/labeltype/"))
-
-    # Step 2: Open label details
-    logger.info("Step 2: Opening label details")
-    page.click(f"text={label_name}")
-    assert_startswith(
-        page.url, context.url("/admin/labeltype/details/4/"))
-
-    # Step 3: Test back button
-    logger.info("Step 3: Testing edit and back button")
-    page.click(f"text={t(Labels.CRUD_BUTTON_EDIT)}")
-    assert_equal(page.url, context.url("/admin/labeltype/"))
-    page.click(f"text={t(Labels.CRUD_BUTTON_BACK)}")
-    assert_equal(page.url, context.url("/admin/labeltype/"))
-
-    # Step 4: Open edit form
-    logger.info("Step 4: Opening edit form")
-    page.click(f"text={t(Labels.CRUD_BUTTON_EDIT)}")
-    assert_equal(page.url, context.url("/admin/labeltype/"))
-
-    # Step 5: Update form fields
-    logger.info("Step 5: Updating form fields")
-    page.fill("input[name=\"sortOrder\"]", "10")
-    page.fill("textarea[name=\"includedPaths\"]", "https://example.com/updated/.*")
-
-    # Step 6: Submit update
-    logger.info("Step 6: Submitting update")
-    page.click(f"text={t(Labels.CRUD_BUTTON_UPDATE)}")
-    assert_equal(page.url, context.url("/admin/labeltype/"))
-
-    # Step 7: Verify update
-    logger.info("Step 7: Verifying update")
-    page.wait_for_load_state("domcontentloaded")
-    table_content = page.inner_text("table")
-    assert_not_equal(table_content.find(label_name), -1,
-                     f"{label_name} not found in table after update")
-
+    crud = CrudRun(context, SPEC)
+    crud.update()
+    crud.report()
     logger.info("Label update test completed successfully")
 
+
 if __name__ == "__main__":
     with sync_playwright() as playwright:
         context: FessContext = setup(playwright)
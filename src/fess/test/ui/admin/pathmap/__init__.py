@@ -1,9 +1,11 @@
 from fess.test.ui import FessContext
+from fess.test.ui.admin import _crud
 
-from . import add, update, delete
+from ._spec import SPEC
+
+
+WRITES = ("pathmap",)
 
 
 def run(context: FessContext) -> None:
-    add.run(context)
-    update.run(context)
-    delete.run(context)
+    _crud.run(context, SPEC)
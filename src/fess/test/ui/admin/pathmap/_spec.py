@@ -0,0 +1,15 @@
+"""What admin/pathmap tests: the CrudSpec its leaves and package run execute."""
+from fess.test.i18n.keys import Labels
+from fess.test.ui.admin._crud import CrudSpec
+
+SPEC = CrudSpec(
+    resource="pathmap",
+    menu=(Labels.MENU_CRAWL, Labels.MENU_PATH_MAPPING),
+    create=lambda name: {"regex": f"/old-{name}/.*", "replacement": f"/new-{name}/",
+                         "processType": "B", "sortOrder": "1",
+                         "userAgent": f"TestAgent-{name}"},
+    update=lambda name: {"userAgent": f"UpdatedAgent-{name}", "sortOrder": "10"},
+    row=lambda name: f"/old-{name}/",
+    verify=("regex", "replacement"),
+    selects=("processType",),
+)
@@ -0,0 +1,12 @@
+"""What admin/relatedcontent tests: the CrudSpec its leaves and package run execute."""
+from fess.test.i18n.keys import Labels
+from fess.test.ui.admin._crud import CrudSpec
+
+SPEC = CrudSpec(
+    resource="relatedcontent",
+    menu=(Labels.MENU_CRAWL, Labels.MENU_RELATED_CONTENT),
+    create=lambda name: {"term": name,
+                         "content": "<a href=\"https://www.n2sm.net/\">N2SM,Inc.</a>はこちら。",
+                         "sortOrder": "1"},
+    update=lambda name: {"sortOrder": "99"},
+)
@@ -1,12 +1,11 @@
-
 import logging
 
-from fess.test import assert_equal, assert_not_equal
-from fess.test.i18n import t
-from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.admin._crud import CrudRun
 from playwright.sync_api import Playwright, sync_playwright
 
+from ._spec import SPEC
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,46 +21,9 @@ def destroy(context: FessContext) -> None:
 
 def run(context: FessContext) -> None:
     logger.info("Starting relatedcontent add test")
-
-    page: "Page" = context.get_admin_page()
-    label_name: str = context.create_label_name()
-    logger.debug(f"Using test label: {label_name}")
-
-    # Click text=クローラー
-    logger.info("Step 1: Navigate to Crawler menu")
-    page.click(f"text={t(Labels.MENU_CRAWL)}")
-
-    # Click text=関連コンテンツ
-    logger.info("Step 2: Navigate to Related Content page")
-    page.click(f"text={t(Labels.MENU_RELATED_CONTENT)}")
-    assert_equal(page.url, context.url("/admin/relatedcontent/"))
-
-    # Click text=新規作成
-    logger.info("Step 3: Click create new button")
-    page.click(f"text={t(Labels.CRUD_LINK_CREATE)}")
-    assert_equal(page.url, context.url("/admin/relatedcontent/createnew/"))
-
-    # Fill input[name="name"]
-    logger.info("Step 4: Fill in related content form")
-    page.fill("input[name=\"term\"]", label_name)
-
-    # Fill textarea[name="content"]
-    page.fill("textarea[name=\"content\"]", "<a href=\"https://www.n2sm.net/\">N2SM,Inc.</a>はこちら。")
-
-    # Fill input[name="sortOrder"]
-    page.fill("input[name=\"sortOrder\"]", "1")
-
-    # Click button:has-text("作成")
-    logger.info("Step 5: Submit form to create related content")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_CREATE)}")')
-    assert_equal(page.url, context.url("/admin/relatedcontent/"))
-
-    logger.info("Step 6: Verify related content was created")
-    page.wait_for_load_state("domcontentloaded")
-    table_content: str = page.inner_text("table")
-    assert_not_equal(table_content.find(label_name), -1,
-                     f"{label_name} not in {table_content}")
-
+    crud = CrudRun(context, SPEC)
+    crud.add()
+    crud.report()
     logger.info("Relatedcontent add test completed successfully")
 
 
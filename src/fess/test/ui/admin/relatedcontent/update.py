@@ -1,11 +1,11 @@
 import logging
 
-from fess.test import assert_equal, assert_startswith
-from fess.test.i18n import t
-from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.admin._crud import CrudRun
 from playwright.sync_api import Playwright, sync_playwright
 
+from ._spec import SPEC
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,50 +21,9 @@ def destroy(context: FessContext) -> None:
 
 def run(context: FessContext) -> None:
     logger.info("Starting relatedcontent update test")
-
-    page: "Page" = context.get_admin_page()
-    label_name: str = context.create_label_name()
-    logger.debug(f"Using test label: {label_name}")
-
-    # Click text=クローラー
-    logger.info("Step 1: Navigate to Crawler menu")
-    page.click(f"text={t(Labels.MENU_CRAWL)}")
-
-    # Click text=関連コンテンツ
-    logger.info("Step 2: Navigate to Related Content page")
-    page.click(f"text={t(Labels.MENU_RELATED_CONTENT)}")
-    assert_equal(page.url, context.url("/admin/relatedcontent/"))
-
-    # Click text=fess
-    logger.info("Step 3: Open related content details")
-    page.click(f"text={label_name}")
-    assert_startswith(
-        page.url, context.url("/admin/relatedcontent/details/4/"))
-
-    # Click text=編集
-    logger.info("Step 4: Click edit button")
-    page.click(f"text={t(Labels.CRUD_BUTTON_EDIT)}")
-    assert_equal(page.url, context.url("/admin/relatedcontent/"))
-
-    # Click text=戻る
-    logger.info("Step 5: Click back button to test navigation")
-    page.click(f"text={t(Labels.CRUD_BUTTON_BACK)}")
-    assert_equal(page.url, context.url("/admin/relatedcontent/"))
-
-    # Click text=編集
-    logger.info("Step 6: Click edit button again")
-    page.click(f"text={t(Labels.CRUD_BUTTON_EDIT)}")
-    assert_equal(page.url, context.url("/admin/relatedcontent/"))
-
-    # Fill input[name="sortOrder"]
-    logger.info("Step 7: Update sort order field")
-    page.fill("input[name=\"sortOrder\"]", "99")
-
-    # Click text=更新
-    logger.info("Step 8: Submit form to update related content")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_UPDATE)}")')
-    assert_equal(page.url, context.url("/admin/relatedcontent/"))
-
+    crud = CrudRun(context, SPEC)
+    crud.update()
+    crud.report()
     logger.info("Relatedcontent update test completed successfully")
 
 
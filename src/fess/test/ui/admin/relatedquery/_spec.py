@@ -0,0 +1,10 @@
+"""What admin/relatedquery tests: the CrudSpec its leaves and package run execute."""
+from fess.test.i18n.keys import Labels
+from fess.test.ui.admin._crud import CrudSpec
+
+SPEC = CrudSpec(
+    resource="relatedquery",
+    menu=(Labels.MENU_CRAWL, Labels.MENU_RELATED_QUERY),
+    create=lambda name: {"term": name, "queries": "n2sm"},
+    update=lambda name: {"queries": "elasticsearch"},
+)
@@ -1,12 +1,11 @@
-
 import logging
 
-from fess.test import assert_equal, assert_not_equal
-from fess.test.i18n import t
-from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.admin._crud import CrudRun
 from playwright.sync_api import Playwright, sync_playwright
 
+from ._spec import SPEC
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,43 +21,9 @@ def destroy(context: FessContext) -> None:
 
 def run(context: FessContext) -> None:
     logger.info("Starting relatedquery add test")
-
-    page: "Page" = context.get_admin_page()
-    label_name: str = context.create_label_name()
-    logger.debug(f"Using test label: {label_name}")
-
-    # Click text=クローラー
-    logger.info("Step 1: Navigate to Crawler menu")
-    page.click(f"text={t(Labels.MENU_CRAWL)}")
-
-    # Click text=関連クエリー
-    logger.info("Step 2: Navigate to Related Query page")
-    page.click(f"text={t(Labels.MENU_RELATED_QUERY)}")
-    assert_equal(page.url, context.url("/admin/relatedquery/"))
-
-    # Click text=新規作成
-    logger.info("Step 3: Click create new button")
-    page.click(f"text={t(Labels.CRUD_LINK_CREATE)}")
-    assert_equal(page.url, context.url("/admin/relatedquery/createnew/"))
-
-    # Fill input[name="term"]
-    logger.info("Step 4: Fill in related query form")
-    page.fill("input[name=\"term\"]", label_name)
-
-    # Fill textarea[name="queries"]
-    page.fill("textarea[name=\"queries\"]", "n2sm")
-
-    # Click button:has-text("作成")
-    logger.info("Step 5: Submit form to create related query")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_CREATE)}")')
-    assert_equal(page.url, context.url("/admin/relatedquery/"))
-
-    logger.info("Step 6: Verify related query was created")
-    page.wait_for_load_state("domcontentloaded")
-    table_content: str = page.inner_text("table")
-    assert_not_equal(table_content.find(label_name), -1,
-                     f"{label_name} not in {table_content}")
-
+    crud = CrudRun(context, SPEC)
+    crud.add()
+    crud.report()
     logger.info("Relatedquery add test completed successfully")
 
 
@@ -7,6 +7,9 @@ from ._const import WEBCONFIG_NAME
 from . import add, delete, update
 
 
+WRITES = ("reqheader", "webconfig")
+
+
 def run(context: FessContext) -> None:
     add.run(context)
     update.run(context)
@@ -3,6 +3,9 @@ from fess.test.ui import FessContext
 from . import add, delete, validation
 
 
+WRITES = ("role",)
+
+
 def run(context: FessContext) -> None:
     add.run(context)
     # Note: role does not have update functionality in Fess UI
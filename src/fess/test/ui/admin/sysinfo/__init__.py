@@ -7,13 +7,26 @@ module here is picked up by adding one line to this file.
 Order preserves what main.py's default list used to do: the data-independent
 structural pages first, then the ones that read crawl/search data.
 """
-from fess.test.ui import FessContext
+from fess.test.ui import FessContext, static_check
 
-from . import (backup, backup_download, configinfo, crawlinfo, deleteall,
-               failureurl, joblog, logfile, maintenance, searchlist, searchlog)
+# deleteall empties the job-log and crawling-info indices, so it has to come
+# after search_seed has launched its crawl; it then waits for that crawl to go
+# idle by itself.
+WRITES = ("joblog", "crawlinginfo")
+READS = ("crawler", "general-settings")
 
 
 def run(context: FessContext) -> None:
+    # Imported on use, so selecting one leaf does not import its siblings
+    # (see fess.test.registry).
+    from . import (backup, backup_download, configinfo, crawlinfo, deleteall,
+                   failureurl, joblog, logfile, maintenance, searchlist, searchlog)
+
+    # Under STATIC_CHECKS the read-only pages below are fetched in one
+    # concurrent round now, and each leaf checks its copy.
+    static_check.prefetch_modules(context, [configinfo, logfile, crawlinfo, joblog,
+                                            failureurl, searchlog, searchlist, backup,
+                                            maintenance])
     configinfo.run(context)
     logfile.run(context)
     crawlinfo.run(context)
@@ -33,11 +33,11 @@ is not touched.
 """
 import json
 import logging
-import time
 
 from playwright.sync_api import Playwright, sync_playwright
 
 from fess.test import assert_equal, assert_true
+from fess.test.eventually import eventually
 from fess.test.ui import FessContext
 
 logger = logging.getLogger(__name__)
@@ -70,7 +70,7 @@ EXPECTED_TARGETS = [
 # already there and the first poll returns; the wait only pays out when
 # someone runs this module alone against a fresh instance.
 LOG_FLUSH_TIMEOUT = 90
-LOG_FLUSH_POLL = 5
+LOG_FLUSH_POLL = 5  # longest interval; polling backs off up to it
 
 
 def setup(playwright: Playwright) -> FessContext:
@@ -130,20 +130,23 @@ def _href_for(hrefs: dict, target: str) -> str:
 
 
 def _wait_for_search_logs(page, context: FessContext, href: str):
-    """Poll until the search-log index holds more than one record."""
-    deadline = time.time() + LOG_FLUSH_TIMEOUT
-    while True:
-        response, lines = _download(page, context, href)
-        if len(lines) > 1:
-            return response, lines
-        if time.time() >= deadline:
-            return response, lines
+    """Poll until the search-log index holds more than one record. Returns
+    the last download either way; the caller asserts on it."""
+    def _generate_traffic(last) -> None:
         # Generate traffic to log, then wait for the aggregator to drain it.
         context.api_search(q="*")
         context.api_search(q="fess")
-        logger.info(f"search_log has {len(lines)} record(s); waiting for the "
+        logger.info(f"search_log has {len(last[1])} record(s); waiting for the "
                     f"Log Aggregator to flush the queue")
-        time.sleep(LOG_FLUSH_POLL)
+
+    result = eventually(lambda: _download(page, context, href),
+                        lambda download: len(download[1]) > 1,
+                        name="sysinfo_backup_download.search_log",
+                        timeout=LOG_FLUSH_TIMEOUT, initial=1.0,
+                        max_interval=LOG_FLUSH_POLL,
+                        progress=lambda download: len(download[1]),
+                        on_wait=_generate_traffic)
+    return result.value
 
 
 def run(context: FessContext) -> None:
@@ -51,11 +51,11 @@ The cancel button needs its class: the modal header's x also carries
 data-dismiss="modal", but as class="close" rather than .btn-outline-light.
 """
 import logging
-import time
 
 from playwright.sync_api import Playwright, sync_playwright
 
 from fess.test import assert_equal, assert_true
+from fess.test.eventually import eventually
 from fess.test.i18n import t, tm
 from fess.test.i18n.keys import Labels
 from fess.test.i18n.message_keys import Messages
@@ -87,16 +87,18 @@ SUCCESS_ALERT = "div.alert-success"
 # beside the success alert) is what surfaced it; the wait is what makes the
 # emptied-list assertion below actually mean the list emptied.
 #
-# search_seed returns as soon as enough documents are indexed, but the crawl
-# it launches runs on: measured ~245s of continued crawling past that return
-# in the ja and de verification runs (the joblog row showed the Running
-# badge with an empty end-time throughout). In the full default order the
+# With SEED_READY=docs, search_seed returns as soon as enough documents are
+# indexed, but the crawl it launches runs on: measured ~245s of continued
+# crawling past that return in the ja and de verification runs (the joblog
+# row showed the Running badge with an empty end-time throughout). The
+# default SEED_READY=crawl waits for the job to end, and this wait's first
+# probe returns; other jobs (wizard, a manual start) can still be running. In the full default order the
 # ~25 search modules between search_seed and sysinfo outlast the crawl, so
 # this wait is free; on a truncated TEST_MODULES subset it does the waiting
 # those modules would otherwise have absorbed. Either way it is required for
 # the assertions to be sound -- do not drop it to speed up a subset run.
 IDLE_TIMEOUT = 900
-IDLE_POLL = 5
+IDLE_POLL = 5  # longest interval; polling backs off up to it
 
 # deleteall() deletes by query and then redirects straight into a list page
 # that re-reads the index. The search engine is only near-real-time, so that
@@ -106,7 +108,7 @@ IDLE_POLL = 5
 # than sampling once. A deleteall that deleted nothing never converges, so
 # the assertion this guards is still falsifiable; it just is not racy.
 EMPTY_TIMEOUT = 30
-EMPTY_POLL = 1
+EMPTY_POLL = 1  # longest interval; polling backs off up to it
 
 
 def setup(playwright: Playwright) -> FessContext:
@@ -121,21 +123,21 @@ def destroy(context: FessContext) -> None:
 
 def _wait_until_no_job_running(page, context: FessContext) -> None:
     """Block until no job log carries the Running badge."""
-    started = time.time()
-    deadline = started + IDLE_TIMEOUT
     running = t(Labels.JOBLOG_STATUS_RUNNING)
-    while True:
+
+    def _job_running() -> bool:
         page.goto(context.url(JOBLOG_URL))
         page.wait_for_load_state("domcontentloaded")
-        if running not in page.inner_text("body"):
-            logger.info(f"no job running after {time.time() - started:.0f}s")
-            return
-        assert_true(time.time() < deadline,
-                    f"a job was still running after {IDLE_TIMEOUT}s; deleting "
-                    f"logs now would silently delete nothing, because deleteall "
-                    f"skips in-flight jobs and sessions")
-        logger.info(f"a job is still running; waiting {IDLE_POLL}s")
-        time.sleep(IDLE_POLL)
+        return running in page.inner_text("body")
+
+    result = eventually(_job_running, lambda is_running: not is_running,
+                        name="sysinfo_deleteall.idle", timeout=IDLE_TIMEOUT,
+                        initial=1.0, max_interval=IDLE_POLL)
+    assert_true(result.converged,
+                f"a job was still running after {result.elapsed:.0f}s; deleting "
+                f"logs now would silently delete nothing, because deleteall "
+                f"skips in-flight jobs and sessions")
+    logger.info(f"no job running after {result.elapsed:.0f}s")
 
 
 def _open_modal(page) -> None:
@@ -198,11 +200,15 @@ def _delete_all(page, context: FessContext, page_url: str,
     # reports success without deleting -- exactly what searchlog's no-op
     # implementation does. The reload also drops the flash message asserted
     # above, which is why that came first.
-    deadline = time.time() + EMPTY_TIMEOUT
-    while page.locator(ROWS).count() > 0 and time.time() < deadline:
-        time.sleep(EMPTY_POLL)
-        page.goto(context.url(page_url))
-        page.wait_for_load_state("domcontentloaded")
+    if page.locator(ROWS).count() > 0:
+        def _reloaded_rows() -> int:
+            page.goto(context.url(page_url))
+            page.wait_for_load_state("domcontentloaded")
+            return page.locator(ROWS).count()
+
+        eventually(_reloaded_rows, lambda rows: rows == 0,
+                   name="sysinfo_deleteall.emptied", timeout=EMPTY_TIMEOUT,
+                   initial=0.25, max_interval=EMPTY_POLL)
     rows_left = page.locator(ROWS).count()
     assert_equal(rows_left, 0,
                  f"{page_url}: {rows_left} row(s) survived a delete-all that "
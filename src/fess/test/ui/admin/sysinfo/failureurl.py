@@ -6,11 +6,13 @@ from playwright.sync_api import Playwright, sync_playwright
 from fess.test import assert_true
 from fess.test.i18n import t
 from fess.test.i18n.keys import Labels
-from fess.test.ui import FessContext
+from fess.test.ui import FessContext, static_check
 
 logger = logging.getLogger(__name__)
 
 PAGE_URL = "/admin/failureurl/"
+# Server-rendered markup only: checked without a browser under STATIC_CHECKS
+STATIC_PATHS = (PAGE_URL,)
 
 
 def setup(playwright: Playwright) -> FessContext:
@@ -25,9 +27,7 @@ def destroy(context: FessContext) -> None:
 
 def run(context: FessContext) -> None:
     logger.info("Starting failureurl")
-    page = context.get_admin_page()
-    page.goto(context.url(PAGE_URL))
-    page.wait_for_load_state("domcontentloaded")
+    page = static_check.open_page(context, PAGE_URL)
 
     expected = [t(Labels.FAILURE_URL_ERROR_COUNT), t(Labels.FAILURE_URL_ERROR_NAME)]
     body = page.inner_text("body")
@@ -3,6 +3,9 @@ from fess.test.ui import FessContext
 from . import add, delete, update, validation
 
 
+WRITES = ("user",)
+
+
 def run(context: FessContext) -> None:
     add.run(context)
     update.run(context)
@@ -12,6 +12,8 @@ from playwright.sync_api import Playwright, sync_playwright
 
 logger = logging.getLogger(__name__)
 
+WRITES = ("general-settings",)
+
 FIELD_NAME = "virtualHostValue"
 TEST_RULE = "Host:e2e-test:8080=e2e-host"
 
@@ -3,6 +3,10 @@ from fess.test.ui import FessContext
 from . import add, delete, update, job, validation
 
 
+# job.py creates and deletes a crawler job for the config.
+WRITES = ("webconfig", "scheduler")
+
+
 def run(context: FessContext) -> None:
     add.run(context)
     update.run(context)
@@ -0,0 +1,218 @@
+"""
+Warm browser server shared across runs and workers (opt-in: BROWSER_SERVER=true).
+
+Every FessContext launches its own Chromium, so each `python -m` run of a
+single module, each shard worker and each main.py run pays a full browser
+cold start. With BROWSER_SERVER=true the first of them starts one
+long-lived browser server (Playwright's launch-server) and records its
+websocket endpoint in BROWSER_SERVER_STATE; every later one connects to it,
+so a run only pays for a new browser context.
+
+Python's Playwright has no launch_server() of its own, so the server is the
+driver's `playwright launch-server` command, started detached from the
+process that needed it first: it outlives that run and is reused by the
+next. The endpoint listens on 127.0.0.1 at a free port, under a random path.
+
+Health: before connecting, the recorded server must accept TCP connections
+on its port and have been started with the same HEADLESS setting. A dead or
+mismatched server is killed and replaced. A connect that fails anyway is
+retried once: against a fresh server when the recorded one now fails the
+health check, else against the same one -- other shards and workers may be
+connected to it, and a server that still answers is not torn down from
+under them. Killing a server checks first that its recorded pid is still
+that launch-server (Linux /proc): a pid from an old state file is left
+alone. A file lock next to the state file keeps shards that start together
+from launching one server each. A server that dies mid-run takes the run's
+browser contexts with it; main.py reconnects before the next module (see
+FessContext.is_connected), which restarts it.
+
+  python -m fess.test.ui.browser_server start|status|stop
+"""
+
+import contextlib
+import fcntl
+import json
+import logging
+import os
+import secrets
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from playwright.sync_api import Browser, Error as PlaywrightError, Playwright
+
+from fess.test.eventually import eventually
+
+logger = logging.getLogger(__name__)
+
+STARTUP_TIMEOUT = 30.0
+CONNECT_TIMEOUT_MS = 10000
+
+
+def enabled() -> bool:
+    return os.environ.get("BROWSER_SERVER", "false").lower() == "true"
+
+
+def _state_path() -> str:
+    return os.environ.get("BROWSER_SERVER_STATE", "browser_server.json")
+
+
+def _headless() -> bool:
+    return os.environ.get("HEADLESS", "false").lower() == "true"
+
+
+@contextlib.contextmanager
+def _locked():
+    """Hold the cross-process lock beside the state file."""
+    path = _state_path()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(f"{path}.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _read_state() -> Optional[Dict]:
+    try:
+        with open(_state_path(), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _accepts_connections(endpoint: str, timeout: float = 1.0) -> bool:
+    address = urlparse(endpoint)
+    try:
+        with socket.create_connection((address.hostname, address.port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def is_healthy(state: Optional[Dict]) -> bool:
+    """Whether the recorded server is up and launched as this run wants."""
+    return (state is not None
+            and state.get("headless") == _headless()
+            and _accepts_connections(state["endpoint"]))
+
+
+def _is_our_server(state: Dict) -> bool:
+    """Whether the recorded pid is still the launch-server this state file
+    describes: started with its config file, which no other process names.
+    A state file can be days old, and its pid reused by anything since."""
+    config = state.get("config")
+    try:
+        with open(f"/proc/{state['pid']}/cmdline", "rb") as f:
+            argv = f.read().split(b"\0")
+    except (OSError, KeyError):
+        return False
+    return bool(config) and b"launch-server" in argv and config.encode() in argv
+
+
+def _kill(state: Dict) -> None:
+    if not _is_our_server(state):
+        logger.debug(f"[BROWSER] pid {state.get('pid')} is not the recorded browser "
+                     f"server; nothing to stop")
+        return
+    try:
+        os.killpg(state["pid"], signal.SIGTERM)
+        logger.info(f"[BROWSER] Stopped browser server (pid {state['pid']})")
+    except OSError as e:
+        logger.debug(f"[BROWSER] Nothing to stop: {e}")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start() -> Dict:
+    """Launch a detached server and wait until it accepts connections."""
+    port = _free_port()
+    endpoint = f"ws://127.0.0.1:{port}/{secrets.token_hex(16)}"
+    config = {"headless": _headless(), "host": "127.0.0.1", "port": port,
+              "wsPath": urlparse(endpoint).path}
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        json.dump(config, f)
+    log = open(f"{_state_path()}.log", "ab")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "playwright", "launch-server",
+         "--browser", "chromium", "--config", f.name],
+        stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+        start_new_session=True)
+    log.close()
+
+    # The config path is in the server's command line: _kill() checks it
+    state = {"endpoint": endpoint, "pid": process.pid, "headless": config["headless"],
+             "config": f.name}
+    started = eventually(lambda: process.poll() is None and _accepts_connections(endpoint),
+                         lambda up: up or process.poll() is not None,
+                         name="browser_server.started", timeout=STARTUP_TIMEOUT,
+                         initial=0.1, max_interval=1.0)
+    os.unlink(f.name)
+    if not started.value:
+        _kill(state)
+        exit_code = process.poll()
+        reason = (f"exited with code {exit_code}" if exit_code is not None
+                  else f"not listening after {STARTUP_TIMEOUT:.0f}s")
+        raise RuntimeError(f"browser server did not start ({reason}); "
+                           f"see {_state_path()}.log")
+    with open(_state_path(), "w", encoding="utf-8") as out:
+        json.dump(state, out)
+    logger.info(f"[BROWSER] Started browser server (pid {process.pid}) at port {port}")
+    return state
+
+
+def endpoint() -> str:
+    """
+    The websocket endpoint of a healthy server, started if need be.
+
+    Returns:
+        The endpoint to pass to chromium.connect()
+    """
+    with _locked():
+        state = _read_state()
+        if is_healthy(state):
+            return state["endpoint"]
+        if state is not None:
+            logger.warning("[BROWSER] Browser server is not healthy; restarting it")
+            _kill(state)
+        return _start()["endpoint"]
+
+
+def connect(playwright: Playwright) -> Browser:
+    """Connect to the warm server, retrying once if the connect fails; the
+    retry's endpoint() replaces the server only if it is no longer healthy."""
+    try:
+        return playwright.chromium.connect(endpoint(), timeout=CONNECT_TIMEOUT_MS)
+    except PlaywrightError as e:
+        logger.warning(f"[BROWSER] Could not connect to the browser server: {e}")
+    return playwright.chromium.connect(endpoint(), timeout=CONNECT_TIMEOUT_MS)
+
+
+def stop() -> None:
+    with _locked():
+        state = _read_state()
+        if state is not None:
+            _kill(state)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(_state_path())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    command = sys.argv[1] if len(sys.argv) > 1 else "status"
+    if command == "start":
+        print(endpoint())
+    elif command == "stop":
+        stop()
+    else:
+        state = _read_state()
+        print(f"{'running' if is_healthy(state) else 'not running'}: {state}")
@@ -3,22 +3,35 @@ import os
 import random
 import string
 import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Callable, Any, Optional, TYPE_CHECKING
+from typing import Callable, Any, List, Optional, TYPE_CHECKING
+from urllib.parse import urlparse
 
-import requests
 from playwright.sync_api import Playwright
 
 from fess.test.capture import HTMLCapture
+from fess.test.memory import MemoryRecord, MemorySampler
+from fess.test.metrics import ActionTiming
+from fess.test.ui import browser_server
+from fess.test.ui.api import FessApiClient
+from fess.test.network import NetworkRecorder
+from fess.test.page_timing import NavigationRecorder
+from fess.test.ui.pacing import Pacer, SETTLE_SCRIPT
 from fess.test import i18n
 from fess.test.i18n.keys import Labels
 
 if TYPE_CHECKING:
-    from playwright.sync_api import Page, Response, ElementHandle
+    from playwright.sync_api import Browser, Page, Response, ElementHandle
 
 logger = logging.getLogger(__name__)
 
 
+def session_reuse_enabled() -> bool:
+    """Whether contexts start from a saved login (REUSE_SESSION, default true)."""
+    return os.environ.get("REUSE_SESSION", "true").lower() == "true"
+
+
 def _normalize_text_selector(selector: str) -> str:
     """Convert `text=X` (substring match) to `text="X"` (exact match).
 
@@ -47,18 +60,68 @@ def _normalize_text_selector(selector: str) -> str:
     return f'text="{escaped}"'
 
 
+def launch_browser(playwright: Playwright) -> "Browser":
+    """Launch the test browser the way every FessContext does, or connect to
+    the warm browser server when BROWSER_SERVER is on."""
+    if browser_server.enabled():
+        return browser_server.connect(playwright)
+    headless: bool = os.environ.get("HEADLESS", "false").lower() == "true"
+    # No slow_mo: pacing is applied per action by PageWrapper (see pacing.py).
+    return playwright.chromium.launch(headless=headless)
+
+
+def browser_locale_for(lang_locale: str) -> str:
+    """The Playwright locale: BROWSER_LOCALE when set, else the one derived
+    from the selected language."""
+    return os.environ.get("BROWSER_LOCALE", "").strip() or lang_locale
+
+
 class PageWrapper:
     """
     Wrapper for Playwright Page that adds logging to browser operations.
 
     Logs click, fill, navigation, and other browser interactions at DEBUG level.
     Optionally captures HTML on page navigation for coverage analysis.
+    Paces click/fill/goto/select_option according to the context's Pacer,
+    times every wrapped call into `timings` (pacing excluded), and has the
+    NavigationRecorder read the browser's page timing after goto and after
+    clicks that load a new page.
     """
 
-    def __init__(self, page: "Page", html_capture: HTMLCapture = None):
+    def __init__(self, page: "Page", html_capture: HTMLCapture = None,
+                 pacer: Optional[Pacer] = None,
+                 timings: Optional[List[ActionTiming]] = None,
+                 navigations: Optional[NavigationRecorder] = None):
         self._page = page
         self._logger = logging.getLogger(f"{__name__}.PageWrapper")
         self._html_capture = html_capture
+        self._pacer = pacer
+        self._timings = timings
+        self._navigations = navigations
+
+    def _record_navigation(self) -> None:
+        if self._navigations is not None:
+            self._navigations.record(self._page)
+
+    @contextmanager
+    def _timed(self, action: str, target: str):
+        started = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            if self._timings is not None:
+                self._timings.append(ActionTiming(
+                    action, target, time.perf_counter() - started, ok))
+
+    def _before_action(self) -> None:
+        if self._pacer is not None:
+            self._pacer.before_action()
+
+    def _after_action(self) -> None:
+        if self._pacer is not None:
+            self._pacer.after_action(self._page)
 
     def __getattr__(self, name: str):
         """Delegate unknown attributes to the wrapped page."""
@@ -69,7 +132,11 @@ class PageWrapper:
         selector = _normalize_text_selector(selector)
         self._logger.debug(f"[CLICK] selector='{selector}'")
         try:
-            self._page.click(selector, **kwargs)
+            self._before_action()
+            with self._timed("click", selector):
+                self._page.click(selector, **kwargs)
+            self._after_action()
+            self._record_navigation()
             self._logger.debug(f"[CLICK] completed: {selector}")
         except Exception as e:
             self._logger.error(f"[CLICK] failed: {selector} - {e}")
@@ -81,7 +148,10 @@ class PageWrapper:
         display_value = '***' if self._is_sensitive_field(selector) else self._truncate_value(value)
         self._logger.debug(f"[FILL] selector='{selector}' value='{display_value}'")
         try:
-            self._page.fill(selector, value, **kwargs)
+            self._before_action()
+            with self._timed("fill", selector):
+                self._page.fill(selector, value, **kwargs)
+            self._after_action()
             self._logger.debug(f"[FILL] completed: {selector}")
         except Exception as e:
             self._logger.error(f"[FILL] failed: {selector} - {e}")
@@ -91,7 +161,11 @@ class PageWrapper:
         """Navigate to a URL with logging and optional HTML capture."""
         self._logger.debug(f"[GOTO] url='{url}'")
         try:
-            response = self._page.goto(url, **kwargs)
+            self._before_action()
+            with self._timed("goto", url):
+                response = self._page.goto(url, **kwargs)
+            self._after_action()
+            self._record_navigation()
             status = response.status if response else 'N/A'
             self._logger.debug(f"[GOTO] completed: {url} status={status}")
 
@@ -109,7 +183,8 @@ class PageWrapper:
         selector = _normalize_text_selector(selector)
         self._logger.debug(f"[WAIT_SELECTOR] selector='{selector}'")
         try:
-            result = self._page.wait_for_selector(selector, **kwargs)
+            with self._timed("wait_for_selector", selector):
+                result = self._page.wait_for_selector(selector, **kwargs)
             self._logger.debug(f"[WAIT_SELECTOR] found: {selector}")
             return result
         except Exception as e:
@@ -119,14 +194,16 @@ class PageWrapper:
     def wait_for_load_state(self, state: str = "load", **kwargs) -> None:
         """Wait for load state with logging."""
         self._logger.debug(f"[WAIT_STATE] state='{state}'")
-        self._page.wait_for_load_state(state, **kwargs)
+        with self._timed("wait_for_load_state", state):
+            self._page.wait_for_load_state(state, **kwargs)
         self._logger.debug(f"[WAIT_STATE] completed: {state}")
 
     def inner_text(self, selector: str, **kwargs) -> str:
         """Get inner text with logging."""
         selector = _normalize_text_selector(selector)
         self._logger.debug(f"[INNER_TEXT] selector='{selector}'")
-        result = self._page.inner_text(selector, **kwargs)
+        with self._timed("inner_text", selector):
+            result = self._page.inner_text(selector, **kwargs)
         self._logger.debug(f"[INNER_TEXT] length={len(result)}")
         return result
 
@@ -134,7 +211,8 @@ class PageWrapper:
         """Get input value with logging."""
         selector = _normalize_text_selector(selector)
         self._logger.debug(f"[INPUT_VALUE] selector='{selector}'")
-        result = self._page.input_value(selector, **kwargs)
+        with self._timed("input_value", selector):
+            result = self._page.input_value(selector, **kwargs)
         display_result = '***' if self._is_sensitive_field(selector) else self._truncate_value(result)
         self._logger.debug(f"[INPUT_VALUE] value='{display_result}'")
         return result
@@ -144,7 +222,10 @@ class PageWrapper:
         selector = _normalize_text_selector(selector)
         self._logger.debug(f"[SELECT_OPTION] selector='{selector}' value='{value}'")
         try:
-            result = self._page.select_option(selector, value, **kwargs)
+            self._before_action()
+            with self._timed("select_option", selector):
+                result = self._page.select_option(selector, value, **kwargs)
+            self._after_action()
             self._logger.debug(f"[SELECT_OPTION] completed: {selector}")
             return result
         except Exception as e:
@@ -155,7 +236,8 @@ class PageWrapper:
         """Take screenshot with logging."""
         path = kwargs.get('path', 'unknown')
         self._logger.debug(f"[SCREENSHOT] path='{path}'")
-        return self._page.screenshot(**kwargs)
+        with self._timed("screenshot", str(path)):
+            return self._page.screenshot(**kwargs)
 
     def _is_sensitive_field(self, selector: str) -> bool:
         """Check if a selector refers to a sensitive field."""
@@ -188,14 +270,31 @@ class FessContext:
         self._lang = i18n.selected_lang()
         self._browser_locale = i18n.selected_browser_locale()
         # Allow explicit BROWSER_LOCALE override (overrides auto-derived)
-        explicit_locale = os.environ.get("BROWSER_LOCALE", "").strip()
-        playwright_locale = explicit_locale or self._browser_locale
+        playwright_locale = browser_locale_for(self._browser_locale)
 
-        self._browser = self._create_browser()
-        self._context = self._browser.new_context(locale=playwright_locale)
         self._base_url: str = os.environ.get(
             "FESS_URL", "http://localhost:8080")
+        self._storage_state_path: Optional[str] = self._resolve_storage_state_path()
+        self._restored_session = (self._storage_state_path is not None
+                                  and os.path.exists(self._storage_state_path))
+
+        self._browser = self._create_browser()
+        if self._restored_session:
+            logger.debug(f"[SESSION] Restoring storage state: {self._storage_state_path}")
+            self._context = self._browser.new_context(
+                locale=playwright_locale, storage_state=self._storage_state_path)
+        else:
+            self._context = self._browser.new_context(locale=playwright_locale)
+        self._pacer = Pacer()
+        self._action_timings: List[ActionTiming] = []
+        self._navigations = NavigationRecorder()
+        self._network = NetworkRecorder(self._base_url)
+        self._network.attach(self._context)
+        self._api = FessApiClient(self._base_url, self._context.cookies,
+                                  self._action_timings)
+        self._context.add_init_script(SETTLE_SCRIPT)
         self._current_page: "Page" = None
+        self._memory = MemorySampler()
         self._test_label_name: str = os.environ.get("TEST_LABEL")
         self._session_lang_set = False
         random.seed(int(datetime.now().timestamp() * 1000))
@@ -215,11 +314,64 @@ class FessContext:
             self._start_tracing()
 
     def _create_browser(self):
-        headless: bool = os.environ.get("HEADLESS", "false").lower() == "true"
-        return self._playwright.chromium.launch(headless=headless, slow_mo=500)
+        return launch_browser(self._playwright)
+
+    def _resolve_storage_state_path(self) -> Optional[str]:
+        """Where this instance/user/language's login is saved, or None when
+        session reuse is off.
+
+        Keyed by language as well as user: login() fixes the Fess session
+        locale with ?browser_lang, so a session saved by a run in another
+        language would render the wrong labels.
+        """
+        if not session_reuse_enabled():
+            return None
+        directory = os.environ.get("STORAGE_STATE_DIR", "storage_state")
+        host = urlparse(self._base_url).netloc.replace(":", "_")
+        user = os.environ.get("FESS_USERNAME", "admin")
+        return os.path.join(directory, f"{host}_{user}_{self._lang}.json")
+
+    def _session_is_valid(self) -> bool:
+        """Cheap probe: one request, no page. The dashboard answers 200 to a
+        logged-in session and redirects an expired one to /login/."""
+        try:
+            response = self._context.request.get(
+                self.url("/admin/dashboard/"), max_redirects=0)
+            return response.status == 200
+        except Exception as e:
+            logger.debug(f"[SESSION] Probe failed: {e}")
+            return False
+
+    def _save_storage_state(self) -> None:
+        """Save the session for later contexts and worker processes.
+
+        Written to a temporary file and renamed, so a worker starting at the
+        same moment never reads half a file.
+        """
+        if self._storage_state_path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self._storage_state_path) or ".", exist_ok=True)
+            tmp_path = f"{self._storage_state_path}.{os.getpid()}.tmp"
+            self._context.storage_state(path=tmp_path)
+            os.replace(tmp_path, self._storage_state_path)
+            logger.debug(f"[SESSION] Storage state saved: {self._storage_state_path}")
+        except Exception as e:
+            logger.warning(f"[SESSION] Failed to save storage state: {e}")
 
     def login(self, username: str = os.environ.get("FESS_USERNAME", "admin"),
               password: str = os.environ.get("FESS_PASSWORD", "admin")) -> bool:
+        # A restored session skips the login form -- unless it has expired
+        # (Fess restarted, session timeout), in which case log in as usual
+        # and overwrite the saved state.
+        if self._restored_session and self._session_is_valid():
+            logger.info("[SESSION] Reusing saved login session")
+            self._session_lang_set = True
+            self._api.invalidate_session()
+            return True
+        if self._restored_session:
+            logger.info("[SESSION] Saved session expired; logging in again")
+
         page: "Page" = self._current_page if self._current_page is not None else self._context.new_page()
 
         # First navigation: include browser_lang to set the Fess session locale.
@@ -238,6 +390,10 @@ class FessContext:
         page.click(f'button:has-text("{login_text}")')
 
         logger.debug(f"URL: {page.url}")
+        self._api.invalidate_session()
+        # Only a login that actually took is worth handing to later contexts.
+        if self._storage_state_path is not None and self._session_is_valid():
+            self._save_storage_state()
         return True  # TODO
 
     def _start_tracing(self) -> None:
@@ -313,7 +469,10 @@ class FessContext:
 
     def get_admin_page(self) -> PageWrapper:
         """Get admin page with logging wrapper and HTML capture."""
-        page: "Page" = self._current_page if self._current_page is not None else self._context.new_page()
+        page: "Page" = self._current_page
+        if page is None:
+            page = self._context.new_page()
+            self._memory.attach(page)
         self._current_page = page
         if not self._session_lang_set:
             page.goto(f"{self._base_url}/admin/?browser_lang={self._lang}")
@@ -321,7 +480,8 @@ class FessContext:
         else:
             page.goto(f"{self._base_url}/admin/")
         logger.debug(f"URL: {page.url}")
-        return PageWrapper(page, self._html_capture)
+        return PageWrapper(page, self._html_capture, self._pacer, self._action_timings,
+                           self._navigations)
 
     def get_current_page(self) -> "Page":
         """Get current raw page (for backwards compatibility)."""
@@ -331,7 +491,45 @@ class FessContext:
         """Get current page with logging wrapper and HTML capture."""
         if self._current_page is None:
             return None
-        return PageWrapper(self._current_page, self._html_capture)
+        return PageWrapper(self._current_page, self._html_capture, self._pacer,
+                           self._action_timings, self._navigations)
+
+    def memory_checkpoint(self) -> Optional[MemoryRecord]:
+        """Sample the page's memory after a module, and recycle the page when
+        it has grown past the thresholds (see fess.test.memory)."""
+        record = self._memory.checkpoint()
+        if record is not None and record.recycled:
+            self.recycle_page()
+        return record
+
+    def recycle_page(self) -> None:
+        """Close the current page; the next get_admin_page() opens a fresh
+        one in the same browser context, so the login session is kept."""
+        self._memory.detach()
+        if self._current_page is not None:
+            self._current_page.close()
+            self._current_page = None
+
+    def take_action_timings(self) -> List[ActionTiming]:
+        """Return the page actions timed since the last call and start a new list."""
+        timings = list(self._action_timings)
+        self._action_timings.clear()
+        return timings
+
+    @property
+    def network(self) -> NetworkRecorder:
+        """HTTP exchanges made by the browser, for the network report."""
+        return self._network
+
+    @property
+    def navigations(self) -> NavigationRecorder:
+        """Browser-side page timings recorded by PageWrapper."""
+        return self._navigations
+
+    @property
+    def pacer(self) -> Pacer:
+        """Pacing applied around page actions; see fess.test.ui.pacing."""
+        return self._pacer
 
     @property
     def html_capture(self) -> HTMLCapture:
@@ -348,6 +546,11 @@ class FessContext:
         """Auto-derived BCP47 browser locale (e.g. 'ja-JP')."""
         return self._browser_locale
 
+    def is_connected(self) -> bool:
+        """Whether the browser is still there (a warm browser server can die
+        under a running context)."""
+        return self._browser.is_connected()
+
     def close(self) -> None:
         """Close browser context and stop tracing."""
         # Stop tracing if active
@@ -358,6 +561,7 @@ class FessContext:
             except Exception as e:
                 logger.debug(f"[TRACE] Stop tracing note: {e}")
 
+        self._api.close()
         if self._current_page is not None:
             self._current_page.close()
         self._context.close()
@@ -374,92 +578,28 @@ class FessContext:
     def url(self, path: str) -> str:
         return self._base_url+path
 
-    def _session_cookies(self) -> dict:
-        """Extract cookies from the Playwright browser context so that
-        authenticated HTTP calls can reuse the same session as the UI.
-        Must be called after login()."""
-        jar: dict = {}
-        for c in self._context.cookies():
-            jar[c["name"]] = c["value"]
-        return jar
+    @property
+    def api(self) -> FessApiClient:
+        """Pooled HTTP client sharing this context's login session."""
+        return self._api
 
     def api_get(self, path: str, timeout: int = 10) -> dict:
         """GET a Fess JSON endpoint using the logged-in session.
         path is relative (e.g. '/api/v1/documents?q=*&size=0').
         Returns parsed JSON; raises on non-2xx or non-JSON responses."""
-        full_url: str = self.url(path)
-        logger.debug(f"[API_GET] {full_url}")
-        resp = requests.get(full_url, cookies=self._session_cookies(), timeout=timeout)
-        resp.raise_for_status()
-        return resp.json()
+        return self._api.get(path, timeout=timeout)
 
     def api_post(self, path: str, json_body: dict, timeout: int = 30) -> dict:
         """POST JSON to a Fess endpoint using the logged-in session."""
-        full_url: str = self.url(path)
-        logger.debug(f"[API_POST] {full_url}")
-        resp = requests.post(full_url, json=json_body,
-                              cookies=self._session_cookies(), timeout=timeout)
-        resp.raise_for_status()
-        return resp.json()
+        return self._api.post(path, json_body, timeout=timeout)
 
     def api_search(self, q: str, ex_q=None, num: int = 1,
                    timeout: int = 10) -> dict:
-        """Query the Fess search JSON API and return a normalized result.
-
-        Prefers the v2 endpoint (``/api/v2/search``) served by snapshot/dev
-        builds and falls back to the v1 endpoint (``/api/v1/documents``)
-        served by released Fess 15.x. No version flag is plumbed to the
-        runner, so the version is detected at runtime: v2 is tried first and
-        a 404 triggers the v1 fallback. The versions differ in:
-
-          * path:        ``/api/v2/search`` vs ``/api/v1/documents``
-          * page-size:   ``num`` (v2, must be >= 1) vs ``size`` (v1)
-          * envelope:    v2 nests the payload under a top-level ``response``
-                         key; v1 returns it flat.
-
-        ``q`` is the query string and ``ex_q`` an optional extra-query filter
-        (str or list of str; repeatable). Only the total hit count is needed
-        by callers, so ``num`` defaults to 1 (v2 rejects ``num <= 0``); the
-        returned page of documents is ignored for count-only use.
-
-        Returns a dict with at least:
-          * ``record_count`` (int): total number of matching documents
-          * ``data`` (list): documents on the first page (may be empty)
-        """
-        from urllib.parse import quote
-        ex_list = [ex_q] if isinstance(ex_q, str) else list(ex_q or [])
-
-        def _query(page_param: str) -> str:
-            parts = [f"q={quote(q, safe='*')}", page_param]
-            parts += [f"ex_q={quote(e, safe=':*')}" for e in ex_list]
-            return "&".join(p for p in parts if p)
-
-        # v2 first (snapshot/dev), falling back to v1 (released 15.x).
-        # 15.x has no /api/v2 route: depending on the build it answers the
-        # v2 path with a 404 *or* a non-JSON error/redirect page served as
-        # HTTP 200 (so resp.json() raises). Treat BOTH an HTTP error status
-        # and a non-JSON body (JSONDecodeError, a ValueError subclass) as
-        # "v2 unavailable" and fall back. requests.HTTPError is not a
-        # ValueError, so both must be listed.
-        try:
-            body = self.api_get(
-                f"/api/v2/search?{_query(f'num={max(1, num)}')}", timeout=timeout)
-        except (requests.HTTPError, ValueError) as e:
-            logger.info(
-                f"v2 search API unavailable ({type(e).__name__}); "
-                f"falling back to v1: {e}")
-            body = self.api_get(
-                f"/api/v1/documents?{_query('size=0')}", timeout=timeout)
-
-        # Unwrap the v2 ``response`` envelope; v1 is already flat. The total
-        # hit count is ``record_count`` in both versions (older builds also
-        # expose ``total_count`` / ``total``).
-        payload = body.get("response", body) or {}
-        record_count = int(payload.get("record_count")
-                           or payload.get("total_count")
-                           or payload.get("total")
-                           or 0)
-        return {"record_count": record_count, "data": payload.get("data") or []}
+        """Query the Fess search JSON API; see FessApiClient.search().
+
+        Returns a dict with at least ``record_count`` (int) and ``data``
+        (list of documents on the first page, may be empty)."""
+        return self._api.search(q, ex_q=ex_q, num=num, timeout=timeout)
 
     def retry_on_failure(self, func: Callable[[], Any], max_attempts: int = 3,
                         delay: float = 1.0, context_name: str = "operation") -> Any:
@@ -0,0 +1,241 @@
+"""
+Admin fixtures created and deleted through Fess's admin REST API.
+
+The prerequisites of a screen under test -- the labels and webconfig
+search/seed indexes with, the role and group user_permission_workflow puts
+a user in, the webconfig crawler_workflow creates a job from -- used to be
+clicked together in the admin UI: list page, create link, form, submit,
+list page again, and the same in reverse for cleanup. Each of those is a
+full page load spent on a screen the module does not test. The admin API
+does each step in one request:
+
+  create(context, "role", {...})        PUT    /api/admin/role/setting
+  find(context, "role", name=...)       GET    /api/admin/role/settings
+  get(context, "role", id)              GET    /api/admin/role/setting/{id}
+  update(context, "role", id, {...})    POST   /api/admin/role/setting
+  delete(context, "role", id)           DELETE /api/admin/role/setting/{id}
+
+ensure() and remove() are the idempotent forms seed relies on. Settings
+start from DEFAULTS, the values the createnew form would have pre-filled.
+
+The admin API authenticates with an access token carrying the admin-api
+role, never with the login session. FESS_ACCESS_TOKEN supplies one;
+otherwise token() creates ACCESS_TOKEN_NAME through the accesstoken screen
+-- the one step that needs the UI, as no token exists yet to ask the API
+with -- and reuses it by name: once per process, shared by every module and
+worker thread, and picked up again by the next run. Modules that may create
+it declare TOKEN_WRITES. main.py calls release() at the end of a run, which
+deletes the token when this process obtained it. In a sharded run each
+shard hands the token it obtained (obtained()) to the parent, which adopts
+it and deletes it once every shard has finished -- a shard deleting it
+itself would pull it from under the shards still running.
+
+Calls go through the context's FessApiClient, so each is timed into the
+module's action timings (api_put, api_get, api_post, api_delete).
+"""
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from fess.test import assert_true
+from fess.test.i18n import t
+from fess.test.i18n.keys import Labels
+from fess.test.ui.api import FessApiClient
+
+logger = logging.getLogger(__name__)
+
+# Admin-api access token to use; when unset, token() creates one.
+FESS_ACCESS_TOKEN = os.environ.get("FESS_ACCESS_TOKEN", "").strip()
+ACCESS_TOKEN_NAME = "e2e-admin-api"
+# Lock a module declares when it may create the token (see schedule.py).
+TOKEN_WRITES = () if FESS_ACCESS_TOKEN else ("accesstoken",)
+
+# The admin API's list size cap (page.max.fetch.size)
+LIST_PAGE_SIZE = 100
+
+# What the createnew form pre-fills, per resource
+DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "labeltype": {"sortOrder": 0, "permissions": "{role}guest"},
+    "webconfig": {
+        "userAgent": "Mozilla/5.0 (compatible; Fess; +http://fess.codelibs.org/bot.html)",
+        "numOfThread": 1, "intervalTime": 1000, "boost": 1.0, "available": "true",
+        "sortOrder": 0, "permissions": "{role}guest",
+    },
+    "user": {"attributes": {}},
+    "group": {"attributes": {}},
+}
+
+# Fess URL -> token value, for the tokens this process obtained
+_tokens: Dict[str, str] = {}
+_tokens_lock = threading.Lock()
+
+
+def _issue_token(context) -> str:
+    """Create ACCESS_TOKEN_NAME through the accesstoken screen, or find the
+    one an earlier run left, and return its value from the details page."""
+    page = context.get_admin_page()
+    page.goto(context.url("/admin/accesstoken/"))
+    page.wait_for_load_state("domcontentloaded")
+    table_el = page.query_selector("table")
+    table_text = table_el.inner_text() if table_el else ""
+    if table_text.find(ACCESS_TOKEN_NAME) == -1:
+        logger.info(f"Creating access token: {ACCESS_TOKEN_NAME}")
+        page.goto(context.url("/admin/accesstoken/createnew/"))
+        page.wait_for_load_state("domcontentloaded")
+        page.fill("input[name=\"name\"]", ACCESS_TOKEN_NAME)
+        page.fill("textarea[name=\"permissions\"]", "{role}admin-api")
+        page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_CREATE)}")')
+        page.wait_for_load_state("domcontentloaded")
+        assert_true(page.url.endswith("/admin/accesstoken/"),
+                    f"after create, expected accesstoken list URL, got {page.url}")
+
+    page.click(f"text={ACCESS_TOKEN_NAME}")
+    page.wait_for_load_state("domcontentloaded")
+    value = page.input_value("input[name=\"token\"]")
+    assert_true(bool(value), f"access token {ACCESS_TOKEN_NAME} has no token value")
+    return value
+
+
+def token(context) -> str:
+    """The admin-api access token: FESS_ACCESS_TOKEN, else ACCESS_TOKEN_NAME,
+    obtained once per process and Fess URL."""
+    if FESS_ACCESS_TOKEN:
+        return FESS_ACCESS_TOKEN
+    base_url = context.url("")
+    with _tokens_lock:
+        if base_url not in _tokens:
+            _tokens[base_url] = _issue_token(context)
+        return _tokens[base_url]
+
+
+def _call(api: FessApiClient, access_token: str, method: str, path: str,
+          body: Optional[dict] = None) -> dict:
+    """One admin API call; returns the response payload.
+
+    Raises:
+        AssertionError: When Fess answers with a non-zero status
+    """
+    answer = api.with_token(method, path, access_token, body)
+    response = answer.get("response", answer)
+    if response.get("status", 0) != 0:
+        raise AssertionError(f"admin API {method} {path} rejected: "
+                             f"{response.get('message', response)}")
+    return response
+
+
+def _admin(context, method: str, path: str, body: Optional[dict] = None) -> dict:
+    return _call(context.api, token(context), method, path, body)
+
+
+def settings(context, resource: str) -> List[Dict[str, Any]]:
+    """Every setting of an admin resource (labeltype, webconfig, role, ...)"""
+    found: List[Dict[str, Any]] = []
+    page = 1
+    while True:
+        response = _admin(context, "GET", f"/api/admin/{resource}/settings"
+                                          f"?size={LIST_PAGE_SIZE}&page={page}")
+        batch = response.get("settings") or []
+        found += batch
+        if len(batch) < LIST_PAGE_SIZE:
+            return found
+        page += 1
+
+
+def find(context, resource: str, **fields: Any) -> Optional[Dict[str, Any]]:
+    """The first setting whose fields equal the given values, or None"""
+    for setting in settings(context, resource):
+        if all(setting.get(name) == value for name, value in fields.items()):
+            return setting
+    return None
+
+
+def get(context, resource: str, setting_id: str) -> Dict[str, Any]:
+    return _admin(context, "GET", f"/api/admin/{resource}/setting/{setting_id}")["setting"]
+
+
+def create(context, resource: str, setting: Dict[str, Any]) -> str:
+    """
+    Create a setting.
+
+    Args:
+        context: FessContext (for its API client and the token)
+        resource: Admin API resource name, e.g. "role"
+        setting: Field values; DEFAULTS fills in the rest
+
+    Returns:
+        The new setting's id
+    """
+    body = {**DEFAULTS.get(resource, {}), **setting}
+    setting_id = _admin(context, "PUT", f"/api/admin/{resource}/setting", body)["id"]
+    logger.info(f"[FIXTURE] Created {resource} {setting.get('name', '')} ({setting_id})")
+    return setting_id
+
+
+def update(context, resource: str, setting_id: str, changes: Dict[str, Any]) -> None:
+    """Change some fields of a setting; the others keep their stored values."""
+    body = {**get(context, resource, setting_id), **changes}
+    _admin(context, "POST", f"/api/admin/{resource}/setting", body)
+    logger.info(f"[FIXTURE] Updated {resource} {setting_id}: {', '.join(changes)}")
+
+
+def delete(context, resource: str, setting_id: str) -> None:
+    _admin(context, "DELETE", f"/api/admin/{resource}/setting/{setting_id}")
+    logger.info(f"[FIXTURE] Deleted {resource} {setting_id}")
+
+
+def ensure(context, resource: str, setting: Dict[str, Any], key: str = "name") -> str:
+    """The id of the setting with setting[key], created when absent."""
+    existing = find(context, resource, **{key: setting[key]})
+    if existing is not None:
+        logger.info(f"[FIXTURE] {resource} {setting[key]} already exists")
+        return existing["id"]
+    return create(context, resource, setting)
+
+
+def remove(context, resource: str, **fields: Any) -> int:
+    """Delete every setting whose fields equal the given values.
+
+    Returns:
+        How many were deleted
+    """
+    matching = [s for s in settings(context, resource)
+                if all(s.get(name) == value for name, value in fields.items())]
+    for setting in matching:
+        delete(context, resource, setting["id"])
+    return len(matching)
+
+
+def obtained() -> Dict[str, str]:
+    """Fess URL -> token value, for the tokens this process obtained"""
+    with _tokens_lock:
+        return dict(_tokens)
+
+
+def adopt(base_url: str, access_token: str) -> None:
+    """Take over a token another process obtained, so that release() here
+    deletes it."""
+    with _tokens_lock:
+        _tokens.setdefault(base_url, access_token)
+
+
+def release() -> None:
+    """Delete the access tokens this process obtained. Swallows errors:
+    a token left behind is reused by the next run."""
+    with _tokens_lock:
+        obtained = list(_tokens.items())
+        _tokens.clear()
+    for base_url, access_token in obtained:
+        api = FessApiClient(base_url, list)
+        try:
+            response = _call(api, access_token, "GET", f"/api/admin/accesstoken/settings"
+                                                       f"?size={LIST_PAGE_SIZE}")
+            for setting in response.get("settings") or []:
+                if setting.get("name") == ACCESS_TOKEN_NAME:
+                    _call(api, access_token, "DELETE",
+                          f"/api/admin/accesstoken/setting/{setting['id']}")
+                    logger.info(f"Access token {ACCESS_TOKEN_NAME} deleted")
+        except Exception as e:
+            logger.warning(f"access token delete failed (continuing): {e}")
+        finally:
+            api.close()
@@ -1,6 +1,7 @@
-from fess.test.ui import FessContext
+from fess.test.ui import FessContext, fixtures
 
-from . import crawler_workflow, dictionary_workflow, suggest_workflow, user_permission_workflow
+WRITES = ("webconfig", "scheduler", "analyzer", "user", "group", "role",
+          "keymatch", "relatedcontent", "relatedquery") + fixtures.TOKEN_WRITES
 
 
 def run(context: FessContext) -> None:
@@ -12,6 +13,10 @@ def run(context: FessContext) -> None:
     name, never "__main__", so such a block could never fire. Run a single
     workflow directly instead: python -m fess.test.ui.integration.crawler_workflow
     """
+    # Imported on use, so selecting one leaf does not import its siblings
+    # (see fess.test.registry).
+    from . import crawler_workflow, dictionary_workflow, suggest_workflow, user_permission_workflow
+
     crawler_workflow.run(context)
     user_permission_workflow.run(context)
     dictionary_workflow.run(context)
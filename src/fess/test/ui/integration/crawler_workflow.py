@@ -4,8 +4,8 @@ import logging
 from fess.test import assert_equal, assert_not_equal, assert_startswith
 from fess.test.i18n import t
 from fess.test.i18n.keys import Labels
-from fess.test.ui import FessContext
-from fess.test.ui.cleanup import Cleanup, assert_absent
+from fess.test.ui import FessContext, fixtures
+from fess.test.ui.cleanup import Cleanup
 from playwright.sync_api import Playwright, sync_playwright
 
 logger = logging.getLogger(__name__)
@@ -24,51 +24,42 @@ def destroy(context: FessContext) -> None:
 def run(context: FessContext) -> None:
     """
     Integration test for crawler workflow:
-    1. Create web crawl configuration
+    1. Create web crawl configuration (admin API fixture)
     2. Create scheduled job for the crawler
     3. Verify job is created
-    4. Delete job
-    5. Delete crawler configuration
+    4. Delete job (admin API)
+    5. Delete crawler configuration (admin API)
+
+    The screen under test is the webconfig's "create new job" path into the
+    scheduler; the webconfig itself is only its prerequisite.
     """
     logger.info("start crawler workflow integration test")
 
-    page: "Page" = context.get_admin_page()
     webconfig_name: str = f"IntegTest_{context.create_label_name()}"
     job_name: str = f"Job_{webconfig_name}"
 
-    created: list = []
+    created: dict = {}
     try:
         # Step 1: Create web crawl configuration
         logger.info("Step 1: Creating web crawl configuration")
-        page.click(f"text={t(Labels.MENU_CRAWL)}")
-        page.click(f"text={t(Labels.MENU_WEB)}")
-        assert_equal(page.url, context.url("/admin/webconfig/"))
-
-        page.click(f"text={t(Labels.CRUD_LINK_CREATE)}")
-        assert_equal(page.url, context.url("/admin/webconfig/createnew/"))
-
-        page.fill("input[name=\"name\"]", webconfig_name)
-        page.fill("textarea[name=\"urls\"]", "https://example.com/")
-        page.fill("textarea[name=\"includedUrls\"]", "https://example.com/.*")
-        page.fill("textarea[name=\"excludedUrls\"]", "(?i).*(css|js|jpeg|jpg|gif|png|bmp|wmv|xml|ico)")
-        page.fill("input[name=\"maxAccessCount\"]", "10")
-        page.fill("input[name=\"numOfThread\"]", "1")
-        page.fill("textarea[name=\"description\"]", "Integration test crawler")
-
-        page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_CREATE)}")')
-        created.append("webconfig")
-        assert_equal(page.url, context.url("/admin/webconfig/"))
-
-        page.wait_for_load_state("domcontentloaded")
-        table_content: str = page.inner_text("table")
-        assert_not_equal(table_content.find(webconfig_name), -1,
-                         f"{webconfig_name} not created in webconfig")
+        created["webconfig"] = fixtures.create(context, "webconfig", {
+            "name": webconfig_name,
+            "urls": "https://example.com/",
+            "includedUrls": "https://example.com/.*",
+            "excludedUrls": "(?i).*(css|js|jpeg|jpg|gif|png|bmp|wmv|xml|ico)",
+            "maxAccessCount": 10,
+            "numOfThread": 1,
+            "description": "Integration test crawler",
+        })
         logger.info(f"✓ Web crawl configuration '{webconfig_name}' created successfully")
 
         # Step 2: Create scheduled job for the crawler
         logger.info("Step 2: Creating scheduled job")
-        page.click(f"text={webconfig_name}")
-        assert_startswith(page.url, context.url("/admin/webconfig/details/4/"))
+        page: "Page" = context.get_admin_page()
+        page.goto(context.url(f"/admin/webconfig/details/4/{created['webconfig']}"))
+        page.wait_for_load_state("domcontentloaded")
+        assert_not_equal(page.inner_text("body").find(webconfig_name), -1,
+                         f"{webconfig_name} details page does not show it")
 
         # Click the "create new job" button; it navigates straight to the
         # web-crawling job creation form (there is no further create-new link).
@@ -80,7 +71,7 @@ def run(context: FessContext) -> None:
         page.fill("input[name=\"name\"]", job_name)
         # Leave cronExpression blank for a manual-trigger job (avoids accidental runs)
         page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_CREATE)}")')
-        created.append("job")
+        created["job"] = job_name
         page.wait_for_load_state("domcontentloaded")
         assert_equal(page.url, context.url("/admin/scheduler/"))
 
@@ -105,35 +96,15 @@ def run(context: FessContext) -> None:
         if "job" in created:
             with cleanup.guard(f"scheduled job '{job_name}'"):
                 logger.info("Step 4: Deleting scheduled job")
-                page.goto(context.url("/admin/scheduler/"))
-                page.wait_for_load_state("domcontentloaded")
-                page.locator(f"tr:has-text('{job_name}')").first.click()
-                page.wait_for_load_state("domcontentloaded")
-                page.click(f"text={t(Labels.CRUD_BUTTON_DELETE)}")
-                page.click('div.modal-footer button[name="delete"]')
-                page.wait_for_load_state("domcontentloaded")
-                assert_absent(page, job_name, "/admin/scheduler/")
+                assert_equal(fixtures.remove(context, "scheduler", name=job_name), 1,
+                             f"expected exactly one scheduled job named {job_name}")
                 logger.info("✓ Job deleted")
 
         # Step 5: Delete crawler configuration (cleanup)
         if "webconfig" in created:
             with cleanup.guard(f"webconfig '{webconfig_name}'"):
                 logger.info("Step 5: Deleting web crawl configuration")
-                # Navigate directly rather than through the sidebar: cleanup must
-                # not depend on menu state. Whether the Crawler section is already
-                # expanded (clicking it then collapses it, hiding the item beneath)
-                # depends on where the failure above left the page.
-                page.goto(context.url("/admin/webconfig/"))
-                page.wait_for_load_state("domcontentloaded")
-
-                page.click(f"text={webconfig_name}")
-                assert_startswith(page.url, context.url("/admin/webconfig/details/4/"))
-
-                page.click(f"text={t(Labels.CRUD_BUTTON_DELETE)}")
-                page.click('div.modal-footer button[name="delete"]')
-
-                page.wait_for_load_state("domcontentloaded")
-                assert_absent(page, webconfig_name, "/admin/webconfig/")
+                fixtures.delete(context, "webconfig", created["webconfig"])
                 logger.info(f"✓ Web crawl configuration deleted")
 
         cleanup.escalate()
@@ -4,8 +4,8 @@ import logging
 from fess.test import assert_equal, assert_not_equal, assert_startswith
 from fess.test.i18n import t
 from fess.test.i18n.keys import Labels
-from fess.test.ui import FessContext
-from fess.test.ui.cleanup import Cleanup, assert_absent
+from fess.test.ui import FessContext, fixtures
+from fess.test.ui.cleanup import Cleanup
 from playwright.sync_api import Playwright, sync_playwright
 
 logger = logging.getLogger(__name__)
@@ -24,63 +24,37 @@ def destroy(context: FessContext) -> None:
 def run(context: FessContext) -> None:
     """
     Integration test for user permission workflow:
-    1. Create a new role
-    2. Create a new group
+    1. Create a new role (admin API fixture)
+    2. Create a new group (admin API fixture)
     3. Create a new user and assign to group
     4. Verify user exists with group assignment
-    5. Delete user, group, and role (cleanup)
+    5. Delete user, group, and role (cleanup, admin API)
+
+    The screen under test is the user form's group assignment; the role and
+    group are only its prerequisites.
     """
     logger.info("start user permission workflow integration test")
 
-    page: "Page" = context.get_admin_page()
     label_base: str = context.create_label_name()
     role_name: str = f"Role_{label_base}"
     group_name: str = f"Group_{label_base}"
     user_name: str = f"User_{label_base}"
 
-    created: list = []
+    created: dict = {}
     try:
         # Step 1: Create a new role
         logger.info("Step 1: Creating role")
-        page.click(f"text={t(Labels.MENU_USER)}")
-        page.click(f"text={t(Labels.MENU_ROLE)}")
-        assert_equal(page.url, context.url("/admin/role/"))
-
-        page.click(f"text={t(Labels.CRUD_LINK_CREATE)}")
-        assert_equal(page.url, context.url("/admin/role/createnew/"))
-
-        page.fill("input[name=\"name\"]", role_name)
-        page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_CREATE)}")')
-        created.append("role")
-        assert_equal(page.url, context.url("/admin/role/"))
-
-        page.wait_for_load_state("domcontentloaded")
-        table_content: str = page.inner_text("table")
-        assert_not_equal(table_content.find(role_name), -1,
-                         f"{role_name} not created")
+        created["role"] = fixtures.create(context, "role", {"name": role_name})
         logger.info(f"✓ Role '{role_name}' created successfully")
 
         # Step 2: Create a new group
         logger.info("Step 2: Creating group")
-        page.goto(context.url("/admin/group/"))
-        page.wait_for_load_state("domcontentloaded")
-
-        page.click(f"text={t(Labels.CRUD_LINK_CREATE)}")
-        assert_equal(page.url, context.url("/admin/group/createnew/"))
-
-        page.fill("input[name=\"name\"]", group_name)
-        page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_CREATE)}")')
-        created.append("group")
-        assert_equal(page.url, context.url("/admin/group/"))
-
-        page.wait_for_load_state("domcontentloaded")
-        table_content = page.inner_text("table")
-        assert_not_equal(table_content.find(group_name), -1,
-                         f"{group_name} not created")
+        created["group"] = fixtures.create(context, "group", {"name": group_name})
         logger.info(f"✓ Group '{group_name}' created successfully")
 
         # Step 3: Create a new user and assign to group
         logger.info("Step 3: Creating user with group assignment")
+        page: "Page" = context.get_admin_page()
         page.goto(context.url("/admin/user/"))
         page.wait_for_load_state("domcontentloaded")
 
@@ -95,7 +69,7 @@ def run(context: FessContext) -> None:
         page.select_option("select[name=\"groups\"]", label=group_name)
 
         page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_CREATE)}")')
-        created.append("user")
+        created["user"] = user_name
         assert_equal(page.url, context.url("/admin/user/"))
 
         page.wait_for_load_state("domcontentloaded")
@@ -121,40 +95,20 @@ def run(context: FessContext) -> None:
         # Delete user (known password: testpassword123 — must not leak)
         if "user" in created:
             with cleanup.guard(f"user '{user_name}' with known password 'testpassword123'"):
-                page.goto(context.url("/admin/user/"))
-                page.wait_for_load_state("domcontentloaded")
-                page.click(f"text={user_name}")
-                page.wait_for_load_state("domcontentloaded")
-                page.click(f"text={t(Labels.CRUD_LINK_DELETE)}")
-                page.click('div.modal-footer button[name="delete"]')
-                page.wait_for_load_state("domcontentloaded")
-                assert_absent(page, user_name, "/admin/user/")
+                assert_equal(fixtures.remove(context, "user", name=user_name), 1,
+                             f"expected exactly one user named {user_name}")
                 logger.info(f"✓ User '{user_name}' deleted")
 
         # Delete group
         if "group" in created:
             with cleanup.guard(f"group '{group_name}'"):
-                page.goto(context.url("/admin/group/"))
-                page.wait_for_load_state("domcontentloaded")
-                page.click(f"text={group_name}")
-                page.wait_for_load_state("domcontentloaded")
-                page.click(f"text={t(Labels.CRUD_LINK_DELETE)}")
-                page.click('div.modal-footer button[name="delete"]')
-                page.wait_for_load_state("domcontentloaded")
-                assert_absent(page, group_name, "/admin/group/")
+                fixtures.delete(context, "group", created["group"])
                 logger.info(f"✓ Group '{group_name}' deleted")
 
         # Delete role
         if "role" in created:
             with cleanup.guard(f"role '{role_name}'"):
-                page.goto(context.url("/admin/role/"))
-                page.wait_for_load_state("domcontentloaded")
-                page.click(f"text={role_name}")
-                page.wait_for_load_state("domcontentloaded")
-                page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_DELETE)}")')
-                page.click('div.modal-footer button[name="delete"]')
-                page.wait_for_load_state("domcontentloaded")
-                assert_absent(page, role_name, "/admin/role/")
+                fixtures.delete(context, "role", created["role"])
                 logger.info(f"✓ Role '{role_name}' deleted")
 
         cleanup.escalate()
@@ -0,0 +1,156 @@
+"""
+Pacing between browser actions.
+
+The suite used to launch Chromium with slow_mo=500, putting half a second in
+front of every browser operation whether or not the page needed it. Pacing is
+now a profile applied by PageWrapper around click/fill/goto/select_option:
+
+    none      no extra waiting; Playwright's own auto-waiting only
+    adaptive  after each action, wait until the DOM has stopped changing and
+              no XHR/fetch is in flight (default)
+    legacy    a fixed delay before each action, the old slow_mo behaviour
+
+PACING selects the profile for the run. A module that is flaky without the
+old delay can set ``PACING = "legacy"`` at module level; run_module() applies
+it for that module only.
+
+Time spent pacing is accumulated separately from the module duration so the
+metrics summary can show how much of a run was waiting rather than testing.
+"""
+import logging
+import os
+import time
+from typing import Optional, TYPE_CHECKING
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+logger = logging.getLogger(__name__)
+
+PROFILES = ("none", "adaptive", "legacy")
+
+# Installed on every page of the context. Counts XHR/fetch requests in flight
+# and remembers when the DOM last changed, so settling is a single
+# wait_for_function round trip instead of a Python polling loop.
+SETTLE_SCRIPT = """
+(() => {
+  if (window.__fessPacing) return;
+  window.__fessPacing = {pending: 0, lastMutation: performance.now()};
+  const state = window.__fessPacing;
+  const done = () => { state.pending = Math.max(0, state.pending - 1); };
+  const origFetch = window.fetch;
+  if (origFetch) {
+    window.fetch = function () {
+      state.pending++;
+      return origFetch.apply(this, arguments).finally(done);
+    };
+  }
+  const origSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    state.pending++;
+    this.addEventListener('loadend', done, {once: true});
+    return origSend.apply(this, arguments);
+  };
+  const observe = () => new MutationObserver(() => {
+    state.lastMutation = performance.now();
+  }).observe(document, {subtree: true, childList: true, attributes: true,
+                        characterData: true});
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', observe, {once: true});
+  } else {
+    observe();
+  }
+})();
+"""
+
+SETTLED_EXPRESSION = """
+(quietMs) => {
+  const state = window.__fessPacing;
+  if (!state) return document.readyState !== 'loading';
+  return document.readyState !== 'loading' && state.pending === 0
+      && performance.now() - state.lastMutation >= quietMs;
+}
+"""
+
+
+def _env_profile() -> str:
+    profile = os.environ.get("PACING", "adaptive").strip().lower()
+    if profile not in PROFILES:
+        logger.warning(f"Unknown PACING={profile!r}; using 'adaptive'")
+        return "adaptive"
+    return profile
+
+
+def _env_ms(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(f"{name}={raw!r} is not a number; using {default}")
+        return default
+
+
+class Pacer:
+    """Applies the pacing profile around PageWrapper actions and keeps
+    count of the time it spends doing so."""
+
+    def __init__(self, profile: Optional[str] = None):
+        self._default_profile = profile or _env_profile()
+        self.profile = self._default_profile
+        self.delay = _env_ms("PACING_DELAY_MS", 500) / 1000
+        self.quiet_ms = _env_ms("PACING_QUIET_MS", 100)
+        self.settle_timeout_ms = _env_ms("PACING_SETTLE_TIMEOUT_MS", 5000)
+        self.pacing_seconds = 0.0
+        self.actions = 0
+
+    def set_module_profile(self, profile: Optional[str]) -> None:
+        """Use ``profile`` for the next module, or the run's profile if None."""
+        if profile is not None and profile not in PROFILES:
+            logger.warning(f"Unknown module PACING={profile!r}; ignoring")
+            profile = None
+        self.profile = profile or self._default_profile
+
+    def reset(self) -> float:
+        """Return the pacing time accumulated so far and start again from zero."""
+        spent = self.pacing_seconds
+        self.pacing_seconds = 0.0
+        self.actions = 0
+        return spent
+
+    def before_action(self) -> None:
+        self.actions += 1
+        if self.profile == "legacy":
+            time.sleep(self.delay)
+            self.pacing_seconds += self.delay
+
+    def after_action(self, page: "Page") -> None:
+        if self.profile == "adaptive":
+            self.settle(page)
+
+    def settle(self, page: "Page") -> None:
+        """Wait until the page has stopped changing. Never raises: a page that
+        keeps polling in the background only costs the settle timeout, and
+        the next action's own auto-wait still applies."""
+        started = time.time()
+        try:
+            # Two attempts: an action that started a navigation can destroy
+            # the execution context the first wait is evaluating in. A timeout
+            # is final -- waiting again would only double the cost.
+            for attempt in range(2):
+                try:
+                    page.wait_for_load_state("domcontentloaded",
+                                             timeout=self.settle_timeout_ms)
+                    page.wait_for_function(SETTLED_EXPRESSION, arg=self.quiet_ms,
+                                           polling=50, timeout=self.settle_timeout_ms)
+                    return
+                except PlaywrightTimeoutError as e:
+                    logger.debug(f"[PACING] page did not settle: {e}")
+                    return
+                except Exception as e:
+                    logger.debug(f"[PACING] settle attempt {attempt + 1} failed: {e}")
+        finally:
+            self.pacing_seconds += time.time() - started
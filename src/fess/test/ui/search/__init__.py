@@ -1,22 +1,9 @@
-from fess.test.ui.search import (
-    cache,
-    facet,
-    form_submit,
-    go_click,
-    help,
-    login_form,
-    no_results,
-    pagination,
-    profile_form,
-    query,
-    related,
-    root_top,
-    seed,
-    sort,
-    suggest,
-    thumbnail,
-    top,
-)
+"""Search UI test modules.
+
+The leaves are not imported here: main.py imports only the modules a run
+selects (see fess.test.registry), and `from fess.test.ui.search import seed`
+imports just that submodule.
+"""
 
 __all__ = [
     "cache",
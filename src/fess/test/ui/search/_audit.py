@@ -0,0 +1,199 @@
+"""
+One in-page audit per page, shared by layout_overflow, i18n_smoke and
+console_errors.
+
+Those three looked at overlapping page sets -- /search/ and /admin/ in all
+of them -- and each paid for its own visit: layout_overflow navigated and
+made two page.evaluate() round trips (soft overflow, then off-screen),
+i18n_smoke navigated and pulled the whole inner_text("body") into Python to
+run two regexes over it, console_errors navigated its six pages again with
+Playwright listeners attached. Now audit_pages() navigates once per page and
+runs AUDIT_SCRIPT in a single evaluate that returns only the findings:
+
+  overflow      .nav-link/.btn whose text overflows its box (soft)
+  offscreen     .nav-link/.btn laid out off the top/left edge (hard)
+  missing_keys  LastaFlute's ???labels.x??? markers for missing labels
+  residue       raw ${...} EL expressions the JSP did not evaluate
+  errors        what the page's console and pageerror listeners heard
+                during the visit -- console errors, the browser's own
+                included (failed XHR/fetch responses, CSP and mixed-content
+                errors), and uncaught errors -- followed by the URL of each
+                failed script/style/image load, buffered in the page by
+                ERROR_BUFFER_SCRIPT; the listeners and the init script are
+                attached before the first audited navigation
+  labels        which of the requested label texts the body shows
+
+Samples are capped at MAX_REPORTED; counts are exact. Each result is kept
+for AUDIT_TTL seconds per context and path, so the module that runs second
+reuses the visits of the first (the default order runs the three within a
+module of each other) and only the pages no one audited yet are loaded.
+"""
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+AUDITED_ELEMENTS = ".nav-link, .btn"
+MAX_REPORTED = 5
+# Seconds an audit is reused for. Long enough to span the three modules,
+# short enough that a watch-mode re-run looks at the pages again.
+AUDIT_TTL = 120.0
+# How long to wait for the page's own requests to finish, so errors raised
+# by late scripts are in the buffer when it is read
+NETWORK_IDLE_TIMEOUT_MS = 10000
+
+# Names the URL of a failed element load, which the browser's console
+# message ("Failed to load resource: ... status of 404") leaves out.
+# Console messages and uncaught errors come from the page's listeners.
+ERROR_BUFFER_SCRIPT = """
+(() => {
+  if (window.__fessAudit) return;
+  const errors = [];
+  window.__fessAudit = {errors};
+  // Capture phase: load errors of <script>/<link>/<img> do not bubble.
+  window.addEventListener('error', event => {
+    const target = event.target;
+    if (target && target !== window && (target.src || target.href) && errors.length < 50) {
+      errors.push('resource: ' + String(target.src || target.href).slice(0, 300));
+    }
+  }, true);
+})();
+"""
+
+AUDIT_SCRIPT = """
+({selector, limit, labels}) => {
+  const items = [...document.querySelectorAll(selector)];
+  const text = el => (el.innerText || '').slice(0, 50);
+  const overflow = items.filter(el => el.scrollWidth > el.clientWidth + 2);
+  const offscreen = items.filter(el => {
+    const r = el.getBoundingClientRect();
+    return r.width > 0 && (r.left < -100 || r.top < -100);
+  });
+  const body = document.body ? document.body.innerText : '';
+  const distinct = re => [...new Set(body.match(re) || [])];
+  const missingKeys = distinct(/\\?{2,}labels\\.[A-Za-z0-9_.]+\\?{2,}/g);
+  const residue = distinct(/\\$\\{[^}]+\\}/g);
+  return {
+    overflow: overflow.slice(0, limit).map(el => ({
+      text: text(el), tag: el.tagName, scroll: el.scrollWidth, client: el.clientWidth})),
+    overflowCount: overflow.length,
+    offscreen: offscreen.slice(0, limit).map(text),
+    offscreenCount: offscreen.length,
+    missingKeys: missingKeys.slice(0, limit),
+    missingKeyCount: missingKeys.length,
+    residue: residue.slice(0, limit),
+    residueCount: residue.length,
+    errors: window.__fessAudit ? window.__fessAudit.errors.slice() : null,
+    labels: Object.fromEntries(labels.map(label => [label, body.includes(label)])),
+  };
+}
+"""
+
+
+@dataclass
+class PageAudit:
+    """What AUDIT_SCRIPT found on one page"""
+    path: str
+    overflow: List[dict] = field(default_factory=list)
+    overflow_count: int = 0
+    offscreen: List[str] = field(default_factory=list)
+    offscreen_count: int = 0
+    missing_keys: List[str] = field(default_factory=list)
+    missing_key_count: int = 0
+    residue: List[str] = field(default_factory=list)
+    residue_count: int = 0
+    # None when the error buffer was not in the page
+    errors: Optional[List[str]] = None
+    labels: Dict[str, bool] = field(default_factory=dict)
+
+    @classmethod
+    def from_script(cls, path: str, found: dict) -> "PageAudit":
+        return cls(path=path,
+                   overflow=found["overflow"], overflow_count=found["overflowCount"],
+                   offscreen=found["offscreen"], offscreen_count=found["offscreenCount"],
+                   missing_keys=found["missingKeys"], missing_key_count=found["missingKeyCount"],
+                   residue=found["residue"], residue_count=found["residueCount"],
+                   errors=found["errors"], labels=found["labels"])
+
+
+# (id(context), path) -> (monotonic audit time, audit)
+_audits: Dict[Tuple[int, str], Tuple[float, PageAudit]] = {}
+# id() of the Playwright pages the error buffer is installed in -> what
+# their console/pageerror listeners collected since the last audit began
+_instrumented: Dict[int, List[str]] = {}
+
+
+def _install_error_buffer(page, again: bool = False) -> List[str]:
+    """Attach the error listeners and ERROR_BUFFER_SCRIPT to the page once.
+
+    Returns:
+        The list the listeners append to
+    """
+    raw = getattr(page, "_page", page)
+    if again or id(raw) not in _instrumented:
+        heard: List[str] = []
+        raw.on("console", lambda msg: heard.append(f"console.{msg.type}: {msg.text}")
+               if msg.type == "error" else None)
+        raw.on("pageerror", lambda exc: heard.append(f"pageerror: {exc}"))
+        raw.add_init_script(ERROR_BUFFER_SCRIPT)
+        _instrumented[id(raw)] = heard
+    return _instrumented[id(raw)]
+
+
+def _audit(context, page, heard: List[str], path: str, labels: List[str]) -> PageAudit:
+    """Navigate to path and run AUDIT_SCRIPT there; `heard` is what the
+    page's listeners collect, merged into the audit's errors."""
+    del heard[:]
+    page.goto(context.url(path))
+    try:
+        page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT_MS)
+    except Exception as e:
+        logger.warning(f"[AUDIT] networkidle wait timed out on {path}: {e}")
+    audit = PageAudit.from_script(path, page.evaluate(AUDIT_SCRIPT, {
+        "selector": AUDITED_ELEMENTS, "limit": MAX_REPORTED, "labels": labels}))
+    if audit.errors is not None:
+        audit.errors = heard + audit.errors
+    return audit
+
+
+def audit_pages(context, paths: Iterable[str],
+                labels: Iterable[str] = ()) -> Dict[str, PageAudit]:
+    """
+    Audit each page, reusing a recent audit of it.
+
+    Args:
+        context: FessContext
+        paths: Paths to audit
+        labels: Label texts to look for in each page's body; a recent audit
+            is reused only when it looked for all of them
+
+    Returns:
+        Path -> PageAudit, in the order given
+    """
+    labels = list(labels)
+    page = None
+    audits: Dict[str, PageAudit] = {}
+    for path in paths:
+        key = (id(context), path)
+        audited_at, audit = _audits.get(key, (0.0, None))
+        if (audit is not None and time.monotonic() - audited_at < AUDIT_TTL
+                and all(label in audit.labels for label in labels)):
+            logger.debug(f"[AUDIT] {path}: reusing the audit of {time.monotonic() - audited_at:.0f}s ago")
+            audits[path] = audit
+            continue
+
+        if page is None:
+            page = context.get_wrapped_page() or context.get_admin_page()
+            heard = _install_error_buffer(page)
+        wanted = sorted(set(labels) | set(audit.labels if audit is not None else ()))
+        audit = _audit(context, page, heard, path, wanted)
+        if audit.errors is None:
+            # A new page that inherited a closed one's id(): instrument it
+            # after all and look again.
+            heard = _install_error_buffer(page, again=True)
+            audit = _audit(context, page, heard, path, wanted)
+        _audits[key] = (time.monotonic(), audit)
+        audits[path] = audit
+    return audits
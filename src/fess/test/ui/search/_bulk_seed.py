@@ -0,0 +1,265 @@
+"""
+Bulk-load the sampledata site into the index without crawling it.
+
+search/seed's crawl path (webconfig + Default Crawler) takes minutes: the
+crawler's startup, its politeness intervals and the index commit dominate
+a corpus of a few dozen pages. SEED_MODE=bulk gets the same documents in
+seconds instead:
+
+  1. walk the sampledata site over HTTP the way the seed webconfig does
+     (same start URL, same included/excluded URL patterns, same access
+     cap, links followed from each page) -- fetch_pages(), whose result
+     seed also fingerprints to detect an instance already seeded;
+  2. build the document the crawler would have indexed for each page --
+     the fields the search modules read: title, content, digest, lang,
+     label (from the label types' included paths), has_cache + cache for
+     text/html, thumbnail from og:image, mimetype/filetype, role;
+  3. PUT them to the admin document API (/api/admin/documents/bulk),
+     BULK_BATCH_SIZE per request, authenticated with an admin-api access
+     token. Pages stream from fetch to load, so a generated corpus of any
+     size (see _corpus) loads in constant memory.
+
+doc_id is derived from the URL, so loading twice overwrites rather than
+duplicates. No crawl runs, so no joblog or crawling-info rows are written:
+modules that need a real crawl's traces (sysinfo/deleteall,
+sysinfo/crawlinfo) need SEED_MODE=crawl.
+"""
+import hashlib
+import logging
+import re
+from collections import deque
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urldefrag, urljoin, urlparse
+
+import requests
+
+from fess.test.ui.api import FessApiClient
+
+logger = logging.getLogger(__name__)
+
+BULK_API_PATH = "/api/admin/documents/bulk"
+# Role every crawled document gets from the webconfig's default
+# "{role}guest" permission, in the index's encoded form.
+GUEST_ROLE = "Rguest"
+# crawler.document.cache.supported.mimetypes default: only HTML is cached.
+CACHE_MIMETYPES = ("text/html",)
+# Documents per bulk request: a generated corpus is loaded in batches.
+BULK_BATCH_SIZE = 500
+# Length of the stored digest (crawler.document.max.digest.length default).
+DIGEST_LENGTH = 200
+
+_FILETYPES = {"text/html": "html", "text/plain": "txt"}
+_SKIPPED_TAGS = {"script", "style", "head", "title"}
+
+
+class _PageParser(HTMLParser):
+    """Pulls the title, lang, og:image, links and body text out of a page"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.lang: Optional[str] = None
+        self.og_image: Optional[str] = None
+        self.links: List[str] = []
+        self._text: List[str] = []
+        self._open: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "html" and attrs.get("lang"):
+            self.lang = attrs["lang"]
+        elif tag == "meta" and attrs.get("property") == "og:image":
+            self.og_image = attrs.get("content")
+        elif tag == "a" and attrs.get("href"):
+            self.links.append(attrs["href"])
+        if tag in _SKIPPED_TAGS:
+            self._open.append(tag)
+
+    def handle_endtag(self, tag):
+        if self._open and self._open[-1] == tag:
+            self._open.pop()
+
+    def handle_data(self, data):
+        if self._open and self._open[-1] == "title":
+            self.title += data
+        elif not self._open and data.strip():
+            self._text.append(data.strip())
+
+    @property
+    def text(self) -> str:
+        return " ".join(self._text)
+
+
+def timestamp() -> str:
+    """Now, as the documents' created/timestamp/last_modified fields hold it"""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def loaded_since(stamp: str) -> str:
+    """Search query for the documents built at or after ``stamp`` (a
+    timestamp() value) -- those a load replaced as well as those it added."""
+    return f'last_modified:["{stamp}" TO *]'
+
+
+def doc_id_for(url: str) -> str:
+    """Stable doc_id for a URL, so a reload replaces the earlier document."""
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+def labels_for(url: str, label_paths: Dict[str, str]) -> List[str]:
+    """Label values whose included-paths pattern matches the URL, as the
+    crawler assigns them (the whole URL must match)."""
+    return [value for value, pattern in label_paths.items()
+            if re.fullmatch(pattern, url)]
+
+
+def build_document(url: str, mimetype: str, body: str,
+                   label_paths: Dict[str, str]) -> Dict:
+    """The index document the crawler would have produced for one page."""
+    parsed = urlparse(url)
+    now = timestamp()
+    doc = {
+        "doc_id": doc_id_for(url),
+        "url": url,
+        "host": parsed.hostname or "",
+        "site": f"{parsed.netloc}{parsed.path}",
+        "mimetype": mimetype,
+        "filetype": _FILETYPES.get(mimetype, "others"),
+        "content_length": str(len(body.encode("utf-8"))),
+        "role": [GUEST_ROLE],
+        "boost": 1.0,
+        "created": now,
+        "timestamp": now,
+        "last_modified": now,
+    }
+    if mimetype == "text/html":
+        page = _PageParser()
+        page.feed(body)
+        doc["title"] = page.title.strip() or url
+        doc["content"] = page.text
+        if page.lang:
+            doc["lang"] = page.lang
+        if page.og_image:
+            doc["thumbnail"] = urljoin(url, page.og_image)
+    else:
+        doc["title"] = parsed.path.rsplit("/", 1)[-1] or url
+        doc["content"] = body.strip()
+    doc["digest"] = doc["content"][:DIGEST_LENGTH]
+    labels = labels_for(url, label_paths)
+    if labels:
+        doc["label"] = labels
+    if mimetype in CACHE_MIMETYPES:
+        doc["has_cache"] = "true"
+        doc["cache"] = body
+    return doc
+
+
+def iter_pages(start_urls: List[str], included: str, excluded: str,
+               max_access: int = 100, timeout: int = 10) -> Iterator[Tuple[str, str, str]]:
+    """
+    Walk the site from start_urls, following links the way the crawler does.
+    A generator: pages are yielded as fetched, so a large corpus is never
+    held in memory (only the URLs seen are).
+
+    Args:
+        start_urls: First URLs fetched (the webconfig's urls)
+        included: Pattern a URL must fully match to be fetched
+        excluded: Pattern that keeps a matching URL out
+        max_access: Most URLs fetched (the webconfig's maxAccessCount)
+        timeout: Per-request timeout in seconds
+
+    Yields:
+        (url, mimetype, body) per page, in the order the pages are reached
+    """
+    seen = set(start_urls)
+    queue = deque(start_urls)
+    fetched = 0
+    with requests.Session() as session:
+        while queue and fetched < max_access:
+            url = queue.popleft()
+            resp = session.get(url, timeout=timeout)
+            if resp.status_code != 200:
+                logger.warning(f"[BULK_SEED] {url} answered {resp.status_code}; skipped")
+                continue
+            fetched += 1
+            content_type = resp.headers.get("content-type", "")
+            mimetype = content_type.split(";")[0].strip()
+            if "charset" not in content_type:
+                # nginx sends no charset; the pages are UTF-8 (multibyte tests).
+                resp.encoding = "utf-8"
+            yield url, mimetype, resp.text
+            if mimetype != "text/html":
+                continue
+            parser = _PageParser()
+            parser.feed(resp.text)
+            for href in parser.links:
+                link = urldefrag(urljoin(url, href))[0]
+                if (link not in seen and re.fullmatch(included, link)
+                        and not re.fullmatch(excluded, link)):
+                    seen.add(link)
+                    queue.append(link)
+
+
+def fetch_pages(start_url: str, included: str, excluded: str,
+                max_access: int = 100, timeout: int = 10) -> List[Tuple[str, str, str]]:
+    """iter_pages() from one start URL, as a list."""
+    return list(iter_pages([start_url], included, excluded, max_access, timeout))
+
+
+def collect_documents(pages: Iterable[Tuple[str, str, str]],
+                      label_paths: Dict[str, str]) -> Iterator[Dict]:
+    """Build a document per page from iter_pages() / fetch_pages().
+
+    Args:
+        pages: (url, mimetype, body) tuples
+        label_paths: Label value -> included-paths pattern
+    """
+    for url, mimetype, body in pages:
+        yield build_document(url, mimetype, body, label_paths)
+
+
+def bulk_load(api: FessApiClient, token: str, documents: Iterable[Dict],
+              batch_size: int = BULK_BATCH_SIZE, timeout: int = 60) -> int:
+    """
+    Index the documents through the admin document API, batch_size per call.
+
+    Args:
+        api: The context's API client (for the base URL and timings)
+        token: Access token with the admin-api role
+        documents: Documents from collect_documents()
+        batch_size: Documents per request
+        timeout: Request timeout in seconds
+
+    Returns:
+        Number of documents the API accepted
+
+    Raises:
+        AssertionError: When the API rejects a request or any document
+    """
+    loaded = 0
+    for batch in _batches(documents, batch_size):
+        resp = api.put_with_token(BULK_API_PATH, token, {"documents": batch},
+                                  timeout=timeout)
+        body = resp.get("response", resp)
+        if body.get("status", 0) != 0:
+            raise AssertionError(f"bulk document load rejected: {body}")
+        failed = [item for item in body.get("items", []) if item.get("error")]
+        if failed:
+            raise AssertionError(f"{len(failed)} of {len(batch)} documents were "
+                                 f"not indexed, first: {failed[0]}")
+        loaded += len(batch)
+        logger.debug(f"[BULK_SEED] {loaded} documents loaded")
+    return loaded
+
+
+def _batches(items: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    batch: List[Dict] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
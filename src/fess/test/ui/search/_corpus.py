@@ -0,0 +1,56 @@
+"""
+The generated sampledata corpus, as seen from the test side.
+
+An image built with CORPUS_PAGES > 0 (sampledata/generate_corpus.py) serves
+g/manifest.json next to the hand-written pages: the corpus size, a digest
+of every file written, the crawl entry page, and the hit count each listed
+query must return from the generated pages alone. The hand-written pages
+never contain the corpus terms, so those counts hold exactly whatever else
+is indexed.
+
+load_manifest() is cached per URL: seed and any search module that wants
+an exact expected count share one fetch.
+"""
+import functools
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PATH = "g/manifest.json"
+
+# Generated section -> the label value the seed's label types give it.
+LABEL_SECTIONS = {
+    "docs/labels/a": "e2e_label_a",
+    "docs/labels/b": "e2e_label_b",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def load_manifest(sampledata_url: str) -> Optional[Dict]:
+    """The corpus manifest served by sampledata, or None when the image was
+    built without a corpus (or sampledata is unreachable)."""
+    try:
+        resp = requests.get(f"{sampledata_url}{MANIFEST_PATH}", timeout=10)
+    except requests.RequestException as e:
+        logger.info(f"No corpus manifest ({type(e).__name__}): {e}")
+        return None
+    if resp.status_code != 200:
+        return None
+    manifest = resp.json()
+    logger.info(f"Corpus manifest: {manifest['pages']} pages, "
+                f"{manifest['documents']} documents, seed {manifest['seed']}")
+    return manifest
+
+
+def expected_hits(manifest: Dict) -> List[Tuple[str, Optional[str], int]]:
+    """(q, ex_q, hits) for every count the manifest pins down: its listed
+    queries, plus the corpus term filtered to each label."""
+    checks: List[Tuple[str, Optional[str], int]] = [
+        (query["q"], None, query["hits"]) for query in manifest["queries"]]
+    for section, label in LABEL_SECTIONS.items():
+        checks.append((manifest["term"], f"label:{label}",
+                       manifest["sections"].get(section, 0)))
+    return checks
@@ -0,0 +1,24 @@
+"""Shared lock declaration for the search/* modules.
+
+Every search module asserts against the documents search_seed indexed, and
+what the public UI shows for them also depends on the analyzer dictionaries,
+/admin/general/ (virtual hosts, thumbnails, the JSON API, loginRequired) and
+the admin rules that rewrite or re-rank results, and the label types the
+search form's label select and facets list. Each of those is a lock the
+module reads, so the admin modules that write one finish before it starts.
+See fess.test.schedule.
+"""
+
+SEARCH_READS = (
+    "index",
+    "analyzer",
+    "general-settings",
+    "loginRequired",
+    "boostdoc",
+    "elevateword",
+    "keymatch",
+    "labeltype",
+    "pathmap",
+    "relatedcontent",
+    "relatedquery",
+)
@@ -21,9 +21,12 @@ from playwright.sync_api import Playwright, sync_playwright
 
 from fess.test import assert_equal, assert_true
 from fess.test.ui import FessContext
+from fess.test.ui.search._locks import SEARCH_READS
 
 logger = logging.getLogger(__name__)
 
+READS = SEARCH_READS
+
 ALL_WORDS = "alpha"
 EXACT_PHRASE = "beta gamma"
 NONE_WORDS = "delta"
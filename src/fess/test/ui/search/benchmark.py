@@ -0,0 +1,127 @@
+"""Search latency benchmark over the JSON API (opt-in: TEST_MODULES=search_benchmark).
+
+Replays a catalog of query classes against the index search_seed built, at
+BENCHMARK_CONCURRENCY workers, BENCHMARK_REQUESTS timed requests per class
+(after BENCHMARK_WARMUP untimed ones):
+
+  single_term      plain terms the search modules query
+  wildcard         trailing wildcards and the match-all query
+  multibyte        search_multibyte_query's SAMPLE_QUERIES
+  label_filter     search_facet's query with an ex_q label filter per label
+  sort             search_sort's query with each sort order
+  deep_pagination  the match-all query far into the result list
+
+The corpus terms of a generated sampledata corpus join single_term and
+multibyte when the image has one. Each worker has its own keep-alive client
+(FessApiClient.fork), so the numbers measure Fess and its search engine,
+not a shared connection pool. p50/p95/p99 and QPS per class go into the
+metrics history (see fess.test.benchmark); the module fails only when a
+class errors on every request.
+
+Not part of the default run: it needs search_seed first, and its load would
+slow the modules sharing the instance.
+"""
+import logging
+from typing import List
+
+from playwright.sync_api import Playwright, sync_playwright
+
+from fess.test import assert_true, benchmark
+from fess.test.benchmark import QueryClass, SearchRequest
+from fess.test.ui import FessContext
+from fess.test.ui.search import _corpus, facet, seed, sort
+from fess.test.ui.search._locks import SEARCH_READS
+from fess.test.ui.search.multibyte_query import SAMPLE_QUERIES
+from fess.test.ui.search.query_errors import MAX_OFFSET
+
+logger = logging.getLogger(__name__)
+
+READS = SEARCH_READS
+
+SINGLE_TERMS = ["intro", "page", "label", "sample", "guide"]
+WILDCARDS = ["pag*", "intr*", "lab*", "*"]
+SORT_ORDERS = ["created.asc", "created.desc", "last_modified.desc", "filename.asc"]
+# Offsets as fractions of the match-all hit count.
+DEEP_PAGE_FRACTIONS = [0.5, 0.9, 0.99]
+PAGE_SIZE = 10
+
+
+def setup(playwright: Playwright) -> FessContext:
+    context: FessContext = FessContext(playwright)
+    context.login()
+    return context
+
+
+def build_catalog(total_docs: int, manifest=None) -> List[QueryClass]:
+    """The query classes, given the match-all hit count and the corpus
+    manifest (None without a generated corpus)."""
+    single = list(SINGLE_TERMS)
+    multibyte = list(SAMPLE_QUERIES.values())
+    if manifest is not None:
+        single += [q["q"] for q in manifest["queries"] if q["q"].isascii()]
+        multibyte += [q["q"] for q in manifest["queries"] if not q["q"].isascii()]
+
+    labels = [seed._label_value(name) for name in seed.LABEL_PATHS]
+    starts = sorted({min(MAX_OFFSET, int(total_docs * f)) // PAGE_SIZE * PAGE_SIZE
+                     for f in DEEP_PAGE_FRACTIONS})
+    return [
+        QueryClass("single_term", [SearchRequest(q) for q in single]),
+        QueryClass("wildcard", [SearchRequest(q) for q in WILDCARDS]),
+        QueryClass("multibyte", [SearchRequest(q) for q in multibyte]),
+        QueryClass("label_filter", [SearchRequest(facet.QUERY, ex_q=f"label:{label}")
+                                    for label in labels]),
+        QueryClass("sort", [SearchRequest(sort.QUERY, sort=order) for order in SORT_ORDERS]),
+        QueryClass("deep_pagination", [SearchRequest("*", start=start) for start in starts]),
+    ]
+
+
+def run(context: FessContext) -> None:
+    logger.info("Starting search/benchmark")
+    total = context.api_search("*")["record_count"]
+    assert_true(total > 0, "index is empty; run search_seed before search_benchmark")
+
+    concurrency = benchmark.benchmark_concurrency()
+    requests = benchmark.benchmark_requests()
+    warmup = benchmark.benchmark_warmup()
+    catalog = build_catalog(total, _corpus.load_manifest(seed.SAMPLEDATA_URL))
+    clients = [context.api.fork() for _ in range(concurrency)]
+    searchers = [
+        lambda r, client=client: client.search(r.q, ex_q=r.ex_q, num=r.num,
+                                               sort=r.sort, start=r.start)
+        for client in clients
+    ]
+    logger.info(f"Benchmarking {len(catalog)} query classes over {total} docs: "
+                f"{requests} requests each at concurrency {concurrency}")
+
+    results = []
+    try:
+        for query_class in catalog:
+            result = benchmark.run_class(query_class, searchers, requests, warmup)
+            logger.info(f"{result.query_class}: p50={result.p50 * 1000:.0f}ms "
+                        f"p95={result.p95 * 1000:.0f}ms p99={result.p99 * 1000:.0f}ms "
+                        f"qps={result.qps} errors={result.errors}")
+            results.append(result)
+    finally:
+        for client in clients:
+            client.close()
+
+    # Printed with the metrics summary at the end of the run.
+    benchmark.record(results)
+    failed = [r.query_class for r in results if r.requests == 0]
+    assert_true(not failed, f"every request failed for query classes: {failed}")
+    logger.info("search/benchmark completed")
+
+
+def destroy(context: FessContext) -> None:
+    context.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    with sync_playwright() as playwright:
+        context: FessContext = setup(playwright)
+        try:
+            run(context)
+            benchmark.print_results(benchmark.end_module())
+        finally:
+            destroy(context)
@@ -45,9 +45,12 @@ from fess.test.i18n import t
 from fess.test.i18n.keys import Labels
 from fess.test.i18n.message_keys import Messages
 from fess.test.ui import FessContext
+from fess.test.ui.search._locks import SEARCH_READS
 
 logger = logging.getLogger(__name__)
 
+READS = SEARCH_READS
+
 # Matches three sampledata documents, not two: docs/ja/intro.html,
 # docs/en/intro.html, and index.html itself (which links both under "JA
 # Intro"/"EN Intro"). Harmless -- every expected value below is read off
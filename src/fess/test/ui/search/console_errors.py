@@ -1,22 +1,29 @@
 """JS console error / page error detector across key pages.
 
-Listens for console.error() and pageerror events while navigating a
-fixed page set. Filters known noise (favicon 404 etc.) and fails on
-any remaining error.
+Listens for console errors and pageerror events while visiting a fixed
+page set, and collects the URL of every failed script/style/image load.
+Filters known noise (favicon 404 etc.) and fails on any remaining error.
+
+The visits are the shared page audit's (_audit.py), whose listeners feed
+its errors, so the pages layout_overflow and i18n_smoke audited moments ago
+are not loaded again.
 
 Detects bug categories:
   3. Functional failure (locale-dependent JS breakage)
 """
 import logging
-from typing import List
 
 from playwright.sync_api import Playwright, sync_playwright
 
 from fess.test import assert_true
 from fess.test.ui import FessContext
+from fess.test.ui.search import _audit
+from fess.test.ui.search._locks import SEARCH_READS
 
 logger = logging.getLogger(__name__)
 
+READS = SEARCH_READS
+
 
 PAGES_TO_VISIT = [
     "/",
@@ -56,24 +63,10 @@ def destroy(context: FessContext) -> None:
 def run(context: FessContext) -> None:
     logger.info(f"Starting search/console_errors (lang={context.lang})")
 
-    errors: List[str] = []
-
-    page = context.get_wrapped_page() or context.get_admin_page()
-    raw_page = page._page  # PageWrapper exposes the wrapped Playwright Page
-
-    raw_page.on(
-        "console",
-        lambda msg: errors.append(f"console.{msg.type}: {msg.text}")
-        if msg.type == "error" else None,
-    )
-    raw_page.on("pageerror", lambda exc: errors.append(f"pageerror: {exc}"))
-
-    for path in PAGES_TO_VISIT:
-        raw_page.goto(context.url(path))
-        try:
-            raw_page.wait_for_load_state("networkidle", timeout=10000)
-        except Exception as e:
-            logger.warning(f"networkidle wait timed out on {path}: {e}")
+    errors = []
+    for path, audit in _audit.audit_pages(context, PAGES_TO_VISIT).items():
+        assert_true(audit.errors is not None, f"No error listeners on {path}")
+        errors += audit.errors
 
     significant = [e for e in errors if not _is_noise(e)]
     assert_true(
@@ -30,10 +30,13 @@ from playwright.sync_api import Playwright, sync_playwright
 from fess.test import assert_equal, assert_true
 from fess.test.i18n import t
 from fess.test.i18n.keys import Labels
-from fess.test.ui import FessContext
+from fess.test.ui import FessContext, static_check
+from fess.test.ui.search._locks import SEARCH_READS
 
 logger = logging.getLogger(__name__)
 
+READS = SEARCH_READS
+
 NOTFOUND_PATH = "/error/notfound/"
 
 # path -> label whose text only that view renders. The request error view is
@@ -49,6 +52,13 @@ ERROR_VIEWS = (
 # Order is irrelevant: the routed one is detected, never assumed.
 REQUEST_ERROR_PATHS = ("/error/badrequest/", "/error/badrequrest/")
 
+ERROR_SYSTEM_PATH = "/error/system?message_key=errors.bad_authentication"
+
+# Every view is server-rendered and every check reads the landing URL or the
+# body text: checked without a browser under STATIC_CHECKS. (The unknown path
+# is generated per run, so run() adds it to the prefetch.)
+STATIC_PATHS = tuple(path for path, _ in ERROR_VIEWS) + REQUEST_ERROR_PATHS + (ERROR_SYSTEM_PATH,)
+
 
 def setup(playwright: Playwright) -> FessContext:
     context: FessContext = FessContext(playwright)
@@ -56,14 +66,14 @@ def setup(playwright: Playwright) -> FessContext:
     return context
 
 
-def _goto(page, context: FessContext, path: str) -> None:
-    page.goto(context.url(path))
-    page.wait_for_load_state("domcontentloaded")
+def _goto(page, context: FessContext, path: str):
+    """The page at `path`: `page` navigated there, or a StaticPage of it."""
+    return static_check.open_page(context, path, page)
 
 
 def _assert_view_renders(page, context: FessContext, path: str, key: str) -> None:
     """The view is served at its own path and renders its own text."""
-    _goto(page, context, path)
+    page = _goto(page, context, path)
 
     # Not a tautology: an /error/* path with no action behind it redirects to
     # /error/notfound/ instead, which is exactly what the unrouted spelling of
@@ -84,7 +94,7 @@ def _assert_contains_marker(page, marker: str, path: str) -> None:
 def _assert_lands_on_notfound(page, context: FessContext, requested: str) -> None:
     """`requested` resolves to no action, so the 404 handler lands us on the
     Not Found view with the original path echoed in ?url=."""
-    _goto(page, context, requested)
+    page = _goto(page, context, requested)
 
     landed = urlparse(page.url)
     assert_equal(landed.path, NOTFOUND_PATH,
@@ -102,8 +112,7 @@ def _assert_lands_on_notfound(page, context: FessContext, requested: str) -> Non
 def _serves_itself(page, context: FessContext, path: str) -> bool:
     """True when an action is routed at `path`: a routed /error/* path stays put,
     while an unrouted one is redirected away to the Not Found view."""
-    _goto(page, context, path)
-    return urlparse(page.url).path == path
+    return urlparse(_goto(page, context, path).url).path == path
 
 
 def _assert_exactly_one_request_error_path_renders(page, context: FessContext) -> None:
@@ -148,20 +157,22 @@ def _assert_error_system_falls_through_to_notfound(page, context: FessContext) -
     page), while on builds that point that branch elsewhere nothing reaches this
     path from redirect.jsp any more and the check is only a guard that no
     ErrorSystemAction has appeared. Kept for the older builds in the matrix."""
-    _goto(page, context, "/error/system?message_key=errors.bad_authentication")
+    page = _goto(page, context, ERROR_SYSTEM_PATH)
     assert_equal(urlparse(page.url).path, NOTFOUND_PATH,
                  f"expected /error/system to land on {NOTFOUND_PATH}, got {page.url}")
 
 
-def _assert_unknown_path_lands_on_notfound(page, context: FessContext) -> None:
+def _assert_unknown_path_lands_on_notfound(page, context: FessContext,
+                                           unknown: str) -> None:
     """A genuinely unrouted URL exercises the real container 404 -> redirect.jsp
     -> /error/notfound/ chain, rather than a hand-written /error/* path."""
-    _assert_lands_on_notfound(page, context,
-                              f"/no-such-page-{context.generate_str(12)}")
+    _assert_lands_on_notfound(page, context, unknown)
 
 
 def run(context: FessContext) -> None:
     logger.info("Starting search/error_pages")
+    unknown = f"/no-such-page-{context.generate_str(12)}"
+    static_check.prefetch(context, STATIC_PATHS + (unknown,))
     page = context.get_wrapped_page() or context.get_admin_page()
 
     for path, key in ERROR_VIEWS:
@@ -169,7 +180,7 @@ def run(context: FessContext) -> None:
 
     _assert_exactly_one_request_error_path_renders(page, context)
     _assert_error_system_falls_through_to_notfound(page, context)
-    _assert_unknown_path_lands_on_notfound(page, context)
+    _assert_unknown_path_lands_on_notfound(page, context, unknown)
 
     logger.info("search/error_pages completed")
 
@@ -5,9 +5,12 @@ from playwright.sync_api import Playwright, sync_playwright
 
 from fess.test import assert_true
 from fess.test.ui import FessContext
+from fess.test.ui.search._locks import SEARCH_READS
 
 logger = logging.getLogger(__name__)
 
+READS = SEARCH_READS
+
 QUERY = "label"  # label-tagged docs contain the word "label"; "page" docs don't carry labels
 LABEL_A_VALUE = "e2e_label_a"  # stored value from PR-1 seed (underscores)
 
@@ -4,10 +4,15 @@ import logging
 from playwright.sync_api import Playwright, sync_playwright
 
 from fess.test import assert_true
-from fess.test.ui import FessContext
+from fess.test.ui import FessContext, static_check
+from fess.test.ui.search._locks import SEARCH_READS
 
 logger = logging.getLogger(__name__)
 
+READS = SEARCH_READS
+# Server-rendered markup only: checked without a browser under STATIC_CHECKS
+STATIC_PATHS = ("/help/",)
+
 
 def setup(playwright: Playwright) -> FessContext:
     context: FessContext = FessContext(playwright)
@@ -17,10 +22,7 @@ def setup(playwright: Playwright) -> FessContext:
 
 def run(context: FessContext) -> None:
     logger.info("Starting search/help")
-    page = context.get_wrapped_page() or context.get_admin_page()
-
-    page.goto(context.url("/help/"))
-    page.wait_for_load_state("domcontentloaded")
+    page = static_check.open_page(context, "/help/")
 
     # If HelpAction redirected to /login/, isLoginRequired() is misconfigured for
     # this run — surface it as a failure rather than silently skipping.
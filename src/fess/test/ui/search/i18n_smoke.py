@@ -4,11 +4,13 @@ Loads the search top page and admin top page and asserts:
   - No 'unknown.label' / '???labels.x???' / raw '${...}' markers leak.
   - A small set of expected labels (looked up via t()) appear in the body.
 
+The markers are matched in the page by the shared audit (_audit.py), which
+returns what it found instead of the whole body text.
+
 Detects bug categories:
   1. i18n missing / fallback to English / untranslated key markers
 """
 import logging
-import re
 
 from playwright.sync_api import Playwright, sync_playwright
 
@@ -16,14 +18,12 @@ from fess.test import assert_true
 from fess.test.i18n import t
 from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.search import _audit
+from fess.test.ui.search._locks import SEARCH_READS
 
 logger = logging.getLogger(__name__)
 
-
-# LastaFlute renders missing labels as "???labels.x???".
-_MISSING_KEY_PATTERN = re.compile(r'\?{2,}labels\.[A-Za-z0-9_.]+\?{2,}')
-# Raw JSP/EL expression leaks
-_JSP_RESIDUE_PATTERN = re.compile(r'\$\{[^}]+\}')
+READS = SEARCH_READS
 
 
 def setup(playwright: Playwright) -> FessContext:
@@ -36,43 +36,33 @@ def destroy(context: FessContext) -> None:
     context.close()
 
 
-def _check_no_untranslated_keys(body_text: str, where: str) -> None:
-    matches = _MISSING_KEY_PATTERN.findall(body_text)
+def _check_no_untranslated_keys(audit: _audit.PageAudit) -> None:
     assert_true(
-        len(matches) == 0,
-        f"Untranslated label keys found on {where}: {matches[:5]}")
+        audit.missing_key_count == 0,
+        f"Untranslated label keys found on {audit.path}: {audit.missing_keys}")
 
 
-def _check_no_jsp_residue(body_text: str, where: str) -> None:
-    matches = _JSP_RESIDUE_PATTERN.findall(body_text)
-    el_like = [m for m in matches if m.startswith('${') and m.endswith('}')]
+def _check_no_jsp_residue(audit: _audit.PageAudit) -> None:
     assert_true(
-        len(el_like) == 0,
-        f"Raw EL expressions leaked on {where}: {el_like[:5]}")
+        audit.residue_count == 0,
+        f"Raw EL expressions leaked on {audit.path}: {audit.residue}")
 
 
 def run(context: FessContext) -> None:
     logger.info(f"Starting search/i18n_smoke (lang={context.lang})")
-    page = context.get_wrapped_page() or context.get_admin_page()
-
-    # 1. Search top
-    page.goto(context.url("/search/"))
-    page.wait_for_load_state("domcontentloaded")
-    body = page.inner_text("body")
-    _check_no_untranslated_keys(body, "/search/")
-    _check_no_jsp_residue(body, "/search/")
-
-    # 2. Admin top
-    page.goto(context.url("/admin/"))
-    page.wait_for_load_state("domcontentloaded")
-    body = page.inner_text("body")
-    _check_no_untranslated_keys(body, "/admin/")
-    _check_no_jsp_residue(body, "/admin/")
-
-    # 3. Verify a known label is rendered (smoke check that locale loaded at all)
+    # A known label, as a smoke check that the locale loaded at all
     expected_dashboard = t(Labels.MENU_DASHBOARD_CONFIG)
+    audits = _audit.audit_pages(context, ["/search/", "/admin/"],
+                                labels=[expected_dashboard])
+
+    # 1. Search top, 2. Admin top
+    for audit in audits.values():
+        _check_no_untranslated_keys(audit)
+        _check_no_jsp_residue(audit)
+
+    # 3. Verify the known label is rendered
     assert_true(
-        expected_dashboard in body,
+        audits["/admin/"].labels[expected_dashboard],
         f"Expected dashboard menu label {expected_dashboard!r} not found on /admin/")
 
     logger.info("search/i18n_smoke completed")
@@ -2,7 +2,9 @@
 
 For a fixed set of pages, evaluates DOM elements (.nav-link, .btn) and
 checks that none are completely off-screen. Soft-warns on text overflow
-within their container (since some ellipsis is acceptable).
+within their container (since some ellipsis is acceptable). Both come from
+the shared page audit (_audit.py), so a page i18n_smoke or console_errors
+audited moments ago is not loaded again.
 
 Detects bug categories:
   2. Layout broken from long translations
@@ -13,9 +15,13 @@ from playwright.sync_api import Playwright, sync_playwright
 
 from fess.test import assert_true
 from fess.test.ui import FessContext
+from fess.test.ui.search import _audit
+from fess.test.ui.search._locks import SEARCH_READS
 
 logger = logging.getLogger(__name__)
 
+READS = SEARCH_READS
+
 
 PAGES_TO_CHECK = [
     "/search/",
@@ -37,41 +43,15 @@ def destroy(context: FessContext) -> None:
 
 def run(context: FessContext) -> None:
     logger.info(f"Starting search/layout_overflow (lang={context.lang})")
-    page = context.get_wrapped_page() or context.get_admin_page()
-
     hard_failures = []
-    for path in PAGES_TO_CHECK:
-        page.goto(context.url(path))
-        page.wait_for_load_state("domcontentloaded")
-
-        soft_overflow = page.evaluate("""
-            () => {
-              const items = document.querySelectorAll('.nav-link, .btn');
-              return [...items].filter(el => el.scrollWidth > el.clientWidth + 2)
-                                .map(el => ({
-                                  text: (el.innerText || '').slice(0, 50),
-                                  tag: el.tagName,
-                                  scroll: el.scrollWidth,
-                                  client: el.clientWidth,
-                                }));
-            }
-        """)
-        if soft_overflow:
+    for path, audit in _audit.audit_pages(context, PAGES_TO_CHECK).items():
+        if audit.overflow_count:
             logger.warning(
-                f"[layout] Soft-overflow on {path} ({len(soft_overflow)} elements): "
-                f"{soft_overflow[:3]}")
-
-        offscreen = page.evaluate("""
-            () => {
-              const items = document.querySelectorAll('.nav-link, .btn');
-              return [...items].filter(el => {
-                const r = el.getBoundingClientRect();
-                return r.width > 0 && (r.left < -100 || r.top < -100);
-              }).map(el => (el.innerText || '').slice(0, 50));
-            }
-        """)
-        if offscreen:
-            hard_failures.append(f"{path}: {len(offscreen)} elements off-screen ({offscreen[:3]})")
+                f"[layout] Soft-overflow on {path} ({audit.overflow_count} elements): "
+                f"{audit.overflow[:3]}")
+        if audit.offscreen_count:
+            hard_failures.append(
+                f"{path}: {audit.offscreen_count} elements off-screen ({audit.offscreen[:3]})")
 
     assert_true(
         len(hard_failures) == 0,
@@ -0,0 +1,262 @@
+"""Concurrent search load through the real UI (opt-in: TEST_MODULES=search_load).
+
+search_benchmark times the JSON API; this times what a user waits for. It
+opens LOAD_CONTEXTS anonymous browser contexts and has them drive /search/
+at the same time, LOAD_REQUESTS timed journeys per class:
+
+  ui_submit    open /, type a query, press search (form_submit's selectors)
+  ui_paginate  a match-all result page, then its next-page link (pagination's)
+  ui_cache     cache's query, then the top result's cached copy (cache's)
+
+Each journey is timed end to end, through the load event of its last page,
+so JSP rendering and the static assets it pulls in are part of the number.
+A journey that lands on an HTTP error or misses the element it clicks counts
+as an error, apart from the latencies. Results go through fess.test.benchmark
+like search_benchmark's, so p50/p95/p99, throughput and the error rate per
+class land in the metrics history and the summary.
+
+Playwright's sync API is bound to the thread that started it, so every
+context lives in a BrowserWorker: its own thread, its own Playwright and
+browser, taking journeys off a queue. The contexts are anonymous (no
+storage state), which is what the search pages serve most of the time, and
+each one loads / once before timing so its asset cache is warm.
+
+Not part of the default run: it needs search_seed first, and N browsers
+hitting /search/ would slow the modules sharing the instance.
+"""
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, List, Optional
+from urllib.parse import quote, urlparse
+
+from playwright.sync_api import Page, Playwright, sync_playwright
+
+from fess.test import assert_true, benchmark
+from fess.test.benchmark import QueryClass, SearchRequest
+from fess.test.ui import FessContext
+from fess.test.ui.context import browser_locale_for, launch_browser
+from fess.test.ui.search import benchmark as search_benchmark
+from fess.test.ui.search import cache, form_submit, pagination
+from fess.test.ui.search._locks import SEARCH_READS
+from fess.test.ui.search.multibyte_query import SAMPLE_QUERIES
+
+logger = logging.getLogger(__name__)
+
+READS = SEARCH_READS
+
+NEXT_LINK = 'a[href*="/search/next"]'
+
+# Journey: (page, url, request) -> None, where url(path) is absolute;
+# raising is an error.
+Journey = Callable[[Page, Callable[[str], str], SearchRequest], None]
+
+
+def _env_count(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.error(f"{name}={raw!r} is not a number; using {default}")
+        return default
+
+
+def load_contexts() -> int:
+    return _env_count("LOAD_CONTEXTS", 4)
+
+
+def load_requests() -> int:
+    """Timed journeys per class"""
+    return _env_count("LOAD_REQUESTS", 50)
+
+
+def setup(playwright: Playwright) -> FessContext:
+    context: FessContext = FessContext(playwright)
+    context.login()
+    return context
+
+
+def _click_and_load(page: Page, selector: str, what: str) -> None:
+    """Click selector and wait for the page it opens to fire load;
+    an HTTP error on that page fails the journey."""
+    with page.expect_navigation(wait_until="load") as navigation:
+        page.click(selector)
+    response = navigation.value
+    assert_true(response is None or response.status < 400,
+                f"{what} answered HTTP {response.status if response else '-'}")
+
+
+def _goto(page: Page, url: str) -> None:
+    response = page.goto(url, wait_until="load")
+    assert_true(response is None or response.status < 400,
+                f"{url} answered HTTP {response.status if response else '-'}")
+
+
+def submit_query(page: Page, url: Callable[[str], str], request: SearchRequest) -> None:
+    _goto(page, url("/"))
+    page.fill('input[name="q"]', request.q)
+    _click_and_load(page, 'button[name="search"]', "search form")
+    assert_true("/search/" in page.url,
+                f"the search form landed on {page.url}, not /search/")
+
+
+def paginate(page: Page, url: Callable[[str], str], request: SearchRequest) -> None:
+    _goto(page, url(f"/search/?q={quote(request.q)}&num={request.num}"))
+    assert_true(page.query_selector(NEXT_LINK) is not None,
+                f"no next-page link for q={request.q} num={request.num}")
+    _click_and_load(page, NEXT_LINK, "next page")
+
+
+def open_cache(page: Page, url: Callable[[str], str], request: SearchRequest) -> None:
+    _goto(page, url(f"/search/?q={quote(request.q)}"))
+    assert_true(page.query_selector(cache.CACHE_LINK) is not None,
+                f"no {cache.CACHE_LINK} for q={request.q}")
+    _click_and_load(page, cache.CACHE_LINK, "cache link")
+    assert_true(urlparse(page.url).path == "/cache/",
+                f"the cache link landed on {page.url}, not /cache/")
+
+
+class BrowserWorker:
+    """
+    An anonymous browser context on a thread of its own.
+
+    call() hands a journey to the worker's thread and blocks until it is
+    done, so the benchmark's worker threads can drive it without ever
+    touching Playwright themselves.
+    """
+
+    def __init__(self, base_url: str, locale: Optional[str] = None, name: str = "load"):
+        self._base_url = base_url
+        self._locale = locale
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._started: Future = Future()
+        self._thread = threading.Thread(target=self._serve, name=name, daemon=True)
+        self._thread.start()
+
+    def url(self, path: str) -> str:
+        return self._base_url + path
+
+    def _open(self):
+        """Start Playwright on this thread and warm a page; returns the page
+        and the function that closes everything again."""
+        playwright = sync_playwright().start()
+        try:
+            browser = launch_browser(playwright)
+            context = browser.new_context(locale=self._locale)
+            page = context.new_page()
+            _goto(page, self.url("/"))
+        except Exception:
+            playwright.stop()
+            raise
+
+        def close() -> None:
+            context.close()
+            browser.close()
+            playwright.stop()
+        return page, close
+
+    def _serve(self) -> None:
+        try:
+            page, close = self._open()
+        except Exception as e:
+            self._started.set_exception(e)
+            return
+        self._started.set_result(None)
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    return
+                journey, request, done = job
+                try:
+                    done.set_result(journey(page, self.url, request))
+                except Exception as e:
+                    done.set_exception(e)
+        finally:
+            try:
+                close()
+            except Exception as e:
+                logger.debug(f"[LOAD] closing {self._thread.name}: {e}")
+
+    def wait_started(self) -> None:
+        """Block until the browser is up; re-raises a launch failure."""
+        self._started.result()
+
+    def call(self, journey: Journey, request: SearchRequest) -> None:
+        done: Future = Future()
+        self._jobs.put((journey, request, done))
+        done.result()
+
+    def searcher(self, journey: Journey) -> benchmark.Searcher:
+        return lambda request: self.call(journey, request)
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._jobs.put(None)
+            self._thread.join()
+
+
+def build_journeys(total_docs: int) -> List[tuple]:
+    """(QueryClass, Journey) pairs, given the match-all hit count."""
+    queries = [form_submit.QUERY] + search_benchmark.SINGLE_TERMS + list(SAMPLE_QUERIES.values())
+    # As in pagination: a page size that leaves several pages to step through.
+    page_size = max(3, total_docs // 4)
+    return [
+        (QueryClass("ui_submit", [SearchRequest(q) for q in queries]), submit_query),
+        (QueryClass("ui_paginate", [SearchRequest(pagination.QUERY, num=page_size)]), paginate),
+        (QueryClass("ui_cache", [SearchRequest(cache.QUERY)]), open_cache),
+    ]
+
+
+def run(context: FessContext) -> None:
+    logger.info("Starting search/load")
+    total = context.api_search(pagination.QUERY)["record_count"]
+    assert_true(total >= pagination.MIN_HITS,
+                f"need >={pagination.MIN_HITS} hits to paginate, got {total}; "
+                f"run search_seed before search_load")
+
+    count = load_contexts()
+    requests = load_requests()
+    locale = browser_locale_for(context.browser_locale)
+    workers = [BrowserWorker(context.url(""), locale, name=f"load-{i}") for i in range(count)]
+    results = []
+    try:
+        for worker in workers:
+            worker.wait_started()
+        logger.info(f"Driving /search/ from {count} anonymous contexts: "
+                    f"{requests} journeys per class")
+        for query_class, journey in build_journeys(total):
+            result = benchmark.run_class(query_class,
+                                         [worker.searcher(journey) for worker in workers],
+                                         requests)
+            logger.info(f"{result.query_class}: p50={result.p50 * 1000:.0f}ms "
+                        f"p95={result.p95 * 1000:.0f}ms p99={result.p99 * 1000:.0f}ms "
+                        f"errors={result.errors}")
+            results.append(result)
+    finally:
+        for worker in workers:
+            worker.close()
+
+    benchmark.record(results)
+    failed = [r.query_class for r in results if r.requests == 0]
+    assert_true(not failed, f"every journey failed for classes: {failed}")
+    logger.info("search/load completed")
+
+
+def destroy(context: FessContext) -> None:
+    context.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    with sync_playwright() as playwright:
+        context: FessContext = setup(playwright)
+        try:
+            run(context)
+            benchmark.print_results(benchmark.end_module())
+        finally:
+            destroy(context)
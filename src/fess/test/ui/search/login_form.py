@@ -10,9 +10,12 @@ from playwright.sync_api import Playwright, sync_playwright
 
 from fess.test import assert_true
 from fess.test.ui import FessContext
+from fess.test.ui.search._locks import SEARCH_READS
 
 logger = logging.getLogger(__name__)
 
+READS = SEARCH_READS
+
 
 def setup(playwright: Playwright) -> FessContext:
     # Reuse the suite-wide login/teardown plumbing so tracing/screenshots work,
@@ -28,7 +31,6 @@ def run(context: FessContext) -> None:
     base_url = os.environ.get("FESS_URL", "http://localhost:8080")
     fresh_browser = context._playwright.chromium.launch(
         headless=os.environ.get("HEADLESS", "false").lower() == "true",
-        slow_mo=500,
     )
     try:
         fresh_ctx = fresh_browser.new_context(locale=context.browser_locale)
@@ -25,9 +25,12 @@ from fess.test import assert_equal, assert_startswith
 from fess.test.i18n import t
 from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.search._locks import SEARCH_READS
 
 logger = logging.getLogger(__name__)
 
+READS = SEARCH_READS
+
 ADMIN_PATH = "/admin/"
 LOGIN_PATH = "/login/"
 LOGOUT_PATH = "/logout/"
@@ -64,7 +67,6 @@ def run(context: FessContext) -> None:
     base_url = os.environ.get("FESS_URL", "http://localhost:8080")
     fresh_browser = context._playwright.chromium.launch(
         headless=os.environ.get("HEADLESS", "false").lower() == "true",
-        slow_mo=500,
     )
     try:
         fresh_ctx = fresh_browser.new_context(locale=context.browser_locale)
@@ -18,6 +18,8 @@ from fess.test.ui import FessContext
 
 logger = logging.getLogger(__name__)
 
+WRITES = ("labeltype",)
+
 
 # Fess locale -> sample multibyte name in the language's native script.
 # For locales without a non-Latin script, fall back to ASCII (suffix only).
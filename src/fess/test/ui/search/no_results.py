@@ -8,9 +8,12 @@ from fess.test import assert_contains
 from fess.test.i18n import t
 from fess.test.i18n.keys import Labels
 from fess.test.ui import FessContext
+from fess.test.ui.search._locks import SEARCH_READS
 
 logger = logging.getLogger(__name__)
 
+READS = SEARCH_READS
+
 IMPOSSIBLE_QUERY = "zzxxqq-nonexistent-xyz-9876543210"
 
 
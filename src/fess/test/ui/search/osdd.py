@@ -17,10 +17,15 @@ from playwright.sync_api import Playwright, sync_playwright
 from fess.test import assert_contains, assert_equal, assert_true
 from fess.test.i18n import t
 from fess.test.i18n.keys import Labels
-from fess.test.ui import FessContext
+from fess.test.ui import FessContext, static_check
+from fess.test.ui.search._locks import SEARCH_READS
 
 logger = logging.getLogger(__name__)
 
+READS = SEARCH_READS
+# Server-rendered markup only: checked without a browser under STATIC_CHECKS
+STATIC_PATHS = ("/",)
+
 OSDD_LINK = 'link[rel="search"][type="application/opensearchdescription+xml"]'
 OSDD_HREF = "/osdd"
 # /osdd 301s to /osdd/, so this is where the fetch actually lands.
@@ -35,10 +40,9 @@ def setup(playwright: Playwright) -> FessContext:
     return context
 
 
-def _assert_top_page_advertises_osdd(page, context: FessContext) -> str:
+def _assert_top_page_advertises_osdd(context: FessContext) -> str:
     """The search top page must carry the <link rel="search"> discovery tag."""
-    page.goto(context.url("/"))
-    page.wait_for_load_state("domcontentloaded")
+    page = static_check.open_page(context, "/")
 
     link = page.query_selector(OSDD_LINK)
     assert_true(link is not None,
@@ -54,32 +58,42 @@ def _assert_top_page_advertises_osdd(page, context: FessContext) -> str:
     return href
 
 
-def _assert_osdd_document_is_served(page, context: FessContext, href: str) -> None:
-    """Following the advertised href must yield the XML document itself.
+def _fetch(context: FessContext, href: str):
+    """(landing URL, headers, body) of a GET of href.
 
     Fetched rather than navigated to: OsddHelper.asStream() sends
     `Content-Disposition: attachment`, so page.goto() would start a download
-    instead of a navigation and raise. page.request reuses this browser
-    context's cookies, so the loginRequired gate is exercised as the UI sees
-    it. /osdd 301s to /osdd/; the request follows that redirect.
+    instead of a navigation and raise. page.request -- or, under
+    STATIC_CHECKS, the pooled session holding the same login cookies --
+    carries this browser context's session, so the loginRequired gate is
+    exercised as the UI sees it. /osdd 301s to /osdd/; both follow that
+    redirect.
     """
+    if static_check.static_checks_enabled():
+        response = context.api.fetch(href)
+        return response.url, response.headers, response.text
+    page = context.get_wrapped_page() or context.get_admin_page()
     response = page.request.get(context.url(href))
+    return response.url, response.headers, response.text()
+
+
+def _assert_osdd_document_is_served(context: FessContext, href: str) -> None:
+    """Following the advertised href must yield the XML document itself."""
+    url, headers, body = _fetch(context, href)
 
     # Deliberately not an HTTP status assertion. An /osdd that resolved to
     # nothing would redirect to /error/notfound/, which Fess answers with 200,
     # and page.request follows redirects -- so `status == 200` would still pass
     # with the endpoint gone. The landing URL is what tells the two apart.
-    assert_equal(urlparse(response.url).path, OSDD_SERVED_PATH,
-                 f"{href} did not serve the OSDD; landed on {response.url}")
+    assert_equal(urlparse(url).path, OSDD_SERVED_PATH,
+                 f"{href} did not serve the OSDD; landed on {url}")
 
-    headers = response.headers
     content_type = headers.get("content-type", "")
     assert_contains(content_type, "text/xml",
                     f"OSDD served as {content_type!r}, expected text/xml")
     assert_contains(headers.get("content-disposition", ""), "osdd.xml",
                     "OSDD is not offered under its osdd.xml filename")
 
-    body = response.text()
     assert_contains(body, OSDD_NAMESPACE,
                     "OSDD body is not an OpenSearch 1.1 description document")
     assert_contains(body, "<ShortName>",
@@ -88,10 +102,8 @@ def _assert_osdd_document_is_served(page, context: FessContext, href: str) -> No
 
 def run(context: FessContext) -> None:
     logger.info("Starting search/osdd")
-    page = context.get_wrapped_page() or context.get_admin_page()
-
-    href = _assert_top_page_advertises_osdd(page, context)
-    _assert_osdd_document_is_served(page, context, href)
+    href = _assert_top_page_advertises_osdd(context)
+    _assert_osdd_document_is_served(context, href)
 
     logger.info("search/osdd completed")
 
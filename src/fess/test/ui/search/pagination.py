@@ -11,9 +11,12 @@ from playwright.sync_api import Playwright, sync_playwright
 
 from fess.test import assert_true, assert_contains
 from fess.test.ui import FessContext
+from fess.test.ui.search._locks import SEARCH_READS
 
 logger = logging.getLogger(__name__)
 
+READS = SEARCH_READS
+
 QUERY = "*"
 MIN_HITS = 12
 
@@ -27,9 +27,12 @@ from fess.test import assert_equal, assert_true
 from fess.test.i18n import tm
 from fess.test.i18n.message_keys import Messages
 from fess.test.ui import FessContext
+from fess.test.ui.search._locks import SEARCH_READS
 
 logger = logging.getLogger(__name__)
 
+READS = SEARCH_READS
+
 ERROR_BOX = "div.alert.alert-warning"
 
 # query.max.search.result.offset (fess_config.properties:783). The guard is a
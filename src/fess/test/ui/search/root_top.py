@@ -9,9 +9,12 @@ from playwright.sync_api import Playwright, sync_playwright
 
 from fess.test import assert_true
 from fess.test.ui import FessContext
+from fess.test.ui.search._locks import SEARCH_READS
 
 logger = logging.getLogger(__name__)
 
+READS = SEARCH_READS
+
 
 # LastaFlute renders missing labels as "???labels.x???".
 _MISSING_KEY_PATTERN = re.compile(r'\?{2,}labels\.[A-Za-z0-9_.]+\?{2,}')
@@ -2,34 +2,106 @@
 Seed module for search UI tests.
 
 Registers a webconfig pointing at http://sampledata01/, attaches two
-labels, triggers the Default Crawler via the scheduler, and polls the
-search API (v2 /api/v2/search, falling back to v1 /api/v1/documents)
-until at least SEED_MIN_DOCS documents are indexed.
+labels, triggers the Default Crawler via the scheduler, and waits for it.
+The labels and the webconfig go through the admin REST API (see
+fess.test.ui.fixtures); no screen of theirs is under test here.
+
+SEED_MODE=bulk skips the crawl: the same pages are fetched straight from
+sampledata01 and loaded through the admin document API (see _bulk_seed),
+which takes seconds instead of minutes. The default SEED_MODE=crawl keeps
+the real crawl, whose joblog and crawling-info traces the sysinfo modules
+read.
+
+When the sampledata image was built with a generated corpus
+(CORPUS_PAGES, see sampledata/generate_corpus.py), its entry page is added
+to the start URLs, and once seeded every hit count in the corpus manifest
+is checked against the index.
+
+With SEED_REUSE=true, reruns against a live instance skip the whole step
+when nothing changed: seed fingerprints the sampledata pages, the labels and
+the webconfig settings, and records the fingerprint and the resulting doc
+count in the webconfig's description. When the next run computes the same
+fingerprint, the index still holds that many documents and (in crawl mode)
+the joblog still lists a Default Crawler run, run() returns at once. Off by
+default: a full run's sysinfo/deleteall empties the joblog it then needs.
+
+Readiness of a crawl comes from the crawler job itself, read off the joblog, together
+with the index doc count from the search API (v2 /api/v2/search, falling
+back to v1 /api/v1/documents): seed returns once the job has ended and the
+count has settled, and fails at once if the finished crawl indexed fewer
+than SEED_MIN_DOCS documents. SEED_READY=docs restores the old behaviour of
+returning as soon as SEED_MIN_DOCS are indexed, leaving the crawl running.
 
 Runs once per test run, before any search/* module.
 """
+import hashlib
+import json
 import logging
 import os
+import re
 import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
+import requests
 from playwright.sync_api import Playwright, sync_playwright
 
 from fess.test import assert_true
+from fess.test.eventually import eventually
 from fess.test.i18n import t
 from fess.test.i18n.keys import Labels
-from fess.test.ui import FessContext
+from fess.test.ui import FessContext, fixtures
+from fess.test.ui.search import _bulk_seed, _corpus
 
 logger = logging.getLogger(__name__)
 
 SAMPLEDATA_URL = os.environ.get("SAMPLEDATA_URL", "http://sampledata01/")
 SEED_MIN_DOCS = int(os.environ.get("SEED_MIN_DOCS", "20"))
-SEED_READY_TIMEOUT = int(os.environ.get("SEED_READY_TIMEOUT", "300"))
+SEED_READY_TIMEOUT = int(os.environ.get("SEED_READY_TIMEOUT", "600"))
+# "crawl" (default): ready when the crawl job has ended; "docs": ready at
+# SEED_MIN_DOCS with the crawl still running.
+SEED_READY = os.environ.get("SEED_READY", "crawl").strip().lower()
+# Longest interval between polls; polling backs off up to it.
 SEED_POLL_INTERVAL = int(os.environ.get("SEED_POLL_INTERVAL", "2"))
+# "crawl" (default): webconfig + Default Crawler; "bulk": admin document API.
+SEED_MODE = os.environ.get("SEED_MODE", "crawl").strip().lower()
+# Skip seeding when the instance already holds this exact seed.
+SEED_REUSE = os.environ.get("SEED_REUSE", "false").lower() == "true"
 
 WEBCONFIG_NAME = "sampledata-e2e"
 LABEL_A_NAME = "e2e-label-a"
 LABEL_B_NAME = "e2e-label-b"
 
+EXCLUDED_URLS = "(?i).*(css|js|jpeg|jpg|gif|png|bmp|wmv|xml|ico)"
+MAX_ACCESS_COUNT = 100
+WEBCONFIG_THREADS = 5
+WEBCONFIG_DESCRIPTION = "E2E sampledata (managed by search/seed)"
+# Suffix of the webconfig description recording what was seeded.
+_FINGERPRINT_PATTERN = re.compile(r"\[seed ([0-9a-f]{16}) docs=(\d+)\]")
+# Label name -> included paths. The stored label value is the name in
+# lower case with underscores (e2e_label_a), see _label_value().
+LABEL_PATHS = {
+    LABEL_A_NAME: "http://sampledata01/docs/labels/a/.*",
+    LABEL_B_NAME: "http://sampledata01/docs/labels/b/.*",
+}
+
+JOBLOG_URL = "/admin/joblog/"
+# A joblog list row; each links to its details page
+_JOBLOG_ROW_PATTERN = re.compile(
+    r'<tr[^>]*data-href="[^"]*/admin/joblog/details/[^"]*"[^>]*>(.*?)</tr>', re.DOTALL)
+CRAWLER_JOB_NAME = "Default Crawler"
+# How long after the start click a Running joblog row must have appeared
+# before readiness falls back to the doc threshold.
+CRAWLER_JOB_START_GRACE = 60
+
+# With SEED_READY=docs the crawl keeps running after run() returns (see
+# sysinfo/deleteall), hence "crawler" alongside "index". READS covers what a crawl applies while indexing.
+WRITES = ("index", "crawler", "labeltype", "webconfig", "scheduler") + fixtures.TOKEN_WRITES
+# Its labels and webconfig are what the search modules run against: with
+# CONFIG_SNAPSHOT on, the snapshot is retaken after it instead of restored.
+KEEPS_CONFIG = True
+READS = ("analyzer", "duplicatehost", "pathmap", "reqheader", "webauth")
+
 
 def setup(playwright: Playwright) -> FessContext:
     context: FessContext = FessContext(playwright)
@@ -37,73 +109,47 @@ def setup(playwright: Playwright) -> FessContext:
     return context
 
 
-def _create_label(page, context: FessContext, name: str, included_paths: str) -> None:
-    """Create a label with an included-URL pattern via the admin UI.
-    Idempotent: if a label with the same name already exists, navigates
-    to it and returns without error (the list-page assertion still holds)."""
-    logger.info(f"Creating label: {name}")
-    page.goto(context.url("/admin/labeltype/"))
-    page.wait_for_load_state("domcontentloaded")
+def _label_value(name: str) -> str:
+    return name.lower().replace("-", "_")
 
-    # If already present, skip creation (table absent when list is empty)
-    table_el = page.query_selector("table")
-    table_text = table_el.inner_text() if table_el else ""
-    if table_text.find(name) != -1:
-        logger.info(f"Label {name} already exists; skipping creation")
-        return
 
-    page.click(f"text={t(Labels.CRUD_LINK_CREATE)}")
-    page.wait_for_load_state("domcontentloaded")
-    page.fill("input[name=\"name\"]", name)
-    page.fill("input[name=\"value\"]", name.lower().replace("-", "_"))
-    page.fill("textarea[name=\"includedPaths\"]", included_paths)
-    page.fill("input[name=\"sortOrder\"]", "1")
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_CREATE)}")')
-    page.wait_for_load_state("domcontentloaded")
-    assert_true(page.url.endswith("/admin/labeltype/"),
-                f"after create, expected labeltype list URL, got {page.url}")
-    assert_true(page.inner_text("table").find(name) != -1,
-                f"label {name} not in list after create")
-
-
-def _create_webconfig(page, context: FessContext) -> None:
-    """Create the sampledata webconfig. Idempotent on name collision."""
+def _create_label(context: FessContext, name: str, included_paths: str) -> str:
+    """Create a label with an included-URL pattern through the admin API and
+    return its id. Idempotent: a label of the same name is reused."""
+    logger.info(f"Creating label: {name}")
+    return fixtures.ensure(context, "labeltype", {
+        "name": name,
+        "value": _label_value(name),
+        "includedPaths": included_paths,
+        "sortOrder": 1,
+    })
+
+
+def _crawl_settings(manifest: Optional[Dict]) -> Tuple[List[str], int]:
+    """Start URLs and access cap of the webconfig: the hand-written site,
+    plus the generated corpus's entry page when the image has one."""
+    if manifest is None:
+        return [SAMPLEDATA_URL], MAX_ACCESS_COUNT
+    return ([SAMPLEDATA_URL, f"{SAMPLEDATA_URL}{manifest['entry']}"],
+            MAX_ACCESS_COUNT + manifest["documents"])
+
+
+def _create_webconfig(context: FessContext, label_ids: List[str],
+                      manifest: Optional[Dict] = None) -> str:
+    """Create the sampledata webconfig with the labels attached, through the
+    admin API, and return its id. Idempotent on name collision."""
     logger.info(f"Creating webconfig: {WEBCONFIG_NAME}")
-    page.goto(context.url("/admin/webconfig/"))
-    page.wait_for_load_state("domcontentloaded")
-
-    table_el = page.query_selector("table")
-    table_text = table_el.inner_text() if table_el else ""
-    if table_text.find(WEBCONFIG_NAME) != -1:
-        logger.info(f"Webconfig {WEBCONFIG_NAME} already exists; skipping")
-        return
-
-    page.click(f"text={t(Labels.CRUD_LINK_CREATE)}")
-    page.wait_for_load_state("domcontentloaded")
-    page.fill("input[name=\"name\"]", WEBCONFIG_NAME)
-    page.fill("textarea[name=\"urls\"]", SAMPLEDATA_URL)
-    page.fill("textarea[name=\"includedUrls\"]", f"{SAMPLEDATA_URL}.*")
-    page.fill("textarea[name=\"excludedUrls\"]",
-              "(?i).*(css|js|jpeg|jpg|gif|png|bmp|wmv|xml|ico)")
-    page.fill("input[name=\"maxAccessCount\"]", "100")
-    page.fill("input[name=\"numOfThread\"]", "5")
-    page.fill("textarea[name=\"description\"]", "E2E sampledata (managed by search/seed)")
-
-    # Attach both labels. The labelTypeIds select is hidden by display:none in
-    # Fess 15 — make the parent div visible first, then select by display text.
-    page.evaluate(
-        "document.querySelector('select[name=\"labelTypeIds\"]')"
-        ".closest('.form-group').style.display = 'block'"
-    )
-    page.select_option("select[name=\"labelTypeIds\"]",
-                       label=[LABEL_A_NAME, LABEL_B_NAME])
-
-    page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_CREATE)}")')
-    page.wait_for_load_state("domcontentloaded")
-    assert_true(page.url.endswith("/admin/webconfig/"),
-                f"after create, expected webconfig list URL, got {page.url}")
-    assert_true(page.inner_text("table").find(WEBCONFIG_NAME) != -1,
-                f"webconfig {WEBCONFIG_NAME} not in list after create")
+    urls, max_access = _crawl_settings(manifest)
+    return fixtures.ensure(context, "webconfig", {
+        "name": WEBCONFIG_NAME,
+        "urls": "\n".join(urls),
+        "includedUrls": f"{SAMPLEDATA_URL}.*",
+        "excludedUrls": EXCLUDED_URLS,
+        "maxAccessCount": max_access,
+        "numOfThread": WEBCONFIG_THREADS,
+        "description": WEBCONFIG_DESCRIPTION,
+        "labelTypeIds": label_ids,
+    })
 
 
 def _start_default_crawler(page, context: FessContext) -> None:
@@ -113,7 +159,7 @@ def _start_default_crawler(page, context: FessContext) -> None:
     page.wait_for_load_state("domcontentloaded")
 
     # Open the Default Crawler details page by clicking its name in the table
-    page.click("text=Default Crawler")
+    page.click(f"text={CRAWLER_JOB_NAME}")
     page.wait_for_load_state("domcontentloaded")
     assert_true("/admin/scheduler/details/" in page.url,
                 f"expected scheduler details URL, got {page.url}")
@@ -130,88 +176,308 @@ def _start_default_crawler(page, context: FessContext) -> None:
     logger.info("Default Crawler start clicked")
 
 
-def _poll_until_indexed(context: FessContext) -> int:
-    """Poll the search API until at least SEED_MIN_DOCS are indexed.
-    Returns the final doc count. Raises AssertionError on timeout.
+def _crawler_jobs(html: str) -> List[bool]:
+    """Running state of each Default Crawler row on the joblog list page.
+
+    Each row links to its details page (data-href); the Running badge
+    (admin_joblog.jsp:88-90) is only rendered while jobStatus == RUNNING.
+    The job name is data, not a label, so it is the same in every UI
+    language.
+
+    Raises:
+        AssertionError: When the page has neither joblog rows nor the empty
+            list message -- it is not the joblog, and reading it as one
+            would mean "never seen running" for the whole crawl
+    """
+    rows = _JOBLOG_ROW_PATTERN.findall(html)
+    assert_true(rows or t(Labels.LIST_COULD_NOT_FIND_CRUD_TABLE) in html,
+                f"{JOBLOG_URL} did not answer with the joblog list: {html[:300]!r}")
+    running = t(Labels.JOBLOG_STATUS_RUNNING)
+    return [running in row for row in rows if CRAWLER_JOB_NAME in row]
+
+
+def _crawler_job_states(context: FessContext) -> List[bool]:
+    """_crawler_jobs() of the joblog, read over the pooled HTTP session: one
+    request, no browser render. Fails when the request did not land on the
+    joblog (a login bounce raises in the API client)."""
+    response = context.api.fetch(JOBLOG_URL)
+    landed = urlparse(response.url).path
+    assert_true(landed == JOBLOG_URL,
+                f"{JOBLOG_URL} was redirected to {response.url}")
+    return _crawler_jobs(response.text)
+
+
+def _crawler_job_running(context: FessContext) -> bool:
+    """Whether the joblog lists a Default Crawler run with the Running badge."""
+    return any(_crawler_job_states(context))
+
+
+class _CrawlWatch:
+    """Tracks the Default Crawler job and the index doc count between polls.
+
+    The job is "ended" once it has been seen running and no longer is. The
+    index has caught up once two doc counts taken after the end agree (the
+    crawler's last commit becomes visible with the next index refresh).
+    """
+
+    def __init__(self, context: FessContext, started: float):
+        self._context = context
+        self.started = started
+        self.seen_running = False
+        self.ended_at: Optional[float] = None
+        self._counts_after_end: List[int] = []
+
+    def probe(self) -> int:
+        running = _crawler_job_running(self._context)
+        if running:
+            self.seen_running = True
+        elif self.seen_running and self.ended_at is None:
+            self.ended_at = time.time()
+            logger.info(f"{CRAWLER_JOB_NAME} job finished after "
+                        f"{self.ended_at - self.started:.0f}s")
+        docs = self._context.api_search("*")["record_count"]
+        if self.ended_at is not None:
+            self._counts_after_end.append(docs)
+        return docs
+
+    def ready(self, docs: int) -> bool:
+        if self.ended_at is not None:
+            return (len(self._counts_after_end) >= 2
+                    and self._counts_after_end[-1] == self._counts_after_end[-2])
+        if SEED_READY == "docs":
+            return docs >= SEED_MIN_DOCS
+        if not self.seen_running and time.time() - self.started > CRAWLER_JOB_START_GRACE:
+            # No Running row ever appeared (job logging off, or a joblog
+            # layout this parser does not know): fall back to the threshold.
+            return docs >= SEED_MIN_DOCS
+        return False
+
+
+def _wait_until_crawled(context: FessContext, started: float) -> int:
+    """Wait for the seed crawl to finish and its documents to be searchable.
+    Returns the final doc count. Raises AssertionError when the crawl does
+    not finish in SEED_READY_TIMEOUT, or finishes with too few documents.
 
     Uses context.api_search(), which prefers the v2 endpoint
-    (/api/v2/search) and falls back to v1 (/api/v1/documents)."""
-    deadline = time.time() + SEED_READY_TIMEOUT
-    last_total = -1
-    while time.time() < deadline:
-        try:
-            total = context.api_search("*")["record_count"]
-        except Exception as e:
-            logger.debug(f"api_search failed during poll: {e}")
-            time.sleep(SEED_POLL_INTERVAL)
-            continue
-
-        if total != last_total:
-            logger.info(f"Indexed doc count: {total}")
-            last_total = total
-        if total >= SEED_MIN_DOCS:
-            return total
-        time.sleep(SEED_POLL_INTERVAL)
-
-    raise AssertionError(
-        f"Seed readiness timeout: only {last_total} docs after "
-        f"{SEED_READY_TIMEOUT}s (wanted >= {SEED_MIN_DOCS})")
+    (/api/v2/search) and falls back to v1 (/api/v1/documents). HTTP errors
+    while Fess is busy count as "not yet"; a joblog that cannot be read as
+    one fails at once, before the first poll, rather than leaving the wait
+    to the doc-count fallback."""
+    _crawler_job_states(context)
+    watch = _CrawlWatch(context, started)
+    result = eventually(watch.probe, watch.ready,
+                        name="search_seed.crawled", timeout=SEED_READY_TIMEOUT,
+                        max_interval=SEED_POLL_INTERVAL,
+                        progress=lambda total: total, target=SEED_MIN_DOCS,
+                        unit="docs", ignore=(requests.RequestException, ValueError))
+    total = result.value if result.value is not None else -1
+    if not result.converged:
+        state = "still running" if watch.seen_running else "never seen running"
+        raise AssertionError(
+            f"Seed readiness timeout: {CRAWLER_JOB_NAME} {state}, only {total} "
+            f"docs after {result.elapsed:.0f}s (wanted >= {SEED_MIN_DOCS})")
+    # A crawl that finished short will not get any better: say so now
+    # instead of after the full timeout.
+    assert_true(total >= SEED_MIN_DOCS,
+                f"{CRAWLER_JOB_NAME} finished with only {total} docs indexed "
+                f"(wanted >= {SEED_MIN_DOCS})")
+
+    crawl_seconds = (watch.ended_at or time.time()) - started
+    if crawl_seconds > 0:
+        logger.info(f"Crawl throughput: {total} docs in {crawl_seconds:.0f}s "
+                    f"({total / crawl_seconds:.1f} docs/s)")
+    return total
+
+
+def _load_documents(context: FessContext, pages: List[Tuple[str, str, str]],
+                    manifest: Optional[Dict] = None) -> int:
+    """Load the sampledata pages -- and the generated corpus, streamed from
+    sampledata in batches -- through the admin document API and wait until
+    they are searchable. Returns the final doc count."""
+    assert_true(len(pages) >= SEED_MIN_DOCS,
+                f"only {len(pages)} pages reachable from {SAMPLEDATA_URL} "
+                f"(wanted >= {SEED_MIN_DOCS})")
+    token = fixtures.token(context)
+    started = time.time()
+    since = _bulk_seed.timestamp()
+    label_paths = {_label_value(name): pattern for name, pattern in LABEL_PATHS.items()}
+    loaded = _bulk_seed.bulk_load(context.api, token,
+                                  _bulk_seed.collect_documents(pages, label_paths))
+    if manifest is not None:
+        corpus = _bulk_seed.iter_pages([f"{SAMPLEDATA_URL}{manifest['entry']}"],
+                                       f"{SAMPLEDATA_URL}.*", EXCLUDED_URLS,
+                                       max_access=manifest["documents"])
+        loaded += _bulk_seed.bulk_load(context.api, token,
+                                       _bulk_seed.collect_documents(corpus, label_paths))
+    logger.info(f"Bulk-loaded {loaded} documents in {time.time() - started:.1f}s")
+
+    # The load is visible with the next index refresh (about a second).
+    # Count only the documents it wrote: docs already in the index would
+    # satisfy a total count early, and a reload replaces rather than adds.
+    loaded_query = _bulk_seed.loaded_since(since)
+    result = eventually(lambda: context.api_search(loaded_query)["record_count"],
+                        lambda count: count >= loaded,
+                        name="search_seed.bulk_loaded", timeout=SEED_READY_TIMEOUT,
+                        max_interval=SEED_POLL_INTERVAL, progress=lambda count: count,
+                        target=loaded, unit="docs", ignore=(Exception,))
+    count = result.value if result.value is not None else -1
+    assert_true(result.converged,
+                f"only {count} of {loaded} bulk-loaded docs searchable "
+                f"after {result.elapsed:.0f}s")
+    return context.api_search("*")["record_count"]
+
+
+def _assert_corpus_hits(context: FessContext, manifest: Dict) -> None:
+    """Every hit count the corpus manifest pins down holds in the index."""
+    mismatches = []
+    for q, ex_q, hits in _corpus.expected_hits(manifest):
+        found = context.api_search(q, ex_q=ex_q)["record_count"]
+        if found != hits:
+            mismatches.append(f"q={q} ex_q={ex_q}: {found} hits, manifest says {hits}")
+    assert_true(not mismatches,
+                "seeded corpus does not match its manifest: " + "; ".join(mismatches))
+
+
+def seed_fingerprint(pages: List[Tuple[str, str, str]],
+                     manifest: Optional[Dict] = None) -> str:
+    """Fingerprint of what a seed would put in the index: the sampledata
+    pages reachable from SAMPLEDATA_URL (URL, type and content), the
+    generated corpus (by its manifest digest), the labels, the webconfig
+    settings and the seed mode."""
+    urls, max_access = _crawl_settings(manifest)
+    settings = {
+        "mode": SEED_MODE,
+        "urls": urls,
+        "included": f"{SAMPLEDATA_URL}.*",
+        "excluded": EXCLUDED_URLS,
+        "max_access": max_access,
+        "threads": WEBCONFIG_THREADS,
+        "labels": {name: [_label_value(name), pattern]
+                   for name, pattern in LABEL_PATHS.items()},
+        "corpus": manifest["digest"] if manifest else None,
+    }
+    digest = hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8"))
+    for url, mimetype, body in sorted(pages):
+        digest.update(f"\n{url}\t{mimetype}\t".encode("utf-8"))
+        digest.update(hashlib.sha256(body.encode("utf-8")).digest())
+    return digest.hexdigest()[:16]
+
+
+def _stored_fingerprint(context: FessContext) -> Optional[Tuple[str, int]]:
+    """(fingerprint, doc count) recorded by the last seed of this instance,
+    read from the webconfig's description through the admin API; None when
+    there is no webconfig or it carries no record."""
+    webconfig = fixtures.find(context, "webconfig", name=WEBCONFIG_NAME)
+    if webconfig is None:
+        return None
+    match = _FINGERPRINT_PATTERN.search(webconfig.get("description") or "")
+    return (match.group(1), int(match.group(2))) if match else None
+
+
+def _record_fingerprint(context: FessContext, webconfig_id: str, fingerprint: str,
+                        total: int) -> None:
+    """Write the fingerprint and doc count into the webconfig description."""
+    logger.info(f"Recording seed fingerprint {fingerprint} ({total} docs)")
+    fixtures.update(context, "webconfig", webconfig_id, {
+        "description": f"{WEBCONFIG_DESCRIPTION} [seed {fingerprint} docs={total}]",
+    })
+
+
+def _seed_is_current(context: FessContext, fingerprint: str) -> bool:
+    """Whether the instance already holds the seed with this fingerprint."""
+    stored = _stored_fingerprint(context)
+    if stored is None:
+        return False
+    stored_fingerprint, stored_docs = stored
+    if stored_fingerprint != fingerprint:
+        logger.info(f"Seed fingerprint changed ({stored_fingerprint} -> {fingerprint})")
+        return False
+    docs = context.api_search("*")["record_count"]
+    if docs != stored_docs:
+        logger.info(f"Seed fingerprint matches but the index holds {docs} docs, "
+                    f"not {stored_docs}")
+        return False
+    if SEED_MODE == "crawl" and not _crawler_job_states(context):
+        # The sysinfo modules (deleteall above all) need the crawl's joblog
+        # and crawling-info rows, which an earlier run may have deleted.
+        logger.info(f"Seed fingerprint matches but the joblog has no "
+                    f"{CRAWLER_JOB_NAME} row")
+        return False
+    return True
+
+
+def _sampledata_pages(manifest: Optional[Dict]) -> Tuple[Optional[List[Tuple[str, str, str]]],
+                                                          Optional[str]]:
+    """(pages, fingerprint) of the sampledata, fetched by the runner itself.
+
+    Only bulk mode (which loads the pages) and SEED_REUSE (which compares
+    the fingerprint) need them; a crawl is Fess's fetch, so a crawl-mode
+    seed gets (None, None) without a request and, when the runner cannot
+    reach sampledata (a host-side or split-network run), seeds without a
+    fingerprint."""
+    if SEED_MODE != "bulk" and not SEED_REUSE:
+        return None, None
+    try:
+        pages = _bulk_seed.fetch_pages(SAMPLEDATA_URL, f"{SAMPLEDATA_URL}.*",
+                                       EXCLUDED_URLS, max_access=MAX_ACCESS_COUNT)
+    except requests.RequestException as e:
+        if SEED_MODE == "bulk":
+            raise
+        logger.warning(f"{SAMPLEDATA_URL} is not reachable from the test runner "
+                       f"({type(e).__name__}); seeding without a fingerprint: {e}")
+        return None, None
+    return pages, seed_fingerprint(pages, manifest)
 
 
 def run(context: FessContext) -> None:
-    logger.info("Starting search/seed")
-    page = context.get_admin_page()
-
-    _create_label(page, context, LABEL_A_NAME,
-                  "http://sampledata01/docs/labels/a/.*")
-    _create_label(page, context, LABEL_B_NAME,
-                  "http://sampledata01/docs/labels/b/.*")
-    _create_webconfig(page, context)
-    _start_default_crawler(page, context)
+    logger.info(f"Starting search/seed (mode: {SEED_MODE})")
+    manifest = _corpus.load_manifest(SAMPLEDATA_URL)
+    pages, fingerprint = _sampledata_pages(manifest)
+    if fingerprint is not None and _seed_is_current(context, fingerprint):
+        logger.info(f"search/seed skipped: instance already seeded ({fingerprint})")
+        return
 
-    total = _poll_until_indexed(context)
+    if fixtures.find(context, "webconfig", name=WEBCONFIG_NAME) is not None:
+        # Left by an earlier seed with other settings (or none recorded):
+        # recreate the webconfig and labels so they match this one.
+        _delete_webconfig(context)
+        for name in LABEL_PATHS:
+            _delete_label(context, name)
+
+    label_ids = [_create_label(context, name, included_paths)
+                 for name, included_paths in LABEL_PATHS.items()]
+    webconfig_id = _create_webconfig(context, label_ids, manifest)
+    if SEED_MODE == "bulk":
+        total = _load_documents(context, pages, manifest)
+    else:
+        started = time.time()
+        _start_default_crawler(context.get_admin_page(), context)
+        total = _wait_until_crawled(context, started)
+    # With SEED_READY=docs the crawl is still running: counts are partial.
+    if manifest is not None and (SEED_MODE == "bulk" or SEED_READY == "crawl"):
+        _assert_corpus_hits(context, manifest)
+    if fingerprint is not None:
+        _record_fingerprint(context, webconfig_id, fingerprint, total)
     logger.info(f"search/seed completed: {total} docs indexed")
 
 
-def _delete_webconfig(page, context: FessContext) -> None:
+def _delete_webconfig(context: FessContext) -> None:
     """Delete the sampledata webconfig if it exists. Swallows errors so that
     one cleanup failure doesn't block subsequent cleanups."""
     logger.info(f"Deleting webconfig: {WEBCONFIG_NAME}")
     try:
-        page.goto(context.url("/admin/webconfig/"))
-        page.wait_for_load_state("domcontentloaded")
-        table_el = page.query_selector("table")
-        table_text = table_el.inner_text() if table_el else ""
-        if table_text.find(WEBCONFIG_NAME) == -1:
+        if not fixtures.remove(context, "webconfig", name=WEBCONFIG_NAME):
             logger.info(f"Webconfig {WEBCONFIG_NAME} not present; skipping delete")
-            return
-        page.click(f"text={WEBCONFIG_NAME}")
-        page.wait_for_load_state("domcontentloaded")
-        page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_DELETE)}")')
-        page.click('div.modal-footer button[name="delete"]')
-        page.wait_for_load_state("domcontentloaded")
-        logger.info(f"Webconfig {WEBCONFIG_NAME} deleted")
     except Exception as e:
         logger.warning(f"webconfig delete failed (continuing): {e}")
 
 
-def _delete_label(page, context: FessContext, name: str) -> None:
+def _delete_label(context: FessContext, name: str) -> None:
     """Delete a label if it exists. Swallows errors."""
     logger.info(f"Deleting label: {name}")
     try:
-        page.goto(context.url("/admin/labeltype/"))
-        page.wait_for_load_state("domcontentloaded")
-        table_el = page.query_selector("table")
-        table_text = table_el.inner_text() if table_el else ""
-        if table_text.find(name) == -1:
+        if not fixtures.remove(context, "labeltype", name=name):
             logger.info(f"Label {name} not present; skipping delete")
-            return
-        page.click(f"text={name}")
-        page.wait_for_load_state("domcontentloaded")
-        page.click(f'button:has-text("{t(Labels.CRUD_BUTTON_DELETE)}")')
-        page.click('div.modal-footer button[name="delete"]')
-        page.wait_for_load_state("domcontentloaded")
-        logger.info(f"Label {name} deleted")
     except Exception as e:
         logger.warning(f"label {name} delete failed (continuing): {e}")
 
@@ -219,13 +485,9 @@ def _delete_label(page, context: FessContext, name: str) -> None:
 def destroy(context: FessContext) -> None:
     logger.info("search/seed: cleanup starting")
     try:
-        # Prefer the wrapped page the login() flow established
-        page = context.get_wrapped_page() or context.get_admin_page()
-        _delete_webconfig(page, context)
-        _delete_label(page, context, LABEL_A_NAME)
-        _delete_label(page, context, LABEL_B_NAME)
-    except Exception as e:
-        logger.warning(f"destroy preamble failed: {e}")
+        _delete_webconfig(context)
+        _delete_label(context, LABEL_A_NAME)
+        _delete_label(context, LABEL_B_NAME)
     finally:
         context.close()
 
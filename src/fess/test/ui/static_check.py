@@ -0,0 +1,249 @@
+"""
+Browserless checks of server-rendered pages.
+
+The sysinfo pages, /help/, the OSDD link on the top page and the error views
+are asserted on nothing a script renders: the page came back, it carries a
+label, a table or form is there, the request landed where it should. Each
+still cost a Chromium navigation -- parse, style, layout, scripts -- for
+markup the JSP had finished before the first byte left Fess.
+
+A module whose checks read only the markup declares it:
+
+    STATIC_PATHS = (PAGE_URL,)      # paths it opens; server-rendered markup only
+
+and opens its pages through open_page(). With STATIC_CHECKS=true, open_page()
+GETs the page over the context's pooled, logged-in HTTP session
+(FessApiClient.fetch) and parses it with html.parser into a StaticPage, which
+answers the part of Playwright's Page those checks use: url,
+inner_text("body"), query_selector() (tag, .class, [attr] and [attr="value"]
+selectors, comma alternatives), wait_for_load_state() as a no-op. Otherwise
+open_page() navigates the browser page, as before.
+
+prefetch() fetches a batch of declared paths concurrently
+(STATIC_CHECK_WORKERS threads, each with a fork of the session) right before
+the checks that read them, so the sysinfo package waits for one round of
+requests instead of nine navigations. A prefetched page is handed out once;
+one that failed to fetch is fetched again by open_page(), so the failure is
+reported by the module that opens it.
+
+What a StaticPage cannot see is the point of the declaration: text hidden by
+CSS still counts as present, and nothing a script adds or removes exists.
+A check that depends on either must not declare STATIC_PATHS. A fetch that
+lands on /login/ -- a stale session snapshot -- fails rather than passing
+as a rendered page.
+"""
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from fess.test import assert_true
+
+logger = logging.getLogger(__name__)
+
+# Elements whose content is not page text
+_NOT_TEXT = {"script", "style", "template", "noscript"}
+
+_SIMPLE_SELECTOR = re.compile(r'^([a-zA-Z][\w-]*)?((?:\.[\w-]+|\[[\w-]+(?:="[^"]*")?\])*)$')
+_PART = re.compile(r'\.([\w-]+)|\[([\w-]+)(?:="([^"]*)")?\]')
+
+# A prefetched page older than this is fetched again: it was left by checks
+# that never ran (their module failed first).
+PREFETCH_TTL = 60.0
+
+# Full URL -> (monotonic fetch time, page prefetched for it), not yet opened
+_prefetched: Dict[str, Tuple[float, "StaticPage"]] = {}
+_prefetched_lock = threading.Lock()
+
+
+def static_checks_enabled() -> bool:
+    """Whether declared pages are checked over HTTP (STATIC_CHECKS, default false)."""
+    return os.environ.get("STATIC_CHECKS", "false").lower() == "true"
+
+
+def static_check_workers() -> int:
+    """Concurrent fetches in prefetch() (STATIC_CHECK_WORKERS, default 8)"""
+    raw = os.environ.get("STATIC_CHECK_WORKERS", "").strip()
+    if not raw:
+        return 8
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.error(f"STATIC_CHECK_WORKERS={raw!r} is not a number; using 8")
+        return 8
+
+
+class StaticElement:
+    """An element's tag and attributes"""
+
+    def __init__(self, tag: str, attrs: Dict[str, str]):
+        self.tag = tag
+        self.attrs = attrs
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self.attrs.get(name)
+
+    def matches(self, tag: Optional[str], parts: List[Tuple[str, str, Optional[str]]]) -> bool:
+        if tag is not None and tag.lower() != self.tag:
+            return False
+        for css_class, attr, value in parts:
+            if css_class and css_class not in self.attrs.get("class", "").split():
+                return False
+            if attr and (attr not in self.attrs
+                         or (value is not None and self.attrs[attr] != value)):
+                return False
+        return True
+
+
+class _Parser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.elements: List[StaticElement] = []
+        self.text: List[str] = []
+        self.body_text: List[str] = []
+        self._skipping = 0
+        self._in_body = False
+
+    def handle_starttag(self, tag, attrs):
+        self.elements.append(StaticElement(tag, {k: v or "" for k, v in attrs}))
+        if tag == "body":
+            self._in_body = True
+        elif tag in _NOT_TEXT:
+            self._skipping += 1
+
+    def handle_endtag(self, tag):
+        if tag in _NOT_TEXT and self._skipping:
+            self._skipping -= 1
+
+    def handle_data(self, data):
+        if not self._skipping:
+            (self.body_text if self._in_body else self.text).append(data)
+
+
+def _parse_selector(selector: str) -> List[Tuple[Optional[str], list]]:
+    """Comma alternatives of tag/.class/[attr]/[attr="value"] selectors.
+
+    Raises:
+        ValueError: For anything else, so a check never passes because a
+            selector was not understood
+    """
+    alternatives = []
+    for simple in selector.split(","):
+        match = _SIMPLE_SELECTOR.match(simple.strip())
+        if match is None or not simple.strip():
+            raise ValueError(f"selector not supported on a static page: {selector!r}")
+        alternatives.append((match.group(1), _PART.findall(match.group(2))))
+    return alternatives
+
+
+class StaticPage:
+    """A fetched page, answering what Page does for markup-only checks"""
+
+    def __init__(self, url: str, html: str):
+        self.url = url
+        parser = _Parser()
+        parser.feed(html)
+        parser.close()
+        self._elements = parser.elements
+        # A fragment with no <body> is all body
+        text = parser.body_text if parser._in_body else parser.text
+        self._text = re.sub(r"[ \t\r\f\v]+", " ", "".join(text)).strip()
+
+    def wait_for_load_state(self, state: str = "load") -> None:
+        pass
+
+    def inner_text(self, selector: str = "body") -> str:
+        if selector != "body":
+            raise ValueError(f"inner_text({selector!r}) not supported on a static page")
+        return self._text
+
+    def query_selector_all(self, selector: str) -> List[StaticElement]:
+        alternatives = _parse_selector(selector)
+        return [element for element in self._elements
+                if any(element.matches(tag, parts) for tag, parts in alternatives)]
+
+    def query_selector(self, selector: str) -> Optional[StaticElement]:
+        found = self.query_selector_all(selector)
+        return found[0] if found else None
+
+
+def _static_page(path: str, response) -> StaticPage:
+    landed = urlparse(response.url).path
+    assert_true(landed.startswith("/login") == path.startswith("/login"),
+                f"{path} was fetched as a logged-out visitor (landed on {response.url})")
+    return StaticPage(response.url, response.text)
+
+
+def prefetch(context, paths: Iterable[str]) -> None:
+    """Fetch the declared paths concurrently, for open_page() to hand out.
+    Does nothing unless STATIC_CHECKS is on."""
+    paths = list(dict.fromkeys(paths))
+    if not static_checks_enabled() or not paths:
+        return
+    workers = min(static_check_workers(), len(paths))
+    # Forked on this thread: Playwright's cookie source belongs to it.
+    clients: "queue.Queue" = queue.Queue()
+    for _ in range(workers):
+        clients.put(context.api.fork())
+
+    def fetch(path: str) -> Tuple[str, Optional[StaticPage]]:
+        client = clients.get()
+        try:
+            return path, _static_page(path, client.fetch(path))
+        except Exception as e:
+            logger.debug(f"[STATIC] prefetch of {path} failed; left to open_page(): {e}")
+            return path, None
+        finally:
+            clients.put(client)
+
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fetched = list(pool.map(fetch, paths))
+    finally:
+        while not clients.empty():
+            clients.get().close()
+    now = time.monotonic()
+    with _prefetched_lock:
+        for path, page in fetched:
+            if page is not None:
+                _prefetched[context.url(path)] = (now, page)
+    logger.info(f"[STATIC] Fetched {len(fetched)} pages in "
+                f"{(time.perf_counter() - started) * 1000:.0f}ms ({workers} at a time)")
+
+
+def prefetch_modules(context, modules: Iterable) -> None:
+    """prefetch() every path the modules declare in STATIC_PATHS."""
+    prefetch(context, [path for module in modules
+                       for path in getattr(module, "STATIC_PATHS", ())])
+
+
+def open_page(context, path: str, page=None):
+    """
+    The page at `path`, ready to be checked.
+
+    Args:
+        context: FessContext
+        path: Path to open; one the module declared in STATIC_PATHS
+        page: Browser page to navigate when STATIC_CHECKS is off (defaults
+            to the context's current page)
+
+    Returns:
+        A StaticPage when STATIC_CHECKS is on, else the navigated page
+    """
+    if static_checks_enabled():
+        with _prefetched_lock:
+            fetched_at, fetched = _prefetched.pop(context.url(path), (0.0, None))
+        if fetched is not None and time.monotonic() - fetched_at < PREFETCH_TTL:
+            return fetched
+        return _static_page(path, context.api.fetch(path))
+    page = page or context.get_wrapped_page() or context.get_admin_page()
+    page.goto(context.url(path))
+    page.wait_for_load_state("domcontentloaded")
+    return page
@@ -0,0 +1,149 @@
+"""
+Source watching and module reloading for watch mode (main.py --watch).
+
+Iterating on one module used to mean `python -m fess.test.ui.admin.label.add`
+again and again, each time launching a browser, logging in and navigating
+from scratch. Watch mode keeps one logged-in FessContext open instead and
+re-runs the selected modules whenever a file under src/fess/test/ui changes.
+
+Watching is mtime polling (no extra dependency): snapshot() the tree, and
+changed() lists the .py files added or modified since. A changed file is
+reloaded with importlib.reload together with every loaded test module that
+imports it, directly or through other modules, dependencies first -- so an
+edit to a helper such as search/_corpus.py reaches the leaves that use it,
+and a composer's package picks up its reloaded leaves. The dependencies are
+read off the live modules: a module depends on every module it holds a
+reference to, or holds a function or class from.
+
+The harness itself (context, api, pacing, browser_server, config_snapshot)
+is not reloaded: the open FessContext was built from it, so a change there
+needs a restart.
+"""
+
+import importlib
+import logging
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+PACKAGE = "fess.test.ui"
+ROOT = Path(__file__).resolve().parent / "ui"
+
+# Modules the open FessContext is built from: reloading them would leave
+# the running context on the old classes.
+HARNESS = {
+    "fess.test.ui",
+    "fess.test.ui.context",
+    "fess.test.ui.api",
+    "fess.test.ui.pacing",
+    "fess.test.ui.browser_server",
+    "fess.test.ui.config_snapshot",
+}
+
+
+def watch_interval() -> float:
+    """Seconds between scans of the watched tree"""
+    return max(0.1, float(os.environ.get("WATCH_INTERVAL", "0.5")))
+
+
+def snapshot(root: Path) -> Dict[Path, float]:
+    """Modification time of every .py file under root"""
+    return {path: path.stat().st_mtime for path in root.rglob("*.py")}
+
+
+def changed(before: Dict[Path, float], after: Dict[Path, float]) -> List[Path]:
+    """Files added or modified between two snapshots"""
+    return sorted(path for path, mtime in after.items() if before.get(path) != mtime)
+
+
+def module_name(path: Path, root: Path, package: str = PACKAGE) -> str:
+    """Dotted name of a file under the watched package root"""
+    parts = list(path.relative_to(root).with_suffix("").parts)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join([package] + parts)
+
+
+def _in_package(name: str, package: str) -> bool:
+    return name == package or name.startswith(package + ".")
+
+
+def _references(module: ModuleType, package: str) -> Set[str]:
+    """Modules of `package` that `module` holds a reference to"""
+    found = set()
+    for value in vars(module).values():
+        name = value.__name__ if isinstance(value, ModuleType) else getattr(value, "__module__", None)
+        if isinstance(name, str) and _in_package(name, package) and name != module.__name__:
+            found.add(name)
+    return found
+
+
+def dependents(names: Set[str], modules: Optional[Dict[str, ModuleType]] = None,
+               package: str = PACKAGE) -> List[str]:
+    """
+    The loaded modules to reload when `names` changed, dependencies first.
+
+    Args:
+        names: Changed modules (dotted names)
+        modules: Module table to read (default sys.modules)
+        package: Only modules under this package are considered
+
+    Returns:
+        The changed modules and every module that depends on them, ordered
+        so that each comes after the modules it depends on
+    """
+    modules = dict(sys.modules if modules is None else modules)
+    graph = {name: _references(module, package) for name, module in modules.items()
+             if module is not None and _in_package(name, package) and name not in HARNESS}
+
+    affected = {name for name in names if name in graph}
+    grew = True
+    while grew:
+        grew = False
+        for name, deps in graph.items():
+            if name not in affected and deps & affected:
+                affected.add(name)
+                grew = True
+
+    ordered: List[str] = []
+
+    def visit(name: str, path: Set[str]) -> None:
+        if name in ordered or name in path:
+            return
+        for dep in sorted(graph[name] & affected):
+            visit(dep, path | {name})
+        ordered.append(name)
+
+    for name in sorted(affected):
+        visit(name, set())
+    return ordered
+
+
+def reload_changed(paths: List[Path], root: Path, package: str = PACKAGE) -> List[str]:
+    """
+    Reload the modules behind the changed files and their dependents.
+
+    Returns:
+        Names of the modules reloaded; empty when nothing loaded changed or
+        the harness did (see HARNESS), or a reload failed
+    """
+    names = {module_name(path, root, package) for path in paths}
+    harness = sorted(names & HARNESS)
+    if harness:
+        logger.warning(f"[WATCH] {', '.join(harness)} changed; restart watch mode to pick it up")
+        return []
+
+    order = [name for name in dependents(names, package=package) if name not in HARNESS]
+    for name in order:
+        try:
+            importlib.reload(sys.modules[name])
+        except Exception as e:
+            logger.error(f"[WATCH] Reloading {name} failed: {type(e).__name__}: {e}")
+            return []
+    if order:
+        logger.info(f"[WATCH] Reloaded {', '.join(order)}")
+    return order
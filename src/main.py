@@ -1,112 +1,31 @@
+import argparse
+import importlib
 import logging
+import multiprocessing
 import os
+import queue
 import sys
+import threading
 import time
 from datetime import datetime
-from typing import List, Any
+from typing import List, Any, Optional, Tuple
+
+# Startup is measured from here: the imports below, then module selection.
+_STARTED = time.perf_counter()
 
 from playwright.sync_api import sync_playwright
 
-from fess.test.ui import FessContext
+from fess.test.ui import FessContext, fixtures
+from fess.test.ui.config_snapshot import ConfigSnapshot, snapshot_mode
+from fess.test.ui.context import session_reuse_enabled
 from fess.test.result import ResultCollector, TestResult
-from fess.test import i18n as i18n_mod
+from fess.test import benchmark, eventually, i18n as i18n_mod, registry, watch
 from fess.test.metrics import MetricsCollector
+from fess.test.network import NetworkCollector
+from fess.test.page_timing import PageTimingCollector
+from fess.test.schedule import (ModuleScheduler, build_predecessors, locks_of,
+                                plan_shards, print_plan_accuracy)
 from fess.test.logging_config import setup_logging
-from fess.test.ui.admin import (accesstoken,
-                                badword,
-                                boostdoc,
-                                dataconfig,
-                                duplicatehost,
-                                elevateword,
-                                fileauth,
-                                general,
-                                keymatch,
-                                label,
-                                pathmap,
-                                relatedcontent,
-                                relatedquery,
-                                reqheader,
-                                scheduler,
-                                sysinfo,
-                                user,
-                                group,
-                                role,
-                                virtualhost,
-                                webauth,
-                                webconfig,
-                                wizard,
-                                fileconfig)
-
-from fess.test.ui.admin.dict import (kuromoji,
-                                     protwords,
-                                     mapping,
-                                     stemmeroverride,
-                                     stopwords,
-                                     synonym)
-
-from fess.test.ui.search import (
-    advance as search_advance,
-    cache as search_cache,
-    error_pages as search_error_pages,
-    facet as search_facet,
-    form_submit as search_form_submit,
-    go_click as search_go_click,
-    help as search_help,
-    login_form as search_login_form,
-    logout as search_logout,
-    no_results as search_no_results,
-    osdd as search_osdd,
-    query_errors as search_query_errors,
-    pagination as search_pagination,
-    profile_form as search_profile_form,
-    query as search_query,
-    related as search_related,
-    root_top as search_root_top,
-    seed as search_seed,
-    sort as search_sort,
-    suggest as search_suggest,
-    thumbnail as search_thumbnail,
-    top as search_top,
-    i18n_smoke as search_i18n_smoke,
-    multibyte_query as search_multibyte_query,
-    layout_overflow as search_layout_overflow,
-    console_errors as search_console_errors,
-    multibyte_admin_input as search_multibyte_admin_input,
-)
-
-from fess.test.ui import integration
-
-# Leaves of the general/ and sysinfo/ packages. The default run drives the two
-# composers imported above; these aliases exist so TEST_MODULES can name a
-# single leaf when debugging one settings page.
-from fess.test.ui.admin.general import (
-    jsonResponse as general_jsonResponse,
-    logLevel as general_logLevel,
-    loginLink as general_loginLink,
-    loginRequired as general_loginRequired,
-    notificationLogin as general_notificationLogin,
-    notificationSearchTop as general_notificationSearchTop,
-    pagedesign as general_pagedesign,
-    plugin as general_plugin,
-    popularWord as general_popularWord,
-    storage as general_storage,
-)
-from fess.test.ui.admin.sysinfo import (
-    backup as sysinfo_backup,
-    backup_download as sysinfo_backup_download,
-    configinfo as sysinfo_configinfo,
-    crawlinfo as sysinfo_crawlinfo,
-    deleteall as sysinfo_deleteall,
-    failureurl as sysinfo_failureurl,
-    joblog as sysinfo_joblog,
-    logfile as sysinfo_logfile,
-    maintenance as sysinfo_maintenance,
-    searchlist as sysinfo_searchlist,
-    searchlog as sysinfo_searchlog,
-)
-from fess.test.ui.admin.wizard import (
-    crawling_config as wizard_crawling_config,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -140,163 +59,35 @@ def get_modules_to_run() -> List[Any]:
     """
     Get list of test modules to run based on TEST_MODULES environment variable.
 
+    Only the selected modules are imported (see fess.test.registry).
+
     Returns:
         List of module objects to execute
     """
-    # All available modules
-    all_modules = {
-        'accesstoken': accesstoken,
-        'badword': badword,
-        'boostdoc': boostdoc,
-        'duplicatehost': duplicatehost,
-        'elevateword': elevateword,
-        'keymatch': keymatch,
-        'label': label,
-        'dataconfig': dataconfig,
-        'pathmap': pathmap,
-        'relatedcontent': relatedcontent,
-        'relatedquery': relatedquery,
-        'user': user,
-        'group': group,
-        'role': role,
-        'kuromoji': kuromoji,
-        'protwords': protwords,
-        'mapping': mapping,
-        'stemmeroverride': stemmeroverride,
-        'stopwords': stopwords,
-        'synonym': synonym,
-        'fileauth': fileauth,
-        'reqheader': reqheader,
-        'scheduler': scheduler,
-        'virtualhost': virtualhost,
-        'webauth': webauth,
-        'webconfig': webconfig,
-        'fileconfig': fileconfig,
-        'search_seed': search_seed,
-        'search_root_top': search_root_top,
-        'search_top': search_top,
-        'search_help': search_help,
-        'search_login_form': search_login_form,
-        'search_profile_form': search_profile_form,
-        'search_form_submit': search_form_submit,
-        'search_query': search_query,
-        'search_advance': search_advance,
-        'search_no_results': search_no_results,
-        'search_query_errors': search_query_errors,
-        'search_go_click': search_go_click,
-        'search_cache': search_cache,
-        'search_error_pages': search_error_pages,
-        'search_osdd': search_osdd,
-        'search_logout': search_logout,
-        'search_pagination': search_pagination,
-        'search_facet': search_facet,
-        'search_sort': search_sort,
-        'search_thumbnail': search_thumbnail,
-        'search_suggest': search_suggest,
-        'search_related': search_related,
-        'search_i18n_smoke': search_i18n_smoke,
-        'search_multibyte_query': search_multibyte_query,
-        'search_layout_overflow': search_layout_overflow,
-        'search_console_errors': search_console_errors,
-        'search_multibyte_admin_input': search_multibyte_admin_input,
-        # Package composers. The default run drives these, not their leaves:
-        # a leaf added to the package then runs without anyone remembering to
-        # touch this file, which is exactly how the six general modules stayed
-        # unregistered and unrun.
-        'general': general,
-        'sysinfo': sysinfo,
-        'integration': integration,
-        'wizard': wizard,
-        # The same leaves, addressable individually so TEST_MODULES can still
-        # name one while debugging (TEST_MODULES=storage). Filtering only --
-        # they are absent from the default order above by design.
-        'jsonResponse': general_jsonResponse,
-        'logLevel': general_logLevel,
-        'loginLink': general_loginLink,
-        'loginRequired': general_loginRequired,
-        'notificationLogin': general_notificationLogin,
-        'notificationSearchTop': general_notificationSearchTop,
-        'pagedesign': general_pagedesign,
-        'plugin': general_plugin,
-        'popularWord': general_popularWord,
-        'storage': general_storage,
-        'backup': sysinfo_backup,
-        'backup_download': sysinfo_backup_download,
-        'configinfo': sysinfo_configinfo,
-        'crawlinfo': sysinfo_crawlinfo,
-        'deleteall': sysinfo_deleteall,
-        'failureurl': sysinfo_failureurl,
-        'joblog': sysinfo_joblog,
-        'logfile': sysinfo_logfile,
-        'maintenance': sysinfo_maintenance,
-        'searchlist': sysinfo_searchlist,
-        'searchlog': sysinfo_searchlog,
-        'crawling_config': wizard_crawling_config,
-    }
+    all_modules = registry.available()
 
     # Check for TEST_MODULES environment variable
     test_modules_env = os.environ.get('TEST_MODULES', 'all').strip()
 
     if test_modules_env == 'all':
         # Run all modules in default order
-        return [
-            accesstoken, badword, boostdoc, duplicatehost, elevateword,
-            keymatch, label, pathmap, relatedcontent, relatedquery, user, group,
-            role, kuromoji, protwords, mapping, stemmeroverride, stopwords, synonym,
-            webconfig, fileconfig,
-            dataconfig, fileauth, reqheader, scheduler, webauth, virtualhost,
-            search_seed,
-            search_root_top, search_top, search_help, search_login_form,
-            search_profile_form, search_form_submit,
-            search_query, search_advance, search_no_results,
-            search_query_errors,
-            search_pagination, search_facet, search_sort,
-            search_thumbnail, search_suggest, search_related,
-            # Both drive a real result: they need search_seed's index, and
-            # go_click's click writes a ClickLog for the document it opens.
-            search_go_click, search_cache,
-            search_i18n_smoke, search_multibyte_query,
-            search_layout_overflow, search_console_errors,
-            search_multibyte_admin_input,
-            # search_osdd must precede general: /osdd is behind the
-            # loginRequired gate, which general's last module toggles.
-            search_error_pages, search_osdd, search_logout,
-            # Cross-resource workflows. After the search modules: dictionary_workflow
-            # edits the morphological analyser's dictionaries, and changed tokenisation
-            # would change what the search assertions above see.
-            integration,
-            # After the search modules because it creates real, persistent
-            # crawl configs. It never starts a crawl -- the wizard's
-            # startCrawling button relaunches every crawler job, which would
-            # rewrite the index the modules above assert against -- so it
-            # deletes the configs it made and leaves the index alone.
-            wizard,
-            # sysinfo ends in deleteall, which empties the job-log and
-            # crawling-info indices. Nothing after it reads them.
-            sysinfo,
-            # Last: general's final module (loginRequired) briefly closes the
-            # public UI to anonymous visitors. It restores the setting itself,
-            # but if that ever fails, nothing is left queued behind it.
-            general,
-        ]
-    else:
-        # Parse comma-separated list of module names
-        module_names = [name.strip() for name in test_modules_env.split(',')]
-        modules = []
+        return registry.load(registry.DEFAULT_ORDER)
 
-        for name in module_names:
-            if name in all_modules:
-                modules.append(all_modules[name])
-                logger.info(f"Including module: {name}")
-            else:
-                logger.warning(f"Unknown module: {name}, skipping")
+    # Parse comma-separated list of module names
+    module_names = []
+    for name in (name.strip() for name in test_modules_env.split(',')):
+        if registry.is_known(name):
+            module_names.append(name)
+            logger.info(f"Including module: {name}")
+        else:
+            logger.warning(f"Unknown module: {name}, skipping")
 
-        if not modules:
-            logger.error("No valid modules specified in TEST_MODULES")
-            logger.info(f"Available modules: {', '.join(sorted(all_modules.keys()))}")
-            sys.exit(1)
+    if not module_names:
+        logger.error("No valid modules specified in TEST_MODULES")
+        logger.info(f"Available modules: {', '.join(sorted(all_modules.keys()))}")
+        sys.exit(1)
 
-        return modules
+    return registry.load(module_names)
 
 
 def save_failure_screenshot(context: FessContext, module_name: str) -> str:
@@ -334,6 +125,35 @@ def save_failure_screenshot(context: FessContext, module_name: str) -> str:
         return None
 
 
+def _add_metric(context: FessContext, metrics: MetricsCollector, module_name: str,
+                duration: float, status: str) -> None:
+    """Record a module's duration with the pacing and page-action timings
+    its context accumulated while it ran, and the page's memory after it."""
+    metrics.add_metric(module_name, duration, status,
+                       pacing=context.pacer.reset(),
+                       actions=context.take_action_timings(),
+                       navigations=context.navigations.take(),
+                       network=context.network.take(),
+                       polls=eventually.end_module(),
+                       benchmark=benchmark.end_module(),
+                       memory=context.memory_checkpoint())
+
+
+_first_test_lock = threading.Lock()
+_first_test_started = False
+
+
+def _note_first_test() -> None:
+    """Log, once per process, how long it took to reach the first module:
+    startup plus browser launch and login."""
+    global _first_test_started
+    with _first_test_lock:
+        if _first_test_started:
+            return
+        _first_test_started = True
+    logger.info(f"Time to first test: {time.perf_counter() - _STARTED:.2f}s")
+
+
 def run_module(context: FessContext, module: Any, collector: ResultCollector,
                metrics: MetricsCollector) -> bool:
     """
@@ -353,6 +173,16 @@ def run_module(context: FessContext, module: Any, collector: ResultCollector,
     # Start module trace
     context.start_module_trace(module_name)
 
+    # A module may opt back into slower pacing (PACING = "legacy").
+    context.pacer.set_module_profile(getattr(module, 'PACING', None))
+    context.pacer.reset()
+    context.take_action_timings()
+    context.navigations.take()
+    context.network.take()
+    eventually.begin_module()
+    benchmark.begin_module()
+
+    _note_first_test()
     start_time = time.time()
     result = None
 
@@ -368,7 +198,7 @@ def run_module(context: FessContext, module: Any, collector: ResultCollector,
             duration=duration
         )
         collector.add_result(result)
-        metrics.add_metric(module_name, duration, 'passed')
+        _add_metric(context, metrics, module_name, duration, 'passed')
 
         # Stop trace without saving for passed tests (unless TRACE_ALL)
         context.stop_module_trace(save=False, status='passed')
@@ -399,7 +229,7 @@ def run_module(context: FessContext, module: Any, collector: ResultCollector,
             url_at_failure=url
         )
         collector.add_result(result)
-        metrics.add_metric(module_name, duration, 'failed')
+        _add_metric(context, metrics, module_name, duration, 'failed')
 
         logger.error(f"Module {module_name} failed: {error_msg}")
         if url:
@@ -424,6 +254,13 @@ def run_module(context: FessContext, module: Any, collector: ResultCollector,
 
         if page:
             context.html_capture.capture_on_failure(page, error_msg)
+            # Read now: the memory checkpoint in _add_metric may recycle
+            # (close) the page. Skipped unless debug logging is on.
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    logger.debug(f"Page content:\n{page.content()}")
+                except Exception as content_error:
+                    logger.debug(f"Page content unavailable: {content_error}")
 
         result = TestResult(
             module=module_name,
@@ -435,7 +272,7 @@ def run_module(context: FessContext, module: Any, collector: ResultCollector,
             url_at_failure=url
         )
         collector.add_result(result)
-        metrics.add_metric(module_name, duration, 'error')
+        _add_metric(context, metrics, module_name, duration, 'error')
 
         logger.error(f"Module {module_name} error ({error_type}): {error_msg}")
         if url:
@@ -443,15 +280,446 @@ def run_module(context: FessContext, module: Any, collector: ResultCollector,
         if trace_path:
             logger.info(f"Trace available: {trace_path}")
 
-        # Also log page content for debugging
-        if page:
-            logger.debug(f"Page content:\n{page.content()}")
-
         return False
 
 
-def main():
+def ensure_connected(playwright, context: FessContext, name: str = "main") -> FessContext:
+    """
+    The context to run the next module in: this one, or a freshly logged-in
+    one when its browser went away (a warm browser server that crashed is
+    restarted by the new context's connect).
+    """
+    if context.is_connected():
+        return context
+    logger.warning(f"[{name}] Browser disconnected; opening a new context")
+    try:
+        context.close()
+    except Exception as e:
+        logger.debug(f"[{name}] Closing the disconnected context: {e}")
+    context = FessContext(playwright)
+    context.login()
+    return context
+
+
+def start_snapshot(context: FessContext) -> Optional[ConfigSnapshot]:
+    """The configuration snapshot to restore between modules, when
+    CONFIG_SNAPSHOT asks for one (see fess.test.ui.config_snapshot)."""
+    mode = snapshot_mode()
+    if mode == "off":
+        return None
+    snapshot = ConfigSnapshot(mode)
+    try:
+        snapshot.take(context)
+    except Exception as e:
+        logger.error(f"[SNAPSHOT] Could not snapshot the configuration; "
+                     f"running without it: {e}")
+        return None
+    return snapshot
+
+
+def after_module(snapshot: Optional[ConfigSnapshot], context: FessContext,
+                 module: Any, passed: bool) -> None:
+    """Restore (or retake) the configuration snapshot after a module. A
+    restore that fails is logged, not raised: the run goes on."""
+    if snapshot is None:
+        return
+    try:
+        snapshot.after_module(context, module, passed)
+    except Exception as e:
+        logger.error(f"[SNAPSHOT] Restoring the configuration failed: {e}")
+
+
+def run_serial(modules: List[Any], collector: ResultCollector,
+               metrics: MetricsCollector) -> bool:
+    """
+    Run modules one after another against a single FessContext.
+
+    Returns:
+        True if every module passed, False otherwise
+    """
+    with sync_playwright() as playwright:
+        context: FessContext = FessContext(playwright)
+
+        try:
+            # Login once before all tests
+            context.login()
+            logger.info("Successfully logged in to Fess")
+            snapshot = start_snapshot(context)
+
+            # Run all selected modules
+            all_passed = True
+            for module in modules:
+                context = ensure_connected(playwright, context)
+                passed = run_module(context, module, collector, metrics)
+                after_module(snapshot, context, module, passed)
+                if not passed:
+                    all_passed = False
+
+        except Exception as e:
+            # Catch any unexpected errors during setup/teardown
+            logger.error(f"Fatal error during test execution: {e}", exc_info=True)
+            all_passed = False
+
+        finally:
+            # Always close the context
+            try:
+                context.close()
+                logger.info("Browser context closed")
+            except Exception as e:
+                logger.error(f"Error closing context: {e}")
+
+    return all_passed
+
+
+def get_parallel_workers() -> int:
+    """Number of browser contexts to run modules in (TEST_PARALLEL, default 1)."""
+    raw = os.environ.get('TEST_PARALLEL', '').strip()
+    if not raw:
+        return 1
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.error(f"TEST_PARALLEL={raw!r} is not a number; running serially")
+        return 1
+
+
+def run_watch(modules: List[Any], collector: ResultCollector,
+              metrics: MetricsCollector) -> None:
+    """
+    Watch mode: run the modules once, then re-run them in the same logged-in
+    FessContext whenever their source (or a module they import) changes
+    under src/fess/test/ui. Runs until interrupted (Ctrl-C).
+
+    Nothing is saved: results and timings of an edit loop are not a run.
+    """
+    root = watch.ROOT
+    names = [module.__name__ for module in modules]
+    with sync_playwright() as playwright:
+        context: FessContext = FessContext(playwright)
+        try:
+            context.login()
+            logger.info("Successfully logged in to Fess")
+            snapshot = start_snapshot(context)
+            to_run = names
+            seen = watch.snapshot(root)
+            while True:
+                for name in to_run:
+                    context = ensure_connected(playwright, context)
+                    module = sys.modules[name]
+                    passed = run_module(context, module, collector, metrics)
+                    after_module(snapshot, context, module, passed)
+                logger.info(f"[WATCH] Watching {root} for changes (Ctrl-C to stop)")
+                to_run = []
+                while not to_run:
+                    time.sleep(watch.watch_interval())
+                    current = watch.snapshot(root)
+                    paths = watch.changed(seen, current)
+                    seen = current
+                    if paths:
+                        reloaded = set(watch.reload_changed(paths, root))
+                        to_run = [name for name in names if name in reloaded]
+        except KeyboardInterrupt:
+            logger.info("[WATCH] Stopped")
+        finally:
+            try:
+                context.close()
+            except Exception as e:
+                logger.error(f"Error closing context: {e}")
+
+
+def prime_session() -> None:
+    """
+    Log in once before the workers start, so each of their contexts (and each
+    module's own setup()) restores the saved session instead of filling in
+    the login form. Without this every worker would race to log in at once.
+    """
+    if not session_reuse_enabled():
+        return
+    try:
+        with sync_playwright() as playwright:
+            context = FessContext(playwright)
+            try:
+                context.login()
+            finally:
+                context.close()
+    except Exception as e:
+        # Not fatal: the workers log in themselves.
+        logger.warning(f"Failed to prepare a shared login session: {e}")
+
+
+def estimate_module_durations(modules: List[Any], metrics: MetricsCollector) -> List[float]:
+    """Expected duration of each module, from test_metrics_history.json."""
+    names = [module.__name__.split('.')[-1] for module in modules]
+    estimates = metrics.estimate_durations(names)
+    return [estimates[name] for name in names]
+
+
+def _parallel_worker(scheduler: ModuleScheduler, collector: ResultCollector,
+                     metrics: MetricsCollector, failures: List[str],
+                     walls: dict) -> None:
+    """
+    Worker thread body: one sync_playwright() and one logged-in FessContext,
+    running whatever module the scheduler hands out next.
+
+    Playwright's sync API is bound to the thread that started it, so every
+    worker owns its own instance rather than sharing the main thread's.
+    """
+    worker = threading.current_thread().name
+    started = time.time()
+    try:
+        with sync_playwright() as playwright:
+            context: FessContext = FessContext(playwright)
+            try:
+                context.login()
+                logger.info(f"[{worker}] Successfully logged in to Fess")
+                while True:
+                    index = scheduler.acquire()
+                    if index is None:
+                        return
+                    module = scheduler.modules[index]
+                    try:
+                        context = ensure_connected(playwright, context, worker)
+                        passed = run_module(context, module, collector, metrics)
+                    finally:
+                        scheduler.release(index)
+                    if not passed:
+                        failures.append(module.__name__)
+            finally:
+                try:
+                    context.close()
+                    logger.info(f"[{worker}] Browser context closed")
+                except Exception as e:
+                    logger.error(f"[{worker}] Error closing context: {e}")
+    except Exception as e:
+        logger.error(f"[{worker}] Fatal error in worker: {e}", exc_info=True)
+        failures.append(worker)
+    finally:
+        walls[worker] = time.time() - started
+
+
+def run_parallel(modules: List[Any], workers: int, collector: ResultCollector,
+                 metrics: MetricsCollector) -> bool:
+    """
+    Run modules in several browser contexts at once, honouring their locks.
+
+    Modules whose READS/WRITES do not conflict overlap; conflicting ones run
+    in the order they were listed (see fess.test.schedule). Among the modules
+    free to start, the longest by history goes first.
+
+    Returns:
+        True if every module ran and passed, False otherwise
+    """
+    estimates = estimate_module_durations(modules, metrics)
+    scheduler = ModuleScheduler(modules, estimates)
+    predicted = plan_shards(scheduler.predecessors, workers, estimates).predicted
+    for module, locks in zip(scheduler.modules, scheduler.locks):
+        logger.debug(f"Locks for {module.__name__}: reads={sorted(locks.reads)} "
+                     f"writes={sorted(locks.writes)} after={sorted(locks.after)}")
+
+    failures: List[str] = []
+    walls: dict = {}
+    threads = [
+        threading.Thread(target=_parallel_worker, name=f"worker-{n + 1}",
+                         args=(scheduler, collector, metrics, failures, walls))
+        for n in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Threads take whatever is ready next, so thread n is not the simulated
+    # worker n: both sides are listed busiest first.
+    print_plan_accuracy("worker", sorted(predicted, reverse=True),
+                        sorted(walls.values(), reverse=True))
+
+    # Only possible when every worker died before the queue drained; report
+    # the modules it left behind rather than letting them vanish from the
+    # summary.
+    for module in scheduler.unstarted():
+        module_name = module.__name__.split('.')[-1]
+        collector.add_result(TestResult(
+            module=module_name,
+            status='error',
+            duration=0.0,
+            error_message='not run: no parallel worker was left to run it',
+            error_type='SchedulerError'
+        ))
+        failures.append(module.__name__)
+
+    return not failures
+
+
+def get_shard_count(shards: Optional[int] = None) -> int:
+    """Number of worker processes (--shards, else TEST_SHARDS, default 1)."""
+    if shards is None:
+        raw = os.environ.get('TEST_SHARDS', '').strip()
+        try:
+            shards = int(raw) if raw else 1
+        except ValueError:
+            logger.error(f"TEST_SHARDS={raw!r} is not a number; running in one process")
+            shards = 1
+    return max(1, shards)
+
+
+def _shard_worker(shard: int, assigned: List[Tuple[int, str, List[int]]],
+                  finished: List[Any], channel: Any, lang: str,
+                  label_dir: str) -> None:
+    """
+    Worker process body for a sharded run.
+
+    Runs its share of the modules in plan order against its own
+    sync_playwright() and FessContext, waiting on `finished` for any
+    predecessor that belongs to another shard, and streams every TestResult
+    and ModuleMetric back to the parent over `channel` as soon as it exists.
+
+    Args:
+        shard: Shard number, for logging
+        assigned: (run index, dotted module name, predecessor run indices)
+        finished: One multiprocessing.Event per module of the whole run
+        channel: multiprocessing.Queue read by run_sharded()
+        lang: Language the parent resolved (TEST_LANG may say 'random')
+        label_dir: Directory with the extracted Fess label files
+    """
+    setup_logging()
+    i18n_mod.init(lang, label_dir)
+    name = f"shard-{shard}"
+    collector = ResultCollector()
+    metrics = MetricsCollector()
+
+    try:
+        with sync_playwright() as playwright:
+            context: FessContext = FessContext(playwright)
+            try:
+                context.login()
+                logger.info(f"[{name}] Successfully logged in to Fess")
+                for index, module_name, predecessors in assigned:
+                    for predecessor in predecessors:
+                        finished[predecessor].wait()
+                    try:
+                        module = importlib.import_module(module_name)
+                        context = ensure_connected(playwright, context, name)
+                        run_module(context, module, collector, metrics)
+                        channel.put(('result', index, collector.results[-1]))
+                        channel.put(('metric', index, metrics.current_metrics[-1]))
+                    finally:
+                        finished[index].set()
+            finally:
+                try:
+                    context.close()
+                    logger.info(f"[{name}] Browser context closed")
+                except Exception as e:
+                    logger.error(f"[{name}] Error closing context: {e}")
+    except Exception as e:
+        logger.error(f"[{name}] Fatal error in shard: {e}", exc_info=True)
+    finally:
+        # A shard that died early must not leave the others waiting on
+        # modules it will never run; run_sharded() reports those as not run.
+        for index, _, _ in assigned:
+            finished[index].set()
+        # Deleted by the parent once no shard needs it (see fixtures.release)
+        for base_url, access_token in fixtures.obtained().items():
+            channel.put(('token', base_url, access_token))
+        channel.put(('done', shard, None))
+
+
+def run_sharded(modules: List[Any], shards: int, lang: str, label_dir: str,
+                collector: ResultCollector, metrics: MetricsCollector) -> bool:
+    """
+    Split modules across worker processes and merge what they report.
+
+    The entries of the module list are the unit of distribution, so a package
+    composer (general, sysinfo, integration) always runs whole inside one
+    shard. Lock conflicts that cross shards become waits on the other shard's
+    module (see fess.test.schedule.plan_shards).
+
+    Returns:
+        True if every module ran and passed, False otherwise
+    """
+    locks = [locks_of(m) for m in modules]
+    predecessors = build_predecessors(locks)
+    plan = plan_shards(predecessors, shards,
+                       estimate_module_durations(modules, metrics))
+    for shard, indices in enumerate(plan.shards):
+        names = [modules[i].__name__.split('.')[-1] for i in indices]
+        logger.info(f"Shard {shard}: {len(names)} modules, predicted "
+                    f"{plan.predicted[shard]:.0f}s: {', '.join(names)}")
+
+    # spawn, not fork: a forked child would inherit the parent's Playwright
+    # driver state, and the sync API's event loop is not fork-safe.
+    mp = multiprocessing.get_context('spawn')
+    finished = [mp.Event() for _ in modules]
+    channel = mp.Queue()
+    processes = []
+    started = time.time()
+    walls: List[Optional[float]] = [None] * shards
+    for shard, indices in enumerate(plan.shards):
+        if not indices:
+            continue
+        assigned = [(i, modules[i].__name__, sorted(predecessors[i])) for i in indices]
+        process = mp.Process(target=_shard_worker, name=f"shard-{shard}",
+                             args=(shard, assigned, finished, channel, lang, label_dir))
+        process.start()
+        processes.append((shard, process))
+
+    reported = set()
+    running = {shard: process for shard, process in processes}
+    while running:
+        try:
+            kind, key, payload = channel.get(timeout=1)
+        except queue.Empty:
+            # A shard killed outright (OOM, browser crash taking the process)
+            # never sends 'done'; release its modules so the others go on.
+            for shard, process in list(running.items()):
+                if not process.is_alive():
+                    logger.error(f"Shard {shard} exited with code {process.exitcode}")
+                    walls[shard] = time.time() - started
+                    for index in plan.shards[shard]:
+                        finished[index].set()
+                    del running[shard]
+            continue
+        if kind == 'result':
+            collector.add_result(payload)
+            reported.add(key)
+        elif kind == 'metric':
+            metrics.add_module_metric(payload)
+        elif kind == 'token':
+            fixtures.adopt(key, payload)
+        elif kind == 'done':
+            running.pop(key, None)
+            walls[key] = time.time() - started
+
+    for _, process in processes:
+        process.join()
+
+    print_plan_accuracy("shard", plan.predicted, walls)
+
+    all_passed = all(r.status == 'passed' for r in collector.results)
+    for index, module in enumerate(modules):
+        if index not in reported:
+            collector.add_result(TestResult(
+                module=module.__name__.split('.')[-1],
+                status='error',
+                duration=0.0,
+                error_message='not run: its shard exited before reaching it',
+                error_type='ShardError'
+            ))
+            all_passed = False
+
+    return all_passed
+
+
+def main(argv: Optional[List[str]] = None):
     """Main test execution function"""
+    parser = argparse.ArgumentParser(description="Fess UI test suite")
+    parser.add_argument('--shards', type=int, default=None,
+                        help="split the modules across N worker processes "
+                             "(default: TEST_SHARDS, else 1)")
+    parser.add_argument('--watch', action='store_true',
+                        help="keep one logged-in browser open and re-run the "
+                             "selected modules whenever their source changes")
+    args = parser.parse_args(argv)
+
     i18n_info = _initialize_i18n()
 
     logger.info("="*70)
@@ -481,35 +749,36 @@ def main():
 
     # Get modules to run
     modules_to_run = get_modules_to_run()
+    startup = time.perf_counter() - _STARTED
+    imported = sum(1 for name in sys.modules if name.startswith("fess.test.ui."))
     logger.info(f"Running {len(modules_to_run)} test modules")
+    logger.info(f"Startup time      : {startup:.2f}s ({imported} test modules imported)")
+    collector.set_environment_extra({"startup_seconds": round(startup, 3)})
 
-    with sync_playwright() as playwright:
-        context: FessContext = FessContext(playwright)
-
-        try:
-            # Login once before all tests
-            context.login()
-            logger.info("Successfully logged in to Fess")
-
-            # Run all selected modules
-            all_passed = True
-            for module in modules_to_run:
-                passed = run_module(context, module, collector, metrics)
-                if not passed:
-                    all_passed = False
-
-        except Exception as e:
-            # Catch any unexpected errors during setup/teardown
-            logger.error(f"Fatal error during test execution: {e}", exc_info=True)
-            all_passed = False
+    if args.watch:
+        run_watch(modules_to_run, collector, metrics)
+        fixtures.release()
+        return 0
 
-        finally:
-            # Always close the context
-            try:
-                context.close()
-                logger.info("Browser context closed")
-            except Exception as e:
-                logger.error(f"Error closing context: {e}")
+    shards = get_shard_count(args.shards)
+    workers = get_parallel_workers()
+    if shards > 1 or workers > 1:
+        prime_session()
+        if snapshot_mode() != "off":
+            # Restoring between modules that run at the same time would
+            # undo each other's work.
+            logger.warning("CONFIG_SNAPSHOT is ignored in parallel and sharded runs")
+    if shards > 1:
+        logger.info(f"Sharded execution: {shards} worker processes")
+        run_sharded(modules_to_run, shards, i18n_info['lang'],
+                    i18n_info['label_dir'], collector, metrics)
+    elif workers > 1:
+        logger.info(f"Parallel execution: {workers} browser contexts")
+        run_parallel(modules_to_run, workers, collector, metrics)
+    else:
+        run_serial(modules_to_run, collector, metrics)
+    # The admin-api token the fixtures created, if any (see fess.test.ui.fixtures)
+    fixtures.release()
 
     # Save results to JSON
     try:
@@ -520,10 +789,31 @@ def main():
     # Save and print metrics
     try:
         metrics.save_history()
+        metrics.save_action_timings()
         metrics.print_metrics_summary()
     except Exception as e:
         logger.error(f"Failed to save/print metrics: {e}")
 
+    # Page timings per route travel with the module metrics
+    try:
+        page_timing = PageTimingCollector()
+        for metric in metrics.current_metrics:
+            page_timing.add(metric.navigations)
+        page_timing.save_history()
+        page_timing.print_summary()
+    except Exception as e:
+        logger.error(f"Failed to save/print page timings: {e}")
+
+    # Network waterfall per module
+    try:
+        network = NetworkCollector()
+        for metric in metrics.current_metrics:
+            network.add(metric.module, metric.network)
+        network.save_json()
+        network.print_summary()
+    except Exception as e:
+        logger.error(f"Failed to save/print network report: {e}")
+
     # Print summary to console
     collector.print_summary()
 
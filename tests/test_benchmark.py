@@ -0,0 +1,111 @@
+"""Tests for the search latency benchmark.
+
+The per-class numbers are compared across runs and backends, so the
+request accounting (every timed request counted once, errors apart from
+latencies) and the history round trip are pinned here.
+"""
+import json
+import threading
+import time
+
+from fess.test import benchmark
+from fess.test.benchmark import BenchmarkResult, QueryClass, SearchRequest
+from fess.test.metrics import MetricsCollector
+from fess.test.ui.search import benchmark as search_benchmark
+
+
+def _searcher(calls, fail_on=None, delay=0.0):
+    def search(request):
+        calls.append((threading.get_ident(), request.q))
+        time.sleep(delay)
+        if request.q == fail_on:
+            raise RuntimeError("boom")
+    return search
+
+
+def test_every_timed_request_is_counted_once_across_workers():
+    calls = []
+    query_class = QueryClass("single_term", [SearchRequest("a"), SearchRequest("b")])
+    result = benchmark.run_class(query_class, [_searcher(calls) for _ in range(3)],
+                                 requests=50, warmup=4)
+    assert len(calls) == 54
+    assert result.requests == 50 and result.errors == 0
+    assert result.concurrency == 3
+    assert result.p50 <= result.p95 <= result.p99
+    assert result.qps > 0
+
+
+def test_errors_are_counted_apart_from_latencies():
+    calls = []
+    query_class = QueryClass("mixed", [SearchRequest("ok"), SearchRequest("bad")])
+    result = benchmark.run_class(query_class, [_searcher(calls, fail_on="bad")],
+                                 requests=10)
+    assert result.requests == 5
+    assert result.errors == 5
+
+
+def test_concurrency_raises_throughput_for_io_bound_requests():
+    query_class = QueryClass("slow", [SearchRequest("q")])
+    serial = benchmark.run_class(query_class, [_searcher([], delay=0.01)], requests=20)
+    parallel = benchmark.run_class(query_class, [_searcher([], delay=0.01) for _ in range(4)],
+                                   requests=20)
+    assert parallel.qps > serial.qps * 2
+
+
+def _result(name, p95, concurrency=4):
+    return BenchmarkResult(name, concurrency, 100, 0, p95 / 2, p95, p95 * 2, 50.0)
+
+
+def test_results_reach_the_metrics_history(tmp_path):
+    history = tmp_path / "history.json"
+    metrics = MetricsCollector(str(history))
+    metrics.add_metric("benchmark", 10.0, "passed", benchmark=[_result("sort", 0.02)])
+    metrics.save_history()
+    saved = json.loads(history.read_text())[-1]["benchmark"]
+    assert saved["sort"]["p95"] == 0.02
+    assert saved["sort"]["concurrency"] == 4
+
+
+def test_p95_regression_is_flagged_against_the_same_concurrency(tmp_path):
+    history = tmp_path / "history.json"
+    for p95 in (0.02, 0.021, 0.019):
+        metrics = MetricsCollector(str(history))
+        metrics.add_metric("benchmark", 10.0, "passed",
+                           benchmark=[_result("sort", p95), _result("wildcard", p95)])
+        metrics.save_history()
+
+    metrics = MetricsCollector(str(history))
+    metrics.add_metric("benchmark", 10.0, "passed",
+                       benchmark=[_result("sort", 0.05), _result("wildcard", 0.05, 16)])
+    metrics.save_history()
+    # wildcard ran at another concurrency, so it has no baseline to regress from.
+    assert metrics.detect_benchmark_regressions() == ["sort"]
+
+
+def test_catalog_covers_every_query_class():
+    catalog = search_benchmark.build_catalog(1000)
+    assert [c.name for c in catalog] == ["single_term", "wildcard", "multibyte",
+                                         "label_filter", "sort", "deep_pagination"]
+    by_name = {c.name: c for c in catalog}
+    assert {r.ex_q for r in by_name["label_filter"].requests} == {
+        "label:e2e_label_a", "label:e2e_label_b"}
+    assert [r.start for r in by_name["deep_pagination"].requests] == [500, 900, 990]
+
+
+def test_percentile_is_nearest_rank():
+    values = [1.0, 2.0, 3.0, 4.0]
+    assert benchmark.percentile(values, 0.50) == 2.0
+    assert benchmark.percentile(values, 0.95) == 4.0
+    assert benchmark.percentile(values, 0.0) == 1.0
+    assert benchmark.percentile([float(n) for n in range(1, 21)], 0.95) == 19.0
+    assert benchmark.percentile([7.0], 0.99) == 7.0
+
+
+def test_a_malformed_setting_falls_back_to_the_default(monkeypatch, caplog):
+    monkeypatch.setenv("BENCHMARK_REQUESTS", "2OO")
+    monkeypatch.setenv("BENCHMARK_WARMUP", " ")
+    monkeypatch.setenv("BENCHMARK_CONCURRENCY", "0")
+    assert benchmark.benchmark_requests() == 200
+    assert "BENCHMARK_REQUESTS='2OO' is not a number" in caplog.text
+    assert benchmark.benchmark_warmup() == 10
+    assert benchmark.benchmark_concurrency() == 1
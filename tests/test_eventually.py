@@ -0,0 +1,87 @@
+"""Tests for the shared polling engine.
+
+Every wait for Fess to converge goes through eventually(), so a wrong
+timeout, a backoff that never resets or a lost record either slows every
+run or hides the data the waits are tuned from.
+"""
+import pytest
+
+from fess.test import eventually as engine
+from fess.test.eventually import begin_module, end_module, eventually
+
+
+class _Clock:
+    """Stands in for time.time/time.sleep so the tests take no real time."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(engine.time, "time", clock.time)
+    monkeypatch.setattr(engine.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_a_condition_that_already_holds_costs_one_probe(clock):
+    result = eventually(lambda: 5, lambda v: v == 5, name="t", timeout=10)
+    assert (result.converged, result.attempts, clock.sleeps) == (True, 1, [])
+
+
+def test_interval_backs_off_to_the_cap_and_stops_at_the_timeout(clock):
+    result = eventually(lambda: 0, lambda v: v > 0, name="t", timeout=10,
+                        initial=0.5, max_interval=2.0)
+    assert not result.converged
+    assert clock.sleeps[:4] == [0.5, 1.0, 2.0, 2.0]
+    assert clock.now == 1010.0
+
+
+def test_progress_resets_the_backoff(clock):
+    values = iter([0, 0, 0, 3, 3, 10])
+    result = eventually(lambda: next(values), lambda v: v >= 10, name="t",
+                        timeout=60, initial=0.5, max_interval=8.0,
+                        progress=lambda v: v, target=10, unit="docs")
+    assert result.converged and result.value == 10
+    assert clock.sleeps == [0.5, 1.0, 2.0, 0.5, 1.0]
+
+
+def test_stalled_progress_gives_up_before_the_timeout(clock):
+    result = eventually(lambda: 1, lambda v: v >= 10, name="t", timeout=600,
+                        initial=1.0, max_interval=1.0, progress=lambda v: v,
+                        stall_timeout=5)
+    assert not result.converged
+    assert clock.now - 1000.0 < 10
+
+
+def test_ignored_probe_errors_mean_not_yet(clock):
+    answers = iter([ConnectionError("starting"), 7])
+
+    def probe():
+        answer = next(answers)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    result = eventually(probe, lambda v: v == 7, name="t", timeout=10,
+                        ignore=(ConnectionError,))
+    assert result.converged and result.attempts == 2
+
+
+def test_module_budget_caps_each_wait_and_records_every_call_site(clock):
+    begin_module(budget=3)
+    eventually(lambda: 0, lambda v: v > 0, name="slow", timeout=60, max_interval=1.0)
+    eventually(lambda: 1, lambda v: v > 0, name="fast", timeout=60)
+    records = end_module()
+    assert clock.now == 1003.0
+    assert [(r.site, r.converged) for r in records] == [("slow", False), ("fast", True)]
+    assert end_module() == []
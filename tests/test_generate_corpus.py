@@ -0,0 +1,74 @@
+"""Tests for the sampledata corpus generator.
+
+The manifest's hit counts are what search modules assert against, so they
+must agree with the files actually written, and the same seed must give
+the same corpus on every build.
+"""
+import importlib.util
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from fess.test.ui.search import _corpus
+
+GENERATOR = Path(__file__).resolve().parent.parent / "sampledata" / "generate_corpus.py"
+_spec = importlib.util.spec_from_file_location("generate_corpus", GENERATOR)
+generate_corpus = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(generate_corpus)
+
+PAGES = 2100
+
+
+@pytest.fixture(scope="module")
+def corpus(tmp_path_factory):
+    out = tmp_path_factory.mktemp("corpus")
+    return out, generate_corpus.generate(PAGES, 7, str(out))
+
+
+def _generated_pages(out: Path):
+    return [p for p in out.rglob("*.html") if re.fullmatch(r"\d{7}\.html", p.name)]
+
+
+def test_same_seed_gives_the_same_corpus(corpus, tmp_path):
+    _, manifest = corpus
+    again = generate_corpus.generate(PAGES, 7, str(tmp_path))
+    assert again["digest"] == manifest["digest"]
+    other = generate_corpus.generate(PAGES, 8, str(tmp_path / "other"))
+    assert other["digest"] != manifest["digest"]
+
+
+def test_layout_keeps_the_sampledata_sections(corpus):
+    out, manifest = corpus
+    assert sum(manifest["sections"].values()) == PAGES
+    for section, count in manifest["sections"].items():
+        assert len(list((out / section / "g").glob("*.html"))) == count
+    assert (out / "docs/ja/g/0000006.html").read_text(encoding="utf-8").count("コーパス") > 0
+    assert "og:image" in (out / "thumbnail/g/0000018.html").read_text(encoding="utf-8")
+
+
+def test_manifest_counts_match_the_files(corpus):
+    out, manifest = corpus
+    texts = [p.read_text(encoding="utf-8") for p in _generated_pages(out)]
+    assert len(texts) == manifest["pages"]
+    for query in manifest["queries"]:
+        term = re.compile(rf"(?<![0-9A-Za-z]){re.escape(query['q'])}(?![0-9A-Za-z])")
+        assert sum(1 for text in texts if term.search(text)) == query["hits"], query
+
+
+def test_hubs_reach_every_page(corpus):
+    out, manifest = corpus
+    hubs = list((out / "g" / "hub").glob("*.html"))
+    assert manifest["documents"] == PAGES + len(hubs) + 1
+    linked = sum(hub.read_text(encoding="utf-8").count("<a href=") for hub in hubs)
+    assert linked == PAGES
+    assert json.loads((out / "g" / "manifest.json").read_text(encoding="utf-8")) == manifest
+
+
+def test_expected_hits_add_one_check_per_label(corpus):
+    _, manifest = corpus
+    checks = _corpus.expected_hits(manifest)
+    assert ("corpusdoc", "label:e2e_label_a",
+            manifest["sections"]["docs/labels/a"]) in checks
+    assert len(checks) == len(manifest["queries"]) + len(_corpus.LABEL_SECTIONS)
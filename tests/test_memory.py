@@ -0,0 +1,121 @@
+"""Tests for per-module browser memory sampling and page recycling.
+
+A fake CDP session stands in for Chromium: what is pinned is which growth
+a module is charged with, when the page is recycled, and that the growth
+reaches the metrics history under the module's name.
+"""
+import json
+
+from fess.test.memory import (MB, MemorySample, MemorySampler, exceeds, parse_metrics,
+                              recycle_thresholds)
+from fess.test.metrics import MetricsCollector
+from fess.test.ui.context import FessContext
+
+
+def _metrics(heap_mb, nodes, listeners):
+    return [{"name": "JSHeapUsedSize", "value": heap_mb * MB},
+            {"name": "JSHeapTotalSize", "value": heap_mb * 2 * MB},
+            {"name": "Nodes", "value": nodes},
+            {"name": "JSEventListeners", "value": listeners},
+            {"name": "Documents", "value": 1},
+            {"name": "LayoutCount", "value": 7}]
+
+
+class _Session:
+    def __init__(self, samples):
+        self.samples = list(samples)
+        self.sent = []
+
+    def send(self, method, params=None):
+        self.sent.append(method)
+        if method == "Performance.getMetrics":
+            return {"metrics": _metrics(*self.samples.pop(0))}
+        return {}
+
+    def detach(self):
+        pass
+
+
+class _BrowserContext:
+    def __init__(self, session):
+        self.session = session
+
+    def new_cdp_session(self, page):
+        return self.session
+
+
+class _Page:
+    def __init__(self, samples):
+        self.context = _BrowserContext(_Session(samples))
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+def test_cdp_metrics_are_read_by_name():
+    sample = parse_metrics(_metrics(3, 120, 40))
+    assert sample == MemorySample(heap_used=3 * MB, heap_total=6 * MB,
+                                  nodes=120, listeners=40, documents=1)
+
+
+def test_each_module_is_charged_with_its_own_growth(monkeypatch):
+    monkeypatch.setenv("MEMORY_RECYCLE_HEAP_MB", "100")
+    page = _Page([(2, 10, 5), (10, 500, 50), (12, 600, 80)])
+    sampler = MemorySampler()
+    sampler.attach(page)
+    first = sampler.checkpoint()
+    second = sampler.checkpoint()
+    assert first.growth.heap_used == 8 * MB and first.growth.nodes == 490
+    assert second.growth.heap_used == 2 * MB and second.growth.listeners == 30
+    assert second.since_opened.heap_used == 10 * MB
+    assert not second.recycled
+    # Garbage is collected before every sample.
+    assert page.context.session.sent.count("HeapProfiler.collectGarbage") == 3
+
+
+def test_thresholds_of_zero_are_off(monkeypatch):
+    monkeypatch.setenv("MEMORY_RECYCLE_HEAP_MB", "0")
+    monkeypatch.setenv("MEMORY_RECYCLE_NODES", "100")
+    growth = MemorySample(heap_used=500 * MB, nodes=101, listeners=0)
+    assert exceeds(growth, recycle_thresholds()) == ["nodes"]
+
+
+def test_growth_past_a_threshold_recycles_the_page(monkeypatch):
+    monkeypatch.setenv("MEMORY_RECYCLE_LISTENERS", "100")
+    page = _Page([(2, 10, 5), (3, 20, 200)])
+    context = object.__new__(FessContext)
+    context._memory = MemorySampler()
+    context._memory.attach(page)
+    context._current_page = page
+
+    record = context.memory_checkpoint()
+    assert record.recycled
+    assert page.closed and context._current_page is None
+    # Nothing is sampled until get_admin_page() opens the next page.
+    assert context.memory_checkpoint() is None
+
+
+def test_sampling_can_be_switched_off(monkeypatch):
+    monkeypatch.setenv("MEMORY_SAMPLING", "false")
+    sampler = MemorySampler()
+    sampler.attach(_Page([(1, 1, 1)]))
+    assert sampler.checkpoint() is None
+
+
+def test_growth_reaches_the_history(tmp_path, monkeypatch):
+    monkeypatch.setenv("MEMORY_RECYCLE_HEAP_MB", "100")
+    page = _Page([(2, 10, 5), (7, 300, 25)])
+    sampler = MemorySampler()
+    sampler.attach(page)
+
+    history = tmp_path / "history.json"
+    metrics = MetricsCollector(str(history))
+    metrics.add_metric("console_errors", 3.0, "passed", memory=sampler.checkpoint())
+    metrics.save_history()
+    saved = json.loads(history.read_text())[-1]["memory_growth"]
+    assert saved["console_errors"] == {"heap_mb": 5.0, "nodes": 290,
+                                       "listeners": 20, "recycled": False}
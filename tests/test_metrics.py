@@ -0,0 +1,62 @@
+"""Tests for the history-based duration estimates the run planner uses."""
+import json
+
+from fess.test.metrics import ActionTiming, DEFAULT_MODULE_ESTIMATE, MetricsCollector
+
+
+def _collector(tmp_path, history) -> MetricsCollector:
+    path = tmp_path / "test_metrics_history.json"
+    path.write_text(json.dumps(history), encoding="utf-8")
+    return MetricsCollector(history_file=str(path))
+
+
+def test_estimate_is_the_median_of_recent_runs(tmp_path):
+    history = [{"module_durations": {"seed": d}} for d in (100.0, 300.0, 120.0)]
+    estimates = _collector(tmp_path, history).estimate_durations(["seed"])
+    assert estimates == {"seed": 120.0}
+
+
+def test_module_without_history_gets_a_typical_estimate(tmp_path):
+    history = [{"module_durations": {"seed": 200.0, "badword": 10.0, "label": 20.0}}]
+    estimates = _collector(tmp_path, history).estimate_durations(["new_module"])
+    assert estimates == {"new_module": 20.0}
+
+
+def test_no_history_at_all_falls_back_to_the_default(tmp_path):
+    collector = MetricsCollector(history_file=str(tmp_path / "missing.json"))
+    assert collector.estimate_durations(["seed"]) == {"seed": DEFAULT_MODULE_ESTIMATE}
+
+
+def test_pacing_is_reported_separately_from_real_work(tmp_path, capsys):
+    collector = MetricsCollector(history_file=str(tmp_path / "missing.json"))
+    collector.add_metric("badword", 10.0, "passed", pacing=4.0)
+    collector.add_metric("label", 30.0, "passed", pacing=1.0)
+    assert collector.get_summary().module_pacing == {"badword": 4.0, "label": 1.0}
+
+    collector.print_metrics_summary()
+    out = capsys.readouterr().out
+    assert "5.00s (12.5%)" in out
+    assert "35.00s" in out
+
+
+def test_action_report_groups_by_module_and_action(tmp_path):
+    collector = MetricsCollector(history_file=str(tmp_path / "test_metrics_history.json"))
+    collector.add_metric("badword", 3.0, "passed", actions=[
+        ActionTiming("goto", "/admin/badword/", 0.2),
+        ActionTiming("goto", "/admin/badword/", 1.5),
+        ActionTiming("click", "#start", 3.0, ok=False),
+    ])
+    collector.add_metric("label", 1.0, "passed", actions=[
+        ActionTiming("goto", "/admin/labeltype/", 0.04)])
+
+    report = collector.get_action_report()
+    goto = report["modules"]["badword"]["goto"]
+    assert (goto["count"], goto["total"], goto["max"]) == (2, 1.7, 1.5)
+    assert sum(goto["histogram"]) == 2
+    assert report["modules"]["badword"]["click"]["failures"] == 1
+    assert report["modules"]["label"]["goto"]["histogram"][0] == 1
+    assert [c["target"] for c in report["slowest_calls"][:2]] == ["#start", "/admin/badword/"]
+    assert report["slowest_targets"][0]["target"] == "#start"
+
+    collector.save_action_timings()
+    assert json.loads((tmp_path / "test_action_timings.json").read_text())["modules"]
@@ -0,0 +1,81 @@
+"""Tests for the per-module network waterfall.
+
+The report's point is to name redundant fetches and slow endpoints, so the
+grouping (by route template vs by exact URL) is what is pinned here.
+"""
+import json
+
+from fess.test.network import (Exchange, NetworkCollector, NetworkRecorder,
+                               summarize_exchanges)
+
+
+class _FakeRequest:
+    def __init__(self, url, method="GET", failure=None):
+        self.url = url
+        self.method = method
+        self.resource_type = "document"
+        self.failure = failure
+        self.timing = {"startTime": 0, "domainLookupStart": -1, "domainLookupEnd": -1,
+                       "connectStart": 1.0, "connectEnd": 3.0, "requestStart": 4.0,
+                       "responseStart": 24.0, "responseEnd": 30.0}
+
+
+class _FakeResponse:
+    def __init__(self, request, status=200, length="512"):
+        self.request = request
+        self.status = status
+        self.headers = {"content-length": length} if length else {}
+
+
+def test_recorder_pairs_response_with_finished_request():
+    recorder = NetworkRecorder("http://fess:8080")
+    recorder.enabled = True
+    request = _FakeRequest("http://fess:8080/admin/labeltype/details/4/AYx3kP0b/")
+    recorder._on_response(_FakeResponse(request))
+    recorder._on_finished(request)
+    recorder._on_failed(_FakeRequest("https://cdn.example/lib.js", failure="net::ERR"))
+
+    ok, failed = recorder.take()
+    assert (ok.template, ok.status, ok.bytes) == ("/admin/labeltype/details/{id}/", 200, 512)
+    assert (ok.dns, ok.connect, ok.wait, ok.download, ok.duration) == (0.0, 2.0, 20.0, 6.0, 30.0)
+    assert failed.template == "cdn.example/lib.js"
+    assert failed.status is None and failed.failure == "net::ERR"
+    assert recorder.take() == []
+
+
+def _exchange(url, template, duration, method="GET", status=200):
+    return Exchange(method=method, url=url, template=template, resource_type="document",
+                    status=status, bytes=100, dns=0.0, connect=0.0, wait=duration,
+                    download=0.0, duration=duration)
+
+
+def test_summary_groups_endpoints_by_template_and_repeats_by_url():
+    exchanges = [
+        _exchange("http://fess/admin/", "/admin/", 50.0),
+        _exchange("http://fess/admin/", "/admin/", 40.0),
+        _exchange("http://fess/admin/", "/admin/", 45.0),
+        _exchange("http://fess/admin/user/details/4/a1/", "/admin/user/details/{id}/", 200.0),
+        _exchange("http://fess/admin/user/details/4/b2/", "/admin/user/details/{id}/", 10.0),
+        _exchange("http://fess/admin/user/", "/admin/user/", 5.0, method="POST", status=500),
+        _exchange("http://fess/admin/user/", "/admin/user/", 5.0, method="POST"),
+    ]
+    summary = summarize_exchanges(exchanges)
+    assert summary["requests"] == 7
+    assert summary["slowest_endpoints"][0]["template"] == "/admin/user/details/{id}/"
+    assert summary["slowest_endpoints"][0]["count"] == 2
+    # Only identical GETs count as repeated; a re-POST is a second action.
+    assert summary["repeated_fetches"] == [
+        {"method": "GET", "url": "http://fess/admin/", "count": 3}]
+    assert summary["redundant_requests"] == 2
+    post = [e for e in summary["slowest_endpoints"] if e["method"] == "POST"][0]
+    assert post["errors"] == 1
+
+
+def test_collector_writes_machine_readable_report(tmp_path):
+    collector = NetworkCollector()
+    collector.add("badword", [_exchange("http://fess/admin/", "/admin/", 50.0)])
+    collector.add("label", [])
+    path = tmp_path / "test_network.json"
+    collector.save_json(str(path))
+    report = json.loads(path.read_text(encoding="utf-8"))
+    assert list(report["modules"]) == ["badword"]
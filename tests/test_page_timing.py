@@ -0,0 +1,71 @@
+"""Tests for per-route page timing.
+
+Routes are the unit regressions are reported against, so two URLs of the
+same page must land on one route and two different pages must not.
+"""
+import json
+
+from fess.test.page_timing import (NavigationRecorder, NavigationTiming,
+                                   PageTimingCollector, normalize_route)
+
+
+def test_identifiers_are_replaced_and_collapsed():
+    assert normalize_route(
+        "http://fess:8080/admin/labeltype/details/4/AYx3kP0bQ1/") == "/admin/labeltype/details/{id}/"
+    assert normalize_route(
+        "http://fess/admin/dict/kuromoji/details/amEva3Vyb21vamkudHh0/4/5") \
+        == "/admin/dict/kuromoji/details/{id}"
+
+
+def test_query_string_and_words_are_kept_apart():
+    assert normalize_route("http://fess/search/?q=fess&start=20") == "/search/"
+    assert normalize_route("http://fess/admin/labeltype/createnew/") == "/admin/labeltype/createnew/"
+    assert normalize_route("http://fess/css/admin/style.css") == "/css/admin/style.css"
+    assert normalize_route("http://fess/api/v1/documents?q=*") == "/api/v1/documents"
+
+
+def _timing(route: str, load: float) -> NavigationTiming:
+    return NavigationTiming(route=route, url=f"http://fess{route}", ttfb=10.0,
+                            dcl=load / 2, load=load, fcp=None, transfer_size=1000)
+
+
+def test_route_regression_against_recent_runs(tmp_path):
+    path = tmp_path / "test_page_timing_history.json"
+    path.write_text(json.dumps([
+        {"routes": {"/admin/": {"load": 100.0}, "/search/": {"load": 200.0}}},
+    ]), encoding="utf-8")
+    collector = PageTimingCollector(history_file=str(path))
+    collector.add([_timing("/admin/", 400.0), _timing("/search/", 210.0)])
+    collector.save_history()
+    assert collector.detect_regressions() == ["/admin/"]
+
+
+def test_route_summary_skips_missing_fields():
+    collector = PageTimingCollector()
+    collector.add([_timing("/admin/", 100.0), _timing("/admin/", 300.0)])
+    stats = collector.get_route_summary()["/admin/"]
+    assert stats["samples"] == 2 and stats["load"] == 200.0
+    assert "fcp" not in stats
+
+
+class _FakePage:
+    def __init__(self, origin: float):
+        self.origin = origin
+
+    def evaluate(self, script, arg):
+        if arg["lastOrigin"] == self.origin:
+            return None
+        return {"origin": self.origin, "url": "http://fess/admin/", "ttfb": 12.34,
+                "dcl": 50.0, "load": 80.0, "fcp": 40.0, "transfer_size": 2048}
+
+
+def test_recorder_records_each_document_once():
+    recorder = NavigationRecorder()
+    recorder.enabled = True
+    page = _FakePage(origin=1.0)
+    assert recorder.record(page).ttfb == 12.3
+    # A click that did not navigate leaves the same document in place.
+    assert recorder.record(page) is None
+    page.origin = 2.0
+    assert recorder.record(page) is not None
+    assert len(recorder.take()) == 2
@@ -0,0 +1,58 @@
+"""Tests for the test module registry.
+
+The names are what TEST_MODULES, the metrics history and the shard plans
+key on, so the discovered names must stay the ones main.py always used, and
+selecting one module must import only that one.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from fess.test import registry
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def test_discovered_names_keep_their_historical_form():
+    names = registry.available()
+    assert names["badword"] == "fess.test.ui.admin.badword"
+    assert names["synonym"] == "fess.test.ui.admin.dict.synonym"
+    assert names["general"] == "fess.test.ui.admin.general"
+    assert names["storage"] == "fess.test.ui.admin.general.storage"
+    assert names["backup_download"] == "fess.test.ui.admin.sysinfo.backup_download"
+    assert names["crawling_config"] == "fess.test.ui.admin.wizard.crawling_config"
+    assert names["integration"] == "fess.test.ui.integration"
+    assert names["crawler_workflow"] == "fess.test.ui.integration.crawler_workflow"
+    assert names["search_seed"] == "fess.test.ui.search.seed"
+
+
+def test_helpers_are_not_test_modules():
+    paths = registry.available().values()
+    assert not [p for p in paths if p.rsplit(".", 1)[-1].startswith("_")]
+
+
+def test_default_order_names_only_registered_modules():
+    assert len(set(registry.DEFAULT_ORDER)) == len(registry.DEFAULT_ORDER)
+    assert set(registry.DEFAULT_ORDER) <= set(registry.available())
+    assert "search_benchmark" not in registry.DEFAULT_ORDER
+
+
+def test_selecting_one_leaf_imports_only_that_leaf():
+    script = ("import sys; from fess.test import registry; "
+              "registry.load(['storage']); "
+              "print(sorted(m for m in sys.modules if m.startswith('fess.test.ui.admin.')))")
+    out = subprocess.run([sys.executable, "-c", script], cwd=SRC, check=True,
+                         capture_output=True, text=True).stdout
+    assert eval(out) == ["fess.test.ui.admin.general", "fess.test.ui.admin.general.storage"]
+
+
+def test_a_name_claimed_twice_is_refused(monkeypatch):
+    monkeypatch.setattr(registry, "EXPLICIT", {"storage": "fess.test.ui.other.storage"})
+    registry.available.cache_clear()
+    try:
+        with pytest.raises(ValueError, match="storage"):
+            registry.available()
+    finally:
+        registry.available.cache_clear()
@@ -0,0 +1,94 @@
+"""Tests for main.run_module()'s failure path.
+
+An errored module is one result among many: whatever the diagnostics after
+it trip over -- here the page the memory checkpoint recycled -- must not
+escape run_module() and end the run.
+"""
+import logging
+import types
+
+import main
+from fess.test.metrics import MetricsCollector
+from fess.test.result import ResultCollector
+
+
+class _Page:
+    url = "http://fess/admin/"
+
+    def __init__(self):
+        self.closed = False
+
+    def screenshot(self, path):
+        pass
+
+    def content(self):
+        if self.closed:
+            raise RuntimeError("Target page, context or browser has been closed")
+        return "<html></html>"
+
+
+class _Recorder:
+    def take(self):
+        return []
+
+
+class _Pacer:
+    def set_module_profile(self, profile):
+        pass
+
+    def reset(self):
+        return 0.0
+
+
+class _Capture:
+    def capture_on_failure(self, page, message):
+        pass
+
+
+class _Context:
+    def __init__(self):
+        self.page = _Page()
+        self.pacer = _Pacer()
+        self.navigations = _Recorder()
+        self.network = _Recorder()
+        self.html_capture = _Capture()
+
+    def start_module_trace(self, name):
+        pass
+
+    def stop_module_trace(self, save, status):
+        return None
+
+    def take_action_timings(self):
+        return []
+
+    def get_current_page(self):
+        return None if self.page.closed else self.page
+
+    def memory_checkpoint(self):
+        # The module grew the page past the thresholds: recycle it
+        self.page.closed = True
+        return None
+
+
+def _errored_module():
+    module = types.ModuleType("fess.test.ui.search.broken")
+
+    def run(context):
+        raise TimeoutError("Timeout 30000ms exceeded")
+
+    module.run = run
+    return module
+
+
+def test_an_errored_module_whose_page_is_recycled_is_recorded(tmp_path, monkeypatch, caplog):
+    monkeypatch.chdir(tmp_path)
+    caplog.set_level(logging.DEBUG, logger="main")
+    context = _Context()
+    collector = ResultCollector()
+    assert main.run_module(context, _errored_module(), collector,
+                           MetricsCollector(str(tmp_path / "history.json"))) is False
+    assert [(r.module, r.status, r.error_type) for r in collector.results] == [
+        ("broken", "error", "TimeoutError")]
+    assert context.page.closed
+    assert "Page content:\n<html></html>" in caplog.text
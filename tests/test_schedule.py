@@ -0,0 +1,178 @@
+"""Tests for the lock-aware module scheduler.
+
+Which modules may overlap is decided entirely from their READS/WRITES/AFTER
+declarations, and a wrong edge shows up only as a rare, unreproducible red in
+some unrelated module. That logic is pure Python, so it is pinned here.
+"""
+import sys
+import threading
+import types
+
+import pytest
+
+from fess.test.schedule import (EXCLUSIVE, ModuleLocks, ModuleScheduler,
+                                build_predecessors, locks_of, plan_shards)
+
+
+def _module(name: str, **declarations) -> types.ModuleType:
+    module = types.ModuleType(name)
+    for attr, value in declarations.items():
+        setattr(module, attr, value)
+    return module
+
+
+def _locks(name: str, reads=(), writes=(), after=()) -> ModuleLocks:
+    return ModuleLocks(name=name, reads=frozenset(reads),
+                       writes=frozenset(writes), after=frozenset(after))
+
+
+def test_readers_do_not_conflict():
+    assert not _locks("a", reads={"index"}).conflicts_with(_locks("b", reads={"index"}))
+
+
+def test_writer_conflicts_with_reader_both_ways():
+    writer = _locks("seed", writes={"index"})
+    reader = _locks("query", reads={"index"})
+    assert writer.conflicts_with(reader)
+    assert reader.conflicts_with(writer)
+
+
+def test_writers_of_different_resources_do_not_conflict():
+    assert not _locks("a", writes={"badword"}).conflicts_with(_locks("b", writes={"keymatch"}))
+
+
+def test_exclusive_conflicts_with_a_module_that_declares_nothing_shared():
+    assert _locks("general", writes={EXCLUSIVE}).conflicts_with(_locks("b", reads={"x"}))
+
+
+def test_undeclared_module_is_exclusive():
+    """Forgetting a declaration must cost speed, never correctness."""
+    assert locks_of(_module("fess.test.ui.e2e_undeclared")).writes == {EXCLUSIVE}
+
+
+def test_leaf_inherits_its_composers_declarations(monkeypatch):
+    """TEST_MODULES=storage names a leaf that declares nothing itself."""
+    package = _module("fess.test.ui.e2e_pkg", WRITES=("general-settings",))
+    monkeypatch.setitem(sys.modules, package.__name__, package)
+    leaf = _module("fess.test.ui.e2e_pkg.leaf")
+    assert locks_of(leaf).writes == {"general-settings"}
+
+
+def test_conflicting_modules_keep_their_listed_order():
+    locks = [_locks("seed", writes={"index"}), _locks("query", reads={"index"}),
+             _locks("badword", writes={"badword"})]
+    assert build_predecessors(locks) == [set(), {0}, set()]
+
+
+def test_after_adds_an_edge_locks_cannot_express():
+    locks = [_locks("integration", writes={"a"}),
+             _locks("wizard", writes={"b"}, after={"integration"})]
+    assert build_predecessors(locks) == [set(), {0}]
+
+
+def test_after_a_module_outside_the_run_is_ignored():
+    locks = [_locks("wizard", writes={"b"}, after={"integration"})]
+    assert build_predecessors(locks) == [set()]
+
+
+def test_after_cycle_is_rejected_at_plan_time():
+    locks = [_locks("a", writes={"x"}, after={"b"}), _locks("b", writes={"y"}, after={"a"})]
+    with pytest.raises(ValueError, match="cycle"):
+        build_predecessors(locks)
+
+
+def test_scheduler_withholds_a_module_until_its_predecessor_finishes():
+    seed = _module("e2e.seed", WRITES=("index",))
+    query = _module("e2e.query", READS=("index",))
+    badword = _module("e2e.badword", WRITES=("badword",))
+    scheduler = ModuleScheduler([seed, query, badword])
+
+    assert scheduler.acquire() == 0
+    # query is blocked on seed, so the next free module is badword.
+    assert scheduler.acquire() == 2
+    scheduler.release(0)
+    assert scheduler.acquire() == 1
+    scheduler.release(1)
+    scheduler.release(2)
+    assert scheduler.acquire() is None
+
+
+def test_scheduler_never_runs_conflicting_modules_together():
+    modules = [_module(f"e2e.m{i}", WRITES=("shared",) if i % 2 else (f"own{i}",))
+               for i in range(8)]
+    scheduler = ModuleScheduler(modules)
+    running = set()
+    overlaps = []
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            index = scheduler.acquire()
+            if index is None:
+                return
+            with lock:
+                overlaps.extend(
+                    (index, other) for other in running
+                    if scheduler.locks[index].conflicts_with(scheduler.locks[other]))
+                running.add(index)
+            with lock:
+                running.discard(index)
+            scheduler.release(index)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert overlaps == []
+    assert scheduler.unstarted() == []
+
+
+def _simulate(predecessors, plan):
+    """Run the shard lists the way the worker processes do and report
+    whether every shard could finish (no circular cross-shard wait)."""
+    done = set()
+    heads = [0] * len(plan.shards)
+    progress = True
+    while progress:
+        progress = False
+        for s, indices in enumerate(plan.shards):
+            if heads[s] < len(indices) and predecessors[indices[heads[s]]] <= done:
+                done.add(indices[heads[s]])
+                heads[s] += 1
+                progress = True
+    return len(done) == len(predecessors)
+
+
+def test_plan_shards_places_every_module_once():
+    predecessors = [set(), set(), {0}, set(), {1, 2}]
+    plan = plan_shards(predecessors, 3)
+    assert sorted(i for shard in plan.shards for i in shard) == [0, 1, 2, 3, 4]
+
+
+def test_plan_shards_spreads_independent_modules():
+    plan = plan_shards([set()] * 4, 2)
+    assert [len(shard) for shard in plan.shards] == [2, 2]
+    assert plan.predicted == [2.0, 2.0]
+
+
+def test_plan_shards_cross_shard_waits_cannot_deadlock():
+    # seed -> many readers, plus an exclusive module at the end.
+    predecessors = [set()] + [{0}] * 6 + [set(range(7))]
+    for shards in (2, 3, 5):
+        assert _simulate(predecessors, plan_shards(predecessors, shards))
+
+
+def test_plan_shards_starts_the_longest_module_first():
+    """LPT: with one 10s module and four 2s ones on two shards, the 10s one
+    must not be left for last (which would give a 14s shard)."""
+    plan = plan_shards([set()] * 5, 2, estimates=[2.0, 2.0, 2.0, 2.0, 10.0])
+    assert plan.shards[0][0] == 4
+    assert max(plan.predicted) == 10.0
+
+
+def test_scheduler_hands_out_the_longest_ready_module_first():
+    modules = [_module(f"e2e.m{i}", WRITES=(f"own{i}",)) for i in range(3)]
+    scheduler = ModuleScheduler(modules, estimates=[1.0, 5.0, 3.0])
+    assert [scheduler.acquire() for _ in range(3)] == [1, 2, 0]
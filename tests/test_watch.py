@@ -0,0 +1,75 @@
+"""Tests for watch mode's change detection and reloading.
+
+A throwaway package on disk stands in for fess.test.ui: what is pinned is
+which modules an edit reloads, in which order, and that a leaf sees the
+edited helper afterwards -- the part that decides what watch mode re-runs.
+"""
+import os
+import sys
+import textwrap
+
+import pytest
+
+from fess.test import watch
+
+PACKAGE = "watchpkg"
+
+
+def _write(path, source):
+    path.write_text(textwrap.dedent(source))
+    # Force a visible mtime change even on coarse file systems.
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    root = tmp_path / PACKAGE
+    root.mkdir()
+    _write(root / "__init__.py", "")
+    _write(root / "_helper.py", "VALUE = 1\n")
+    _write(root / "leaf.py", """
+        from watchpkg import _helper
+
+        def run():
+            return _helper.VALUE
+    """)
+    _write(root / "other.py", "def run():\n    return 'other'\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    import watchpkg.leaf  # noqa: F401
+    import watchpkg.other  # noqa: F401
+    yield root
+    for name in [n for n in sys.modules if n == PACKAGE or n.startswith(PACKAGE + ".")]:
+        del sys.modules[name]
+
+
+def test_changed_lists_added_and_modified_files(package):
+    before = watch.snapshot(package)
+    _write(package / "leaf.py", "def run():\n    return 2\n")
+    _write(package / "new.py", "")
+    assert watch.changed(before, watch.snapshot(package)) == [package / "leaf.py",
+                                                              package / "new.py"]
+
+
+def test_module_names_follow_the_layout(package):
+    assert watch.module_name(package / "leaf.py", package, PACKAGE) == "watchpkg.leaf"
+    assert watch.module_name(package / "__init__.py", package, PACKAGE) == "watchpkg"
+
+
+def test_an_edited_helper_reloads_its_users_after_it(package):
+    order = watch.dependents({"watchpkg._helper"}, package=PACKAGE)
+    assert order.index("watchpkg._helper") < order.index("watchpkg.leaf")
+    assert "watchpkg.other" not in order
+
+
+def test_reloaded_leaf_sees_the_edit(package):
+    _write(package / "_helper.py", "VALUE = 2\n")
+    reloaded = watch.reload_changed([package / "_helper.py"], package, PACKAGE)
+    assert "watchpkg.leaf" in reloaded
+    assert sys.modules["watchpkg.leaf"].run() == 2
+
+
+def test_a_broken_edit_reloads_nothing(package):
+    _write(package / "other.py", "def run(:\n")
+    assert watch.reload_changed([package / "other.py"], package, PACKAGE) == []
+    assert sys.modules["watchpkg.other"].run() == "other"
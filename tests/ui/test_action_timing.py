@@ -0,0 +1,36 @@
+"""Tests for per-action timing in PageWrapper.
+
+The timings are how a slow module is broken down into navigation, slow
+selectors and timeouts, so a call that goes unrecorded -- in particular one
+that failed -- would hide exactly the time being looked for.
+"""
+import pytest
+
+from fess.test.ui.context import PageWrapper
+
+
+class _FakePage:
+    def click(self, selector, **kwargs):
+        if selector == "#missing":
+            raise TimeoutError("Timeout 3000ms exceeded")
+
+    def goto(self, url, **kwargs):
+        return None
+
+
+def test_each_call_is_timed_with_its_target():
+    timings = []
+    wrapper = PageWrapper(_FakePage(), timings=timings)
+    wrapper.goto("http://fess/admin/")
+    wrapper.click('text=Create')
+    assert [(t.action, t.target, t.ok) for t in timings] == [
+        ("goto", "http://fess/admin/", True),
+        ("click", 'text="Create"', True),
+    ]
+
+
+def test_failed_call_is_recorded_as_failed():
+    timings = []
+    with pytest.raises(TimeoutError):
+        PageWrapper(_FakePage(), timings=timings).click("#missing")
+    assert [(t.action, t.ok) for t in timings] == [("click", False)]
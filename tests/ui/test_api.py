@@ -0,0 +1,130 @@
+"""Tests for the pooled Fess API client.
+
+Every seed/backup poll goes through FessApiClient.search(), so a client that
+re-probes the API version or re-reads the cookie jar on each call quietly
+doubles the cost of every wait in the suite.
+"""
+import pytest
+import requests
+
+from fess.test.ui import api
+from fess.test.ui.api import FessApiClient
+
+
+class _FakeResponse:
+    def __init__(self, url, status=200, body=None):
+        self.url = url
+        self.status_code = status
+        self._body = body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} for {self.url}")
+
+    def json(self):
+        if self._body is None:
+            raise ValueError("not JSON")
+        return self._body
+
+
+class _FakeSession:
+    """Answers by path prefix; records every call."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+        self.cookies = requests.cookies.RequestsCookieJar()
+
+    def request(self, method, url, **kwargs):
+        self.calls.append(url)
+        for prefix, make in self.routes.items():
+            if prefix in url:
+                return make(url)
+        return _FakeResponse(url, status=404)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_version_cache(monkeypatch):
+    monkeypatch.setattr(api, "_search_versions", {})
+
+
+def _client(routes, cookies=None):
+    reads = []
+
+    def cookie_source():
+        reads.append(1)
+        return cookies or [{"name": "JSESSIONID", "value": "abc", "domain": "fess"}]
+
+    timings = []
+    client = FessApiClient("http://fess", cookie_source, timings)
+    client._session = _FakeSession(routes)
+    return client, reads, timings
+
+
+def test_search_probes_v2_once_then_goes_straight_to_v1():
+    client, _, _ = _client({
+        "/api/v1/documents": lambda url: _FakeResponse(url, body={"record_count": 7}),
+    })
+    assert client.search("*")["record_count"] == 7
+    assert client.search("*")["record_count"] == 7
+    assert [u.split("?")[0] for u in client._session.calls] == [
+        "http://fess/api/v2/search", "http://fess/api/v1/documents",
+        "http://fess/api/v1/documents"]
+
+
+def test_search_unwraps_the_v2_envelope():
+    client, _, _ = _client({
+        "/api/v2/search": lambda url: _FakeResponse(
+            url, body={"response": {"record_count": 3, "data": [{"title": "a"}]}}),
+    })
+    assert client.search("*") == {"record_count": 3, "data": [{"title": "a"}]}
+
+
+def test_cookies_are_read_once_per_browser_session():
+    client, reads, _ = _client({"/api/": lambda url: _FakeResponse(url, body={})})
+    client.get("/api/v1/documents?q=*")
+    client.get("/api/v1/documents?q=*")
+    assert len(reads) == 1
+    assert client._session.cookies.get("JSESSIONID") == "abc"
+    client.invalidate_session()
+    client.get("/api/v1/documents?q=*")
+    assert len(reads) == 2
+
+
+def test_a_login_bounce_resyncs_cookies_and_retries_once():
+    answers = iter([_FakeResponse("http://fess/login/", body=None),
+                    _FakeResponse("http://fess/api/admin/x", body={"ok": True})])
+    client, reads, _ = _client({"/api/admin/": lambda url: next(answers)})
+    assert client.get("/api/admin/x") == {"ok": True}
+    assert len(reads) == 2
+
+
+def test_calls_are_timed_per_endpoint():
+    client, _, timings = _client({"/api/": lambda url: _FakeResponse(url, status=500)})
+    with pytest.raises(requests.HTTPError):
+        client.get("/api/v1/documents?q=*")
+    assert [(t.action, t.target, t.ok) for t in timings] == [
+        ("api_get", "/api/v1/documents", False)]
+
+
+def test_a_persistent_login_bounce_raises():
+    client, reads, _ = _client({
+        "/admin/": lambda url: _FakeResponse("http://fess/login/?redirect=x", body=None)})
+    with pytest.raises(requests.HTTPError, match="login page"):
+        client.get_html("/admin/joblog/")
+    assert len(reads) == 2
+
+
+@pytest.mark.parametrize("base_url", ["http://fesstest01:8080", "http://localhost:8080",
+                                      "http://fess.example.com"])
+def test_browser_cookies_are_sent_to_a_dotless_host(base_url):
+    host = base_url.split("//")[1].split(":")[0]
+    # What Playwright reports for a host-only session cookie
+    client = FessApiClient(base_url, lambda: [
+        {"name": "JSESSIONID", "value": "abc", "domain": host, "path": "/"}])
+
+    for session_client in (client, client.fork()):
+        session_client._sync_cookies()
+        request = requests.Request("GET", session_client.url("/admin/joblog/")).prepare()
+        assert requests.cookies.get_cookie_header(
+            session_client._session.cookies, request) == "JSESSIONID=abc"
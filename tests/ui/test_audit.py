@@ -0,0 +1,168 @@
+"""Tests for the shared in-page audit.
+
+A fake page answers AUDIT_SCRIPT with canned findings per path: what is
+pinned is one navigation and one evaluate per page, that a second module
+reuses the first one's audits, that asking for a new label looks again, and
+that the error listeners and buffer are installed once per page -- and
+again when a page turns up without them -- and that what the listeners hear
+during a visit is merged into that page's errors.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from fess.test.ui.search import _audit, console_errors, i18n_smoke, layout_overflow
+
+
+def _found(errors=(), labels=(), **findings):
+    found = {"overflow": [], "overflowCount": 0, "offscreen": [], "offscreenCount": 0,
+             "missingKeys": [], "missingKeyCount": 0, "residue": [], "residueCount": 0,
+             "errors": list(errors), "labels": {label: True for label in labels}}
+    found.update(findings)
+    return found
+
+
+class _Page:
+    def __init__(self, findings):
+        self.findings = findings
+        self.url = None
+        self.init_scripts = 0
+        self.listeners = {}
+        self.visits = []
+        self.evaluates = 0
+
+    @property
+    def _page(self):
+        return self
+
+    def add_init_script(self, script):
+        self.init_scripts += 1
+
+    def on(self, event, handler):
+        self.listeners.setdefault(event, []).append(handler)
+
+    def goto(self, url):
+        self.url = url
+        path = url.split("http://fess", 1)[1]
+        self.visits.append(path)
+        # What the browser reports while the page loads
+        for text in self.findings.get(path, {}).get("console", ()):
+            for handler in self.listeners.get("console", ()):
+                handler(SimpleNamespace(type="error", text=text))
+            for handler in self.listeners.get("console", ()):
+                handler(SimpleNamespace(type="warning", text="not an error"))
+
+    def wait_for_load_state(self, state, timeout=None):
+        pass
+
+    def evaluate(self, script, arg):
+        self.evaluates += 1
+        path = self.url.split("http://fess", 1)[1]
+        findings = {key: value for key, value in self.findings.get(path, {}).items()
+                    if key != "console"}
+        found = _found(**findings)
+        found["labels"] = {label: label in found["labels"] for label in arg["labels"]}
+        if not self.init_scripts:
+            found["errors"] = None
+        return found
+
+
+class _Context:
+    lang = "en"
+
+    def __init__(self, findings=None):
+        self.page = _Page(findings or {})
+
+    def url(self, path):
+        return "http://fess" + path
+
+    def get_wrapped_page(self):
+        return self.page
+
+
+@pytest.fixture(autouse=True)
+def fresh(monkeypatch):
+    monkeypatch.setattr(_audit, "_audits", {})
+    monkeypatch.setattr(_audit, "_instrumented", {})
+    monkeypatch.setattr(i18n_smoke, "t", lambda key: key)
+
+
+def test_one_visit_and_one_evaluate_per_page():
+    context = _Context()
+    audits = _audit.audit_pages(context, ["/search/", "/admin/"])
+    assert list(audits) == ["/search/", "/admin/"]
+    assert context.page.visits == ["/search/", "/admin/"]
+    assert context.page.evaluates == 2 and context.page.init_scripts == 1
+
+
+def test_the_three_modules_share_their_visits():
+    context = _Context({"/admin/": {"labels": ["labels.menu_dashboard_config"]}})
+    layout_overflow.run(context)
+    i18n_smoke.run(context)
+    console_errors.run(context)
+    # i18n_smoke asks for a label the layout audits did not look for, so it
+    # looks at /search/ and /admin/ again; console_errors adds its own pages.
+    assert sorted(context.page.visits) == sorted(
+        layout_overflow.PAGES_TO_CHECK + ["/search/", "/admin/", "/", "/help/", "/admin/badword/"])
+    assert context.page.init_scripts == 1
+
+
+def test_a_recent_audit_with_the_labels_is_reused():
+    context = _Context({"/admin/": {"labels": ["Dashboard"]}})
+    _audit.audit_pages(context, ["/admin/"], labels=["Dashboard"])
+    audits = _audit.audit_pages(context, ["/admin/"])
+    assert audits["/admin/"].labels == {"Dashboard": True}
+    assert context.page.visits == ["/admin/"]
+
+
+def test_an_expired_audit_is_redone(monkeypatch):
+    context = _Context()
+    _audit.audit_pages(context, ["/admin/"])
+    monkeypatch.setattr(_audit, "AUDIT_TTL", 0.0)
+    _audit.audit_pages(context, ["/admin/"])
+    assert context.page.visits == ["/admin/", "/admin/"]
+
+
+def test_a_page_without_the_buffer_is_instrumented_and_audited_again():
+    context = _Context()
+    # Another page once had this id() and was instrumented
+    _audit._instrumented[id(context.page)] = []
+    audits = _audit.audit_pages(context, ["/search/"])
+    assert audits["/search/"].errors == []
+    assert len(context.page.listeners["pageerror"]) == 1
+    assert context.page.init_scripts == 1 and context.page.visits == ["/search/", "/search/"]
+
+
+def test_findings_fail_the_modules():
+    context = _Context({
+        "/admin/scheduler/": {"offscreen": ["Start"], "offscreenCount": 1},
+        "/search/": {"missingKeys": ["???labels.x???"], "missingKeyCount": 1},
+        "/help/": {"errors": ["resource: http://fess/css/favicon.ico",
+                              "pageerror: x is not defined"]},
+    })
+    with pytest.raises(AssertionError, match="/admin/scheduler/: 1 elements off-screen"):
+        layout_overflow.run(context)
+    with pytest.raises(AssertionError, match=r"on /search/: \['\?\?\?labels.x\?\?\?'\]"):
+        i18n_smoke.run(context)
+    with pytest.raises(AssertionError, match=r"JS errors detected: \['pageerror: x is not defined'\]"):
+        console_errors.run(context)
+
+
+def test_a_missing_label_fails_i18n_smoke():
+    context = _Context({"/search/": {"labels": ["labels.menu_dashboard_config"]}})
+    with pytest.raises(AssertionError, match="not found on /admin/"):
+        i18n_smoke.run(context)
+
+
+def test_the_browser_console_is_merged_into_the_errors():
+    status_500 = ("Failed to load resource: the server responded with a status "
+                  "of 500 (Internal Server Error)")
+    context = _Context({"/admin/": {"console": [status_500],
+                                    "errors": ["resource: http://fess/js/admin.js"]}})
+    audits = _audit.audit_pages(context, ["/search/", "/admin/"])
+    # Heard on /admin/ only, each console error once, the warning dropped
+    assert audits["/search/"].errors == []
+    assert audits["/admin/"].errors == [f"console.error: {status_500}",
+                                        "resource: http://fess/js/admin.js"]
+    with pytest.raises(AssertionError, match="status of 500"):
+        console_errors.run(context)
@@ -0,0 +1,146 @@
+"""Tests for the warm browser server's health checks and restarts.
+
+No browser here: the server is stood in for by a listening socket, which is
+all the health check looks at, and the launch itself is replaced. What is
+pinned is when a recorded server is reused and when it is replaced.
+"""
+import json
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+
+from fess.test.ui import browser_server
+
+
+@pytest.fixture
+def listener():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        s.listen()
+        yield f"ws://127.0.0.1:{s.getsockname()[1]}/token"
+
+
+@pytest.fixture
+def state_file(monkeypatch, tmp_path):
+    path = tmp_path / "browser_server.json"
+    monkeypatch.setenv("BROWSER_SERVER_STATE", str(path))
+    monkeypatch.setenv("HEADLESS", "true")
+    return path
+
+
+@pytest.fixture
+def launches(monkeypatch, listener):
+    started, killed = [], []
+
+    def start():
+        state = {"endpoint": listener, "pid": 1, "headless": True}
+        started.append(state)
+        return state
+    monkeypatch.setattr(browser_server, "_start", start)
+    monkeypatch.setattr(browser_server, "_kill", killed.append)
+    return started, killed
+
+
+def test_health_needs_a_listening_port_and_the_same_headless(listener, state_file):
+    assert browser_server.is_healthy({"endpoint": listener, "headless": True})
+    assert not browser_server.is_healthy({"endpoint": listener, "headless": False})
+    assert not browser_server.is_healthy(None)
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        closed = f"ws://127.0.0.1:{s.getsockname()[1]}/token"
+    assert not browser_server.is_healthy({"endpoint": closed, "headless": True})
+
+
+def test_a_healthy_server_is_reused(listener, state_file, launches):
+    state_file.write_text(json.dumps({"endpoint": listener, "pid": 7, "headless": True}))
+    assert browser_server.endpoint() == listener
+    assert launches == ([], [])
+
+
+def test_a_dead_server_is_killed_and_replaced(listener, state_file, launches):
+    dead = {"endpoint": "ws://127.0.0.1:1/token", "pid": 7, "headless": True}
+    state_file.write_text(json.dumps(dead))
+    assert browser_server.endpoint() == listener
+    started, killed = launches
+    assert len(started) == 1 and killed == [dead]
+
+
+class _Chromium:
+    def __init__(self, failures):
+        self.failures = failures
+        self.endpoints = []
+
+    def connect(self, endpoint, timeout):
+        self.endpoints.append(endpoint)
+        if len(self.endpoints) <= self.failures:
+            raise PlaywrightError("WebSocket error")
+        return "browser"
+
+
+class _Playwright:
+    def __init__(self, failures):
+        self.chromium = _Chromium(failures)
+
+
+def test_a_failed_connect_to_a_healthy_server_retries_it(listener, state_file, launches):
+    """Other shards may be connected to it: it is not killed."""
+    state_file.write_text(json.dumps({"endpoint": listener, "pid": 7, "headless": True}))
+    playwright = _Playwright(failures=1)
+    assert browser_server.connect(playwright) == "browser"
+    assert playwright.chromium.endpoints == [listener, listener]
+    assert launches == ([], [])
+
+    with pytest.raises(PlaywrightError):
+        browser_server.connect(_Playwright(failures=2))
+
+
+def test_a_server_that_died_during_the_connect_is_replaced(listener, state_file, launches):
+    dead = {"endpoint": "ws://127.0.0.1:1/token", "pid": 7, "headless": True}
+
+    class _Dying(_Chromium):
+        def connect(self, endpoint, timeout):
+            # The first connect finds the server, which then goes away
+            state_file.write_text(json.dumps(dead))
+            return super().connect(endpoint, timeout)
+
+    state_file.write_text(json.dumps({"endpoint": listener, "pid": 7, "headless": True}))
+    playwright = _Playwright(failures=1)
+    playwright.chromium = _Dying(failures=1)
+    assert browser_server.connect(playwright) == "browser"
+    started, killed = launches
+    assert len(started) == 1 and killed == [dead]
+
+
+@pytest.fixture
+def server_process():
+    """A process whose command line looks like the server's"""
+    config = "/tmp/tmpserver.json"
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)",
+                                "launch-server", "--config", config],
+                               start_new_session=True)
+    # Until it has exec'd, /proc shows the forking test process instead
+    deadline = time.time() + 5
+    while (b"launch-server" not in open(f"/proc/{process.pid}/cmdline", "rb").read()
+           and time.time() < deadline):
+        time.sleep(0.01)
+    yield {"endpoint": "ws://127.0.0.1:1/token", "pid": process.pid,
+           "headless": True, "config": config}, process
+    process.kill()
+    process.wait()
+
+
+def test_only_the_recorded_server_is_signalled(server_process):
+    state, process = server_process
+    # Same pid, other config: the pid was reused by another launch
+    browser_server._kill({**state, "config": "/tmp/other.json"})
+    # An old state file without the config
+    browser_server._kill({key: value for key, value in state.items() if key != "config"})
+    assert process.poll() is None
+
+    browser_server._kill(state)
+    assert process.wait(timeout=5) == -15
@@ -0,0 +1,83 @@
+"""Tests for search/seed's bulk-load path.
+
+The bulk documents replace what the crawler would index, so the fields the
+search modules assert on -- labels, has_cache, the og:image thumbnail --
+and the set of pages reached must match the crawl. The walk runs against
+the real sampledata content served from a local HTTP server.
+"""
+import functools
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from fess.test.ui.search import _bulk_seed, seed
+
+CONTENT = Path(__file__).resolve().parents[2] / "sampledata" / "content"
+
+LABEL_PATHS = {
+    "e2e_label_a": "http://sampledata01/docs/labels/a/.*",
+    "e2e_label_b": "http://sampledata01/docs/labels/b/.*",
+}
+
+
+@pytest.fixture
+def sampledata_url():
+    class _Quiet(SimpleHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0),
+                                 functools.partial(_Quiet, directory=str(CONTENT)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+
+
+def test_label_pages_carry_their_label_value():
+    html = (CONTENT / "docs/labels/a/1.html").read_text(encoding="utf-8")
+    doc = _bulk_seed.build_document("http://sampledata01/docs/labels/a/1.html",
+                                    "text/html", html, LABEL_PATHS)
+    assert doc["label"] == ["e2e_label_a"]
+    assert doc["title"] == "ラベルA ページ1"
+    assert "labelA" in doc["content"]
+    assert doc["lang"] == "ja"
+    assert doc["has_cache"] == "true" and doc["cache"] == html
+
+
+def test_og_image_becomes_the_thumbnail():
+    html = (CONTENT / "thumbnail/with_og.html").read_text(encoding="utf-8")
+    doc = _bulk_seed.build_document("http://sampledata01/thumbnail/with_og.html",
+                                    "text/html", html, LABEL_PATHS)
+    assert doc["thumbnail"] == "http://sampledata01/thumbnail/thumb.png"
+    assert "label" not in doc
+
+
+def test_only_html_gets_a_cached_copy():
+    doc = _bulk_seed.build_document("http://sampledata01/files/sample.txt",
+                                    "text/plain", "plain text", LABEL_PATHS)
+    assert "has_cache" not in doc
+    assert doc["filetype"] == "txt"
+
+
+def test_doc_id_is_stable_per_url():
+    assert (_bulk_seed.doc_id_for("http://sampledata01/")
+            == _bulk_seed.doc_id_for("http://sampledata01/"))
+    assert (_bulk_seed.doc_id_for("http://sampledata01/")
+            != _bulk_seed.doc_id_for("http://sampledata01/index.html"))
+
+
+def test_walk_reaches_the_pages_the_crawler_reaches(sampledata_url):
+    labels = {"a": f"{sampledata_url}docs/labels/a/.*"}
+    pages = _bulk_seed.fetch_pages(sampledata_url, f"{sampledata_url}.*",
+                                   seed.EXCLUDED_URLS)
+    documents = list(_bulk_seed.collect_documents(pages, labels))
+    urls = {doc["url"] for doc in documents}
+    assert f"{sampledata_url}docs/ja/intro.html" in urls
+    assert f"{sampledata_url}files/sample.txt" in urls
+    # pages/021-030 are not linked from anywhere, so the crawl never sees them.
+    assert f"{sampledata_url}pages/021.html" not in urls
+    assert len(urls) == len(documents) >= seed.SEED_MIN_DOCS
+    assert sum(1 for doc in documents if doc.get("label") == ["a"]) == 5
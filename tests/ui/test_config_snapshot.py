@@ -0,0 +1,201 @@
+"""Tests for the configuration snapshot restored between modules.
+
+A fake Fess serves the backup downloads from in-memory files: what is
+pinned is which documents a restore deletes, which it re-imports, what it
+leaves alone, and when the snapshot is retaken instead of restored.
+"""
+import json
+
+import pytest
+
+from fess.test.ui import config_snapshot
+from fess.test.ui.config_snapshot import (ConfigSnapshot, diff, parse_bulk,
+                                          parse_properties)
+
+WEB = ".fess_config.web_config"
+JOB_LOG = ".fess_config.job_log"
+
+
+def _bulk(*docs):
+    lines = []
+    for index, doc_id, source in docs:
+        lines.append(json.dumps({"index": {"_index": index, "_id": doc_id}}))
+        lines.append(json.dumps(source))
+    return "\n".join(lines) + "\n"
+
+
+class _Response:
+    def __init__(self, url, text, download=True):
+        self.url = url
+        self.content = text.encode("utf-8")
+        self.headers = ({"content-disposition": "attachment",
+                         "content-type": "application/octet-stream"} if download
+                        else {"content-type": "text/html;charset=UTF-8"})
+
+
+class _Api:
+    def __init__(self, files):
+        self.files = files
+        self.logged_in = True
+
+    def download(self, path):
+        url = f"http://fess{path}"
+        if not self.logged_in:
+            return _Response("http://fess/login/", "<form>", download=False)
+        target = path.rstrip("/").split("/")[-1]
+        if target not in self.files:
+            # The backup page re-rendered, as for any id it does not serve
+            return _Response(url, "<html>", download=False)
+        return _Response(url, self.files[target])
+
+
+class _Page:
+    def __init__(self, fess):
+        self.fess = fess
+
+    def goto(self, url):
+        pass
+
+    def wait_for_load_state(self, state):
+        pass
+
+    def set_input_files(self, selector, files):
+        self.fess.uploads.append((files["name"], files["buffer"].decode("utf-8")))
+
+    def click(self, selector):
+        name, content = self.fess.uploads[-1]
+        if name.endswith(".bulk"):
+            current = parse_bulk(self.fess.api.files[name])
+            current.update(parse_bulk(content))
+            self.fess.api.files[name] = "\n".join(
+                line for pair in current.values() for line in pair) + "\n"
+        else:
+            self.fess.api.files[name] = content
+
+
+class _Fess:
+    def __init__(self, files):
+        self.api = _Api(files)
+        self.uploads = []
+        self.deleted = []
+
+    def url(self, path):
+        return path
+
+    def get_wrapped_page(self):
+        return _Page(self)
+
+
+@pytest.fixture
+def fess(monkeypatch):
+    monkeypatch.setenv("CONFIG_SNAPSHOT_TARGETS", "fess_config.bulk,system.properties")
+    monkeypatch.setattr(config_snapshot.fixtures, "token", lambda context: "tok")
+    fess = _Fess({
+        "fess_config.bulk": _bulk((WEB, "w1", {"name": "sampledata"}),
+                                  (JOB_LOG, "j1", {"jobName": "crawl"})),
+        "system.properties": "#Sun Oct 18\nlogin.required=false\n",
+    })
+
+    def delete(context, resource, setting_id):
+        fess.deleted.append((resource, setting_id))
+        docs = parse_bulk(fess.api.files["fess_config.bulk"])
+        docs = {key: pair for key, pair in docs.items() if key[1] != setting_id}
+        fess.api.files["fess_config.bulk"] = "\n".join(
+            line for pair in docs.values() for line in pair) + "\n"
+
+    monkeypatch.setattr(config_snapshot.fixtures, "delete", delete)
+    return fess
+
+
+def test_properties_ignore_comments():
+    assert parse_properties("#Sun Oct 18\n! note\na.b=c=d\n") == {"a.b": "c=d"}
+
+
+def test_diff_sorts_changes_by_what_undoes_them():
+    saved = {"fess_config.bulk": parse_bulk(_bulk((WEB, "w1", {"name": "a"}),
+                                                  (WEB, "w2", {"name": "b"}),
+                                                  (JOB_LOG, "j1", {}))),
+             "system.properties": {"login.required": "false"}}
+    current = {"fess_config.bulk": parse_bulk(_bulk((WEB, "w1", {"name": "edited"}),
+                                                    (WEB, "w3", {"name": "new"}),
+                                                    (JOB_LOG, "j2", {}),
+                                                    (".fess_config.unknown", "u1", {}))),
+               "system.properties": {"login.required": "true", "added": "x"}}
+    drift = diff(saved, current)
+    assert [json.loads(source)["name"] for _, source in drift.reimport["fess_config.bulk"]] \
+        == ["a", "b"]
+    assert drift.deletable() == [(WEB, "w3")]
+    assert drift.properties
+    # Job logs are run-time state; an unknown type and an added key cannot be undone.
+    assert drift.unrestorable() == [".fess_config.unknown/u1", "system.properties:added"]
+
+
+def test_a_clean_module_restores_nothing(fess):
+    snapshot = ConfigSnapshot("module")
+    snapshot.take(fess)
+    fess.api.files["fess_config.bulk"] += _bulk((JOB_LOG, "j2", {"jobName": "crawl"}))
+    assert snapshot.restore(fess, "label")
+    assert fess.uploads == [] and fess.deleted == []
+
+
+def test_a_leak_is_deleted_and_an_edit_reimported(fess):
+    snapshot = ConfigSnapshot("module")
+    snapshot.take(fess)
+    fess.api.files["fess_config.bulk"] = _bulk((WEB, "w1", {"name": "edited"}),
+                                               (WEB, "w2", {"name": "leaked"}))
+    fess.api.files["system.properties"] = "login.required=true\n"
+
+    assert snapshot.restore(fess, "webconfig")
+    assert fess.deleted == [("webconfig", "w2")]
+    assert [name for name, _ in fess.uploads] == ["fess_config.bulk", "system.properties"]
+    assert parse_bulk(fess.api.files["fess_config.bulk"])[(WEB, "w1")][1] \
+        == json.dumps({"name": "sampledata"})
+    assert parse_properties(fess.api.files["system.properties"]) == {"login.required": "false"}
+
+
+def test_a_target_this_fess_does_not_serve_is_skipped(fess, monkeypatch):
+    monkeypatch.setenv("CONFIG_SNAPSHOT_TARGETS", "fess_basic_config.bulk,fess_config.bulk")
+    snapshot = ConfigSnapshot("module")
+    snapshot.take(fess)
+    assert snapshot._targets == ["fess_config.bulk"]
+
+
+def test_a_login_page_fails_the_snapshot(fess):
+    fess.api.logged_in = False
+    snapshot = ConfigSnapshot("module")
+    with pytest.raises(AssertionError, match="not a backup file"):
+        snapshot.take(fess)
+    assert snapshot._targets == ["fess_config.bulk", "system.properties"]
+
+
+def test_a_snapshot_of_no_target_fails(fess, monkeypatch):
+    monkeypatch.setenv("CONFIG_SNAPSHOT_TARGETS", "fess_basic_config.bulk")
+    with pytest.raises(AssertionError, match="nothing would be restored"):
+        ConfigSnapshot("module").take(fess)
+
+
+class _Module:
+    def __init__(self, name, keeps=False):
+        self.__name__ = f"fess.test.ui.{name}"
+        if keeps:
+            self.KEEPS_CONFIG = True
+
+
+def test_failure_mode_restores_only_after_a_failure(fess):
+    snapshot = ConfigSnapshot("failure")
+    snapshot.take(fess)
+    fess.api.files["fess_config.bulk"] += _bulk((WEB, "w9", {"name": "left"}))
+    snapshot.after_module(fess, _Module("label"), passed=True)
+    assert fess.deleted == []
+    snapshot.after_module(fess, _Module("label"), passed=False)
+    assert fess.deleted == [("webconfig", "w9")]
+
+
+def test_a_module_that_keeps_its_configuration_is_retaken(fess):
+    snapshot = ConfigSnapshot("module")
+    snapshot.take(fess)
+    fess.api.files["fess_config.bulk"] += _bulk((WEB, "w9", {"name": "seeded"}))
+    snapshot.after_module(fess, _Module("seed", keeps=True), passed=True)
+    assert fess.deleted == []
+    assert snapshot.restore(fess, "next")
+    assert fess.deleted == []
@@ -0,0 +1,196 @@
+"""Tests for the declarative admin CRUD engine.
+
+A fake admin screen stands in for Fess: list, createnew, details and the
+edit form, with LastaFlute's habit of answering every POST under the list
+URL. What is pinned is which page loads a run spends, that the validation
+cases share one form session, and that the row is followed through a
+rename to its delete.
+"""
+import re
+
+import pytest
+
+from fess.test.i18n.keys import Labels
+from fess.test.ui.admin import _crud
+from fess.test.ui.admin._crud import CrudRun, CrudSpec, Invalid
+
+LIST = "/admin/thing/"
+
+
+class _Locator:
+    def __init__(self, n):
+        self.n = n
+
+    def count(self):
+        return self.n
+
+
+class _AdminScreen:
+    """One admin resource: rows by id, the page on screen, the loads."""
+
+    def __init__(self):
+        self.rows = {}
+        self.url = "http://fess/admin/"
+        self.screen = "dashboard"
+        self.form = {}
+        self.current = None
+        self.rejected = False
+        self.loads = []
+
+    def _show(self, screen, path):
+        self.screen = screen
+        self.url = f"http://fess{path}"
+        self.loads.append(screen)
+
+    def goto(self, url):
+        path = url.split("http://fess", 1)[1]
+        if path.endswith("createnew/"):
+            self.form, self.rejected = {}, False
+            self._show("create", path)
+        elif "/details/4/" in path:
+            self.current = path.rstrip("/").split("/")[-1]
+            self._show("details", path)
+        else:
+            self._show("list", path)
+
+    def wait_for_load_state(self, state):
+        pass
+
+    def fill(self, selector, value):
+        self.form[re.search(r'name="(\w+)"', selector).group(1)] = value
+
+    select_option = fill
+
+    def eval_on_selector(self, selector, script):
+        self.form["sortOrder"] = "not-a-number"
+
+    def _valid(self):
+        return (all(self.form.get(name) for name in ("name",))
+                and all(len(value) <= 100 for value in self.form.values())
+                and self.form.get("sortOrder", "1").isdigit())
+
+    def click(self, selector):
+        if selector == f'button:has-text("{Labels.CRUD_BUTTON_CREATE}")':
+            self.rejected = not self._valid()
+            if not self.rejected:
+                self.rows[f"id{len(self.rows) + 1}"] = dict(self.form)
+            self._show("create" if self.rejected else "list", LIST)
+        elif selector == f"text={Labels.CRUD_BUTTON_EDIT}":
+            self.form = dict(self.rows[self.current])
+            self._show("edit", LIST)
+        elif selector == f"text={Labels.CRUD_BUTTON_BACK}":
+            self._show("details", LIST)
+        elif selector == f'button:has-text("{Labels.CRUD_BUTTON_UPDATE}")':
+            self.rows[self.current] = dict(self.form)
+            self._show("list", LIST)
+        elif selector == 'div.modal-footer button[name="delete"]':
+            del self.rows[self.current]
+            self._show("list", LIST)
+
+    def _listed(self):
+        return "\n".join(row["name"] for row in self.rows.values())
+
+    def inner_text(self, selector):
+        assert self.screen == "list", f"read the list on the {self.screen} page"
+        return self._listed()
+
+    def get_attribute(self, selector, attribute):
+        text = re.search(r'has-text\("(.*)"\)', selector).group(1)
+        for row_id, row in self.rows.items():
+            if self.screen == "list" and text in row["name"]:
+                return f"{LIST}details/4/{row_id}/"
+        return None
+
+    def input_value(self, selector):
+        return self.rows[self.current][re.search(r'name="(\w+)"', selector).group(1)]
+
+    def locator(self, selector):
+        if selector == _crud.ERROR_SELECTOR:
+            return _Locator(1 if self.rejected and self.screen == "create" else 0)
+        return _Locator(1)
+
+    def evaluate(self, script):
+        return False
+
+
+class _Context:
+    def __init__(self):
+        self.page = _AdminScreen()
+
+    def url(self, path):
+        return "http://fess" + path
+
+    def create_label_name(self):
+        return "thing1"
+
+    def generate_str(self, n=20):
+        return "g" * n
+
+    def get_wrapped_page(self):
+        return self.page
+
+
+SPEC = CrudSpec(
+    resource="thing",
+    menu=(Labels.MENU_CRAWL, Labels.MENU_LABEL_TYPE),
+    create=lambda name: {"name": name, "sortOrder": "1"},
+    update=lambda name: {"name": f"{name}X"},
+    renamed=lambda name: f"{name}X",
+    verify=("name",),
+    invalid=(Invalid("empty name", {"name": ""}),
+             Invalid("non-numeric sortOrder", {"name": "n"},
+                     script=("#sortOrder", "el => {}")),
+             Invalid("over-long name", {"name": "n" * 300, "sortOrder": "1"})),
+    markup_field="name",
+)
+
+
+@pytest.fixture
+def context(monkeypatch):
+    monkeypatch.setattr(_crud, "t", lambda key: key)
+    monkeypatch.setattr("fess.test.ui.cleanup.t", lambda key: key)
+    return _Context()
+
+
+def test_a_package_run_loads_only_the_pages_it_tests(context):
+    assert _crud.run(context, SPEC) == 16
+    assert context.page.rows == {}
+    # add: createnew, list, details -- no /admin/ and no menu clicks
+    assert context.page.loads[:3] == ["create", "list", "details"]
+
+
+def test_validation_cases_share_one_form_session(context):
+    crud = CrudRun(context, SPEC)
+    crud.validation()
+    # One createnew, one submit per case, then the markup record's own
+    # create and its delete from the list the create landed on.
+    assert crud.loads["validation"] == 1 + 3 + 1 + 2
+    assert context.page.loads.count("create") == 4
+    assert context.page.rows == {}
+
+
+def test_a_case_the_form_accepts_fails(context):
+    spec = CrudSpec(resource="thing", menu=SPEC.menu, create=SPEC.create,
+                    update=SPEC.update, invalid=(Invalid("valid", {"name": "ok"}),))
+    with pytest.raises(AssertionError, match="valid must be rejected"):
+        CrudRun(context, spec).validation()
+
+
+def test_the_row_is_followed_through_its_rename(context):
+    first = CrudRun(context, SPEC)
+    first.add()
+    first.update()
+    assert first.row == "thing1X"
+    # A leaf run on its own finds the list and the row first.
+    context.page.goto("http://fess/admin/")
+    later = CrudRun(context, SPEC)
+    later.row = "thing1X"
+    later.delete()
+    assert later.loads["delete"] == 3
+    assert context.page.rows == {}
+
+
+def test_an_unlisted_row_fails_before_touching_anything(context):
+    crud = CrudRun(context, SPEC)
+    with pytest.raises(AssertionError, match="not listed on page 1"):
+        crud.update()
@@ -0,0 +1,150 @@
+"""Tests for the admin REST API fixtures.
+
+A fake admin API stands in for Fess: what is pinned is the request each
+fixture sends (method, path, token, body with the form defaults), that a
+rejection fails loudly instead of passing as created, and that the token is
+obtained once and shared.
+"""
+import pytest
+import requests
+
+from fess.test.ui import fixtures
+from fess.test.ui.api import FessApiClient
+
+
+class _Response:
+    def __init__(self, url, body):
+        self.url = url
+        self.status_code = 200
+        self._body = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._body
+
+
+class _AdminApi:
+    """In-memory /api/admin/<resource>/setting[s]; records every call."""
+
+    def __init__(self):
+        self.store = {}
+        self.calls = []
+        self.cookies = requests.cookies.RequestsCookieJar()
+        self.reject = None
+
+    def request(self, method, url, json=None, timeout=None, headers=None):
+        path = url.split("http://fess", 1)[1]
+        self.calls.append((method, path.split("?")[0], headers["Authorization"], json))
+        if self.reject:
+            return _Response(url, {"response": {"status": 1, "message": self.reject}})
+        resource, kind, *rest = path.split("?")[0].split("/")[3:]
+        rows = self.store.setdefault(resource, {})
+        if method == "GET" and kind == "settings":
+            return _Response(url, {"response": {"status": 0, "settings": list(rows.values())}})
+        if method == "GET":
+            return _Response(url, {"response": {"status": 0, "setting": rows[rest[0]]}})
+        if method == "PUT":
+            setting_id = f"{resource}-{len(rows) + 1}"
+            rows[setting_id] = {**json, "id": setting_id}
+            return _Response(url, {"response": {"status": 0, "id": setting_id, "created": True}})
+        if method == "POST":
+            rows[json["id"]] = json
+            return _Response(url, {"response": {"status": 0, "id": json["id"]}})
+        del rows[rest[0]]
+        return _Response(url, {"response": {"status": 0, "id": rest[0]}})
+
+
+class _Context:
+    def __init__(self):
+        self.timings = []
+        self.api = FessApiClient("http://fess", list, self.timings)
+        self.api._anonymous = _AdminApi()
+
+    def url(self, path):
+        return "http://fess" + path
+
+
+@pytest.fixture
+def context(monkeypatch):
+    monkeypatch.setattr(fixtures, "FESS_ACCESS_TOKEN", "")
+    monkeypatch.setattr(fixtures, "_tokens", {})
+    issued = []
+    monkeypatch.setattr(fixtures, "_issue_token", lambda context: issued.append(1) or "tok")
+    context = _Context()
+    context.issued = issued
+    return context
+
+
+def test_create_sends_the_form_defaults_with_the_token(context):
+    setting_id = fixtures.create(context, "labeltype", {"name": "a", "value": "a"})
+    method, path, auth, body = context.api._anonymous.calls[-1]
+    assert (method, path, auth) == ("PUT", "/api/admin/labeltype/setting", "Bearer tok")
+    assert body == {"name": "a", "value": "a", "sortOrder": 0, "permissions": "{role}guest"}
+    assert fixtures.find(context, "labeltype", name="a")["id"] == setting_id
+
+
+def test_ensure_reuses_an_existing_setting(context):
+    first = fixtures.ensure(context, "role", {"name": "r"})
+    assert fixtures.ensure(context, "role", {"name": "r"}) == first
+    assert len(context.api._anonymous.store["role"]) == 1
+
+
+def test_update_keeps_the_stored_fields(context):
+    setting_id = fixtures.create(context, "webconfig", {"name": "w", "urls": "http://x/"})
+    fixtures.update(context, "webconfig", setting_id, {"description": "d"})
+    stored = context.api._anonymous.store["webconfig"][setting_id]
+    assert stored["urls"] == "http://x/" and stored["description"] == "d"
+
+
+def test_remove_deletes_every_match(context):
+    fixtures.create(context, "user", {"name": "u"})
+    fixtures.create(context, "user", {"name": "u"})
+    fixtures.create(context, "user", {"name": "v"})
+    assert fixtures.remove(context, "user", name="u") == 2
+    assert [s["name"] for s in fixtures.settings(context, "user")] == ["v"]
+
+
+def test_a_rejected_call_fails(context):
+    context.api._anonymous.reject = "name is required"
+    with pytest.raises(AssertionError, match="name is required"):
+        fixtures.create(context, "group", {})
+
+
+def test_the_token_is_obtained_once(context):
+    fixtures.create(context, "role", {"name": "a"})
+    fixtures.create(context, "role", {"name": "b"})
+    assert context.issued == [1]
+
+
+def test_a_supplied_token_is_used_as_is(context, monkeypatch):
+    monkeypatch.setattr(fixtures, "FESS_ACCESS_TOKEN", "given")
+    fixtures.create(context, "role", {"name": "a"})
+    assert context.api._anonymous.calls[-1][2] == "Bearer given"
+    assert context.issued == []
+
+
+def test_calls_are_timed_per_method(context):
+    setting_id = fixtures.create(context, "role", {"name": "a"})
+    fixtures.delete(context, "role", setting_id)
+    assert [t.action for t in context.timings] == ["api_put", "api_delete"]
+
+
+def test_a_token_handed_over_is_deleted_by_the_process_that_adopted_it(context, monkeypatch):
+    fixtures.create(context, "role", {"name": "a"})
+    handed_over = fixtures.obtained()
+    assert handed_over == {"http://fess": "tok"}
+    # The parent of a sharded run obtained none itself
+    monkeypatch.setattr(fixtures, "_tokens", {})
+    for base_url, access_token in handed_over.items():
+        fixtures.adopt(base_url, access_token)
+    calls = []
+
+    def call(api, access_token, method, path, body=None):
+        calls.append((method, path, access_token))
+        return {"settings": [{"id": "t1", "name": fixtures.ACCESS_TOKEN_NAME}]}
+    monkeypatch.setattr(fixtures, "_call", call)
+    fixtures.release()
+    assert calls[-1] == ("DELETE", "/api/admin/accesstoken/setting/t1", "tok")
+    assert fixtures.obtained() == {}
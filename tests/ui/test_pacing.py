@@ -0,0 +1,81 @@
+"""Tests for action pacing.
+
+Pacing decides how long every click, fill and navigation waits, so a profile
+that silently waits too much costs minutes per run and one that waits too
+little shows up as flaky modules. The profile logic and time accounting are
+pure Python, so they are pinned here.
+"""
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from fess.test.ui.context import PageWrapper
+from fess.test.ui.pacing import Pacer
+
+
+class _FakePage:
+    def __init__(self, settle_errors=()):
+        self.calls = []
+        self._settle_errors = list(settle_errors)
+
+    def click(self, selector, **kwargs):
+        self.calls.append(("click", selector))
+
+    def wait_for_load_state(self, state, **kwargs):
+        self.calls.append(("load_state", state))
+
+    def wait_for_function(self, expression, **kwargs):
+        self.calls.append(("settle", kwargs["arg"]))
+        if self._settle_errors:
+            raise self._settle_errors.pop(0)
+
+
+def test_none_profile_adds_no_waiting():
+    page = _FakePage()
+    PageWrapper(page, pacer=Pacer("none")).click("#go")
+    assert page.calls == [("click", "#go")]
+
+
+def test_adaptive_profile_waits_for_the_page_to_settle_after_the_action():
+    page = _FakePage()
+    pacer = Pacer("adaptive")
+    PageWrapper(page, pacer=pacer).click("#go")
+    assert page.calls == [("click", "#go"), ("load_state", "domcontentloaded"),
+                          ("settle", pacer.quiet_ms)]
+
+
+def test_legacy_profile_counts_its_delay_as_pacing(monkeypatch):
+    monkeypatch.setenv("PACING_DELAY_MS", "250")
+    pacer = Pacer("legacy")
+    monkeypatch.setattr("fess.test.ui.pacing.time.sleep", lambda seconds: None)
+    wrapper = PageWrapper(_FakePage(), pacer=pacer)
+    wrapper.click("#a")
+    wrapper.click("#b")
+    assert pacer.reset() == 0.5
+    assert pacer.pacing_seconds == 0.0
+
+
+def test_settle_timeout_is_not_retried_and_never_raises():
+    page = _FakePage(settle_errors=[PlaywrightTimeoutError("busy")])
+    Pacer("adaptive").settle(page)
+    assert [call for call in page.calls if call[0] == "settle"] == [("settle", 100)]
+
+
+def test_settle_retries_once_after_a_navigation_destroyed_the_context():
+    page = _FakePage(settle_errors=[Exception("Execution context was destroyed")])
+    Pacer("adaptive").settle(page)
+    assert len([call for call in page.calls if call[0] == "settle"]) == 2
+
+
+def test_module_profile_overrides_the_run_profile_for_one_module():
+    pacer = Pacer("none")
+    pacer.set_module_profile("legacy")
+    assert pacer.profile == "legacy"
+    pacer.set_module_profile(None)
+    assert pacer.profile == "none"
+
+
+def test_a_malformed_setting_falls_back_to_the_default(monkeypatch, caplog):
+    monkeypatch.setenv("PACING_DELAY_MS", "0.5s")
+    monkeypatch.setenv("PACING_QUIET_MS", "")
+    pacer = Pacer("legacy")
+    assert pacer.delay == 0.5 and pacer.quiet_ms == 100
+    assert "PACING_DELAY_MS='0.5s' is not a number" in caplog.text
@@ -0,0 +1,84 @@
+"""Tests for the browser-level search load mode.
+
+No browser here: a BrowserWorker whose _open returns a stand-in page shows
+that journeys run on the worker's own thread (Playwright's sync API allows
+nothing else) and that their failures reach the benchmark as errors.
+"""
+import threading
+
+import pytest
+
+from fess.test import benchmark
+from fess.test.benchmark import QueryClass, SearchRequest
+from fess.test.ui.search import load
+
+
+class _Worker(load.BrowserWorker):
+    def __init__(self, fail_open=False):
+        self.fail_open = fail_open
+        self.closed = False
+        super().__init__("http://fess:8080", name="test-load")
+
+    def _open(self):
+        if self.fail_open:
+            raise RuntimeError("no browser")
+
+        def close():
+            self.closed = True
+        return object(), close
+
+
+def _journey(seen):
+    def journey(page, url, request):
+        seen.append((threading.get_ident(), url("/search/")))
+        if request.q == "bad":
+            raise AssertionError("no next-page link")
+    return journey
+
+
+def test_journeys_run_on_the_worker_thread():
+    worker = _Worker()
+    worker.wait_started()
+    seen = []
+    worker.call(_journey(seen), SearchRequest("a"))
+    worker.close()
+    assert seen == [(worker._thread.ident, "http://fess:8080/search/")]
+    assert seen[0][0] != threading.get_ident()
+    assert worker.closed
+
+
+def test_launch_failure_is_raised_to_the_caller():
+    worker = _Worker(fail_open=True)
+    with pytest.raises(RuntimeError, match="no browser"):
+        worker.wait_started()
+    worker.close()
+
+
+def test_failed_journeys_count_as_errors():
+    workers = [_Worker() for _ in range(2)]
+    seen = []
+    query_class = QueryClass("ui_paginate", [SearchRequest("ok"), SearchRequest("bad")])
+    try:
+        result = benchmark.run_class(query_class,
+                                     [w.searcher(_journey(seen)) for w in workers], 20)
+    finally:
+        for worker in workers:
+            worker.close()
+    assert (result.requests, result.errors, result.concurrency) == (10, 10, 2)
+    assert benchmark.error_rate(result) == 0.5
+    assert {ident for ident, _ in seen} <= {w._thread.ident for w in workers}
+
+
+def test_journeys_cover_submit_paginate_and_cache():
+    journeys = load.build_journeys(40)
+    assert [c.name for c, _ in journeys] == ["ui_submit", "ui_paginate", "ui_cache"]
+    paginate = journeys[1][0].requests[0]
+    assert paginate.num == 10
+
+
+def test_a_malformed_setting_falls_back_to_the_default(monkeypatch, caplog):
+    monkeypatch.setenv("LOAD_CONTEXTS", "four")
+    monkeypatch.setenv("LOAD_REQUESTS", "0")
+    assert load.load_contexts() == 4
+    assert "LOAD_CONTEXTS='four' is not a number" in caplog.text
+    assert load.load_requests() == 1
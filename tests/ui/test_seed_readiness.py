@@ -0,0 +1,132 @@
+"""Tests for search/seed's crawl-completion readiness.
+
+Readiness decides whether every search module starts against a finished
+index, so "still crawling" and "finished short" must not be confused.
+"""
+import pytest
+
+from fess.test.i18n.keys import Labels
+from fess.test.ui.search import seed
+
+LABELS = {
+    Labels.JOBLOG_STATUS_RUNNING: "Running",
+    Labels.LIST_COULD_NOT_FIND_CRUD_TABLE: "Could not find data.",
+}
+
+# The joblog list as admin_joblog.jsp renders it: the admin sidebar (whose
+# menu links to every list page, the joblog included), then one row per job
+# run, linked to its details page, with the status badge in the second cell.
+ADMIN_CHROME = """<html><body class="hold-transition skin-blue sidebar-mini">
+<aside class="main-sidebar"><ul class="sidebar-menu">
+<li><a href="/admin/joblog/"><i class="fa fa-genderless"></i><span>Job Log</span></a></li>
+<li><a href="/admin/crawlinginfo/"><span>Crawling Info</span></a></li>
+</ul></aside><div class="content-wrapper"><section class="content">{}</section></div>
+</body></html>"""
+
+JOBLOG_ROWS = """<table class="table table-bordered table-striped"><thead><tr>
+<th>Name</th><th>Status</th><th>Target</th><th>Start Time</th><th>End Time</th>
+</tr></thead><tbody>
+<tr data-href="/admin/joblog/details/4/AXa1">
+  <td>Default Crawler</td>
+  <td><span class="badge bg-success">{}</span></td>
+  <td>all</td><td>2026-10-18T10:02:11</td><td>{}</td>
+</tr>
+<tr data-href="/admin/joblog/details/4/AXa0">
+  <td>Log Purger</td>
+  <td><span class="badge bg-primary">OK</span></td>
+  <td>all</td><td>2026-10-18T00:00:00</td><td>2026-10-18T00:00:01</td>
+</tr>
+</tbody></table>"""
+
+EMPTY_JOBLOG = """<div class="row"><div class="col-sm-12">
+<em class="fa fa-info-circle text-light-blue"></em> Could not find data.
+</div></div>"""
+
+
+class _FakeContext:
+    def __init__(self, counts):
+        self._counts = iter(counts)
+
+    def api_search(self, q):
+        return {"record_count": next(self._counts)}
+
+
+def _watch(monkeypatch, running, counts, started=0.0):
+    states = iter(running)
+    monkeypatch.setattr(seed, "_crawler_job_running", lambda context: next(states))
+    return seed._CrawlWatch(_FakeContext(counts), started)
+
+
+def test_ready_only_after_the_job_ended_and_the_count_settled(monkeypatch):
+    monkeypatch.setattr(seed, "SEED_READY", "crawl")
+    watch = _watch(monkeypatch, [True, True, False, False],
+                   [5, 40, 118, 118], started=seed.time.time())
+    readiness = [watch.ready(watch.probe()) for _ in range(4)]
+    # 40 docs is past the threshold, but the crawl is still running.
+    assert readiness == [False, False, False, True]
+    assert watch.ended_at is not None
+
+
+def test_docs_mode_is_ready_at_the_threshold(monkeypatch):
+    monkeypatch.setattr(seed, "SEED_READY", "docs")
+    watch = _watch(monkeypatch, [True], [seed.SEED_MIN_DOCS], started=seed.time.time())
+    assert watch.ready(watch.probe())
+
+
+def test_falls_back_to_the_threshold_when_no_job_row_ever_runs(monkeypatch):
+    monkeypatch.setattr(seed, "SEED_READY", "crawl")
+    long_ago = seed.time.time() - seed.CRAWLER_JOB_START_GRACE - 1
+    watch = _watch(monkeypatch, [False], [seed.SEED_MIN_DOCS], started=long_ago)
+    assert watch.ready(watch.probe())
+
+
+@pytest.fixture
+def labels(monkeypatch):
+    monkeypatch.setattr(seed, "t", LABELS.__getitem__)
+
+
+def test_the_joblog_markup_reads_as_job_states(labels):
+    running = ADMIN_CHROME.format(JOBLOG_ROWS.format("Running", ""))
+    assert seed._crawler_jobs(running) == [True]
+    ended = ADMIN_CHROME.format(JOBLOG_ROWS.format("OK", "2026-10-18T10:04:40"))
+    assert seed._crawler_jobs(ended) == [False]
+    assert seed._crawler_jobs(ADMIN_CHROME.format(EMPTY_JOBLOG)) == []
+
+
+def test_a_page_that_is_not_the_joblog_fails(labels):
+    # Another admin page carries the sidebar link to the joblog, but no rows
+    dashboard = ADMIN_CHROME.format("<h1>Dashboard</h1>")
+    with pytest.raises(AssertionError, match="did not answer with the joblog list"):
+        seed._crawler_jobs(dashboard)
+    login = '<form action="/login/" method="post"><input name="username"></form>'
+    with pytest.raises(AssertionError, match="did not answer with the joblog list"):
+        seed._crawler_jobs(login)
+
+
+class _BulkContext:
+    api = None
+
+    def __init__(self, loaded_counts, total):
+        self._loaded_counts = iter(loaded_counts)
+        self.total = total
+        self.queries = []
+
+    def api_search(self, q):
+        self.queries.append(q)
+        if q == "*":
+            return {"record_count": self.total}
+        return {"record_count": next(self._loaded_counts)}
+
+
+def test_bulk_readiness_counts_only_the_loaded_documents(monkeypatch):
+    monkeypatch.setattr(seed.fixtures, "token", lambda context: "token")
+    monkeypatch.setattr(seed._bulk_seed, "bulk_load", lambda api, token, documents: 30)
+    monkeypatch.setattr(seed, "SEED_POLL_INTERVAL", 0.01)
+    monkeypatch.setattr("fess.test.eventually.time.sleep", lambda seconds: None)
+    # 500 docs were indexed already: the total alone would pass at once.
+    context = _BulkContext([0, 12, 30], total=500)
+    pages = [(f"http://sampledata/{n}.html", "text/html", "") for n in range(seed.SEED_MIN_DOCS)]
+    assert seed._load_documents(context, pages) == 500
+    loaded_queries = [q for q in context.queries if q != "*"]
+    assert len(loaded_queries) == 3
+    assert loaded_queries[0].startswith('last_modified:["')
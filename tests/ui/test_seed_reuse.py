@@ -0,0 +1,114 @@
+"""Tests for skipping search/seed when the instance already holds the seed.
+
+A false match starts every search module against the wrong index; a false
+mismatch only costs a reseed. The fingerprint must therefore move with
+anything that changes what gets indexed, and the skip needs both the
+fingerprint and the doc count to agree.
+"""
+import pytest
+import requests
+
+from fess.test.ui.search import seed
+
+PAGES = [
+    ("http://sampledata01/", "text/html", "<html>index</html>"),
+    ("http://sampledata01/docs/en/intro.html", "text/html", "<html>intro</html>"),
+]
+
+
+class _FakeContext:
+    def __init__(self, description, docs: int):
+        # The webconfig as the admin API lists it; None: no webconfig
+        self.webconfig = (None if description is None
+                          else {"id": "abc", "name": seed.WEBCONFIG_NAME,
+                                "description": description})
+        self._docs = docs
+
+    def api_search(self, q):
+        return {"record_count": self._docs}
+
+
+@pytest.fixture(autouse=True)
+def admin_api(monkeypatch):
+    def find(context, resource, **fields):
+        assert resource == "webconfig" and fields == {"name": seed.WEBCONFIG_NAME}
+        return context.webconfig
+
+    monkeypatch.setattr(seed.fixtures, "find", find)
+    monkeypatch.setattr(seed, "SEED_MODE", "crawl")
+    # The joblog lists one ended Default Crawler run
+    monkeypatch.setattr(seed, "_crawler_job_states", lambda context: [False])
+
+
+def _description(fingerprint: str, docs: int) -> str:
+    return f"{seed.WEBCONFIG_DESCRIPTION} [seed {fingerprint} docs={docs}]"
+
+
+def test_fingerprint_ignores_page_order_but_not_content():
+    assert seed.seed_fingerprint(PAGES) == seed.seed_fingerprint(list(reversed(PAGES)))
+    changed = [PAGES[0], (PAGES[1][0], "text/html", "<html>edited</html>")]
+    assert seed.seed_fingerprint(PAGES) != seed.seed_fingerprint(changed)
+
+
+def test_fingerprint_covers_the_seed_settings(monkeypatch):
+    before = seed.seed_fingerprint(PAGES)
+    monkeypatch.setattr(seed, "MAX_ACCESS_COUNT", 50)
+    assert seed.seed_fingerprint(PAGES) != before
+
+
+def test_matching_fingerprint_and_doc_count_skip_the_seed():
+    fingerprint = seed.seed_fingerprint(PAGES)
+    context = _FakeContext(_description(fingerprint, 37), docs=37)
+    assert seed._seed_is_current(context, fingerprint)
+
+
+def test_a_changed_doc_count_reseeds():
+    fingerprint = seed.seed_fingerprint(PAGES)
+    context = _FakeContext(_description(fingerprint, 37), docs=12)
+    assert not seed._seed_is_current(context, fingerprint)
+
+
+def test_a_webconfig_without_a_record_reseeds():
+    context = _FakeContext(seed.WEBCONFIG_DESCRIPTION, docs=37)
+    assert not seed._seed_is_current(context, seed.seed_fingerprint(PAGES))
+
+
+def test_no_webconfig_reseeds():
+    context = _FakeContext(None, docs=37)
+    assert not seed._seed_is_current(context, seed.seed_fingerprint(PAGES))
+
+
+def test_a_crawl_seed_without_joblog_rows_reseeds(monkeypatch):
+    # An earlier run's sysinfo/deleteall emptied the joblog
+    monkeypatch.setattr(seed, "_crawler_job_states", lambda context: [])
+    fingerprint = seed.seed_fingerprint(PAGES)
+    context = _FakeContext(_description(fingerprint, 37), docs=37)
+    assert not seed._seed_is_current(context, fingerprint)
+    monkeypatch.setattr(seed, "SEED_MODE", "bulk")
+    assert seed._seed_is_current(context, fingerprint)
+
+
+def _unreachable(*args, **kwargs):
+    raise requests.ConnectionError("sampledata01: Name or service not known")
+
+
+def test_a_crawl_seed_without_reuse_never_fetches_sampledata(monkeypatch):
+    monkeypatch.setattr(seed, "SEED_REUSE", False)
+    monkeypatch.setattr(seed._bulk_seed, "fetch_pages", _unreachable)
+    assert seed._sampledata_pages(None) == (None, None)
+
+
+def test_an_unreachable_sampledata_only_costs_the_fingerprint(monkeypatch):
+    monkeypatch.setattr(seed, "SEED_REUSE", True)
+    monkeypatch.setattr(seed._bulk_seed, "fetch_pages", _unreachable)
+    assert seed._sampledata_pages(None) == (None, None)
+    # Bulk mode loads those pages itself: it cannot do without them
+    monkeypatch.setattr(seed, "SEED_MODE", "bulk")
+    with pytest.raises(requests.ConnectionError):
+        seed._sampledata_pages(None)
+
+
+def test_reuse_fingerprints_the_fetched_pages(monkeypatch):
+    monkeypatch.setattr(seed, "SEED_REUSE", True)
+    monkeypatch.setattr(seed._bulk_seed, "fetch_pages", lambda *args, **kwargs: PAGES)
+    assert seed._sampledata_pages(None) == (PAGES, seed.seed_fingerprint(PAGES))
@@ -0,0 +1,72 @@
+"""Tests for reusing a saved login across browser contexts.
+
+A wrong decision here either logs every context in through the form again
+(slow, and racy under TEST_PARALLEL) or hands a module an expired or
+wrong-language session. The decisions are pure Python once the browser is
+out of the way, so they are pinned here.
+"""
+from fess.test.ui.api import FessApiClient
+from fess.test.ui.context import FessContext
+
+
+class _FakeResponse:
+    def __init__(self, status: int):
+        self.status = status
+
+
+class _FakeRequest:
+    def __init__(self, status: int):
+        self._status = status
+        self.calls = []
+
+    def get(self, url: str, **kwargs) -> _FakeResponse:
+        self.calls.append((url, kwargs))
+        return _FakeResponse(self._status)
+
+
+class _FakeBrowserContext:
+    def __init__(self, status: int):
+        self.request = _FakeRequest(status)
+
+
+def _context(lang: str = "en", base_url: str = "http://fess:8080") -> FessContext:
+    """A FessContext without a browser behind it."""
+    context = object.__new__(FessContext)
+    context._lang = lang
+    context._base_url = base_url
+    return context
+
+
+def test_storage_state_is_keyed_by_host_user_and_language(monkeypatch, tmp_path):
+    monkeypatch.setenv("STORAGE_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("FESS_USERNAME", "admin")
+    en = _context("en")._resolve_storage_state_path()
+    ja = _context("ja")._resolve_storage_state_path()
+    assert en == str(tmp_path / "fess_8080_admin_en.json")
+    assert en != ja
+
+
+def test_storage_state_is_off_when_reuse_is_disabled(monkeypatch):
+    monkeypatch.setenv("REUSE_SESSION", "false")
+    assert _context()._resolve_storage_state_path() is None
+
+
+def test_session_probe_does_not_follow_the_login_redirect():
+    context = _context()
+    context._context = _FakeBrowserContext(302)
+    assert not context._session_is_valid()
+    url, kwargs = context._context.request.calls[0]
+    assert url == "http://fess:8080/admin/dashboard/"
+    assert kwargs["max_redirects"] == 0
+
+
+def test_restored_valid_session_skips_the_login_form():
+    context = _context()
+    context._context = _FakeBrowserContext(200)
+    context._restored_session = True
+    context._session_lang_set = False
+    context._current_page = None
+    context._api = FessApiClient(context._base_url, lambda: [])
+    assert context.login()
+    # The session locale came with the saved login.
+    assert context._session_lang_set
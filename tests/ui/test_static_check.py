@@ -0,0 +1,179 @@
+"""Tests for the browserless checks of server-rendered pages.
+
+Markup strings stand in for Fess's JSPs and a fake session for the pooled
+HTTP client: what is pinned is what a StaticPage answers for the selectors
+and text the read-only modules check, that a prefetch is fetched
+concurrently and handed out once, and that a bounce to the login page
+fails instead of passing as a rendered page.
+"""
+import threading
+
+import pytest
+import requests
+
+from fess.test.ui import static_check
+from fess.test.ui.api import FessApiClient
+from fess.test.ui.static_check import StaticPage
+
+HTML = """<!DOCTYPE html><html><head><title>Fess</title>
+<link rel="search" type="application/opensearchdescription+xml" href="/osdd" title="Fess Search">
+<script>var label = "not text";</script></head>
+<body class="hold-transition"><div class="container main">
+<h1>Job Log</h1><table><tr><td>crawl &amp; index</td></tr></table>
+<form><input name="q" type="text"><button name="search">Go</button></form>
+<style>.x { color: red }</style></div></body></html>"""
+
+
+def test_body_text_skips_the_head_and_scripts():
+    page = StaticPage("http://fess/admin/joblog/", HTML)
+    body = page.inner_text("body")
+    assert "Job Log" in body and "crawl & index" in body
+    assert "Fess" not in body.replace("Fess Search", "")
+    assert "not text" not in body and "color" not in body
+
+
+def test_selectors_the_modules_use():
+    page = StaticPage("http://fess/", HTML)
+    link = page.query_selector('link[rel="search"][type="application/opensearchdescription+xml"]')
+    assert link.get_attribute("href") == "/osdd"
+    assert page.query_selector('input[name="q"]') is not None
+    assert page.query_selector('button[name="search"]') is not None
+    assert page.query_selector("table, form, .container").tag == "div"
+    assert page.query_selector('input[name="other"]') is None
+
+
+def test_a_selector_it_cannot_answer_raises():
+    with pytest.raises(ValueError):
+        StaticPage("http://fess/", HTML).query_selector("div > table")
+
+
+class _Response:
+    def __init__(self, url, text):
+        self.url = url
+        self.text = text
+
+
+class _Client:
+    def __init__(self, fess):
+        self.fess = fess
+
+    def fetch(self, path):
+        with self.fess.lock:
+            self.fess.fetched.append((threading.get_ident(), path))
+        self.fess.barrier.wait(timeout=5)
+        landed = "/login/" if path == "/admin/private/" else path
+        return _Response(f"http://fess{landed}", f"<body>{path}</body>")
+
+    def close(self):
+        pass
+
+
+class _Api(_Client):
+    def fork(self):
+        return _Client(self.fess)
+
+
+class _Context:
+    def __init__(self, workers):
+        self.lock = threading.Lock()
+        self.fetched = []
+        self.barrier = threading.Barrier(workers)
+        self.api = _Api(self)
+
+    def url(self, path):
+        return "http://fess" + path
+
+
+@pytest.fixture(autouse=True)
+def static_mode(monkeypatch):
+    monkeypatch.setenv("STATIC_CHECKS", "true")
+    monkeypatch.setattr(static_check, "_prefetched", {})
+    yield
+    # What a test prefetched and never opened goes with it
+    static_check._prefetched.clear()
+
+
+def test_prefetched_pages_are_fetched_together_and_handed_out_once(monkeypatch):
+    monkeypatch.setenv("STATIC_CHECK_WORKERS", "3")
+    context = _Context(workers=3)
+    # The barrier only opens when three fetches are in flight at once.
+    static_check.prefetch(context, ["/a/", "/b/", "/c/"])
+    assert len({thread for thread, _ in context.fetched}) == 3
+
+    assert static_check.open_page(context, "/b/").inner_text() == "/b/"
+    context.barrier = threading.Barrier(1)
+    static_check.open_page(context, "/b/")
+    assert [path for _, path in context.fetched].count("/b/") == 2
+
+
+def test_a_login_bounce_fails(monkeypatch):
+    context = _Context(workers=1)
+    with pytest.raises(AssertionError, match="logged-out visitor"):
+        static_check.open_page(context, "/admin/private/")
+
+
+def test_a_failed_prefetch_is_left_to_the_module(monkeypatch):
+    monkeypatch.setenv("STATIC_CHECK_WORKERS", "1")
+    context = _Context(workers=1)
+    static_check.prefetch(context, ["/admin/private/", "/a/"])
+    assert list(static_check._prefetched) == ["http://fess/a/"]
+
+
+def test_browser_mode_navigates_the_page(monkeypatch):
+    monkeypatch.setenv("STATIC_CHECKS", "false")
+    visited = []
+
+    class _Page:
+        def goto(self, url):
+            visited.append(url)
+
+        def wait_for_load_state(self, state):
+            pass
+
+    context = _Context(workers=1)
+    static_check.prefetch(context, ["/a/"])
+    page = _Page()
+    assert static_check.open_page(context, "/a/", page) is page
+    assert visited == ["http://fess/a/"] and context.fetched == []
+
+
+def test_fetches_carry_the_login_cookies_to_a_dotless_host(monkeypatch):
+    """The pooled session and its forks against the CI's host name, through
+    the real cookie jar: only the transport is replaced."""
+    sent = []
+
+    def send(adapter, request, **kwargs):
+        cookie = request.headers.get("Cookie")
+        sent.append((request.url, cookie))
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url if cookie else "http://fesstest01:8080/login/"
+        response._content = b"<body>Job Log</body>"
+        response.encoding = "utf-8"
+        response.request = request
+        return response
+
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", send)
+    monkeypatch.setenv("STATIC_CHECK_WORKERS", "2")
+
+    class _LiveContext:
+        api = FessApiClient("http://fesstest01:8080", lambda: [
+            {"name": "JSESSIONID", "value": "abc", "domain": "fesstest01", "path": "/"}])
+
+        def url(self, path):
+            return "http://fesstest01:8080" + path
+
+    context = _LiveContext()
+    static_check.prefetch(context, ["/admin/joblog/", "/admin/crawlinginfo/"])
+    assert len(static_check._prefetched) == 2
+    assert static_check.open_page(context, "/admin/joblog/").inner_text() == "Job Log"
+    static_check.open_page(context, "/admin/crawlinginfo/")
+    static_check.open_page(context, "/help/")
+    assert static_check._prefetched == {}
+    assert [cookie for _, cookie in sent] == ["JSESSIONID=abc"] * 3
+
+
+def test_a_malformed_worker_count_falls_back_to_the_default(monkeypatch, caplog):
+    monkeypatch.setenv("STATIC_CHECK_WORKERS", "eight")
+    assert static_check.static_check_workers() == 8
+    assert "STATIC_CHECK_WORKERS='eight' is not a number" in caplog.text